@@ -53,10 +53,13 @@ setup(
     install_requires=install_requires,
     extras_require={
         "dev": dev_requires,
+        # 物体検出のONNX推論（未導入の場合はcv2.dnnで推論）
+        "onnx": ["onnxruntime>=1.15.0"],
     },
     entry_points={
         "console_scripts": [
             "face-mosaic-cli=face_mosaic.cli.main:main",
+            "face-mosaic-serve=face_mosaic.cli.main:serve_main",
             "face-mosaic-gui=face_mosaic.gui.main:main",
         ],
     },
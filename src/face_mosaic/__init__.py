@@ -8,8 +8,9 @@ __version__ = "2.0.0"
 __author__ = "Face Mosaic Tool Team"
 __description__ = "YuNet専用高精度顔モザイク処理ツール"
 
-# メインクラスのインポート
-from .core.application import FaceMosaicApplication
+from ._lazy import lazy_exports
+
+# 設定クラスのインポート
 from .config.settings import AppConfig, default_config
 
 # 例外クラスのインポート
@@ -22,8 +23,16 @@ from .core.exceptions import (
     ValidationError,
 )
 
-# ユーティリティ関数のインポート
-from .utils.system_info import get_system_info, check_requirements, print_system_info
+# cv2 などの重い依存を持つモジュールは参照時に読み込む（PEP 562）
+_LAZY_ATTRIBUTES = {
+    "FaceMosaicApplication": ".core.application",
+    "get_system_info": ".utils.system_info",
+    "check_requirements": ".utils.system_info",
+    "print_system_info": ".utils.system_info",
+}
+
+__getattr__, __dir__ = lazy_exports(_LAZY_ATTRIBUTES, globals())
+
 
 __all__ = [
     # メインクラス
@@ -59,6 +68,8 @@ def create_application(config=None):
     Returns:
         FaceMosaicApplicationインスタンス
     """
+    from .core.application import FaceMosaicApplication
+
     return FaceMosaicApplication(config)
 
 
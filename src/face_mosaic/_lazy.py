@@ -0,0 +1,35 @@
+"""
+パッケージ属性の遅延読み込み（PEP 562）
+"""
+
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    attributes: Dict[str, str], namespace: Dict[str, Any]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    参照時にモジュールを読み込むパッケージの __getattr__ / __dir__ を作成
+
+    Args:
+        attributes: 属性名 → 定義元モジュール（パッケージからの相対名）
+        namespace: パッケージの globals()（読み込んだ属性をキャッシュする）
+
+    Returns:
+        (__getattr__, __dir__) のタプル
+    """
+    package = namespace["__name__"]
+
+    def __getattr__(name: str) -> Any:
+        if name in attributes:
+            module = importlib.import_module(attributes[name], package)
+            value = getattr(module, name)
+            namespace[name] = value
+            return value
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(attributes))
+
+    return __getattr__, __dir__
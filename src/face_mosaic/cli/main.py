@@ -4,15 +4,21 @@ CLI版メインモジュール
 """
 
 import argparse
+import contextlib
 import sys
 import time
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from ..core.application import FaceMosaicApplication
-from ..config.settings import AppConfig
+from .. import __description__, __version__
+from ..config.settings import AppConfig, ModelConfig, VideoConfig
 from ..core.exceptions import FaceMosaicError
-from ..utils.system_info import print_system_info
+from ..utils.file_utils import is_video_file
+
+# アプリケーション（cv2）・物体検出（torch）は必要になった時点で読み込み、
+# --version/--info/--dry-run を高速に応答する
+if TYPE_CHECKING:
+    from ..core.application import FaceMosaicApplication
 
 
 class CLIApplication:
@@ -20,7 +26,7 @@ class CLIApplication:
 
     def __init__(self):
         """初期化"""
-        self.app: Optional[FaceMosaicApplication] = None
+        self.app: Optional["FaceMosaicApplication"] = None
 
     def create_parser(self) -> argparse.ArgumentParser:
         """引数パーサーを作成"""
@@ -32,6 +38,21 @@ class CLIApplication:
   %(prog)s -i input_dir -o output_dir
   %(prog)s -i input_dir -o output_dir -r 0.05
   %(prog)s -i input_dir -o output_dir --dry-run
+  %(prog)s -i input_dir -o output_dir --workers 8
+  %(prog)s -i input_dir -o output_dir --resume
+  %(prog)s -i input_dir -o output_dir --incremental --dry-run
+  %(prog)s -i input_dir -o output_dir --face-model int8
+  %(prog)s -i sample_dir --compare-variants
+  %(prog)s --serve --object-detect --object-labels person
+  %(prog)s -i input.jpg -o output.jpg --server --object-detect --object-labels person
+  %(prog)s --serve-http --http-port 8080 --threads 2
+  %(prog)s -i spool_dir -o output_dir --watch --archive archive_dir
+  %(prog)s -i input.mp4 -o output.mp4 --track --detect-interval 5
+  %(prog)s -i input.mp4 -o output.mp4 -c 0.8 --persist-frames 3
+  %(prog)s -i input.mp4 -o output.mp4 --workers 8
+  %(prog)s --live 0 --target-latency 80
+  %(prog)s --live rtsp://127.0.0.1:8554/cam --live-output - | ffplay -f rawvideo ...
+  jobs.jsonl を入力に: %(prog)s --jsonl --threads 4 < jobs.jsonl > results.jsonl
   %(prog)s --info
             """,
         )
@@ -62,6 +83,49 @@ class CLIApplication:
         parser.add_argument(
             "--blur", action="store_true", help="ピクセル化の代わりにブラーを使用"
         )
+        parser.add_argument(
+            "--face-model",
+            type=str,
+            default="fp32",
+            choices=["fp32", *ModelConfig().quantized_model_urls],
+            help="YuNetモデルのバリアント (fp32, int8: 量子化版でCPU推論を高速化, "
+            "デフォルト: fp32)",
+        )
+        parser.add_argument(
+            "--detection-max-side",
+            type=int,
+            default=None,
+            help="検出用縮小画像の最大辺 (0で縮小なし, デフォルト: 4096)。"
+            "モザイクは元解像度の画像に適用",
+        )
+
+        # タイル検出オプション
+        parser.add_argument(
+            "--tiling",
+            action="store_true",
+            help="大きな画像を重なりのあるタイルに分割して顔検出",
+        )
+        parser.add_argument(
+            "--tile-size", type=int, default=640, help="タイルの一辺 (デフォルト: 640)"
+        )
+        parser.add_argument(
+            "--tile-overlap",
+            type=float,
+            default=0.25,
+            help="タイルの重なり率 (0.0-0.9, デフォルト: 0.25)",
+        )
+        parser.add_argument(
+            "--tile-scales",
+            type=str,
+            default="1.0",
+            help="タイル検出のスケール（カンマ区切り, 例: 1.0,0.5）",
+        )
+        parser.add_argument(
+            "--tile-threads",
+            type=int,
+            default=1,
+            help="タイル検出の並列スレッド数 (デフォルト: 1)",
+        )
 
         # 物体検出オプション
         parser.add_argument(
@@ -79,17 +143,214 @@ class CLIApplication:
             "--object-detector",
             type=str,
             default="yolo",
-            choices=["fasterrcnn", "yolo"],
-            help="物体検出器の種類 (yolo または fasterrcnn, デフォルト: yolo)",
+            choices=["fasterrcnn", "yolo", "onnx"],
+            help="物体検出器の種類 (yolo, fasterrcnn または onnx, デフォルト: yolo)。"
+            "onnx はONNX Runtime/cv2.dnnでtorchを使わずに推論",
+        )
+        parser.add_argument(
+            "--onnx-source",
+            type=str,
+            default="yolo",
+            choices=["yolo", "fasterrcnn"],
+            help="onnx 指定時に .onnx 以外のモデルを変換する場合の変換元 "
+            "(変換結果は models/onnx/ に保存, デフォルト: yolo)",
         )
         parser.add_argument(
             "--object-model",
             type=str,
             default=None,
-            help="物体検出モデルの.ptファイルパス（YOLOやFasterRCNNのカスタムモデル指定用）",
+            help="物体検出モデルの.pt/.onnxファイルパス（カスタムモデル指定用）",
+        )
+        parser.add_argument(
+            "--object-precision",
+            type=str,
+            default="fp32",
+            choices=["fp32", "int8"],
+            help="物体検出の推論精度 (int8: CPU向けの動的量子化。yolo はONNXに変換して"
+            "推論, デフォルト: fp32)",
+        )
+        parser.add_argument(
+            "--calibration-dir",
+            type=str,
+            default=None,
+            help="--object-precision int8 でONNXモデルを静的量子化する校正画像の"
+            "ディレクトリ（未指定の場合は重みのみの動的量子化）",
+        )
+        parser.add_argument(
+            "--object-batch-size",
+            type=int,
+            default=1,
+            help="物体検出をまとめて推論する画像数（逐次処理時, デフォルト: 1）",
+        )
+        parser.add_argument(
+            "--object-gate",
+            action="store_true",
+            help="縮小画像で対象物体の有無を先に判定し、候補がない画像の本検出を省略",
+        )
+        parser.add_argument(
+            "--object-gate-size",
+            type=int,
+            default=320,
+            help="事前判定に使う画像の最大辺 (デフォルト: 320)",
+        )
+        parser.add_argument(
+            "--object-gate-threshold",
+            type=float,
+            default=0.1,
+            help="事前判定の信頼度閾値 (デフォルト: 0.1)",
         )
 
         # 実行オプション
+        parser.add_argument(
+            "-w",
+            "--workers",
+            type=int,
+            default=1,
+            help="並列処理のワーカープロセス数。動画は区間に分けてプロセスごとに処理 "
+            "(デフォルト: 1 = 逐次処理)",
+        )
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=1,
+            help="スレッド並列処理のスレッド数。検出器をスレッドごとに用意し"
+            "モデルを1プロセスで共有 (デフォルト: 1)",
+        )
+        parser.add_argument(
+            "--pipeline",
+            action="store_true",
+            help="読み込み・検出・保存をスレッドのステージに分割して処理（--workers と併用不可）",
+        )
+        parser.add_argument(
+            "--queue-depth",
+            type=int,
+            default=8,
+            help="パイプラインのステージ間キュー長 (デフォルト: 8)",
+        )
+        parser.add_argument(
+            "--io-threads",
+            type=int,
+            default=2,
+            help="パイプラインの読み込み/保存スレッド数 (デフォルト: 2)",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="進捗ジャーナルを参照し、前回処理済みのファイルをスキップして再開",
+        )
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="入力・設定が前回から変わらず出力が存在するファイルをスキップ",
+        )
+        parser.add_argument(
+            "--hash-check",
+            action="store_true",
+            help="--incremental 時、更新時刻が変わっても内容ハッシュが同じならスキップ",
+        )
+        parser.add_argument(
+            "--detection-cache",
+            type=Path,
+            default=None,
+            help="検出結果キャッシュファイル（画像内容と検出設定が同じなら検出を省略）",
+        )
+        parser.add_argument(
+            "--detection-cache-size",
+            type=int,
+            default=100000,
+            help="検出結果キャッシュの最大エントリ数 (デフォルト: 100000)",
+        )
+        parser.add_argument(
+            "--no-journal",
+            action="store_true",
+            help="進捗ジャーナル（出力先の隣の .journal.sqlite3）を記録しない",
+        )
+        parser.add_argument(
+            "--detect-only",
+            action="store_true",
+            help="検出のみ実行し、結果を -o のファイル (JSON Lines, .gz 可) に保存",
+        )
+        parser.add_argument(
+            "--render-from",
+            type=Path,
+            metavar="SIDECAR",
+            help="--detect-only の検出結果を使ってモザイクを適用（検出モデルは読み込まない）",
+        )
+        parser.add_argument(
+            "--jsonl",
+            action="store_true",
+            help="標準入力から1行1ジョブのJSON（input, output, mosaic）を読み込み、"
+            "完了した順に結果を標準出力へ1行ずつ書き出す",
+        )
+        parser.add_argument(
+            "--watch",
+            action="store_true",
+            help="入力ディレクトリを監視し、書き込まれた画像を停止（Ctrl+C）まで処理し続ける",
+        )
+        parser.add_argument(
+            "--archive",
+            type=Path,
+            default=None,
+            help="監視モードで処理済みの元ファイルを移動するディレクトリ",
+        )
+        parser.add_argument(
+            "--settle-time",
+            type=float,
+            default=1.0,
+            help="監視モードで書き込み完了とみなすまでの待ち時間（秒, デフォルト: 1.0）",
+        )
+        parser.add_argument(
+            "--poll",
+            action="store_true",
+            help="監視モードで inotify を使わずにポーリングする",
+        )
+        parser.add_argument(
+            "--track",
+            action="store_true",
+            help="動画で検出を間引き、間のフレームは検出枠を追跡する",
+        )
+        parser.add_argument(
+            "--detect-interval",
+            type=int,
+            default=5,
+            help="--track で検出するフレームの間隔 (デフォルト: 5, "
+            "シーンの切り替わりでも検出)",
+        )
+        parser.add_argument(
+            "--persist-frames",
+            type=int,
+            default=0,
+            help="動画で検出が途切れても枠を保持するフレーム数。途切れた区間は"
+            "前後の検出から補間 (デフォルト: 0 = 無効)",
+        )
+        parser.add_argument(
+            "--live",
+            type=str,
+            default=None,
+            metavar="SOURCE",
+            help="カメラ番号・ストリームのURL・動画ファイルをリアルタイムに処理"
+            "（Ctrl+Cで停止）",
+        )
+        parser.add_argument(
+            "--live-output",
+            type=str,
+            default="window",
+            help="リアルタイム処理の出力先: window（ウィンドウ表示）、-（標準出力へ "
+            "BGR24 の生フレーム）、名前付きパイプまたは動画ファイルのパス "
+            "(デフォルト: window)",
+        )
+        parser.add_argument(
+            "--target-latency",
+            type=float,
+            default=100.0,
+            help="リアルタイム処理の遅延の目標（ミリ秒, デフォルト: 100）",
+        )
+        parser.add_argument(
+            "--max-fps",
+            type=float,
+            default=0.0,
+            help="リアルタイム処理の出力フレームレートの上限 (デフォルト: 0 = 入力に合わせる)",
+        )
         parser.add_argument(
             "--dry-run",
             action="store_true",
@@ -99,6 +360,71 @@ class CLIApplication:
             "--no-confirm", action="store_true", help="確認プロンプトをスキップ"
         )
         parser.add_argument("--estimate", action="store_true", help="処理時間を推定")
+        parser.add_argument(
+            "--compare-variants",
+            action="store_true",
+            help="-i の画像で通常版と量子化版のモデルの速度・検出結果の一致度を比較"
+            "（-o 不要。--object-detect 指定時は物体検出も比較）",
+        )
+        parser.add_argument(
+            "--compare-samples",
+            type=int,
+            default=20,
+            help="--compare-variants で使用する画像の最大枚数 (デフォルト: 20)",
+        )
+
+        # 常駐サーバーオプション
+        parser.add_argument(
+            "--serve",
+            action="store_true",
+            help="モデルを読み込んだまま常駐し、Unixソケットでジョブを受け付ける",
+        )
+        parser.add_argument(
+            "--server",
+            action="store_true",
+            help="常駐サーバーが同じ設定で起動していれば処理を転送する"
+            "（起動していない場合や --incremental・--workers・--pipeline "
+            "指定時はこのプロセスで処理）",
+        )
+        parser.add_argument(
+            "--stop-server", action="store_true", help="常駐サーバーを停止"
+        )
+        parser.add_argument(
+            "--socket",
+            type=Path,
+            default=None,
+            help="常駐サーバーのソケットパス (デフォルト: 一時ディレクトリの "
+            "face-mosaic-<uid>.sock)",
+        )
+        parser.add_argument(
+            "--serve-http",
+            action="store_true",
+            help="HTTPサーバーを起動（POST /mosaic で画像、POST /detect で検出結果を返す）",
+        )
+        parser.add_argument(
+            "--http-host",
+            type=str,
+            default="127.0.0.1",
+            help="HTTPサーバーのホスト (デフォルト: 127.0.0.1)",
+        )
+        parser.add_argument(
+            "--http-port",
+            type=int,
+            default=8080,
+            help="HTTPサーバーのポート (デフォルト: 8080)",
+        )
+        parser.add_argument(
+            "--http-batch-size",
+            type=int,
+            default=8,
+            help="同時に届いたリクエストをまとめて検出する最大枚数 (デフォルト: 8)",
+        )
+        parser.add_argument(
+            "--http-batch-window",
+            type=float,
+            default=5.0,
+            help="まとめる相手を待つ最大時間（ミリ秒, デフォルト: 5）",
+        )
 
         # 情報表示オプション
         parser.add_argument("--info", action="store_true", help="システム情報を表示")
@@ -115,6 +441,49 @@ class CLIApplication:
         if args.info:
             return True
 
+        # 検出・モザイク・並列処理の設定は全モード共通で検証
+        if not self.validate_settings(args):
+            return False
+
+        # JSON Lines・リアルタイム処理とサーバーの起動・停止は入出力不要
+        input_less = (
+            args.jsonl
+            or args.live is not None
+            or args.serve_http
+            or args.serve
+            or args.stop_server
+        )
+        if input_less and args.dry_run:
+            print("エラー: --dry-run は入力パス(-i)を処理するモードでのみ使用できます")
+            return False
+
+        if args.jsonl:
+            return True
+        if args.live is not None:
+            if args.target_latency < 0 or args.max_fps < 0:
+                print(
+                    "エラー: 遅延の目標・フレームレートの上限は0以上で指定してください"
+                )
+                return False
+            return True
+        if args.serve_http:
+            if args.http_batch_size < 1 or args.http_batch_window < 0:
+                print("エラー: HTTPサーバーのバッチ設定が不正です")
+                return False
+            return True
+        if args.serve or args.stop_server:
+            return True
+
+        # モデル比較は入力のみ必須
+        if args.compare_variants:
+            if not args.input or not args.input.exists():
+                print("エラー: 比較に使う画像のパス(-i)を指定してください")
+                return False
+            if args.compare_samples < 1:
+                print("エラー: 比較に使う画像数は1以上で指定してください")
+                return False
+            return True
+
         # その他の場合は入力・出力が必須
         if not args.input or not args.output:
             print("エラー: 入力パス(-i)と出力パス(-o)は必須です")
@@ -128,6 +497,47 @@ class CLIApplication:
             print(f"エラー: 入力パスが見つかりません: {args.input}")
             return False
 
+        # 動画の出力形式の検証
+        video_formats = VideoConfig().supported_formats
+        if args.input.is_file() and is_video_file(args.input, video_formats):
+            if not is_video_file(args.output, video_formats):
+                print(
+                    "エラー: 動画の出力パス(-o)は動画の拡張子で指定してください "
+                    f"({', '.join(video_formats)})"
+                )
+                return False
+            if args.detect_interval < 1:
+                print("エラー: 検出間隔(--detect-interval)は1以上で指定してください")
+                return False
+            if args.persist_frames < 0:
+                print(
+                    "エラー: 枠の保持フレーム数(--persist-frames)は0以上で指定してください"
+                )
+                return False
+
+        # 監視モードの検証
+        if args.watch:
+            if not args.input.is_dir():
+                print(
+                    "エラー: 監視モードの入力パス(-i)はディレクトリを指定してください"
+                )
+                return False
+            if args.settle_time < 0:
+                print("エラー: 待ち時間は0以上で指定してください")
+                return False
+
+        # 検出/描画分離モードの検証
+        if args.detect_only and args.render_from:
+            print("エラー: --detect-only と --render-from は同時に指定できません")
+            return False
+        if args.render_from and not args.render_from.is_file():
+            print(f"エラー: 検出結果ファイルが見つかりません: {args.render_from}")
+            return False
+
+        return True
+
+    def validate_settings(self, args: argparse.Namespace) -> bool:
+        """検出・モザイク・並列処理の設定値を検証"""
         # モザイク比率の検証
         if not (0.01 <= args.ratio <= 1.0):
             print("エラー: モザイク比率は0.01から1.0の間で指定してください")
@@ -138,46 +548,122 @@ class CLIApplication:
             print("エラー: 信頼度閾値は0.1から1.0の間で指定してください")
             return False
 
+        # 検出プロキシサイズの検証
+        if args.detection_max_side is not None and args.detection_max_side < 0:
+            print("エラー: 検出用最大辺は0以上で指定してください")
+            return False
+
+        # タイル検出設定の検証
+        if args.tiling:
+            try:
+                scales = [float(v) for v in args.tile_scales.split(",") if v.strip()]
+            except ValueError:
+                scales = []
+            if not scales or any(scale <= 0 for scale in scales):
+                print("エラー: タイル検出のスケールは正の数で指定してください")
+                return False
+            if args.tile_size < 32 or not (0.0 <= args.tile_overlap <= 0.9):
+                print(
+                    "エラー: タイルサイズは32以上、重なり率は0.0から0.9の間で"
+                    "指定してください"
+                )
+                return False
+
+        if args.object_batch_size < 1:
+            print("エラー: 物体検出のバッチサイズは1以上で指定してください")
+            return False
+
+        # 物体検出の事前判定設定の検証
+        if args.object_gate:
+            if args.object_gate_size < 32:
+                print("エラー: 事前判定の画像サイズは32以上で指定してください")
+                return False
+            if not (0.0 < args.object_gate_threshold <= 1.0):
+                print(
+                    "エラー: 事前判定の信頼度閾値は0より大きく1.0以下で指定してください"
+                )
+                return False
+
+        # ワーカー数の検証
+        if args.workers < 1:
+            print("エラー: ワーカー数は1以上で指定してください")
+            return False
+        if args.threads < 1:
+            print("エラー: スレッド数は1以上で指定してください")
+            return False
+
+        # パイプライン設定の検証
+        if args.queue_depth < 1 or args.io_threads < 1:
+            print("エラー: キュー長とI/Oスレッド数は1以上で指定してください")
+            return False
+        if args.pipeline and args.workers > 1:
+            print("エラー: --pipeline と --workers 2以上は同時に指定できません")
+            return False
+
         return True
 
+    def build_config(self, args: argparse.Namespace) -> AppConfig:
+        """引数からアプリケーション設定を作成（モデルは読み込まない）"""
+        config = AppConfig()
+        config.mosaic.ratio = args.ratio
+        config.detection.confidence_threshold = args.confidence
+        config.mosaic.pixelate = not args.blur
+        config.detection.detection_max_side = args.detection_max_side
+        config.model.model_variant = args.face_model
+        if args.tiling:
+            config.detection.tiling = True
+            config.detection.tile_size = args.tile_size
+            config.detection.tile_overlap = args.tile_overlap
+            config.detection.tile_scales = tuple(
+                float(v) for v in args.tile_scales.split(",") if v.strip()
+            )
+            config.detection.tile_threads = max(1, args.tile_threads)
+
+        # 物体検出オプション（描画のみの場合は検出器を使わない）
+        if getattr(args, "object_detect", False) and not args.render_from:
+            config.object_detection.enabled = True
+            config.object_detection.labels = tuple(
+                s.strip() for s in args.object_labels.split(",") if s.strip()
+            )
+            config.object_detection.detector_type = getattr(
+                args, "object_detector", "yolo"
+            )
+            config.object_detection.model_path = getattr(args, "object_model", None)
+        config.object_detection.onnx_source = args.onnx_source
+        config.object_detection.precision = args.object_precision
+        config.object_detection.calibration_dir = args.calibration_dir
+        config.object_detection.batch_size = args.object_batch_size
+        config.object_detection.gate = args.object_gate
+        config.object_detection.gate_max_side = args.object_gate_size
+        config.object_detection.gate_score_threshold = args.object_gate_threshold
+
+        config.processing.workers = args.workers
+        config.processing.threads = args.threads
+        config.processing.pipeline = args.pipeline
+        config.processing.pipeline_queue_depth = args.queue_depth
+        config.processing.pipeline_io_threads = args.io_threads
+        config.processing.journal = not args.no_journal
+        config.processing.incremental = args.incremental
+        config.processing.incremental_hash = args.hash_check
+        config.processing.detection_cache_path = args.detection_cache
+        config.processing.detection_cache_max_entries = args.detection_cache_size
+
+        return config
+
     def initialize_application(self, args: argparse.Namespace) -> None:
         """アプリケーションを初期化"""
         try:
-            # 設定を作成
-            config = AppConfig()
-            config.mosaic.ratio = args.ratio
-            config.detection.confidence_threshold = args.confidence
-            config.mosaic.pixelate = not args.blur
-
-            # 物体検出オプション
-            object_detector = None
-            object_labels = []
-            use_object_detection = getattr(args, "object_detect", False)
-            object_detector = None
-            if use_object_detection:
-                detector_type = getattr(args, "object_detector", "yolo")
-                model_path = getattr(args, "object_model", None)
-                if detector_type == "yolo":
-                    from ..core.yolov8_object_detector import YoloV8ObjectDetector
-
-                    object_detector = YoloV8ObjectDetector(model_path=model_path)
-                else:
-                    from ..core.object_detector import ObjectDetector
-
-                    object_detector = ObjectDetector(model_path=model_path)
-                if args.object_labels:
-                    object_labels = [
-                        s.strip() for s in args.object_labels.split(",") if s.strip()
-                    ]
-
-            # アプリケーション初期化
-            self.app = FaceMosaicApplication(config)
-            # ImageProcessorへ物体検出器を渡す
-            self.app.image_processor.object_detector = object_detector
-            self.app.image_processor.object_labels = object_labels
-            self.app.image_processor.use_object_detection = use_object_detection
-
-            if not self.app.is_ready():
+            from ..core.application import FaceMosaicApplication
+
+            # アプリケーション初期化（設定で有効な場合は物体検出器も構築される）
+            self.app = FaceMosaicApplication(self.build_config(args))
+
+            # 描画のみの場合は検出モデルを読み込まずに要件だけ確認
+            if args.render_from:
+                ready = all(self.app.check_requirements().values())
+            else:
+                ready = self.app.is_ready()
+            if not ready:
                 print("エラー: アプリケーションの初期化に失敗しました")
                 print("システム要件を確認してください（--info オプション）")
                 sys.exit(1)
@@ -187,15 +673,35 @@ class CLIApplication:
             sys.exit(1)
 
     def show_info(self) -> None:
-        """システム情報を表示"""
+        """システム情報を表示（アプリケーションの初期化・モデルの読み込みは行わない）"""
+        from ..utils.system_info import print_system_info
+
         print_system_info()
 
-        if self.app:
-            app_info = self.app.get_application_info()
-            print(f"\n=== アプリケーション情報 ===")
-            print(f"バージョン: {app_info['version']}")
-            print(f"名前: {app_info['name']}")
-            print(f"説明: {app_info['description']}")
+        print(f"\n=== アプリケーション情報 ===")
+        print(f"バージョン: {__version__}")
+        print(f"名前: Face Mosaic Tool")
+        print(f"説明: {__description__}")
+
+    def dry_run(self, args: argparse.Namespace) -> None:
+        """処理対象のみを表示（検出モデルは読み込まない）"""
+        from ..core.batch_processor import BatchProcessor
+
+        print("=== ドライラン ===")
+        start_time = time.time()
+        if args.input.is_file():
+            print(f"処理対象ファイル: {args.input}")
+            print(f"出力ファイル: {args.output}")
+            return
+
+        # ドライランは設定のフィンガープリントとジャーナルだけを参照するため、
+        # 画像処理インスタンス（検出器）なしで実行できる
+        config = self.build_config(args)
+        batch_processor = BatchProcessor(None, config.processing, config)
+        stats = batch_processor.process_directory(
+            args.input, args.output, dry_run=True, resume=args.resume
+        )
+        self.show_batch_results(stats, start_time)
 
     def estimate_processing_time(self, args: argparse.Namespace) -> None:
         """処理時間を推定"""
@@ -214,6 +720,281 @@ class CLIApplication:
             minutes = estimation["estimated_time"] / 60
             print(f"              {minutes:.1f} 分")
 
+    def compare_variants(self, args: argparse.Namespace) -> None:
+        """モデルバリアントの比較結果を表示"""
+        object_precisions = ["fp32", "int8"] if args.object_detect else None
+
+        print("モデルバリアントを比較中...")
+        report = self.app.compare_model_variants(
+            args.input,
+            object_precisions=object_precisions,
+            sample_size=args.compare_samples,
+        )
+
+        print(f"\n=== モデルバリアント比較 ({report['images']} 枚) ===")
+        print(
+            f"一致率は先頭のバリアントの検出結果との比較 (IoU >= {report['iou_threshold']})"
+        )
+        for title, rows in (("顔検出", report["face"]), ("物体検出", report["object"])):
+            if not rows:
+                continue
+            print(f"\n[{title}]")
+            for row in rows:
+                if "error" in row:
+                    print(f"{row['variant']:>8}: 失敗 ({row['error']})")
+                    continue
+                print(
+                    f"{row['variant']:>8}: {row['mean_time'] * 1000:.1f} ms/枚 "
+                    f"(x{row['speedup']:.2f}) 検出 {row['detections']} 個 "
+                    f"再現率 {row['recall'] * 100:.1f}% "
+                    f"適合率 {row['precision'] * 100:.1f}% [{row['model']}]"
+                )
+
+    def serve(self, args: argparse.Namespace) -> None:
+        """常駐サーバーを起動（SIGTERM/Ctrl+Cで停止）"""
+        import signal
+        import threading
+
+        from ..server.socket_server import FaceMosaicSocketServer
+
+        self.initialize_application(args)
+        config = self.app.config
+        if args.socket is not None:
+            config.server.socket_path = args.socket
+
+        server = FaceMosaicSocketServer(self.app, config.server.socket_path)
+        try:
+            server.start()
+        except FaceMosaicError as e:
+            print(f"エラー: {e}")
+            sys.exit(1)
+
+        # serve_forever を実行中のスレッド以外から停止する
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(
+                signal.SIGTERM,
+                lambda *_: threading.Thread(
+                    target=server.shutdown, daemon=True
+                ).start(),
+            )
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            server.close()
+        print("サーバーを停止しました")
+
+    def serve_http(self, args: argparse.Namespace) -> None:
+        """HTTPサーバーを起動（Ctrl+Cで停止）"""
+        from ..server.http_server import FaceMosaicHTTPServer
+
+        self.initialize_application(args)
+        server_config = self.app.config.server
+        server_config.http_host = args.http_host
+        server_config.http_port = args.http_port
+        server_config.batch_size = args.http_batch_size
+        server_config.batch_window_ms = args.http_batch_window
+
+        try:
+            FaceMosaicHTTPServer(self.app).run()
+        except OSError as e:
+            print(f"エラー: HTTPサーバーを起動できません: {e}")
+            sys.exit(1)
+        print("HTTPサーバーを停止しました")
+
+    def process_json_lines(self, args: argparse.Namespace) -> None:
+        """
+        JSON Lines モードで処理
+
+        標準出力は結果専用とし、ログ・進捗表示は標準エラー出力へ出す
+        """
+        sink = sys.stdout
+        with contextlib.redirect_stdout(sys.stderr):
+            self.initialize_application(args)
+            stats = self.app.process_json_lines(sys.stdin, sink)
+            print(
+                f"処理完了: {stats['total']} 件 "
+                f"(成功 {stats['success']}, 失敗 {stats['failed']})"
+            )
+
+    def watch(self, args: argparse.Namespace) -> None:
+        """入力ディレクトリを監視して処理（SIGTERM/Ctrl+Cで停止）"""
+        import signal
+        import threading
+
+        self.initialize_application(args)
+        watch_config = self.app.config.watch
+        watch_config.settle_time = args.settle_time
+        watch_config.use_inotify = not args.poll
+        watch_config.archive_dir = args.archive
+
+        # 停止要求を受けたら処理中のファイルを終えてから終了する
+        stop_event = threading.Event()
+        if threading.current_thread() is threading.main_thread():
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                signal.signal(signum, lambda *_: stop_event.set())
+
+        def on_result(path: Path, result, error) -> None:
+            if error is not None:
+                print(f"処理エラー: {path}: {error}")
+
+        print(f"監視を開始しました: {args.input}（Ctrl+Cで停止）")
+        start_time = time.time()
+        stats = self.app.watch_directory(args.input, args.output, stop_event, on_result)
+
+        elapsed = time.time() - start_time
+        print("\n=== 監視結果 ===")
+        print(f"監視方式: {stats['watcher']}")
+        print(f"処理: {stats['processed']} ファイル")
+        print(f"失敗: {stats['failed']} ファイル")
+        print(f"処理済みのためスキップ: {stats['skipped']} ファイル")
+        if watch_config.archive_dir is not None:
+            print(f"アーカイブ: {stats['archived']} ファイル")
+        print(f"検出された顔: {stats['total_faces']} 個")
+        if elapsed > 0:
+            print(f"処理速度: {stats['processed'] / elapsed * 60:.1f} ファイル/分")
+
+    def live(self, args: argparse.Namespace) -> None:
+        """
+        カメラ・ストリームをリアルタイムに処理（SIGTERM/Ctrl+Cで停止）
+
+        標準出力へフレームを出力する場合、ログ・統計は標準エラー出力へ出す
+        """
+        import signal
+        import threading
+
+        output = args.live_output
+        log = sys.stdout
+        if output == "-":
+            from ..core.live_processor import RawPipeSink
+
+            # 標準出力はフレーム専用にする
+            output = RawPipeSink(sys.stdout.buffer)
+            log = sys.stderr
+        with contextlib.redirect_stdout(log):
+            self.initialize_application(args)
+            live_config = self.app.config.live
+            live_config.target_latency_ms = args.target_latency
+            live_config.max_fps = args.max_fps
+
+            stop_event = threading.Event()
+            if threading.current_thread() is threading.main_thread():
+                for signum in (signal.SIGINT, signal.SIGTERM):
+                    signal.signal(signum, lambda *_: stop_event.set())
+
+            def on_stats(stats: dict) -> None:
+                print(
+                    f"{stats['fps']:6.1f} fps | 遅延 {stats['latency_ms']:6.1f} ms "
+                    f"(p95 {stats['latency_p95_ms']:.1f} ms, "
+                    f"目標内 {stats['within_target']:.0%}) | "
+                    f"検出 {stats['detect_fps']:.1f} 回/秒 | "
+                    f"破棄 {stats['dropped']} フレーム",
+                    flush=True,
+                )
+
+            print(
+                f"リアルタイム処理を開始しました: {args.live} → {args.live_output} "
+                f"(遅延の目標 {args.target_latency:.0f} ms, Ctrl+Cで停止)"
+            )
+            try:
+                stats = self.app.process_live(args.live, output, stop_event, on_stats)
+            except FaceMosaicError as e:
+                print(f"エラー: {e}")
+                sys.exit(1)
+
+            print("\n=== リアルタイム処理結果 ===")
+            print(f"取り込んだフレーム: {stats['frames_captured']}")
+            print(
+                f"出力したフレーム: {stats['frames_output']} "
+                f"(破棄 {stats['frames_dropped']})"
+            )
+            print(f"検出回数: {stats['detections']}")
+            print(f"平均フレームレート: {stats['fps']} fps")
+            print(
+                f"遅延: 平均 {stats['latency_ms']} ms, p95 {stats['latency_p95_ms']} ms "
+                f"(目標内 {stats['within_target']:.0%})"
+            )
+
+    def _create_client(self, args: argparse.Namespace, config: AppConfig):
+        """常駐サーバーのクライアントを作成"""
+        from ..server.socket_client import FaceMosaicClient
+        from ..utils.hash_utils import settings_fingerprint
+
+        socket_path = args.socket or config.server.socket_path
+        return FaceMosaicClient(socket_path, settings_fingerprint(config))
+
+    def stop_server(self, args: argparse.Namespace) -> None:
+        """常駐サーバーを停止"""
+        client = self._create_client(args, AppConfig())
+        if client.ping(AppConfig().server.connect_timeout) is None:
+            print(f"サーバーは起動していません: {client.socket_path}")
+            return
+        client.fingerprint = None
+        client.shutdown()
+        print("サーバーに停止を要求しました")
+
+    def forward_to_server(self, args: argparse.Namespace) -> bool:
+        """
+        常駐サーバーに処理を転送
+
+        Returns:
+            転送して処理した場合はTrue（サーバーが使えずローカルで処理する場合はFalse）
+        """
+        if args.detect_only or args.render_from:
+            return False
+
+        # 常駐サーバーは画像のみ扱うため、動画（追跡設定を含む）はこのプロセスで処理する
+        if args.input.is_file() and is_video_file(
+            args.input, VideoConfig().supported_formats
+        ):
+            print("常駐サーバーは動画に対応していないため、このプロセスで処理します")
+            return False
+
+        # 実行方式・差分判定はサーバー側の設定で決まるため、指定時は転送しない
+        # （--resume はディレクトリのジョブと一緒に送る）
+        local_only = [
+            option
+            for option, enabled in (
+                ("--incremental", args.incremental),
+                ("--workers", args.workers > 1),
+                ("--pipeline", args.pipeline),
+            )
+            if enabled
+        ]
+        if local_only:
+            print(
+                f"警告: 常駐サーバーは {', '.join(local_only)} に対応していないため、"
+                "このプロセスで処理します"
+            )
+            return False
+
+        config = self.build_config(args)
+        client = self._create_client(args, config)
+        info = client.ping(config.server.connect_timeout)
+        if info is None:
+            print("常駐サーバーが起動していないため、このプロセスで処理します")
+            return False
+        if info["fingerprint"] != client.fingerprint:
+            print("常駐サーバーと設定が異なるため、このプロセスで処理します")
+            return False
+
+        if not self.confirm_processing(args):
+            print("処理をキャンセルしました")
+            return True
+
+        print(f"常駐サーバーに転送します (pid {info['pid']})")
+        start_time = time.time()
+        try:
+            if args.input.is_file():
+                result = client.process_file(args.input, args.output)
+                self.show_single_result(result, start_time)
+            else:
+                stats = client.process_directory(args.input, args.output, args.resume)
+                self.show_batch_results(stats, start_time)
+        except FaceMosaicError as e:
+            print(f"処理エラー: {e}")
+            sys.exit(1)
+        return True
+
     def confirm_processing(self, args: argparse.Namespace) -> bool:
         """処理実行の確認"""
         if args.no_confirm:
@@ -224,6 +1005,7 @@ class CLIApplication:
         print(f"モザイク比率: {args.ratio}")
         print(f"信頼度閾値: {args.confidence}")
         print(f"モザイク方式: {'ブラー' if args.blur else 'ピクセル化'}")
+        print(f"ワーカー数: {args.workers}")
 
         response = input("\n処理を開始しますか？ (y/N): ").strip().lower()
         return response in ["y", "yes"]
@@ -233,14 +1015,35 @@ class CLIApplication:
         start_time = time.time()
 
         try:
-            if args.input.is_file():
+            if args.detect_only:
+                # 検出のみ
+                stats = self.app.detect_only(args.input, args.output)
+                print(f"検出結果を保存しました: {stats['sidecar_path']}")
+                self.show_batch_results(stats, start_time)
+            elif args.render_from:
+                # 検出結果から描画
+                stats = self.app.render_from_sidecar(
+                    args.input, args.output, args.render_from
+                )
+                self.show_batch_results(stats, start_time)
+            elif args.input.is_file() and is_video_file(
+                args.input, self.app.config.video.supported_formats
+            ):
+                # 動画処理
+                video_config = self.app.config.video
+                video_config.tracking = args.track
+                video_config.detect_interval = args.detect_interval
+                video_config.persist_frames = args.persist_frames
+                result = self.app.process_video(args.input, args.output)
+                self.show_video_result(result)
+            elif args.input.is_file():
                 # 単一ファイル処理
                 result = self.app.process_single_image(args.input, args.output)
                 self.show_single_result(result, start_time)
             else:
                 # ディレクトリ処理
                 stats = self.app.process_directory(
-                    args.input, args.output, dry_run=args.dry_run
+                    args.input, args.output, dry_run=args.dry_run, resume=args.resume
                 )
                 self.show_batch_results(stats, start_time)
 
@@ -258,6 +1061,29 @@ class CLIApplication:
                 traceback.print_exc()
             sys.exit(1)
 
+    def show_video_result(self, result: dict) -> None:
+        """動画処理結果を表示"""
+        print(f"\n=== 処理結果 ===")
+        print(f"処理フレーム数: {result['frames']}")
+        if "segments" in result:
+            print(f"並列処理した区間: {result['segments']}")
+        print(f"モザイクを適用したフレーム: {result['frames_with_targets']}")
+        print(f"検出された顔: {result['faces_detected']} 個（延べ）")
+        if result["persisted_boxes"]:
+            print(f"保持・補間した枠: {result['persisted_boxes']} 個（延べ）")
+        if result["tracked_frames"]:
+            print(
+                f"検出回数: {result['detection_calls']} 回 "
+                f"(削減 {result['detections_saved']} 回, "
+                f"追跡したフレーム {result['tracked_frame_ratio']:.1%})"
+            )
+        print(
+            "音声の再多重化: "
+            + ("完了" if result["audio"] else "未実施（ffmpegが見つからないか失敗）")
+        )
+        print(f"出力ファイル: {result['output_path']}")
+        print(f"処理時間: {result['elapsed']:.2f} 秒 ({result['processing_fps']} fps)")
+
     def show_single_result(self, result: dict, start_time: float) -> None:
         """単一ファイル処理結果を表示"""
         elapsed_time = time.time() - start_time
@@ -280,6 +1106,8 @@ class CLIApplication:
         print(f"対象ファイル数: {stats['total']}")
         print(f"成功: {stats['success']} ファイル")
         print(f"失敗: {stats['failed']} ファイル")
+        if stats.get("skipped"):
+            print(f"スキップ: {stats['skipped']} ファイル")
         print(f"検出された顔: {stats['faces_detected']} 個")
         print(f"処理時間: {elapsed_time:.2f} 秒")
 
@@ -287,6 +1115,30 @@ class CLIApplication:
             avg_time = elapsed_time / stats["success"]
             print(f"平均処理時間: {avg_time:.2f} 秒/ファイル")
 
+        gates = [f["object_gate"] for f in stats["files"] if "object_gate" in f]
+        if any(gate.get("skipped") == "fixed_input_size" for gate in gates):
+            print(
+                "物体検出の事前判定: 入力サイズが固定の検出器のため省略しました"
+                "（--object-detector yolo / fasterrcnn で有効）"
+            )
+            gates = [gate for gate in gates if "skipped" not in gate]
+        if gates:
+            skipped = [gate for gate in gates if not gate["passed"]]
+            saving = sum(gate.get("estimated_saving", 0.0) for gate in skipped)
+            print(
+                f"物体検出の事前判定: {len(gates)} ファイル中 {len(skipped)} ファイルで"
+                f"本検出を省略 (推定削減 {saving:.2f} 秒)"
+            )
+
+        if "stage_times" in stats:
+            print("\n=== ステージ別稼働時間 ===")
+            for stage, timing in stats["stage_times"].items():
+                print(
+                    f"{stage}: 稼働 {timing['busy_time']:.2f} 秒 / "
+                    f"待機 {timing['idle_time']:.2f} 秒 "
+                    f"(稼働率 {timing['utilization'] * 100:.0f}%)"
+                )
+
         if stats["failed"] > 0:
             print(f"\n{stats['failed']} 個のファイルで処理に失敗しました")
             sys.exit(1)
@@ -302,26 +1154,68 @@ class CLIApplication:
         if not self.validate_arguments(parsed_args):
             sys.exit(1)
 
+        try:
+            self.dispatch(parsed_args)
+        finally:
+            # サーバー・監視・リアルタイム処理を含め、終了時にキャッシュを閉じる
+            self.close_application()
+
+    def dispatch(self, parsed_args: argparse.Namespace) -> None:
+        """
+        引数に応じて処理モードを実行
+
+        Args:
+            parsed_args: 検証済みのコマンドライン引数
+        """
         # システム情報表示のみの場合
         if parsed_args.info:
-            self.initialize_application(parsed_args)
             self.show_info()
             return
 
+        # ドライラン
+        if parsed_args.dry_run:
+            self.dry_run(parsed_args)
+            return
+
+        # 常駐サーバー
+        if parsed_args.serve:
+            self.serve(parsed_args)
+            return
+        if parsed_args.serve_http:
+            self.serve_http(parsed_args)
+            return
+        if parsed_args.jsonl:
+            self.process_json_lines(parsed_args)
+            return
+        if parsed_args.stop_server:
+            self.stop_server(parsed_args)
+            return
+        if parsed_args.server and self.forward_to_server(parsed_args):
+            return
+
+        # リアルタイム処理
+        if parsed_args.live is not None:
+            self.live(parsed_args)
+            return
+
+        # フォルダ監視
+        if parsed_args.watch:
+            self.watch(parsed_args)
+            return
+
         # アプリケーション初期化
         self.initialize_application(parsed_args)
 
+        # モデルバリアント比較
+        if parsed_args.compare_variants:
+            self.compare_variants(parsed_args)
+            return
+
         # 処理時間推定
         if parsed_args.estimate:
             self.estimate_processing_time(parsed_args)
             return
 
-        # ドライラン
-        if parsed_args.dry_run:
-            print("=== ドライラン ===")
-            self.process_files(parsed_args)
-            return
-
         # 確認プロンプト
         if not self.confirm_processing(parsed_args):
             print("処理をキャンセルしました")
@@ -330,6 +1224,12 @@ class CLIApplication:
         # 処理実行
         self.process_files(parsed_args)
 
+    def close_application(self) -> None:
+        """アプリケーションの終了処理（初期化済みの場合のみ）"""
+        if self.app is not None:
+            self.app.close()
+            self.app = None
+
 
 def main():
     """CLI版メイン関数"""
@@ -337,5 +1237,11 @@ def main():
     cli_app.run()
 
 
+def serve_main():
+    """常駐サーバーのメイン関数（face-mosaic-serve）"""
+    cli_app = CLIApplication()
+    cli_app.run(["--serve", *sys.argv[1:]])
+
+
 if __name__ == "__main__":
     main()
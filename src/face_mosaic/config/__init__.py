@@ -9,6 +9,11 @@ from .settings import (
     MosaicConfig,
     ProcessingConfig,
     ModelConfig,
+    ObjectDetectionConfig,
+    ServerConfig,
+    WatchConfig,
+    VideoConfig,
+    LiveConfig,
     default_config,
 )
 
@@ -18,5 +23,10 @@ __all__ = [
     "MosaicConfig",
     "ProcessingConfig",
     "ModelConfig",
+    "ObjectDetectionConfig",
+    "ServerConfig",
+    "WatchConfig",
+    "VideoConfig",
+    "LiveConfig",
     "default_config",
 ]
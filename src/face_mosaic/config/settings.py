@@ -3,8 +3,10 @@
 アプリケーション全体の設定を一元管理
 """
 
-from dataclasses import dataclass
-from typing import Tuple
+import os
+import tempfile
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
 from pathlib import Path
 
 
@@ -17,6 +19,17 @@ class DetectionConfig:
     nms_threshold: float = 0.3
     top_k: int = 5000
     input_size: Tuple[int, int] = (320, 320)
+    # 検出用プロキシ画像の最大辺（Noneの場合はProcessingConfig.max_image_size、0で縮小なし）。
+    # タイル検出時に未設定の場合は縮小せず元解像度でタイル分割する
+    detection_max_side: Optional[int] = None
+    # タイル分割検出（大画像の小さな顔向け）
+    tiling: bool = False
+    tile_size: int = 640
+    tile_overlap: float = 0.25  # 隣接タイルの重なり率
+    tile_scales: Tuple[float, ...] = (1.0,)  # 検出スケールのピラミッド
+    # タイルに収まらない大きな顔向けに、画像全体をタイルサイズまで縮小して検出する
+    tile_global_pass: bool = True
+    tile_threads: int = 1  # タイル検出の並列スレッド数
 
 
 @dataclass
@@ -41,9 +54,38 @@ class ProcessingConfig:
         ".tiff",
         ".webp",
     )
-    max_image_size: int = 4096
+    max_image_size: int = 4096  # 検出時の最大辺（出力画像は元解像度のまま）
     quality: int = 95
     preserve_metadata: bool = False
+    workers: int = 1  # 2以上でプロセスプールによる並列処理
+    threads: int = 1  # 2以上でスレッドプールと検出器プールによる並列処理
+    pipeline: bool = False  # 読み込み・検出・保存をステージ分割して処理
+    pipeline_queue_depth: int = 8  # ステージ間キューの最大長
+    pipeline_io_threads: int = 2  # 読み込み/保存ステージのスレッド数
+    journal: bool = True  # ディレクトリ処理の進捗を出力先の隣にジャーナル記録
+    incremental: bool = (
+        False  # 入力・設定が前回から変わらず出力が存在するファイルをスキップ
+    )
+    incremental_hash: bool = False  # 更新時刻が変わっても内容ハッシュが同じならスキップ
+    detection_cache_path: Optional[Path] = None  # 検出結果キャッシュ（Noneで無効）
+    detection_cache_max_entries: int = 100000
+
+
+@dataclass
+class ObjectDetectionConfig:
+    """物体検出設定"""
+
+    enabled: bool = False
+    detector_type: str = "yolo"  # "yolo", "fasterrcnn" または "onnx"
+    onnx_source: str = "yolo"  # "onnx" でONNX以外のモデルを指定した場合の変換元
+    model_path: Optional[str] = None
+    labels: Tuple[str, ...] = ()
+    gate: bool = False  # 縮小画像での事前判定で対象がない画像の本検出を省略
+    gate_max_side: int = 320  # 事前判定に使う画像の最大辺
+    gate_score_threshold: float = 0.1  # 事前判定の信頼度閾値（見逃し防止のため低め）
+    batch_size: int = 1  # 逐次処理時に物体検出をまとめて推論する画像数
+    precision: str = "fp32"  # "fp32" または "int8"（量子化、CPU向け）
+    calibration_dir: Optional[str] = None  # int8静的量子化の校正画像（ONNXのみ）
 
 
 @dataclass
@@ -56,6 +98,97 @@ class ModelConfig:
     )
     model_filename: str = "face_detection_yunet_2023mar.onnx"
     model_cache_dir: Path = Path.cwd()
+    # 使用するYuNetモデルのバリアント（"fp32" は yunet_model_url のモデル）
+    model_variant: str = "fp32"
+    # 量子化済みバリアントのダウンロードURL（ファイル名はURL末尾）
+    quantized_model_urls: Dict[str, str] = field(
+        default_factory=lambda: {
+            "int8": (
+                "https://github.com/opencv/opencv_zoo/raw/main/models/"
+                "face_detection_yunet/face_detection_yunet_2023mar_int8.onnx"
+            ),
+            "int8bq": (
+                "https://github.com/opencv/opencv_zoo/raw/main/models/"
+                "face_detection_yunet/face_detection_yunet_2023mar_int8bq.onnx"
+            ),
+        }
+    )
+
+
+def _default_socket_path() -> Path:
+    """ユーザーごとの常駐サーバーのソケットパス"""
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return Path(tempfile.gettempdir()) / f"face-mosaic-{uid}.sock"
+
+
+@dataclass
+class ServerConfig:
+    """常駐サーバー設定"""
+
+    socket_path: Path = field(default_factory=_default_socket_path)
+    connect_timeout: float = 1.0  # クライアントの接続確認のタイムアウト（秒）
+
+    # HTTPサーバー
+    http_host: str = "127.0.0.1"
+    http_port: int = 8080
+    http_workers: int = 4  # デコード・検出・エンコードを実行するスレッド数
+    batch_size: int = 8  # 同時に届いたリクエストをまとめて検出する最大枚数
+    batch_window_ms: float = 5.0  # まとめる相手を待つ最大時間（ミリ秒）
+    max_body_size: int = 64 * 1024 * 1024  # 受け付ける画像データの最大サイズ（バイト）
+
+
+@dataclass
+class WatchConfig:
+    """フォルダ監視設定"""
+
+    settle_time: float = (
+        1.0  # 書き込み完了とみなすまでサイズ・更新時刻が変化しない時間（秒）
+    )
+    poll_interval: float = 1.0  # inotify が使えない場合のスキャン間隔（秒）
+    use_inotify: bool = True  # Falseの場合は常にポーリング
+    archive_dir: Optional[Path] = (
+        None  # 処理済みの元ファイルの移動先（Noneで移動しない）
+    )
+
+
+@dataclass
+class VideoConfig:
+    """動画処理設定"""
+
+    supported_formats: Tuple[str, ...] = (".mp4", ".mov", ".m4v", ".avi", ".mkv")
+    fourcc: str = "mp4v"  # cv2.VideoWriter のコーデック
+    frames_in_flight: int = 0  # 同時に処理するフレーム数（0でスレッド数の2倍）
+    keep_audio: bool = True  # ffmpeg で元動画の音声を出力に再多重化
+    ffmpeg_path: str = "ffmpeg"
+    # 2プロセス以上（processing.workers）で処理する場合の1区間の最小フレーム数
+    min_segment_frames: int = 300
+
+    # 追跡（検出を間引き、間のフレームは検出枠をオプティカルフローで移動）
+    tracking: bool = False
+    detect_interval: int = 5  # 検出するフレームの間隔（シーンの切り替わりでも検出）
+    # シーンの切り替わりとみなす追跡用画像の平均絶対差（0〜255）
+    scene_cut_threshold: float = 30.0
+    tracking_margin: float = 0.15  # 追跡した枠の各辺を広げる割合
+    tracking_max_side: int = 480  # 追跡用画像の最大辺
+
+    # 枠の保持（検出が途切れても枠を残し、途切れた区間は前後の検出から補間）
+    # 枠を保持するフレーム数（0で無効。出力はこのフレーム数だけ遅れる）
+    persist_frames: int = 0
+    persist_iou: float = 0.3  # 前後のフレームの枠を同じ対象とみなすIoUの下限
+
+
+@dataclass
+class LiveConfig:
+    """カメラ・ストリームのリアルタイム処理設定"""
+
+    # 取り込みから出力までの遅延の目標（ミリ秒）。出力するフレームの検出が
+    # 目標内に終わりそうなら待ち、間に合わない場合は直前の検出枠を使う
+    target_latency_ms: float = 100.0
+    max_fps: float = 0.0  # 出力フレームレートの上限（0で入力に合わせる）
+    box_margin: float = 0.1  # 直前の検出枠を使う場合に各辺を広げる割合
+    stats_interval: float = 1.0  # 統計を表示する間隔（秒）
+    window_name: str = "face-mosaic"
+    fourcc: str = "mp4v"  # ファイルに出力する場合のコーデック
 
 
 @dataclass
@@ -76,6 +209,11 @@ class AppConfig:
         self.mosaic = MosaicConfig()
         self.processing = ProcessingConfig()
         self.model = ModelConfig()
+        self.object_detection = ObjectDetectionConfig()
+        self.server = ServerConfig()
+        self.watch = WatchConfig()
+        self.video = VideoConfig()
+        self.live = LiveConfig()
 
 
 # デフォルト設定インスタンス
@@ -3,15 +3,26 @@
 顔検出、画像処理、バッチ処理の核となる機能を提供
 """
 
-from .application import FaceMosaicApplication
-from .face_detector import FaceDetector
-from .image_processor import ImageProcessor
-from .batch_processor import BatchProcessor
-from .model_manager import ModelManager
-from .object_detector import ObjectDetector
-from ..core.yolov8_object_detector import YoloV8ObjectDetector
+from .._lazy import lazy_exports
+
 from .exceptions import *
 
+# 各クラスは参照時に読み込む（PEP 562）。cv2 は検出・画像処理の初回使用時、
+# torch/ultralytics は物体検出器の初回使用時まで読み込まない（ONNX使用時はtorch不要）
+_LAZY_ATTRIBUTES = {
+    "FaceMosaicApplication": ".application",
+    "FaceDetector": ".face_detector",
+    "ImageProcessor": ".image_processor",
+    "BatchProcessor": ".batch_processor",
+    "ModelManager": ".model_manager",
+    "ObjectDetector": ".object_detector",
+    "YoloV8ObjectDetector": ".yolov8_object_detector",
+    "OnnxObjectDetector": ".onnx_object_detector",
+}
+
+__getattr__, __dir__ = lazy_exports(_LAZY_ATTRIBUTES, globals())
+
+
 __all__ = [
     "FaceMosaicApplication",
     "FaceDetector",
@@ -20,4 +31,5 @@ __all__ = [
     "ModelManager",
     "ObjectDetector",
     "YoloV8ObjectDetector",
+    "OnnxObjectDetector",
 ]
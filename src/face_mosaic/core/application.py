@@ -3,14 +3,25 @@
 全体の処理を統合管理
 """
 
+import threading
+import time
 from pathlib import Path
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional, Callable, Iterable, List, TextIO
 
 from ..config.settings import AppConfig, default_config
 from ..core.model_manager import ModelManager
 from ..core.face_detector import FaceDetector
 from ..core.image_processor import ImageProcessor
 from ..core.batch_processor import BatchProcessor
+from ..core.detection_cache import DetectionCache
+from ..core.detector_pool import DetectorPool
+from ..core.model_registry import model_registry
+from ..core.folder_watcher import FolderWatchProcessor
+from ..core.live_processor import LiveStreamProcessor
+from ..core.stream_processor import JsonLinesProcessor
+from ..core.video_processor import SegmentedVideoProcessor, VideoProcessor
+from ..core.object_detector_factory import create_object_detector
+from ..core.variant_comparison import ModelVariantComparison
 from ..utils.system_info import get_system_info, check_requirements
 
 
@@ -29,12 +40,37 @@ class FaceMosaicApplication:
         # コンポーネント初期化
         self.model_manager = ModelManager(self.config.model)
         self.face_detector = FaceDetector(self.config.detection, self.model_manager)
+        self.detection_cache = None
+        # 構築済み物体検出器の設定（種類, モデルパス, 変換元, 精度, 校正画像）。
+        # 同じ設定での再構成時に再利用する
+        self._object_detector_key = None
+        # 直近の物体検出器の構成にかかった時間（秒）
+        self.object_detector_setup_time = 0.0
+        if self.config.processing.detection_cache_path is not None:
+            self.detection_cache = DetectionCache(
+                Path(self.config.processing.detection_cache_path),
+                self.config.processing.detection_cache_max_entries,
+            )
         self.image_processor = ImageProcessor(
-            self.face_detector, self.config.mosaic, self.config.processing
+            self.face_detector,
+            self.config.mosaic,
+            self.config.processing,
+            detection_cache=self.detection_cache,
         )
         self.batch_processor = BatchProcessor(
-            self.image_processor, self.config.processing
+            self.image_processor, self.config.processing, self.config
         )
+        self._build_detector_pools()
+
+        # 設定で物体検出が有効な場合は検出器を構築
+        object_config = self.config.object_detection
+        if object_config.enabled:
+            self.configure_object_detection(
+                True,
+                list(object_config.labels),
+                object_config.detector_type,
+                object_config.model_path,
+            )
 
     def process_single_image(
         self, input_path: Path, output_path: Path
@@ -51,12 +87,41 @@ class FaceMosaicApplication:
         """
         return self.image_processor.process_image_file(input_path, output_path)
 
+    def process_video(
+        self,
+        input_path: Path,
+        output_path: Path,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        動画を処理
+
+        ワーカー数が2以上の場合は動画を区間に分け、プロセスごとに処理する
+
+        Args:
+            input_path: 入力動画パス
+            output_path: 出力動画パス
+            progress_callback: 進捗コールバック (処理済みフレーム数, 総フレーム数)
+
+        Returns:
+            処理結果
+        """
+        workers = self.config.processing.workers
+        if workers > 1:
+            processor = SegmentedVideoProcessor(self.config, workers)
+        else:
+            processor = VideoProcessor(
+                self.image_processor, self.config.video, self.config.processing.threads
+            )
+        return processor.process_video(input_path, output_path, progress_callback)
+
     def process_directory(
         self,
         input_dir: Path,
         output_dir: Path,
         progress_callback: Optional[Callable[[int, int], None]] = None,
         dry_run: bool = False,
+        resume: bool = False,
     ) -> Dict[str, Any]:
         """
         ディレクトリを処理
@@ -66,13 +131,170 @@ class FaceMosaicApplication:
             output_dir: 出力ディレクトリ
             progress_callback: 進捗コールバック
             dry_run: ドライラン
+            resume: 前回の実行で処理済みのファイルをスキップ
 
         Returns:
             処理結果統計
         """
         return self.batch_processor.process_directory(
-            input_dir, output_dir, progress_callback, dry_run
+            input_dir, output_dir, progress_callback, dry_run, resume
+        )
+
+    def process_json_lines(self, source: Iterable[str], sink: TextIO) -> Dict[str, int]:
+        """
+        JSON Lines 形式のジョブを読み込んで処理し、結果を完了順に書き出す
+
+        Args:
+            source: ジョブの行を返すイテラブル（標準入力など）
+            sink: 結果の書き出し先（標準出力など）
+
+        Returns:
+            処理結果統計
+        """
+        processing = self.config.processing
+        processor = JsonLinesProcessor(
+            self.image_processor, processing.threads, processing.pipeline_queue_depth
+        )
+        return processor.run(source, sink)
+
+    def watch_directory(
+        self,
+        input_dir: Path,
+        output_dir: Path,
+        stop_event: Optional[threading.Event] = None,
+        on_result: Optional[
+            Callable[[Path, Optional[Dict], Optional[str]], None]
+        ] = None,
+    ) -> Dict[str, Any]:
+        """
+        ディレクトリを監視し、書き込まれた画像を停止要求まで処理し続ける
+
+        Args:
+            input_dir: 監視するディレクトリ
+            output_dir: 出力ディレクトリ
+            stop_event: 停止要求
+            on_result: 結果通知コールバック (入力パス, 処理結果辞書, エラーメッセージ)
+
+        Returns:
+            処理結果統計
+        """
+        processing = self.config.processing
+        watcher = FolderWatchProcessor(
+            self.image_processor,
+            self.config.watch,
+            processing.supported_formats,
+            processing.threads,
         )
+        return watcher.run(input_dir, output_dir, stop_event, on_result)
+
+    def process_live(
+        self,
+        source: str,
+        output: Any,
+        stop_event: threading.Event,
+        on_stats: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        カメラ・ストリームをリアルタイムに処理し、停止要求まで出力し続ける
+
+        Args:
+            source: カメラ番号、動画ファイルのパス、またはストリームのURL
+            output: 出力先（"window"、"-"（標準出力へ生フレーム）、名前付きパイプ・動画ファイルのパス）
+            stop_event: 停止要求
+            on_stats: 一定間隔で直近の統計を受け取るコールバック
+
+        Returns:
+            全体の統計
+        """
+        processor = LiveStreamProcessor(self.image_processor, self.config.live)
+        return processor.run(source, output, stop_event, on_stats)
+
+    def detect_only(
+        self,
+        input_path: Path,
+        sidecar_path: Path,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        検出のみを実行し、結果をサイドカーファイルに保存
+
+        Args:
+            input_path: 入力ファイルまたはディレクトリ
+            sidecar_path: 検出結果の保存先
+            progress_callback: 進捗コールバック
+
+        Returns:
+            処理結果統計
+        """
+        return self.batch_processor.detect_directory(
+            input_path, sidecar_path, progress_callback
+        )
+
+    def render_from_sidecar(
+        self,
+        input_path: Path,
+        output_path: Path,
+        sidecar_path: Path,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        サイドカーファイルの検出結果でモザイクを適用
+
+        Args:
+            input_path: 入力ファイルまたはディレクトリ
+            output_path: 出力ファイルまたはディレクトリ
+            sidecar_path: 検出結果ファイル
+            progress_callback: 進捗コールバック
+
+        Returns:
+            処理結果統計
+        """
+        return self.batch_processor.render_directory(
+            input_path, output_path, sidecar_path, progress_callback
+        )
+
+    def compare_model_variants(
+        self,
+        input_path: Path,
+        face_variants: Optional[List[str]] = None,
+        object_precisions: Optional[List[str]] = None,
+        sample_size: int = 20,
+    ) -> Dict[str, Any]:
+        """
+        通常版と量子化版のモデルの速度・検出結果の一致度を比較
+
+        Args:
+            input_path: 比較に使う画像ファイルまたはディレクトリ
+            face_variants: 比較するYuNetのバリアント（Noneの場合は全て、先頭が基準）
+            object_precisions: 比較する物体検出の精度（Noneの場合は比較しない）
+            sample_size: 使用する画像の最大枚数
+
+        Returns:
+            比較結果
+        """
+        comparison = ModelVariantComparison(self.config)
+        return comparison.compare(
+            input_path, face_variants, object_precisions, sample_size
+        )
+
+    def close(self) -> None:
+        """
+        終了処理
+
+        検出結果キャッシュへの未確定の書き込みを確定して閉じ、
+        タイル検出用のスレッドを終了する。2回目以降の呼び出しは何もしない
+        """
+        if self.detection_cache is not None:
+            self.detection_cache.close()
+            self.detection_cache = None
+            self.image_processor.detection_cache = None
+        self._close_face_detectors()
+
+    def __enter__(self) -> "FaceMosaicApplication":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     def get_file_list(self, input_dir: Path) -> list:
         """
@@ -134,10 +356,13 @@ class FaceMosaicApplication:
             "requirements_check": self.check_requirements(),
             "detector_info": self.face_detector.get_detector_info(),
             "processor_info": self.image_processor.get_processor_info(),
+            "model_registry": model_registry.get_stats(),
+            "object_detector_setup_time": self.object_detector_setup_time,
             "config": {
                 "detection": {
                     "method": self.config.detection.method,
                     "confidence_threshold": self.config.detection.confidence_threshold,
+                    "model_variant": self.model_manager.variant,
                 },
                 "mosaic": {
                     "ratio": self.config.mosaic.ratio,
@@ -146,6 +371,8 @@ class FaceMosaicApplication:
                 "processing": {
                     "supported_formats": self.config.processing.supported_formats,
                     "max_image_size": self.config.processing.max_image_size,
+                    "workers": self.config.processing.workers,
+                    "threads": self.config.processing.threads,
                 },
             },
         }
@@ -171,12 +398,161 @@ class FaceMosaicApplication:
         """
         if 0.1 <= threshold <= 1.0:
             self.config.detection.confidence_threshold = threshold
-            # 検出器を再初期化
+            # 検出器を再初期化（古い検出器のタイル検出用スレッドは終了する）
+            self._close_face_detectors()
             self.face_detector = FaceDetector(self.config.detection, self.model_manager)
             self.image_processor.face_detector = self.face_detector
+            self._build_detector_pools()
         else:
             raise ValueError("信頼度閾値は0.1から1.0の間で指定してください")
 
+    def update_workers(self, workers: int) -> None:
+        """
+        並列処理のワーカー数を更新
+
+        Args:
+            workers: ワーカープロセス数（1の場合は逐次処理）
+        """
+        if workers >= 1:
+            self.config.processing.workers = workers
+        else:
+            raise ValueError("ワーカー数は1以上で指定してください")
+
+    def update_threads(self, threads: int) -> None:
+        """
+        スレッド並列処理のスレッド数を更新
+
+        Args:
+            threads: スレッド数（1の場合は逐次処理）
+        """
+        if threads >= 1:
+            self.config.processing.threads = threads
+            self._close_pooled_face_detectors()
+            self._build_detector_pools()
+        else:
+            raise ValueError("スレッド数は1以上で指定してください")
+
+    def _close_pooled_face_detectors(self) -> None:
+        """顔検出器プールで追加生成した検出器のタイル検出用スレッドを終了"""
+        pool = self.image_processor.face_detector_pool
+        if pool is None:
+            return
+        for detector in pool.drain():
+            if detector is not self.face_detector:
+                detector.close()
+
+    def _close_face_detectors(self) -> None:
+        """共有の顔検出器とプールの検出器のタイル検出用スレッドを終了"""
+        self._close_pooled_face_detectors()
+        self.face_detector.close()
+
+    def _build_detector_pools(self) -> None:
+        """
+        スレッド数に合わせて検出器プールを構築
+
+        cv2.FaceDetectorYN は setInputSize で内部状態を書き換えるため、
+        スレッド並列時はスレッドごとに独立した検出器を使用する
+        """
+        threads = self.config.processing.threads
+        face_pool = object_pool = None
+
+        if threads > 1:
+            detection_config = self.config.detection
+            # 既存の検出器もプールに入れて読み込み済みモデルを再利用
+            face_pool = DetectorPool(
+                lambda: FaceDetector(detection_config, self.model_manager),
+                threads,
+                initial=[self.face_detector],
+            )
+
+            object_config = self.config.object_detection
+            object_detector = self.image_processor.object_detector
+            if object_config.enabled and object_detector:
+                object_pool = DetectorPool(
+                    # 推論は並列実行できないため、プール分は専用のモデルを読み込む
+                    lambda: create_object_detector(
+                        object_config.detector_type,
+                        object_config.model_path,
+                        shared=False,
+                        onnx_source=object_config.onnx_source,
+                        precision=object_config.precision,
+                        calibration_dir=object_config.calibration_dir,
+                    ),
+                    threads,
+                    initial=[object_detector],
+                )
+
+        self.image_processor.face_detector_pool = face_pool
+        self.image_processor.object_detector_pool = object_pool
+
+    def configure_object_detection(
+        self,
+        enabled: bool,
+        labels: Optional[List[str]] = None,
+        detector_type: str = "yolo",
+        model_path: Optional[str] = None,
+    ) -> None:
+        """
+        物体検出を設定
+
+        並列処理のワーカーでも同じ検出器を構築できるよう、設定にも反映する
+
+        Args:
+            enabled: 物体検出を使用するかどうか
+            labels: モザイクをかける物体のラベルリスト
+            detector_type: 検出器の種類（"yolo", "fasterrcnn" または "onnx"）
+            model_path: 物体検出モデルファイルパス
+        """
+        object_config = self.config.object_detection
+        object_config.enabled = enabled
+        object_config.detector_type = detector_type
+        object_config.model_path = model_path
+        object_config.labels = tuple(labels or [])
+
+        start = time.perf_counter()
+        key = (
+            (
+                detector_type,
+                model_path,
+                object_config.onnx_source,
+                object_config.precision,
+                object_config.calibration_dir,
+            )
+            if enabled
+            else None
+        )
+        reuse = (
+            key is not None
+            and key == self._object_detector_key
+            and self.image_processor.object_detector is not None
+        )
+
+        if not reuse:
+            object_detector = None
+            if enabled:
+                # モデル本体はレジストリから取得するため、読み込み済みなら再読み込みしない
+                object_detector = create_object_detector(
+                    detector_type,
+                    model_path,
+                    onnx_source=object_config.onnx_source,
+                    precision=object_config.precision,
+                    calibration_dir=object_config.calibration_dir,
+                )
+            self.image_processor.object_detector = object_detector
+            self._object_detector_key = key
+
+        self.image_processor.object_labels = list(object_config.labels)
+        self.image_processor.use_object_detection = enabled
+        self.image_processor.object_gate_max_side = (
+            object_config.gate_max_side if object_config.gate else 0
+        )
+        self.image_processor.object_gate_threshold = object_config.gate_score_threshold
+        self.image_processor.object_batch_size = max(1, object_config.batch_size)
+        if not reuse:
+            self._build_detector_pools()
+
+        self.object_detector_setup_time = time.perf_counter() - start
+
     def clear_model_cache(self) -> bool:
         """
         モデルキャッシュをクリア
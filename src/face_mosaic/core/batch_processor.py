@@ -5,19 +5,27 @@
 
 import time
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Tuple
 from tqdm import tqdm
 
-from ..config.settings import ProcessingConfig
+from ..config.settings import AppConfig, ProcessingConfig
+from ..core.detection_sidecar import DetectionSidecarWriter, load_detection_sidecar
 from ..core.image_processor import ImageProcessor
+from ..core.parallel_processor import ParallelProcessor, ThreadedProcessor
+from ..core.pipeline_processor import PipelineProcessor
+from ..core.progress_journal import ProgressJournal
 from ..utils.file_utils import get_image_files
+from ..utils.hash_utils import file_content_hash, settings_fingerprint
 
 
 class BatchProcessor:
     """バッチ処理クラス"""
 
     def __init__(
-        self, image_processor: ImageProcessor, processing_config: ProcessingConfig
+        self,
+        image_processor: ImageProcessor,
+        processing_config: ProcessingConfig,
+        app_config: Optional[AppConfig] = None,
     ):
         """
         初期化
@@ -25,9 +33,11 @@ class BatchProcessor:
         Args:
             image_processor: 画像処理インスタンス
             processing_config: 処理設定
+            app_config: アプリケーション設定（並列処理のワーカー構築に使用）
         """
         self.image_processor = image_processor
         self.processing_config = processing_config
+        self.app_config = app_config
 
     def process_directory(
         self,
@@ -35,6 +45,7 @@ class BatchProcessor:
         output_dir: Path,
         progress_callback: Optional[Callable[[int, int], None]] = None,
         dry_run: bool = False,
+        resume: bool = False,
     ) -> Dict[str, Any]:
         """
         ディレクトリ内の画像を一括処理
@@ -44,6 +55,7 @@ class BatchProcessor:
             output_dir: 出力ディレクトリ
             progress_callback: 進捗コールバック関数
             dry_run: ドライラン（実際の処理は行わない）
+            resume: 進捗ジャーナルで処理済みのファイルをスキップ
 
         Returns:
             処理結果統計
@@ -58,6 +70,7 @@ class BatchProcessor:
                 "total": 0,
                 "success": 0,
                 "failed": 0,
+                "skipped": 0,
                 "faces_detected": 0,
                 "processing_time": 0.0,
                 "files": [],
@@ -65,20 +78,49 @@ class BatchProcessor:
 
         print(f"対象ファイル数: {len(image_files)}")
 
+        fingerprint = None
+        journal_path = ProgressJournal.default_path(output_dir)
+        skip_mode = resume or self.processing_config.incremental
+        if self.app_config is not None:
+            fingerprint = settings_fingerprint(self.app_config)
+
         # ドライランの場合はファイル一覧のみ表示
         if dry_run:
+            journal = None
+            if skip_mode and fingerprint and journal_path.exists():
+                journal = ProgressJournal(journal_path)
+            try:
+                tasks, _, skipped = self._plan_tasks(
+                    image_files,
+                    input_dir,
+                    output_dir,
+                    journal,
+                    fingerprint,
+                    resume,
+                    dry_run=True,
+                )
+            finally:
+                if journal is not None:
+                    journal.close()
+
             print("\n=== 処理対象ファイル一覧 ===")
-            for img_file in image_files:
+            for img_file, _ in tasks:
                 rel_path = img_file.relative_to(input_dir)
                 print(f"  {rel_path}")
+            if skip_mode:
+                print(
+                    f"\n処理予定: {len(tasks)} ファイル / スキップ予定: {skipped} ファイル"
+                )
 
             return {
                 "total": len(image_files),
                 "success": 0,
                 "failed": 0,
+                "skipped": skipped,
+                "to_process": len(tasks),
                 "faces_detected": 0,
                 "processing_time": 0.0,
-                "files": [str(f.relative_to(input_dir)) for f in image_files],
+                "files": [str(f.relative_to(input_dir)) for f, _ in tasks],
             }
 
         # 統計情報初期化
@@ -86,37 +128,58 @@ class BatchProcessor:
             "total": len(image_files),
             "success": 0,
             "failed": 0,
+            "skipped": 0,
             "faces_detected": 0,
             "processing_time": 0.0,
             "files": [],
         }
 
+        # 進捗ジャーナル（中断後の再開・差分処理用）
+        journal = None
+        if fingerprint and (self.processing_config.journal or skip_mode):
+            journal = ProgressJournal(journal_path)
+
+        # 出力パスを決定（相対パス構造を保持）
+        tasks, file_stats, stats["skipped"] = self._plan_tasks(
+            image_files, input_dir, output_dir, journal, fingerprint, resume
+        )
+
+        if stats["skipped"]:
+            print(f"処理済みのためスキップ: {stats['skipped']} ファイル")
+
         # 処理開始
         start_time = time.time()
 
         # 進捗バー付きで処理
-        with tqdm(image_files, desc="画像処理中", unit="files") as pbar:
-            for i, img_file in enumerate(pbar):
-                try:
-                    # 出力パスを決定（相対パス構造を保持）
-                    rel_path = img_file.relative_to(input_dir)
-                    output_file = output_dir / rel_path
-
-                    # 画像処理実行
-                    result = self.image_processor.process_image_file(
-                        img_file, output_file
-                    )
-
+        try:
+            with tqdm(total=len(tasks), desc="画像処理中", unit="files") as pbar:
+
+                def on_result(
+                    img_file: Path,
+                    output_file: Path,
+                    result: Optional[Dict[str, Any]],
+                    error: Optional[str],
+                ) -> None:
                     # 統計更新
-                    if result["success"]:
-                        stats["success"] += 1
-                        stats["faces_detected"] += result["faces_detected"]
-                    else:
-                        stats["failed"] += 1
-
-                    stats["files"].append(result)
+                    self._update_stats(stats, img_file, output_file, result, error)
+
+                    # ジャーナルに記録
+                    if journal is not None:
+                        rel_path, size, mtime_ns, content_hash = file_stats[img_file]
+                        journal.record(
+                            rel_path,
+                            size,
+                            mtime_ns,
+                            fingerprint,
+                            success=error is None and result["success"],
+                            faces=result["faces_detected"] if result else 0,
+                            error=error,
+                            output_path=str(output_file),
+                            content_hash=content_hash,
+                        )
 
                     # 進捗バー更新
+                    pbar.update(1)
                     pbar.set_postfix(
                         {
                             "Success": stats["success"],
@@ -127,24 +190,364 @@ class BatchProcessor:
 
                     # 進捗コールバック呼び出し
                     if progress_callback:
-                        progress_callback(i + 1, len(image_files))
+                        progress_callback(len(stats["files"]), len(tasks))
+
+                workers = self.processing_config.workers
+                if self.processing_config.pipeline and workers <= 1:
+                    stats["stage_times"] = PipelineProcessor(
+                        self.image_processor, self.processing_config
+                    ).run(tasks, on_result)
+                else:
+                    self._run_tasks(tasks, on_result, "process_image_file")
+        finally:
+            if journal is not None:
+                journal.close()
 
-                except Exception as e:
-                    stats["failed"] += 1
-                    stats["files"].append(
-                        {
-                            "success": False,
-                            "error": str(e),
-                            "input_path": str(img_file),
-                            "output_path": str(
-                                output_dir / img_file.relative_to(input_dir)
-                            ),
-                        }
+        # 処理時間計算
+        stats["processing_time"] = time.time() - start_time
+
+        return stats
+
+    def _plan_tasks(
+        self,
+        image_files: List[Path],
+        input_dir: Path,
+        output_dir: Path,
+        journal: Optional[ProgressJournal],
+        fingerprint: Optional[str],
+        resume: bool,
+        dry_run: bool = False,
+    ) -> Tuple[List[Tuple[Path, Path]], Dict[Path, Tuple], int]:
+        """
+        ジャーナルを参照して処理対象タスクを決定
+
+        Args:
+            image_files: 画像ファイルリスト
+            input_dir: 入力ディレクトリ
+            output_dir: 出力ディレクトリ
+            journal: 進捗ジャーナル（Noneの場合はスキップ判定なし）
+            fingerprint: 設定フィンガープリント
+            resume: 処理済みのファイルをスキップ
+            dry_run: ドライラン（ジャーナルを更新しない）
+
+        Returns:
+            (タスクリスト, ジャーナル記録用のファイル情報, スキップ数) のタプル
+        """
+        incremental = self.processing_config.incremental
+        use_hash = incremental and self.processing_config.incremental_hash
+        tasks = []
+        file_stats = {}
+        skipped = 0
+
+        for img_file in image_files:
+            rel_path = img_file.relative_to(input_dir)
+            output_file = output_dir / rel_path
+
+            if journal is None:
+                tasks.append((img_file, output_file))
+                continue
+
+            key = rel_path.as_posix()
+            file_stat = img_file.stat()
+            size, mtime_ns = file_stat.st_size, file_stat.st_mtime_ns
+            content_hash = None
+
+            entry = journal.lookup(key) if (resume or incremental) else None
+            if (
+                entry is not None
+                and entry["status"] == "success"
+                and entry["fingerprint"] == fingerprint
+            ):
+                unchanged = (entry["size"], entry["mtime_ns"]) == (size, mtime_ns)
+                if incremental and not output_file.exists():
+                    # 出力が削除されている場合は再処理
+                    unchanged = False
+                elif (
+                    not unchanged
+                    and use_hash
+                    and entry["content_hash"]
+                    and entry["size"] == size
+                ):
+                    # 更新時刻のみ変わったファイルは内容ハッシュで判定
+                    content_hash = file_content_hash(img_file)
+                    unchanged = content_hash == entry["content_hash"]
+                    if unchanged and not dry_run:
+                        journal.update_mtime(key, mtime_ns)
+
+                if unchanged:
+                    skipped += 1
+                    continue
+
+            if use_hash and content_hash is None and not dry_run:
+                content_hash = file_content_hash(img_file)
+
+            file_stats[img_file] = (key, size, mtime_ns, content_hash)
+            tasks.append((img_file, output_file))
+
+        return tasks, file_stats, skipped
+
+    def _update_stats(
+        self,
+        stats: Dict[str, Any],
+        img_file: Path,
+        output_file: Optional[Path],
+        result: Optional[Dict[str, Any]],
+        error: Optional[str],
+    ) -> None:
+        """
+        1ファイルぶんの結果を統計に反映
+
+        Args:
+            stats: 処理結果統計
+            img_file: 入力ファイルパス
+            output_file: 出力ファイルパス
+            result: 処理結果辞書
+            error: エラーメッセージ
+        """
+        if error is not None:
+            stats["failed"] += 1
+            stats["files"].append(
+                {
+                    "success": False,
+                    "error": error,
+                    "input_path": str(img_file),
+                    "output_path": str(output_file),
+                }
+            )
+            print(f"エラー ({img_file.name}): {error}")
+        else:
+            if result["success"]:
+                stats["success"] += 1
+                stats["faces_detected"] += result["faces_detected"]
+            else:
+                stats["failed"] += 1
+            stats["files"].append(result)
+
+    def _run_tasks(
+        self,
+        tasks: List[Tuple[Path, Optional[Path]]],
+        on_result: Callable[
+            [Path, Optional[Path], Optional[Dict[str, Any]], Optional[str]], None
+        ],
+        method: str,
+    ) -> None:
+        """
+        設定に応じてタスクをプロセス並列・スレッド並列・逐次のいずれかで処理
+
+        Args:
+            tasks: (入力パス, 出力パス) のリスト
+            on_result: 結果通知コールバック
+            method: タスクごとに呼び出すImageProcessorのメソッド名
+        """
+        workers = self.processing_config.workers
+        threads = self.processing_config.threads
+        if workers > 1 and self.app_config is not None:
+            ParallelProcessor(self.app_config, workers).run(tasks, on_result, method)
+        elif threads > 1:
+            ThreadedProcessor(self.image_processor, threads).run(
+                tasks, on_result, method
+            )
+        elif (
+            method == "process_image_file"
+            and self.image_processor.use_object_detection
+            and self.image_processor.object_batch_size > 1
+        ):
+            self._run_batched(tasks, on_result)
+        else:
+            self._run_sequential(tasks, on_result, method)
+
+    def _run_batched(
+        self,
+        tasks: List[Tuple[Path, Optional[Path]]],
+        on_result: Callable[
+            [Path, Optional[Path], Optional[Dict[str, Any]], Optional[str]], None
+        ],
+    ) -> None:
+        """
+        タスクを物体検出のバッチサイズごとにまとめて処理
+
+        Args:
+            tasks: (入力パス, 出力パス) のリスト
+            on_result: 結果通知コールバック
+        """
+        batch_size = self.image_processor.object_batch_size
+        for start in range(0, len(tasks), batch_size):
+            batch = tasks[start : start + batch_size]
+            outcomes = self.image_processor.process_image_batch(batch)
+            for (img_file, output_file), (result, error) in zip(batch, outcomes):
+                on_result(img_file, output_file, result, error)
+
+    def _run_sequential(
+        self,
+        tasks: List[Tuple[Path, Optional[Path]]],
+        on_result: Callable[
+            [Path, Optional[Path], Optional[Dict[str, Any]], Optional[str]], None
+        ],
+        method: str = "process_image_file",
+    ) -> None:
+        """
+        タスクを逐次処理
+
+        Args:
+            tasks: (入力パス, 出力パス) のリスト
+            on_result: 結果通知コールバック
+            method: タスクごとに呼び出すImageProcessorのメソッド名
+        """
+        process = getattr(self.image_processor, method)
+        for img_file, output_file in tasks:
+            try:
+                result = process(img_file, output_file)
+            except Exception as e:
+                on_result(img_file, output_file, None, str(e))
+                continue
+
+            on_result(img_file, output_file, result, None)
+
+    def _collect_inputs(self, input_path: Path) -> Tuple[List[Path], Path]:
+        """
+        入力パス（ファイルまたはディレクトリ）から処理対象を取得
+
+        Args:
+            input_path: 入力ファイルまたはディレクトリ
+
+        Returns:
+            (画像ファイルリスト, 相対パスの基準ディレクトリ) のタプル
+        """
+        if input_path.is_file():
+            return [input_path], input_path.parent
+        return self.get_file_list(input_path), input_path
+
+    def detect_directory(
+        self,
+        input_path: Path,
+        sidecar_path: Path,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        検出のみを実行し、結果をサイドカーファイルに保存
+
+        Args:
+            input_path: 入力ファイルまたはディレクトリ
+            sidecar_path: 検出結果の保存先（JSON Lines, .gz で圧縮）
+            progress_callback: 進捗コールバック関数
+
+        Returns:
+            処理結果統計
+        """
+        image_files, base_dir = self._collect_inputs(input_path)
+        stats = {
+            "total": len(image_files),
+            "success": 0,
+            "failed": 0,
+            "faces_detected": 0,
+            "processing_time": 0.0,
+            "sidecar_path": str(sidecar_path),
+            "files": [],
+        }
+        tasks = [(img_file, None) for img_file in image_files]
+        settings = {"detection": self.image_processor.get_detection_signature()}
+
+        start_time = time.time()
+
+        with DetectionSidecarWriter(sidecar_path, settings) as writer, tqdm(
+            total=len(tasks), desc="検出中", unit="files"
+        ) as pbar:
+
+            def on_result(
+                img_file: Path,
+                output_file: Optional[Path],
+                result: Optional[Dict[str, Any]],
+                error: Optional[str],
+            ) -> None:
+                if result is not None and result["success"]:
+                    writer.write(
+                        img_file.relative_to(base_dir).as_posix(),
+                        result.pop("original_size"),
+                        result.pop("faces"),
+                        result.pop("objects"),
                     )
+                self._update_stats(stats, img_file, output_file, result, error)
 
-                    print(f"エラー ({img_file.name}): {e}")
+                pbar.update(1)
+                if progress_callback:
+                    progress_callback(len(stats["files"]), len(tasks))
+
+            self._run_tasks(tasks, on_result, "detect_image_file")
+
+        stats["processing_time"] = time.time() - start_time
+
+        return stats
+
+    def render_directory(
+        self,
+        input_path: Path,
+        output_path: Path,
+        sidecar_path: Path,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        サイドカーファイルの検出結果でモザイクを適用（検出モデルは読み込まない）
+
+        Args:
+            input_path: 入力ファイルまたはディレクトリ
+            output_path: 出力ファイルまたはディレクトリ
+            sidecar_path: 検出結果ファイル
+            progress_callback: 進捗コールバック関数
+
+        Returns:
+            処理結果統計
+        """
+        records = load_detection_sidecar(sidecar_path)
+        image_files, base_dir = self._collect_inputs(input_path)
+        stats = {
+            "total": len(image_files),
+            "success": 0,
+            "failed": 0,
+            "skipped": 0,
+            "faces_detected": 0,
+            "processing_time": 0.0,
+            "files": [],
+        }
+
+        tasks = []
+        for img_file in image_files:
+            rel_path = img_file.relative_to(base_dir).as_posix()
+            if input_path.is_file() and rel_path not in records:
+                # 単一ファイルの場合はディレクトリ検出時の相対パスとも照合
+                matches = [key for key in records if key.endswith("/" + rel_path)]
+                if len(matches) == 1:
+                    rel_path = matches[0]
+            if rel_path not in records:
+                # 検出結果のない画像は出力しない
+                stats["skipped"] += 1
+                continue
+            output_file = (
+                output_path if input_path.is_file() else output_path / rel_path
+            )
+            tasks.append((img_file, output_file, records[rel_path]))
+
+        if stats["skipped"]:
+            print(f"検出結果がないためスキップ: {stats['skipped']} ファイル")
+
+        start_time = time.time()
+
+        with tqdm(total=len(tasks), desc="再描画中", unit="files") as pbar:
+            for img_file, output_file, record in tasks:
+                faces = [face["box"] for face in record["faces"]]
+                objects = [obj["box"] for obj in record["objects"]]
+                try:
+                    result = self.image_processor.render_image_file(
+                        img_file, output_file, faces, objects
+                    )
+                    error = None
+                except Exception as e:
+                    result, error = None, str(e)
+                self._update_stats(stats, img_file, output_file, result, error)
+
+                pbar.update(1)
+                if progress_callback:
+                    progress_callback(len(stats["files"]), len(tasks))
 
-        # 処理時間計算
         stats["processing_time"] = time.time() - start_time
 
         return stats
@@ -190,12 +593,12 @@ class BatchProcessor:
             try:
                 start_time = time.time()
 
-                # 画像読み込みと顔検出のみ実行（保存はしない）
+                # 画像読み込みと検出のみ実行（保存はしない）
                 import cv2
 
                 image = cv2.imread(str(img_file))
                 if image is not None:
-                    self.image_processor.face_detector.detect_faces(image)
+                    self.image_processor.detect_targets(image)
 
                 sample_time = time.time() - start_time
                 total_sample_time += sample_time
@@ -0,0 +1,164 @@
+"""
+検出枠の追跡
+検出を行わないフレームでは、直前のフレームの検出枠をオプティカルフロー
+（cv2.calcOpticalFlowPyrLK）で移動させて使う
+"""
+
+from typing import List, Tuple
+
+import cv2
+import numpy as np
+
+Box = Tuple[int, int, int, int]
+
+# 1枠あたりの追跡点の最大数
+MAX_POINTS_PER_BOX = 24
+
+
+def make_tracking_image(frame: np.ndarray, max_side: int) -> Tuple[np.ndarray, float]:
+    """
+    追跡用の縮小グレースケール画像を作成
+
+    Args:
+        frame: フレーム（BGR形式）
+        max_side: 縮小後の最大辺（0以下の場合は縮小しない）
+
+    Returns:
+        (グレースケール画像, 縮小倍率) のタプル
+    """
+    height, width = frame.shape[:2]
+    if max_side <= 0 or max(width, height) <= max_side:
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY), 1.0
+    # 縮小してから変換する（変換する画素数を減らす）
+    scale = max_side / max(width, height)
+    size = (max(1, int(width * scale)), max(1, int(height * scale)))
+    small = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+    return cv2.cvtColor(small, cv2.COLOR_BGR2GRAY), scale
+
+
+def is_scene_cut(previous: np.ndarray, current: np.ndarray, threshold: float) -> bool:
+    """
+    シーンが切り替わったかどうかを判定
+
+    追跡用画像の画素値の平均絶対差で判定する
+
+    Args:
+        previous: 直前のフレームの追跡用画像
+        current: 現在のフレームの追跡用画像
+        threshold: 切り替わりとみなす平均絶対差（0〜255）
+
+    Returns:
+        切り替わった場合はTrue
+    """
+    return float(cv2.absdiff(previous, current).mean()) > threshold
+
+
+def _box_points(gray: np.ndarray, box: np.ndarray) -> np.ndarray:
+    """枠内の追跡点（特徴点、見つからない場合は格子点）を取得"""
+    height, width = gray.shape
+    x1, y1, x2, y2 = np.clip(box, 0, [width, height, width, height]).astype(int)
+    if x2 - x1 < 2 or y2 - y1 < 2:
+        return np.empty((0, 2), np.float32)
+
+    corners = cv2.goodFeaturesToTrack(
+        gray[y1:y2, x1:x2],
+        maxCorners=MAX_POINTS_PER_BOX,
+        qualityLevel=0.01,
+        minDistance=2,
+    )
+    if corners is not None and len(corners) >= 4:
+        return corners.reshape(-1, 2) + np.float32([x1, y1])
+
+    # 特徴の少ない領域は格子点を追跡する
+    xs = np.linspace(x1, x2 - 1, 5, dtype=np.float32)
+    ys = np.linspace(y1, y2 - 1, 5, dtype=np.float32)
+    return np.stack(np.meshgrid(xs, ys), axis=-1).reshape(-1, 2)
+
+
+def track_boxes(
+    previous: np.ndarray, current: np.ndarray, boxes: List[Box], scale: float
+) -> List[Box]:
+    """
+    検出枠を次のフレームへ移動
+
+    枠ごとに追跡点の移動量の中央値で平行移動し、点の広がりの比で拡大縮小する。
+    追跡できなかった枠は移動させずに残す（モザイクの取りこぼしを防ぐ）
+
+    Args:
+        previous: 直前のフレームの追跡用画像
+        current: 現在のフレームの追跡用画像
+        boxes: 直前のフレームの検出枠リスト（元解像度の (x, y, w, h)）
+        scale: 追跡用画像の縮小倍率
+
+    Returns:
+        現在のフレームの検出枠リスト（元解像度の (x, y, w, h)）
+    """
+    if not boxes:
+        return []
+
+    xywh = np.asarray(boxes, np.float32) * scale
+    corners = np.concatenate([xywh[:, :2], xywh[:, :2] + xywh[:, 2:]], axis=1)
+
+    # 全枠の追跡点をまとめて1回で追跡する
+    points = [_box_points(previous, box) for box in corners]
+    owners = np.repeat(np.arange(len(boxes)), [len(p) for p in points])
+    if len(owners) == 0:
+        return list(boxes)
+    start = np.concatenate(points).reshape(-1, 1, 2).astype(np.float32)
+    moved, status, _ = cv2.calcOpticalFlowPyrLK(
+        previous, current, start, None, winSize=(15, 15), maxLevel=2
+    )
+    start = start.reshape(-1, 2)
+    moved = moved.reshape(-1, 2)
+    valid = status.reshape(-1) == 1
+
+    tracked = []
+    for i, (x, y, w, h) in enumerate(xywh):
+        mask = valid & (owners == i)
+        if mask.sum() < 3:
+            tracked.append(boxes[i])
+            continue
+        p0, p1 = start[mask], moved[mask]
+        dx, dy = np.median(p1 - p0, axis=0)
+        spread0 = np.median(np.linalg.norm(p0 - np.median(p0, axis=0), axis=1))
+        spread1 = np.median(np.linalg.norm(p1 - np.median(p1, axis=0), axis=1))
+        ratio = float(np.clip(spread1 / spread0, 0.8, 1.25)) if spread0 > 0 else 1.0
+
+        cx, cy = x + w / 2 + dx, y + h / 2 + dy
+        w, h = w * ratio, h * ratio
+        tracked.append(
+            (
+                int(round((cx - w / 2) / scale)),
+                int(round((cy - h / 2) / scale)),
+                int(round(w / scale)),
+                int(round(h / scale)),
+            )
+        )
+    return tracked
+
+
+def expand_boxes(
+    boxes: List[Box], ratio: float, frame_size: Tuple[int, int]
+) -> List[Box]:
+    """
+    枠を上下左右に広げる（画像の範囲内に収める）
+
+    Args:
+        boxes: 枠リスト (x, y, w, h)
+        ratio: 幅・高さに対して各辺を広げる割合
+        frame_size: フレームサイズ (width, height)
+
+    Returns:
+        広げた枠リスト
+    """
+    if not boxes or ratio <= 0:
+        return list(boxes)
+    width, height = frame_size
+    expanded = []
+    for x, y, w, h in boxes:
+        mx, my = int(w * ratio), int(h * ratio)
+        x1, y1 = max(0, x - mx), max(0, y - my)
+        x2, y2 = min(width, x + w + mx), min(height, y + h + my)
+        if x2 > x1 and y2 > y1:
+            expanded.append((x1, y1, x2 - x1, y2 - y1))
+    return expanded
@@ -0,0 +1,180 @@
+"""
+検出結果キャッシュクラス
+画像内容と検出設定をキーに顔・物体の検出結果をSQLiteへ保存
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+Box = Tuple[int, int, int, int]
+
+
+class DetectionCache:
+    """LRU上限付きの永続検出結果キャッシュクラス"""
+
+    # 上限超過チェックを行う書き込み間隔
+    EVICTION_INTERVAL = 100
+    # 参照時刻の更新をまとめて書き込む件数
+    ACCESS_FLUSH_INTERVAL = 100
+
+    def __init__(self, cache_path: Path, max_entries: int = 100000):
+        """
+        初期化
+
+        Args:
+            cache_path: キャッシュファイルパス
+            max_entries: 保持する最大エントリ数（超過分は最終参照が古い順に削除）
+        """
+        self.cache_path = cache_path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        self._closed = False
+        # 未書き込みの参照時刻（キー → 時刻）
+        self._pending_access: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # パイプライン処理の検出スレッドからも使用するためスレッド共有を許可
+        self.connection = sqlite3.connect(
+            str(cache_path), timeout=30.0, check_same_thread=False
+        )
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS detections (
+                key TEXT PRIMARY KEY,
+                faces TEXT NOT NULL,
+                objects TEXT NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """)
+        self.connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_last_access ON detections (last_access)"
+        )
+        self.connection.commit()
+
+    def get(self, key: str) -> Optional[Tuple[List[Box], List[Box]]]:
+        """
+        検出結果を取得
+
+        Args:
+            key: キャッシュキー
+
+        Returns:
+            (顔座標リスト, 物体座標リスト) のタプル（未登録の場合はNone）
+        """
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT faces, objects FROM detections WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            # ヒットのたびにコミットしないよう参照時刻はまとめて書き込む
+            self._pending_access[key] = time.time()
+            if len(self._pending_access) >= self.ACCESS_FLUSH_INTERVAL:
+                self._flush_access()
+                self.connection.commit()
+            self.hits += 1
+
+        faces = [tuple(box) for box in json.loads(row[0])]
+        objects = [tuple(box) for box in json.loads(row[1])]
+        return faces, objects
+
+    def put(self, key: str, faces: List[Box], objects: List[Box]) -> None:
+        """
+        検出結果を登録
+
+        Args:
+            key: キャッシュキー
+            faces: 顔座標リスト
+            objects: 物体座標リスト
+        """
+        faces_json = json.dumps([[int(v) for v in box] for box in faces])
+        objects_json = json.dumps([[int(v) for v in box] for box in objects])
+
+        with self._lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO detections (key, faces, objects, last_access)"
+                " VALUES (?, ?, ?, ?)",
+                (key, faces_json, objects_json, time.time()),
+            )
+
+            self._writes += 1
+            if self._writes % self.EVICTION_INTERVAL == 0:
+                self._flush_access()
+                self._evict()
+
+            self.connection.commit()
+
+    def _flush_access(self) -> None:
+        """保留中の参照時刻を書き込む（コミットは呼び出し側で行う）"""
+        if self._pending_access:
+            self.connection.executemany(
+                "UPDATE detections SET last_access = ? WHERE key = ?",
+                [(access, key) for key, access in self._pending_access.items()],
+            )
+            self._pending_access.clear()
+
+    def _evict(self) -> None:
+        """上限を超えたエントリを最終参照が古い順に削除"""
+        count = self.connection.execute("SELECT COUNT(*) FROM detections").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            self.connection.execute(
+                "DELETE FROM detections WHERE key IN ("
+                "SELECT key FROM detections ORDER BY last_access LIMIT ?)",
+                (excess,),
+            )
+
+    def clear(self) -> None:
+        """キャッシュを全削除"""
+        with self._lock:
+            self._pending_access.clear()
+            self.connection.execute("DELETE FROM detections")
+            self.connection.commit()
+
+    def get_stats(self) -> dict:
+        """
+        キャッシュ統計を取得
+
+        Returns:
+            キャッシュ統計辞書
+        """
+        with self._lock:
+            entries = self.connection.execute(
+                "SELECT COUNT(*) FROM detections"
+            ).fetchone()[0]
+
+        return {
+            "path": str(self.cache_path),
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def close(self) -> None:
+        """キャッシュを閉じる（2回目以降の呼び出しは何もしない）"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._flush_access()
+            self._evict()
+            self.connection.commit()
+            self.connection.close()
+
+    def __enter__(self) -> "DetectionCache":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
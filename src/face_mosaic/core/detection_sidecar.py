@@ -0,0 +1,143 @@
+"""
+検出結果サイドカー
+検出のみの実行結果をJSON Lines形式で保存し、モデルなしでの再描画に使用
+"""
+
+import gzip
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from ..core.exceptions import ValidationError
+
+SIDECAR_FORMAT = "face_mosaic.detections"
+SIDECAR_VERSION = 1
+
+
+def _open_text(path: Path, mode: str):
+    """拡張子が .gz の場合はgzip圧縮してテキストファイルを開く"""
+    if path.suffix == ".gz":
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+class DetectionSidecarWriter:
+    """検出結果サイドカー書き込みクラス"""
+
+    def __init__(self, sidecar_path: Path, settings: Dict[str, Any] = None):
+        """
+        初期化
+
+        Args:
+            sidecar_path: サイドカーファイルパス（.gz の場合は圧縮）
+            settings: ヘッダに記録する検出設定
+        """
+        self.sidecar_path = sidecar_path
+        self.sidecar_path.parent.mkdir(parents=True, exist_ok=True)
+        self.count = 0
+
+        self._file = _open_text(sidecar_path, "w")
+        header = {
+            "format": SIDECAR_FORMAT,
+            "version": SIDECAR_VERSION,
+            "created_at": time.time(),
+            "settings": settings or {},
+        }
+        self._file.write(json.dumps(header, ensure_ascii=False) + "\n")
+
+    def write(
+        self,
+        path: str,
+        size: Tuple[int, int],
+        faces: List[Dict[str, Any]],
+        objects: List[Dict[str, Any]],
+    ) -> None:
+        """
+        1画像ぶんの検出結果を書き込み
+
+        顔は [x, y, w, h, 信頼度, ランドマーク10値]、
+        物体は [x, y, w, h, ラベル, スコア] の配列として保存する
+
+        Args:
+            path: 入力ディレクトリからの相対パス
+            size: 画像サイズ (width, height)
+            faces: 顔検出結果リスト
+            objects: 物体検出結果リスト
+        """
+        record = {
+            "path": path,
+            "size": list(size),
+            "faces": [
+                [*face["box"], face["confidence"]]
+                + [v for point in face["landmarks"] for v in point]
+                for face in faces
+            ],
+            "objects": [[*obj["box"], obj["label"], obj["score"]] for obj in objects],
+        }
+        self._file.write(
+            json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+        )
+        self.count += 1
+
+    def close(self) -> None:
+        """ファイルを閉じる"""
+        self._file.close()
+
+    def __enter__(self) -> "DetectionSidecarWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+def load_detection_sidecar(sidecar_path: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    検出結果サイドカーを読み込み
+
+    Args:
+        sidecar_path: サイドカーファイルパス
+
+    Returns:
+        相対パスをキーとする検出結果辞書
+        {path: {"size": (w, h), "faces": [{"box", "confidence", "landmarks"}],
+                "objects": [{"box", "label", "score"}]}}
+
+    Raises:
+        ValidationError: 形式が不正な場合
+    """
+    records = {}
+
+    with _open_text(sidecar_path, "r") as f:
+        try:
+            header = json.loads(f.readline())
+        except json.JSONDecodeError:
+            header = {}
+        if header.get("format") != SIDECAR_FORMAT:
+            raise ValidationError(f"検出結果ファイルの形式が不正です: {sidecar_path}")
+        if header.get("version", 0) > SIDECAR_VERSION:
+            raise ValidationError(
+                f"未対応の検出結果ファイルのバージョンです: {header.get('version')}"
+            )
+
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            records[record["path"]] = {
+                "size": tuple(record["size"]),
+                "faces": [
+                    {
+                        "box": tuple(face[:4]),
+                        "confidence": face[4],
+                        "landmarks": [face[i : i + 2] for i in range(5, 15, 2)],
+                    }
+                    for face in record["faces"]
+                ],
+                "objects": [
+                    {"box": tuple(obj[:4]), "label": obj[4], "score": obj[5]}
+                    for obj in record["objects"]
+                ],
+            }
+
+    return records
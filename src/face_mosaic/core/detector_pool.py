@@ -0,0 +1,137 @@
+"""
+検出器プールクラス
+独立に初期化した検出器を複数保持し、スレッドへ貸し出す
+"""
+
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from ..core.exceptions import DetectionError
+
+
+class DetectorPool:
+    """スレッドセーフな検出器プールクラス"""
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        size: int,
+        initial: Optional[List[Any]] = None,
+    ):
+        """
+        初期化
+
+        検出器は必要になった時点で最大 size 個まで生成する
+
+        Args:
+            factory: 検出器を1つ生成する関数
+            size: プールする検出器の最大数
+            initial: 生成済みの検出器リスト（読み込み済みモデルの再利用用）
+        """
+        if size < 1:
+            raise ValueError("プールサイズは1以上で指定してください")
+
+        self.size = size
+        self._factory = factory
+        self._available = queue.LifoQueue()
+        self._lock = threading.Lock()
+
+        initial = list(initial or [])[:size]
+        for detector in initial:
+            self._available.put(detector)
+        self._created = len(initial)
+
+    def checkout(self, timeout: Optional[float] = None) -> Any:
+        """
+        検出器を借り出す
+
+        空きがなく上限に達している場合は返却を待つ
+
+        Args:
+            timeout: 返却待ちの最大秒数（Noneの場合は無制限）
+
+        Returns:
+            検出器インスタンス
+
+        Raises:
+            DetectionError: 待機がタイムアウトした場合
+        """
+        try:
+            return self._available.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            create = self._created < self.size
+            if create:
+                self._created += 1
+
+        if create:
+            try:
+                return self._factory()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+
+        try:
+            return self._available.get(timeout=timeout)
+        except queue.Empty:
+            raise DetectionError("検出器の取得がタイムアウトしました")
+
+    def checkin(self, detector: Any) -> None:
+        """
+        検出器を返却
+
+        Args:
+            detector: checkout で借り出した検出器
+        """
+        self._available.put(detector)
+
+    @contextmanager
+    def acquire(self, timeout: Optional[float] = None) -> Iterator[Any]:
+        """
+        with文の間だけ検出器を借り出す
+
+        Args:
+            timeout: 返却待ちの最大秒数
+
+        Yields:
+            検出器インスタンス
+        """
+        detector = self.checkout(timeout)
+        try:
+            yield detector
+        finally:
+            self.checkin(detector)
+
+    def drain(self) -> List[Any]:
+        """
+        貸し出し中でない検出器をすべて取り出す（プールを破棄する前の後始末用）
+
+        Returns:
+            取り出した検出器のリスト
+        """
+        detectors = []
+        while True:
+            try:
+                detectors.append(self._available.get_nowait())
+            except queue.Empty:
+                return detectors
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        プール統計を取得
+
+        Returns:
+            プール統計辞書
+        """
+        with self._lock:
+            created = self._created
+        return {
+            "size": self.size,
+            "created": created,
+            "available": self._available.qsize(),
+        }
@@ -3,6 +3,8 @@
 アプリケーション固有のエラーハンドリング
 """
 
+from typing import Optional
+
 
 class FaceMosaicError(Exception):
     """基底例外クラス"""
@@ -52,6 +54,12 @@ class UnsupportedFormatError(ImageProcessingError):
     pass
 
 
+class VideoProcessingError(ImageProcessingError):
+    """動画処理エラー"""
+
+    pass
+
+
 class ConfigurationError(FaceMosaicError):
     """設定エラー"""
 
@@ -62,3 +70,12 @@ class ValidationError(FaceMosaicError):
     """バリデーションエラー"""
 
     pass
+
+
+class ServerError(FaceMosaicError):
+    """常駐サーバーとの通信・処理エラー"""
+
+    def __init__(self, message: str, error_type: Optional[str] = None):
+        super().__init__(message)
+        # サーバー側で発生した例外の種類（"SettingsMismatch" など）
+        self.error_type = error_type
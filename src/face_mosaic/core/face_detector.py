@@ -3,14 +3,23 @@
 YuNetを使用した高精度顔検出
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import cv2
 import numpy as np
 from typing import List, Tuple, Optional
 from pathlib import Path
 
 from ..config.settings import DetectionConfig
+from ..core.detector_pool import DetectorPool
 from ..core.exceptions import DetectionError, ModelLoadError
 from ..core.model_manager import ModelManager
+from ..utils.box_utils import generate_tiles, non_max_suppression
+
+# YuNet出力のうちx座標・y座標を表す列（矩形左上とランドマーク5点）
+_X_COLUMNS = [0, 4, 6, 8, 10, 12]
+_Y_COLUMNS = [1, 5, 7, 9, 11, 13]
 
 
 class FaceDetector:
@@ -27,138 +36,319 @@ class FaceDetector:
         self.config = config
         self.model_manager = model_manager
         self.detector = None
-        self._initialize_detector()
+        self._init_lock = threading.Lock()
+        # タイル検出用のスレッドと検出器（初回のタイル検出で生成し、以降使い回す）
+        self._tile_executor: Optional[ThreadPoolExecutor] = None
+        self._tile_pool: Optional[DetectorPool] = None
 
     def _initialize_detector(self) -> None:
         """
-        検出器を初期化
+        検出器を初期化（初回の検出時に実行）
+
+        検出結果から再描画するだけの場合などにモデル読み込みを省略できるよう、
+        コンストラクタでは初期化しない
 
         Raises:
             ModelLoadError: モデル読み込み失敗時
         """
-        try:
-            # モデルファイルを確保
-            model_path = self.model_manager.ensure_model_available()
-
-            # YuNet検出器を初期化
-            self.detector = cv2.FaceDetectorYN.create(
-                str(model_path),
-                "",
-                self.config.input_size,
-                self.config.confidence_threshold,
-                self.config.nms_threshold,
-                self.config.top_k,
-            )
+        with self._init_lock:
+            if self.detector is not None:
+                return
+            self._load_detector()
+
+    def _load_detector(self) -> None:
+        """
+        YuNet検出器を読み込み
 
+        Raises:
+            ModelLoadError: モデル読み込み失敗時
+        """
+        try:
+            self.detector = self._create_detector()
             print("OpenCV YuNet Face Detection を初期化しました")
 
         except Exception as e:
             raise ModelLoadError(f"YuNet検出器の初期化に失敗しました: {e}")
 
-    def detect_faces(self, image: np.ndarray) -> List[Tuple[int, int, int, int]]:
+    def _create_detector(self):
         """
-        画像から顔を検出
+        YuNet検出器インスタンスを生成
+
+        Returns:
+            cv2.FaceDetectorYN インスタンス
+        """
+        # モデルファイルを確保
+        model_path = self.model_manager.ensure_model_available()
+
+        return cv2.FaceDetectorYN.create(
+            str(model_path),
+            "",
+            self.config.input_size,
+            self.config.confidence_threshold,
+            self.config.nms_threshold,
+            self.config.top_k,
+        )
+
+    def _get_tile_workers(
+        self, threads: int
+    ) -> Tuple[ThreadPoolExecutor, DetectorPool]:
+        """
+        タイル検出用のスレッドプールと検出器プールを取得
+
+        どちらもインスタンスの生存期間中に1度だけ生成し、画像をまたいで使い回す
+
+        Args:
+            threads: 並列スレッド数
+
+        Returns:
+            (スレッドプール, 検出器プール)
+        """
+        with self._init_lock:
+            if self._tile_executor is None:
+                self._tile_executor = ThreadPoolExecutor(
+                    max_workers=threads, thread_name_prefix="face-tile"
+                )
+                self._tile_pool = DetectorPool(self._create_detector, threads)
+            return self._tile_executor, self._tile_pool
+
+    def close(self) -> None:
+        """タイル検出用のスレッドプールを終了"""
+        with self._init_lock:
+            executor, self._tile_executor = self._tile_executor, None
+            self._tile_pool = None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _run_detector(self, detector, image: np.ndarray) -> np.ndarray:
+        """
+        検出器を1回実行
 
         Args:
+            detector: cv2.FaceDetectorYN インスタンス
             image: 入力画像（BGR形式）
 
         Returns:
-            検出された顔の座標リスト [(x, y, w, h), ...]
+            YuNetの生出力 (N, 15) [x, y, w, h, ランドマーク10値, 信頼度]
+        """
+        height, width = image.shape[:2]
+        detector.setInputSize((width, height))
+        _, faces = detector.detect(image)
+
+        if faces is None:
+            return np.empty((0, 15), dtype=np.float32)
+        return faces
+
+    def _detect_rows(self, image: np.ndarray) -> np.ndarray:
+        """
+        設定に応じて全体検出またはタイル検出を実行
+
+        Args:
+            image: 入力画像（BGR形式）
+
+        Returns:
+            YuNetの生出力形式の検出結果 (N, 15)
 
         Raises:
             DetectionError: 検出処理失敗時
         """
-        if self.detector is None:
-            raise DetectionError("検出器が初期化されていません")
-
         if image is None or image.size == 0:
             raise DetectionError("無効な画像です")
 
+        if self.detector is None:
+            self._initialize_detector()
+
         try:
-            # 画像サイズを設定
-            height, width = image.shape[:2]
-            self.detector.setInputSize((width, height))
+            if self.config.tiling:
+                return self._detect_tiled(image)
+            return self._run_detector(self.detector, image)
 
-            # 顔検出実行
-            _, faces = self.detector.detect(image)
+        except Exception as e:
+            raise DetectionError(f"顔検出に失敗しました: {e}")
 
-            if faces is None:
-                return []
+    def _detect_tiled(self, image: np.ndarray) -> np.ndarray:
+        """
+        画像を重なりのあるタイルに分割し、複数スケールで検出
 
-            # 結果を整数座標に変換
-            face_list = []
-            for face in faces:
-                x, y, w, h = face[:4].astype(int)
-                # 負の値や画像外の座標をクリップ
-                x = max(0, min(x, width - 1))
-                y = max(0, min(y, height - 1))
-                w = max(1, min(w, width - x))
-                h = max(1, min(h, height - y))
-                face_list.append((x, y, w, h))
+        タイルより大きな顔向けに画像全体を縮小した検出も加え（tile_global_pass）、
+        各検出結果を元画像座標に戻して全体でNMSを行って統合する
 
-            return face_list
+        Args:
+            image: 入力画像（BGR形式）
 
-        except Exception as e:
-            raise DetectionError(f"顔検出に失敗しました: {e}")
+        Returns:
+            YuNetの生出力形式の検出結果 (N, 15)
+        """
+        height, width = image.shape[:2]
+        jobs = []
+
+        for scale in self.config.tile_scales:
+            if scale == 1.0:
+                scaled_image = image
+            else:
+                scaled_image = cv2.resize(
+                    image,
+                    (max(1, int(width * scale)), max(1, int(height * scale))),
+                    interpolation=cv2.INTER_AREA if scale < 1.0 else cv2.INTER_LINEAR,
+                )
+            scaled_height, scaled_width = scaled_image.shape[:2]
+
+            for tile in generate_tiles(
+                scaled_width,
+                scaled_height,
+                self.config.tile_size,
+                self.config.tile_overlap,
+            ):
+                jobs.append((scaled_image, tile, scale))
+
+        # どのスケールでも1枚のタイルに収まらない場合は、画像全体を縮小して検出し、
+        # タイルの境界をまたぐ大きな顔も1つの枠として検出する
+        max_side = max(width, height)
+        tile_size = self.config.tile_size
+        if self.config.tile_global_pass and all(
+            max_side * scale > tile_size for scale in self.config.tile_scales
+        ):
+            scale = tile_size / max_side
+            global_image = cv2.resize(
+                image,
+                (max(1, int(width * scale)), max(1, int(height * scale))),
+                interpolation=cv2.INTER_AREA,
+            )
+            global_height, global_width = global_image.shape[:2]
+            jobs.append((global_image, (0, 0, global_width, global_height), scale))
+
+        threads = max(1, self.config.tile_threads) if len(jobs) > 1 else 1
+
+        pool = None
+        if threads > 1:
+            executor, pool = self._get_tile_workers(threads)
+
+        def detect_tile(job) -> np.ndarray:
+            scaled_image, (x, y, w, h), scale = job
+            crop = np.ascontiguousarray(scaled_image[y : y + h, x : x + w])
+            if pool is None:
+                rows = self._run_detector(self.detector, crop).copy()
+            else:
+                with pool.acquire() as detector:
+                    rows = self._run_detector(detector, crop).copy()
+            # タイル座標 → 元画像座標（x, yとランドマークはオフセット、全体を倍率で戻す）
+            rows[:, _X_COLUMNS] += x
+            rows[:, _Y_COLUMNS] += y
+            rows[:, :14] /= scale
+            return rows
+
+        if pool is not None:
+            results = list(executor.map(detect_tile, jobs))
+        else:
+            results = [detect_tile(job) for job in jobs]
+
+        rows = np.concatenate(results) if results else np.empty((0, 15))
+        if len(rows) == 0:
+            return rows.astype(np.float32)
+
+        keep = non_max_suppression(rows[:, :4], rows[:, 14], self.config.nms_threshold)
+        return rows[keep].astype(np.float32)
+
+    def _to_face_list(self, rows: np.ndarray, image: np.ndarray) -> list:
+        """
+        生出力を画像内にクリップした整数座標に変換
 
-    def detect_faces_with_confidence(
-        self, image: np.ndarray
-    ) -> List[Tuple[int, int, int, int, float]]:
+        Args:
+            rows: YuNetの生出力形式の検出結果 (N, 15)
+            image: 入力画像
+
+        Returns:
+            [(x, y, w, h, confidence), ...]
         """
-        信頼度付きで顔を検出
+        height, width = image.shape[:2]
+        face_list = []
+        for face in rows:
+            x, y, w, h = face[:4].astype(int)
+            confidence = float(face[14])  # YuNetの信頼度は14番目の要素
+
+            # 負の値や画像外の座標をクリップ
+            x = max(0, min(x, width - 1))
+            y = max(0, min(y, height - 1))
+            w = max(1, min(w, width - x))
+            h = max(1, min(h, height - y))
+
+            face_list.append((x, y, w, h, confidence))
+
+        return face_list
+
+    def detect_face_details(self, image: np.ndarray) -> List[dict]:
+        """
+        信頼度とランドマーク付きで顔を検出
 
         Args:
             image: 入力画像（BGR形式）
 
         Returns:
-            検出された顔の座標と信頼度リスト [(x, y, w, h, confidence), ...]
+            検出結果リスト
+            [{"box": (x, y, w, h), "confidence": float,
+              "landmarks": [[x, y], ...（右目, 左目, 鼻, 右口角, 左口角）]}, ...]
 
         Raises:
             DetectionError: 検出処理失敗時
         """
-        if self.detector is None:
-            raise DetectionError("検出器が初期化されていません")
+        rows = self._detect_rows(image)
+        faces = []
+        for row, (x, y, w, h, confidence) in zip(rows, self._to_face_list(rows, image)):
+            faces.append(
+                {
+                    "box": (int(x), int(y), int(w), int(h)),
+                    "confidence": round(confidence, 4),
+                    "landmarks": np.round(row[4:14].reshape(5, 2), 1).tolist(),
+                }
+            )
 
-        if image is None or image.size == 0:
-            raise DetectionError("無効な画像です")
+        return faces
 
-        try:
-            # 画像サイズを設定
-            height, width = image.shape[:2]
-            self.detector.setInputSize((width, height))
+    def detect_faces(self, image: np.ndarray) -> List[Tuple[int, int, int, int]]:
+        """
+        画像から顔を検出
 
-            # 顔検出実行
-            _, faces = self.detector.detect(image)
+        Args:
+            image: 入力画像（BGR形式）
 
-            if faces is None:
-                return []
+        Returns:
+            検出された顔の座標リスト [(x, y, w, h), ...]
 
-            # 結果を整数座標と信頼度に変換
-            face_list = []
-            for face in faces:
-                x, y, w, h = face[:4].astype(int)
-                confidence = float(face[14])  # YuNetの信頼度は14番目の要素
+        Raises:
+            DetectionError: 検出処理失敗時
+        """
+        rows = self._detect_rows(image)
+        return [face[:4] for face in self._to_face_list(rows, image)]
 
-                # 負の値や画像外の座標をクリップ
-                x = max(0, min(x, width - 1))
-                y = max(0, min(y, height - 1))
-                w = max(1, min(w, width - x))
-                h = max(1, min(h, height - y))
+    def detect_faces_with_confidence(
+        self, image: np.ndarray
+    ) -> List[Tuple[int, int, int, int, float]]:
+        """
+        信頼度付きで顔を検出
 
-                face_list.append((x, y, w, h, confidence))
+        Args:
+            image: 入力画像（BGR形式）
 
-            return face_list
+        Returns:
+            検出された顔の座標と信頼度リスト [(x, y, w, h, confidence), ...]
 
-        except Exception as e:
-            raise DetectionError(f"顔検出に失敗しました: {e}")
+        Raises:
+            DetectionError: 検出処理失敗時
+        """
+        rows = self._detect_rows(image)
+        return self._to_face_list(rows, image)
 
     def is_available(self) -> bool:
         """
         検出器が利用可能かチェック
 
         Returns:
-            利用可能かどうか
+            利用可能かどうか（未初期化の場合は初期化を試みる）
         """
+        if self.detector is None:
+            try:
+                self._initialize_detector()
+            except ModelLoadError:
+                return False
         return self.detector is not None
 
     def get_detector_info(self) -> dict:
@@ -174,5 +364,6 @@ class FaceDetector:
             "confidence_threshold": self.config.confidence_threshold,
             "nms_threshold": self.config.nms_threshold,
             "input_size": self.config.input_size,
+            "tiling": self.config.tiling,
             "model_info": self.model_manager.get_model_info(),
         }
@@ -0,0 +1,464 @@
+"""
+フォルダ監視クラス
+入力ディレクトリに書き込まれたファイルを inotify（使えない環境ではポーリング）で検知し、
+書き込みが落ち着いたものから順に処理する
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import shutil
+import struct
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from ..config.settings import WatchConfig
+from ..core.image_processor import ImageProcessor
+
+# inotify のイベント種別（<sys/inotify.h>）
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+_WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE_SELF
+_EVENT = struct.Struct("iIII")
+
+FileSignature = Tuple[int, int]  # (サイズ, 更新時刻 ns)
+
+
+def _signature(path: Path) -> Optional[FileSignature]:
+    """ファイルのサイズと更新時刻を取得（存在しない場合はNone）"""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _scan_files(directory: Path) -> Iterator[Tuple[Path, FileSignature]]:
+    """ディレクトリ以下のファイルとシグネチャを列挙"""
+    stack = [directory]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = list(os.scandir(current))
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(Path(entry.path))
+                elif entry.is_file():
+                    stat = entry.stat()
+                    yield Path(entry.path), (stat.st_size, stat.st_mtime_ns)
+            except OSError:
+                continue
+
+
+class PollingWatcher:
+    """定期的なスキャンでファイルの追加・更新を検知するクラス"""
+
+    name = "polling"
+
+    def __init__(self, directory: Path, interval: float = 1.0):
+        """
+        初期化
+
+        Args:
+            directory: 監視するディレクトリ
+            interval: スキャン間隔（秒）
+        """
+        self.directory = directory
+        self.interval = interval
+        # 直前のスキャン時点のファイル（ディレクトリにあるファイル数に比例）
+        self._snapshot: Dict[Path, FileSignature] = {}
+        self._next_scan = 0.0
+
+    def read(self, timeout: float) -> List[Path]:
+        """
+        前回のスキャン以降に追加・更新されたファイルを取得
+
+        初回は既存のファイルを全て返す
+
+        Args:
+            timeout: 次のスキャンまで待つ最大時間（秒）
+
+        Returns:
+            ファイルパスのリスト
+        """
+        wait_time = self._next_scan - time.monotonic()
+        if wait_time > 0:
+            time.sleep(min(wait_time, timeout))
+            if time.monotonic() < self._next_scan:
+                return []
+        self._next_scan = time.monotonic() + self.interval
+
+        snapshot = dict(_scan_files(self.directory))
+        changed = [
+            path
+            for path, signature in snapshot.items()
+            if self._snapshot.get(path) != signature
+        ]
+        self._snapshot = snapshot
+        return changed
+
+    def close(self) -> None:
+        """監視を終了"""
+
+
+class InotifyWatcher:
+    """inotify で書き込み完了・移動されたファイルを検知するクラス（Linuxのみ）"""
+
+    name = "inotify"
+
+    def __init__(self, directory: Path):
+        """
+        初期化
+
+        Args:
+            directory: 監視するディレクトリ（サブディレクトリも監視する）
+
+        Raises:
+            OSError: inotify が使えない場合
+        """
+        libc_name = ctypes.util.find_library("c")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(self._libc, "inotify_init1"):
+            raise OSError("inotify を使用できません")
+
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify の初期化に失敗しました")
+
+        self.directory = directory
+        self._watches: Dict[int, Path] = {}
+        # 監視開始前・監視追加前に書き込まれたファイル（初回と取りこぼし時に返す）
+        self._backlog: List[Path] = []
+        try:
+            self._add_tree(directory)
+        except OSError:
+            self.close()
+            raise
+
+    def _add_tree(self, directory: Path) -> None:
+        """ディレクトリ以下を監視に追加し、既存のファイルを取りこぼし分として記録"""
+        for current, _, _ in os.walk(directory):
+            wd = self._libc.inotify_add_watch(
+                self._fd, os.fsencode(current), _WATCH_MASK
+            )
+            if wd < 0:
+                raise OSError(ctypes.get_errno(), f"監視を追加できません: {current}")
+            self._watches[wd] = Path(current)
+        # 監視を追加した後に列挙し、その間に書き込まれたファイルも拾う
+        self._backlog.extend(path for path, _ in _scan_files(directory))
+
+    def read(self, timeout: float) -> List[Path]:
+        """
+        書き込みが完了した・移動されてきたファイルを取得
+
+        初回は既存のファイルも返す。イベントキューが溢れた場合は全体を再スキャンする
+
+        Args:
+            timeout: イベントを待つ最大時間（秒）
+
+        Returns:
+            ファイルパスのリスト
+        """
+        if self._backlog:
+            paths, self._backlog = self._backlog, []
+            return paths
+
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return []
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+
+        paths = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size
+            name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                # 取りこぼしたイベントは全体の再スキャンで補う
+                paths.extend(path for path, _ in _scan_files(self.directory))
+                continue
+            if mask & IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+            parent = self._watches.get(wd)
+            if parent is None or not name:
+                continue
+
+            path = parent / os.fsdecode(name)
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    try:
+                        self._add_tree(path)
+                    except OSError:
+                        # 作成直後に削除された場合など
+                        pass
+            elif mask & (IN_CLOSE_WRITE | IN_MOVED_TO):
+                paths.append(path)
+
+        paths.extend(self._backlog)
+        self._backlog = []
+        return paths
+
+    def close(self) -> None:
+        """監視を終了"""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def create_watcher(directory: Path, config: WatchConfig):
+    """
+    監視クラスを作成（inotify が使えない場合はポーリング）
+
+    Args:
+        directory: 監視するディレクトリ
+        config: フォルダ監視設定
+
+    Returns:
+        InotifyWatcher または PollingWatcher
+    """
+    if config.use_inotify:
+        try:
+            return InotifyWatcher(directory)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(directory, config.poll_interval)
+
+
+class FileSettler:
+    """書き込み中のファイルを除外し、一定時間変化のないファイルを返すクラス"""
+
+    def __init__(self, settle_time: float):
+        """
+        初期化
+
+        Args:
+            settle_time: サイズ・更新時刻が変化しない状態が続く必要のある時間（秒）
+        """
+        self.settle_time = settle_time
+        # パス -> (最後に確認したシグネチャ, そのシグネチャを最初に確認した時刻)
+        self._pending: Dict[Path, Tuple[Optional[FileSignature], float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def touch(self, path: Path, now: Optional[float] = None) -> None:
+        """ファイルの書き込みを記録（待ち時間をリセット）"""
+        now = time.monotonic() if now is None else now
+        self._pending[path] = (_signature(path), now)
+
+    def ready(self, limit: int, now: Optional[float] = None) -> List[Path]:
+        """
+        書き込みが落ち着いたファイルを取得
+
+        Args:
+            limit: 返す最大件数（残りは次回以降に返す）
+            now: 現在時刻（monotonic）
+
+        Returns:
+            ファイルパスのリスト
+        """
+        now = time.monotonic() if now is None else now
+        settled = []
+        for path, (signature, since) in list(self._pending.items()):
+            if len(settled) >= limit:
+                break
+            if now - since < self.settle_time:
+                continue
+            current = _signature(path)
+            if current is None:
+                # 削除された・移動されたファイル
+                del self._pending[path]
+            elif current == signature and current[0] > 0:
+                del self._pending[path]
+                settled.append(path)
+            else:
+                # 前回の確認から変化している場合は待ち直す
+                self._pending[path] = (current, now)
+        return settled
+
+
+class FolderWatchProcessor:
+    """フォルダを監視して画像を処理するクラス"""
+
+    def __init__(
+        self,
+        image_processor: ImageProcessor,
+        config: WatchConfig,
+        supported_formats: Tuple[str, ...],
+        threads: int = 1,
+    ):
+        """
+        初期化
+
+        Args:
+            image_processor: 画像処理インスタンス（2スレッド以上の場合は検出器プール設定済み）
+            config: フォルダ監視設定
+            supported_formats: 処理対象の拡張子
+            threads: 処理スレッド数
+        """
+        self.image_processor = image_processor
+        self.config = config
+        self.supported_formats = tuple(ext.lower() for ext in supported_formats)
+        self.threads = max(1, threads)
+
+    def run(
+        self,
+        input_dir: Path,
+        output_dir: Path,
+        stop_event: Optional[threading.Event] = None,
+        on_result: Optional[
+            Callable[[Path, Optional[Dict[str, Any]], Optional[str]], None]
+        ] = None,
+    ) -> Dict[str, Any]:
+        """
+        stop_event がセットされるまで入力ディレクトリを監視して処理
+
+        出力は入力ディレクトリからの相対パスを保って保存する。出力が入力より新しい
+        ファイルは処理済みとしてスキップする
+
+        Args:
+            input_dir: 監視するディレクトリ
+            output_dir: 出力ディレクトリ
+            stop_event: 停止要求
+            on_result: 結果通知コールバック (入力パス, 処理結果辞書, エラーメッセージ)
+
+        Returns:
+            処理結果統計
+        """
+        stop_event = stop_event or threading.Event()
+        input_dir = input_dir.resolve()
+        output_dir = output_dir.resolve()
+        archive_dir = (
+            Path(self.config.archive_dir).resolve() if self.config.archive_dir else None
+        )
+        # 入力ディレクトリ内に出力・アーカイブがある場合はそこを監視対象から外す
+        excluded = [d for d in (output_dir, archive_dir) if d is not None]
+
+        # 最初のファイルで検出器の初期化を待たないように事前に読み込む
+        self.image_processor.detect_details(np.zeros((32, 32, 3), np.uint8))
+
+        watcher = create_watcher(input_dir, self.config)
+        settler = FileSettler(self.config.settle_time)
+        stats: Dict[str, Any] = {
+            "watcher": watcher.name,
+            "processed": 0,
+            "failed": 0,
+            "skipped": 0,
+            "archived": 0,
+            "total_faces": 0,
+        }
+        start_time = time.time()
+
+        # 投入済みタスクを上限付きにしてメモリ使用量を抑える
+        # （処理が追いつかない間はイベントを読まず、カーネル側に溜める）
+        max_in_flight = self.threads * 4
+        pending = {}
+        try:
+            with ThreadPoolExecutor(max_workers=self.threads) as executor:
+                while not stop_event.is_set() or pending:
+                    if stop_event.is_set():
+                        wait(pending, return_when=FIRST_COMPLETED)
+                    elif len(pending) < max_in_flight:
+                        # 処理中のファイルがある間は結果の回収と次の投入を優先する
+                        if pending:
+                            timeout = 0.05
+                        elif settler:
+                            timeout = self.config.settle_time / 2
+                        else:
+                            timeout = 0.5
+                        for path in watcher.read(timeout):
+                            if self._is_target(path, excluded):
+                                settler.touch(path)
+                    else:
+                        wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+
+                    for future in [f for f in pending if f.done()]:
+                        path = pending.pop(future)
+                        result, error = future.result()
+                        self._record(stats, result, error)
+                        if on_result is not None:
+                            on_result(path, result, error)
+
+                    if stop_event.is_set():
+                        continue
+                    for path in settler.ready(max_in_flight - len(pending)):
+                        relative = path.relative_to(input_dir)
+                        output_path = output_dir / relative
+                        if self._is_up_to_date(path, output_path):
+                            stats["skipped"] += 1
+                            continue
+                        archive_path = archive_dir / relative if archive_dir else None
+                        future = executor.submit(
+                            self._process_file, path, output_path, archive_path
+                        )
+                        pending[future] = path
+        finally:
+            watcher.close()
+
+        stats["elapsed"] = time.time() - start_time
+        return stats
+
+    def _is_target(self, path: Path, excluded: List[Path]) -> bool:
+        """処理対象のファイルかどうか（一時ファイル・出力先のファイルは除外）"""
+        if (
+            path.name.startswith(".")
+            or path.suffix.lower() not in self.supported_formats
+        ):
+            return False
+        return not any(directory in path.parents for directory in excluded)
+
+    @staticmethod
+    def _is_up_to_date(input_path: Path, output_path: Path) -> bool:
+        """出力が入力より新しい（処理済み）かどうか"""
+        try:
+            return output_path.stat().st_mtime_ns >= input_path.stat().st_mtime_ns
+        except OSError:
+            return False
+
+    def _process_file(
+        self, input_path: Path, output_path: Path, archive_path: Optional[Path]
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """ファイルを処理し、指定があれば元ファイルをアーカイブへ移動"""
+        try:
+            result = self.image_processor.process_image_file(input_path, output_path)
+            if archive_path is not None:
+                archive_path.parent.mkdir(parents=True, exist_ok=True)
+                shutil.move(str(input_path), str(archive_path))
+                result["archive_path"] = str(archive_path)
+            return result, None
+        except Exception as e:
+            return None, str(e)
+
+    @staticmethod
+    def _record(
+        stats: Dict[str, Any], result: Optional[Dict[str, Any]], error: Optional[str]
+    ) -> None:
+        """処理結果を統計に反映"""
+        if error is not None:
+            stats["failed"] += 1
+            return
+        stats["processed"] += 1
+        stats["total_faces"] += result["faces_detected"]
+        if "archive_path" in result:
+            stats["archived"] += 1
@@ -3,6 +3,13 @@
 モザイク処理とファイル操作を担当
 """
 
+import copy
+import hashlib
+import json
+import time
+from contextlib import nullcontext
+from dataclasses import asdict
+
 import cv2
 import numpy as np
 from pathlib import Path
@@ -10,9 +17,11 @@ from typing import List, Tuple, Optional, Dict, Any
 from PIL import Image, ImageFilter
 
 from ..config.settings import MosaicConfig, ProcessingConfig
+from ..core.detection_cache import DetectionCache
+from ..core.detector_pool import DetectorPool
 from ..core.exceptions import ImageProcessingError, InvalidImageError
 from ..core.face_detector import FaceDetector
-from ..core.object_detector import ObjectDetector
+from ..utils.box_utils import scale_boxes
 from ..utils.file_utils import validate_image_format, ensure_directory
 
 
@@ -24,9 +33,12 @@ class ImageProcessor:
         face_detector: FaceDetector,
         mosaic_config: MosaicConfig,
         processing_config: ProcessingConfig,
-        object_detector: ObjectDetector = None,
+        object_detector: Any = None,
         object_labels: list = None,
         use_object_detection: bool = False,
+        detection_cache: Optional[DetectionCache] = None,
+        face_detector_pool: Optional[DetectorPool] = None,
+        object_detector_pool: Optional[DetectorPool] = None,
     ):
         """
         初期化
@@ -35,9 +47,12 @@ class ImageProcessor:
             face_detector: 顔検出インスタンス
             mosaic_config: モザイク設定
             processing_config: 処理設定
-            object_detector: 物体検出インスタンス（オプション）
+            object_detector: 物体検出インスタンス（オプション, detect/detect_batch を持つ）
             object_labels: モザイクをかける物体のラベルリスト（オプション）
             use_object_detection: 物体検出を使用するかどうか（オプション）
+            detection_cache: 検出結果キャッシュ（オプション）
+            face_detector_pool: マルチスレッド処理用の顔検出器プール（オプション）
+            object_detector_pool: マルチスレッド処理用の物体検出器プール（オプション）
         """
         self.face_detector = face_detector
         self.mosaic_config = mosaic_config
@@ -45,6 +60,33 @@ class ImageProcessor:
         self.object_detector = object_detector
         self.object_labels = object_labels or []
         self.use_object_detection = use_object_detection
+        self.detection_cache = detection_cache
+        # プールが設定されている場合は検出のたびに専用の検出器を借り出す
+        self.face_detector_pool = face_detector_pool
+        self.object_detector_pool = object_detector_pool
+        # 物体検出の事前判定（最大辺0で無効）
+        self.object_gate_max_side = 0
+        self.object_gate_threshold = 0.1
+        # バッチ処理で物体検出をまとめて推論する画像数
+        self.object_batch_size = 1
+        # 1枚あたりの本検出の平均所要時間（事前判定による削減時間の推定用）
+        self._object_full_time: Optional[float] = None
+
+    def with_mosaic_config(self, mosaic_config: MosaicConfig) -> "ImageProcessor":
+        """
+        モザイク設定だけを差し替えた画像処理インスタンスを作成
+
+        検出器・検出器プール・検出結果キャッシュは元のインスタンスと共有する
+
+        Args:
+            mosaic_config: モザイク設定
+
+        Returns:
+            画像処理インスタンス
+        """
+        processor = copy.copy(self)
+        processor.mosaic_config = mosaic_config
+        return processor
 
     def apply_mosaic(
         self, image: np.ndarray, faces: List[Tuple[int, int, int, int]]
@@ -143,57 +185,404 @@ class ImageProcessor:
 
         return mosaic_region
 
-    def process_image_file(self, input_path: Path, output_path: Path) -> Dict[str, Any]:
+    def load_image(
+        self, input_path: Path
+    ) -> Tuple[np.ndarray, Tuple[int, int], Optional[str]]:
         """
-        画像ファイルを処理
+        画像ファイルを読み込み
 
         Args:
             input_path: 入力ファイルパス
-            output_path: 出力ファイルパス
 
         Returns:
-            処理結果辞書
+            (画像, 画像サイズ (width, height), 内容ハッシュ) のタプル
+            （内容ハッシュは検出結果キャッシュ使用時のみ、それ以外はNone）
 
         Raises:
-            ImageProcessingError: 処理失敗時
+            ImageProcessingError: 読み込み失敗時
         """
         # 入力ファイル検証
         validate_image_format(input_path, self.processing_config.supported_formats)
 
-        # 画像読み込み
-        image = cv2.imread(str(input_path))
+        # 画像読み込み（キャッシュキー用にファイル内容を一度だけ読む）
+        content_hash = None
+        if self.detection_cache is not None:
+            data = input_path.read_bytes()
+            content_hash = hashlib.blake2b(data, digest_size=20).hexdigest()
+            image = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+        else:
+            image = cv2.imread(str(input_path))
         if image is None:
             raise InvalidImageError(f"画像を読み込めません: {input_path}")
 
-        # 画像サイズチェック
         height, width = image.shape[:2]
-        max_size = self.processing_config.max_image_size
-        if max(width, height) > max_size:
-            # リサイズ
-            scale = max_size / max(width, height)
-            new_width = int(width * scale)
-            new_height = int(height * scale)
-            image = cv2.resize(image, (new_width, new_height))
-            print(
-                f"画像をリサイズしました: {width}x{height} -> {new_width}x{new_height}"
+
+        return image, (width, height), content_hash
+
+    def detect_targets(
+        self,
+        image: np.ndarray,
+        content_hash: Optional[str] = None,
+        stats: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Tuple[int, int, int, int]], List[Tuple[int, int, int, int]]]:
+        """
+        モザイク対象（顔・物体）を検出
+
+        大きな画像は縮小したプロキシ画像で検出し、座標を元解像度に戻す。
+        内容ハッシュが与えられ検出結果キャッシュが有効な場合はキャッシュを参照する
+
+        Args:
+            image: 入力画像（BGR形式）
+            content_hash: 画像ファイルの内容ハッシュ（キャッシュキー用）
+            stats: 検出の統計情報（物体検出の事前判定結果など）の格納先
+
+        Returns:
+            (顔座標リスト, 物体座標リスト) のタプル（いずれも元解像度の (x, y, w, h)）
+        """
+        return self.detect_targets_batch([image], [content_hash], [stats])[0]
+
+    def detect_targets_batch(
+        self,
+        images: List[np.ndarray],
+        content_hashes: Optional[List[Optional[str]]] = None,
+        stats_list: Optional[List[Optional[Dict[str, Any]]]] = None,
+    ) -> List[Tuple[List[Tuple[int, int, int, int]], List[Tuple[int, int, int, int]]]]:
+        """
+        複数画像のモザイク対象をまとめて検出（物体検出はバッチ推論）
+
+        Args:
+            images: 入力画像リスト（BGR形式）
+            content_hashes: 画像ごとの内容ハッシュ（キャッシュキー用）
+            stats_list: 画像ごとの検出統計の格納先
+
+        Returns:
+            画像ごとの (顔座標リスト, 物体座標リスト) のリスト
+        """
+        content_hashes = content_hashes or [None] * len(images)
+        stats_list = stats_list or [None] * len(images)
+        results: List[Any] = [None] * len(images)
+        cache_keys: List[Optional[str]] = [None] * len(images)
+
+        if self.detection_cache is not None:
+            signature = self.get_detection_signature()
+            for i, content_hash in enumerate(content_hashes):
+                if content_hash is None:
+                    continue
+                cache_keys[i] = f"{content_hash}:{signature}"
+                results[i] = self.detection_cache.get(cache_keys[i])
+
+        pending = [i for i, result in enumerate(results) if result is None]
+        if pending:
+            detected = self.detect_details_batch(
+                [images[i] for i in pending], [stats_list[i] for i in pending]
             )
+            for i, (faces, objects) in zip(pending, detected):
+                results[i] = (
+                    [face["box"] for face in faces],
+                    [obj["box"] for obj in objects],
+                )
+                if cache_keys[i] is not None:
+                    self.detection_cache.put(cache_keys[i], *results[i])
+
+        return results
+
+    def detect_details(
+        self, image: np.ndarray, stats: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        信頼度・ランドマーク・ラベル付きでモザイク対象を検出
+
+        Args:
+            image: 入力画像（BGR形式）
+            stats: 検出の統計情報の格納先（物体検出の事前判定結果を "object_gate" に記録）
+
+        Returns:
+            (顔検出結果リスト, 物体検出結果リスト) のタプル（いずれも元解像度）
+            顔: {"box": (x, y, w, h), "confidence": float, "landmarks": [[x, y], ...]}
+            物体: {"box": (x, y, w, h), "label": str, "score": float}
+        """
+        return self.detect_details_batch([image], [stats])[0]
+
+    def detect_details_batch(
+        self,
+        images: List[np.ndarray],
+        stats_list: Optional[List[Optional[Dict[str, Any]]]] = None,
+    ) -> List[Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]]:
+        """
+        複数画像の検出結果を信頼度・ランドマーク・ラベル付きで取得
+
+        顔検出は1枚ずつ、物体検出はまとめてバッチ推論する
+
+        Args:
+            images: 入力画像リスト（BGR形式）
+            stats_list: 画像ごとの検出統計の格納先
+
+        Returns:
+            画像ごとの (顔検出結果リスト, 物体検出結果リスト) のリスト
+        """
+        stats_list = stats_list or [None] * len(images)
+        proxies = [self.create_detection_proxy(image) for image in images]
 
         # 顔検出
-        faces = self.face_detector.detect_faces(image)
+        all_faces = []
+        with self._acquire(self.face_detector_pool, self.face_detector) as detector:
+            for proxy, _ in proxies:
+                all_faces.append(detector.detect_face_details(proxy))
+
         # 物体検出（オプション）
-        objects = []
+        all_objects = [[] for _ in images]
+        if self.use_object_detection and self.object_detector and self.object_labels:
+            detected = self._detect_objects_batch(
+                [proxy for proxy, _ in proxies], stats_list
+            )
+            for objects, items in zip(all_objects, detected):
+                for obj in items:
+                    x1, y1, x2, y2 = obj["box"]
+                    w, h = x2 - x1, y2 - y1
+                    objects.append(
+                        {
+                            "box": (int(x1), int(y1), int(w), int(h)),
+                            "label": obj["label"],
+                            "score": round(float(obj["score"]), 4),
+                        }
+                    )
+
+        # 座標を元解像度に戻す
+        for image, (_, scale), faces, objects in zip(
+            images, proxies, all_faces, all_objects
+        ):
+            if scale == 1.0:
+                continue
+            image_size = image.shape[:2][::-1]
+            for items in (faces, objects):
+                boxes = scale_boxes(
+                    [item["box"] for item in items], 1.0 / scale, image_size
+                )
+                for item, box in zip(items, boxes):
+                    item["box"] = box
+            for face in faces:
+                face["landmarks"] = [
+                    [round(x / scale, 1), round(y / scale, 1)]
+                    for x, y in face["landmarks"]
+                ]
+
+        return list(zip(all_faces, all_objects))
+
+    def _detect_objects_batch(
+        self,
+        images: List[np.ndarray],
+        stats_list: List[Optional[Dict[str, Any]]],
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        物体検出を実行（事前判定が有効な場合は縮小画像で対象の有無を先に確認）
+
+        Args:
+            images: 入力画像リスト（BGR形式）
+            stats_list: 画像ごとの検出統計の格納先
+
+        Returns:
+            画像ごとの物体検出器の検出結果リスト（box は (x1, y1, x2, y2)）
+        """
+        results: List[List[Dict[str, Any]]] = [[] for _ in images]
+        gates: List[Optional[Dict[str, Any]]] = [None] * len(images)
+        targets = list(range(len(images)))
+
+        gate_max_side = self.object_gate_max_side
+        gated = [
+            i
+            for i, image in enumerate(images)
+            if gate_max_side > 0 and max(image.shape[:2]) > gate_max_side
+        ]
+        if gated and not getattr(self.object_detector, "resizable_input", False):
+            # 入力サイズ固定の検出器は縮小画像でも本検出と同じ解像度で推論するため、
+            # 事前判定は削減にならない。省略して理由を記録する
+            for i in gated:
+                gates[i] = {"passed": True, "skipped": "fixed_input_size"}
+            gated = []
+        if gated:
+            small_images = []
+            for i in gated:
+                height, width = images[i].shape[:2]
+                scale = gate_max_side / max(width, height)
+                small_images.append(
+                    cv2.resize(
+                        images[i],
+                        (max(1, int(width * scale)), max(1, int(height * scale))),
+                        interpolation=cv2.INTER_AREA,
+                    )
+                )
+            start = time.perf_counter()
+            candidates = self._run_object_detector(
+                small_images, self.object_gate_threshold, input_size=gate_max_side
+            )
+            gate_time = (time.perf_counter() - start) / len(gated)
+
+            for i, found in zip(gated, candidates):
+                gates[i] = {
+                    "passed": bool(found),
+                    "candidates": len(found),
+                    "gate_time": round(gate_time, 4),
+                }
+                if not found:
+                    # 本検出を省略
+                    targets.remove(i)
+                    if self._object_full_time is not None:
+                        gates[i]["estimated_saving"] = round(
+                            max(0.0, self._object_full_time - gate_time), 4
+                        )
+
+        if targets:
+            start = time.perf_counter()
+            detected = self._run_object_detector([images[i] for i in targets])
+            elapsed = (time.perf_counter() - start) / len(targets)
+            # 1枚あたりの本検出時間の移動平均を更新
+            if self._object_full_time is None:
+                self._object_full_time = elapsed
+            else:
+                self._object_full_time = 0.8 * self._object_full_time + 0.2 * elapsed
+
+            for i, items in zip(targets, detected):
+                results[i] = items
+                if gates[i] is not None:
+                    gates[i]["full_time"] = round(elapsed, 4)
+
+        for gate, stats in zip(gates, stats_list):
+            if gate is not None and stats is not None:
+                stats["object_gate"] = gate
+
+        return results
+
+    def _run_object_detector(
+        self,
+        images: List[np.ndarray],
+        score_thresh: Optional[float] = None,
+        input_size: Optional[int] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        物体検出器をバッチ実行
+
+        Args:
+            images: 入力画像リスト（BGR形式）
+            score_thresh: 信頼度閾値（Noneの場合は検出器の既定値）
+            input_size: 推論時の最大辺（Noneの場合は検出器の既定値。
+                resizable_input に対応した検出器のみ指定可能）
+
+        Returns:
+            画像ごとの物体検出器の検出結果リスト
+        """
+        # OpenCVはBGR, torchvisionはRGBなので変換
+        rgb_images = [cv2.cvtColor(image, cv2.COLOR_BGR2RGB) for image in images]
+        options = {"target_labels": self.object_labels, "score_thresh": score_thresh}
+        if input_size is not None:
+            options["input_size"] = input_size
+        with self._acquire(self.object_detector_pool, self.object_detector) as detector:
+            if not hasattr(detector, "detect_batch"):
+                # バッチ推論に未対応の検出器は1枚ずつ実行
+                return [detector.detect(image, **options) for image in rgb_images]
+            return detector.detect_batch(rgb_images, **options)
+
+    @staticmethod
+    def _acquire(pool: Optional[DetectorPool], detector: Any):
+        """
+        検出器を使用するコンテキストを取得
+
+        Args:
+            pool: 検出器プール（Noneの場合は共有の検出器をそのまま使用）
+            detector: 共有の検出器
+
+        Returns:
+            検出器を返すコンテキストマネージャ
+        """
+        if pool is None:
+            return nullcontext(detector)
+        return pool.acquire()
+
+    def create_detection_proxy(self, image: np.ndarray) -> Tuple[np.ndarray, float]:
+        """
+        検出用の縮小プロキシ画像を作成
+
+        Args:
+            image: 入力画像（BGR形式）
+
+        Returns:
+            (プロキシ画像, 縮小倍率) のタプル（縮小不要の場合は元画像と1.0）
+        """
+        height, width = image.shape[:2]
+        max_side = self.get_detection_max_side()
+        if max_side <= 0 or max(width, height) <= max_side:
+            return image, 1.0
+
+        scale = max_side / max(width, height)
+        new_width = max(1, int(width * scale))
+        new_height = max(1, int(height * scale))
+        proxy = cv2.resize(image, (new_width, new_height), interpolation=cv2.INTER_AREA)
+
+        return proxy, scale
+
+    def get_detection_signature(self) -> str:
+        """
+        検出結果に影響する設定のシグネチャを取得
+
+        Returns:
+            検出設定シグネチャ（16進文字列）
+        """
+        model_info = self.face_detector.model_manager.get_model_info()
+        settings = {
+            "detection": asdict(self.face_detector.config),
+            "detection_max_side": self.get_detection_max_side(),
+            "face_model": [Path(model_info["model_path"]).name, model_info["size_mb"]],
+            "objects": None,
+        }
         if self.use_object_detection and self.object_detector and self.object_labels:
-            # OpenCVはBGR, torchvisionはRGBなので変換
-            rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-            detected = self.object_detector.detect(
-                rgb_image, target_labels=self.object_labels
+            settings["objects"] = {
+                "detector": type(self.object_detector).__name__,
+                "model_path": getattr(self.object_detector, "model_path", None),
+                "score_thresh": getattr(self.object_detector, "score_thresh", None),
+                "imgsz": getattr(self.object_detector, "imgsz", None),
+                "precision": getattr(self.object_detector, "precision", "fp32"),
+                "labels": sorted(self.object_labels),
+                "gate": [self.object_gate_max_side, self.object_gate_threshold],
+            }
+
+        payload = json.dumps(settings, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+    def get_detection_max_side(self) -> int:
+        """
+        検出プロキシ画像の最大辺を取得
+
+        Returns:
+            最大辺（ピクセル）。DetectionConfig.detection_max_side が未設定の場合は
+            ProcessingConfig.max_image_size（タイル検出時は0: 縮小なし）
+        """
+        detection_config = self.face_detector.config
+        max_side = detection_config.detection_max_side
+        if max_side is None:
+            # タイル検出は大画像の小さな顔向けのため、縮小せずにタイルへ分割する
+            max_side = (
+                0 if detection_config.tiling else self.processing_config.max_image_size
             )
-            for obj in detected:
-                x1, y1, x2, y2 = obj["box"]
-                w, h = x2 - x1, y2 - y1
-                objects.append((x1, y1, w, h))
+        return max_side
+
+    def render_image(
+        self,
+        image: np.ndarray,
+        faces: List[Tuple[int, int, int, int]],
+        objects: List[Tuple[int, int, int, int]],
+        input_path: Path,
+    ) -> np.ndarray:
+        """
+        検出結果にモザイクを適用
+
+        Args:
+            image: 入力画像（BGR形式）
+            faces: 顔座標リスト
+            objects: 物体座標リスト
+            input_path: 入力ファイルパス（ログ表示用）
 
-        # モザイク処理
+        Returns:
+            モザイク処理済み画像
+        """
         all_targets = faces + objects
         if all_targets:
             processed_image = self.apply_mosaic(image, all_targets)
@@ -204,13 +593,26 @@ class ImageProcessor:
             processed_image = image
             print(f"顔・物体が検出されませんでした: {input_path.name}")
 
+        return processed_image
+
+    def save_image(self, image: np.ndarray, output_path: Path) -> None:
+        """
+        画像を保存
+
+        Args:
+            image: 保存する画像
+            output_path: 出力ファイルパス
+
+        Raises:
+            ImageProcessingError: 保存失敗時
+        """
         # 出力ディレクトリ作成
         ensure_directory(output_path.parent)
 
         # 画像保存
         success = cv2.imwrite(
             str(output_path),
-            processed_image,
+            image,
             [cv2.IMWRITE_JPEG_QUALITY, self.processing_config.quality],
         )
 
@@ -219,16 +621,250 @@ class ImageProcessor:
 
         print(f"処理完了: {output_path}")
 
+    def encode_image(self, image: np.ndarray, ext: str = ".jpg") -> bytes:
+        """
+        画像をファイル形式にエンコード
+
+        Args:
+            image: エンコードする画像
+            ext: 出力形式の拡張子（".jpg", ".png" など）
+
+        Returns:
+            エンコード済み画像データ
+
+        Raises:
+            ImageProcessingError: エンコード失敗時
+        """
+        params = []
+        if ext.lower() in (".jpg", ".jpeg"):
+            params = [cv2.IMWRITE_JPEG_QUALITY, self.processing_config.quality]
+        try:
+            success, buffer = cv2.imencode(ext, image, params)
+        except cv2.error as e:
+            raise ImageProcessingError(f"画像のエンコードに失敗しました: {e}")
+        if not success:
+            raise ImageProcessingError(f"画像のエンコードに失敗しました: {ext}")
+        return buffer.tobytes()
+
+    def build_result(
+        self,
+        input_path: Path,
+        output_path: Path,
+        faces: List[Tuple[int, int, int, int]],
+        objects: List[Tuple[int, int, int, int]],
+        original_size: Tuple[int, int],
+        processed_image: np.ndarray,
+    ) -> Dict[str, Any]:
+        """
+        処理結果辞書を作成
+
+        Args:
+            input_path: 入力ファイルパス
+            output_path: 出力ファイルパス
+            faces: 顔座標リスト
+            objects: 物体座標リスト
+            original_size: 元画像サイズ (width, height)
+            processed_image: 処理済み画像
+
+        Returns:
+            処理結果辞書
+        """
         return {
             "success": True,
             "faces_detected": len(faces),
             "objects_detected": len(objects),
             "input_path": str(input_path),
             "output_path": str(output_path),
-            "original_size": (width, height),
+            "original_size": original_size,
             "processed_size": processed_image.shape[:2][::-1],
+            "detection_max_side": self.get_detection_max_side(),
         }
 
+    def process_image_file(self, input_path: Path, output_path: Path) -> Dict[str, Any]:
+        """
+        画像ファイルを処理
+
+        Args:
+            input_path: 入力ファイルパス
+            output_path: 出力ファイルパス
+
+        Returns:
+            処理結果辞書
+
+        Raises:
+            ImageProcessingError: 処理失敗時
+        """
+        image, original_size, content_hash = self.load_image(input_path)
+        detection_stats = {}
+        faces, objects = self.detect_targets(image, content_hash, detection_stats)
+        processed_image = self.render_image(image, faces, objects, input_path)
+        self.save_image(processed_image, output_path)
+
+        result = self.build_result(
+            input_path, output_path, faces, objects, original_size, processed_image
+        )
+        result.update(detection_stats)
+        return result
+
+    def process_image_data(
+        self, data: bytes, ext: str = ".jpg"
+    ) -> Tuple[bytes, Dict[str, Any]]:
+        """
+        エンコード済みの画像データを処理（ファイルを介さない）
+
+        Args:
+            data: 画像ファイルの内容
+            ext: 出力形式の拡張子
+
+        Returns:
+            (モザイク処理済みの画像データ, 処理結果辞書) のタプル
+
+        Raises:
+            InvalidImageError: 画像データを読み込めない場合
+            ImageProcessingError: エンコード失敗時
+        """
+        image = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+        if image is None:
+            raise InvalidImageError("画像データを読み込めません")
+
+        content_hash = None
+        if self.detection_cache is not None:
+            content_hash = hashlib.blake2b(data, digest_size=20).hexdigest()
+
+        detection_stats = {}
+        faces, objects = self.detect_targets(image, content_hash, detection_stats)
+        name = Path(f"<memory>{ext}")
+        processed_image = self.render_image(image, faces, objects, name)
+        encoded = self.encode_image(processed_image, ext)
+
+        result = self.build_result(
+            name, name, faces, objects, image.shape[:2][::-1], processed_image
+        )
+        result.update(detection_stats)
+        return encoded, result
+
+    def process_image_batch(
+        self, tasks: List[Tuple[Path, Path]]
+    ) -> List[Tuple[Optional[Dict[str, Any]], Optional[str]]]:
+        """
+        複数の画像ファイルをまとめて処理（物体検出は1回のバッチ推論）
+
+        Args:
+            tasks: (入力パス, 出力パス) のリスト
+
+        Returns:
+            タスクごとの (処理結果辞書, エラーメッセージ) のリスト
+        """
+        outcomes: List[Tuple[Optional[Dict[str, Any]], Optional[str]]] = [
+            (None, None)
+        ] * len(tasks)
+        loaded = []
+        for i, (input_path, _) in enumerate(tasks):
+            try:
+                loaded.append((i, self.load_image(input_path)))
+            except Exception as e:
+                outcomes[i] = (None, str(e))
+
+        if not loaded:
+            return outcomes
+
+        stats_list = [{} for _ in loaded]
+        try:
+            detections = self.detect_targets_batch(
+                [payload[0] for _, payload in loaded],
+                [payload[2] for _, payload in loaded],
+                stats_list,
+            )
+        except Exception as e:
+            for i, _ in loaded:
+                outcomes[i] = (None, str(e))
+            return outcomes
+
+        for (i, payload), (faces, objects), detection_stats in zip(
+            loaded, detections, stats_list
+        ):
+            input_path, output_path = tasks[i]
+            image, original_size, _ = payload
+            try:
+                processed_image = self.render_image(image, faces, objects, input_path)
+                self.save_image(processed_image, output_path)
+                result = self.build_result(
+                    input_path,
+                    output_path,
+                    faces,
+                    objects,
+                    original_size,
+                    processed_image,
+                )
+                result.update(detection_stats)
+                outcomes[i] = (result, None)
+            except Exception as e:
+                outcomes[i] = (None, str(e))
+
+        return outcomes
+
+    def detect_image_file(
+        self, input_path: Path, output_path: Optional[Path] = None
+    ) -> Dict[str, Any]:
+        """
+        画像ファイルの検出のみを実行（モザイク処理・保存は行わない）
+
+        Args:
+            input_path: 入力ファイルパス
+            output_path: 未使用（バッチ処理の呼び出し形式に合わせるための引数）
+
+        Returns:
+            検出結果を含む処理結果辞書
+
+        Raises:
+            ImageProcessingError: 処理失敗時
+        """
+        image, original_size, _ = self.load_image(input_path)
+        detection_stats = {}
+        faces, objects = self.detect_details(image, detection_stats)
+        print(f"{len(faces)}個の顔, {len(objects)}個の物体を検出: {input_path.name}")
+
+        return {
+            **detection_stats,
+            "success": True,
+            "faces_detected": len(faces),
+            "objects_detected": len(objects),
+            "input_path": str(input_path),
+            "original_size": original_size,
+            "faces": faces,
+            "objects": objects,
+        }
+
+    def render_image_file(
+        self,
+        input_path: Path,
+        output_path: Path,
+        faces: List[Tuple[int, int, int, int]],
+        objects: List[Tuple[int, int, int, int]],
+    ) -> Dict[str, Any]:
+        """
+        保存済みの検出結果を使って画像ファイルにモザイクを適用（検出器は使用しない）
+
+        Args:
+            input_path: 入力ファイルパス
+            output_path: 出力ファイルパス
+            faces: 顔座標リスト
+            objects: 物体座標リスト
+
+        Returns:
+            処理結果辞書
+
+        Raises:
+            ImageProcessingError: 処理失敗時
+        """
+        image, original_size, _ = self.load_image(input_path)
+        processed_image = self.render_image(image, faces, objects, input_path)
+        self.save_image(processed_image, output_path)
+
+        return self.build_result(
+            input_path, output_path, faces, objects, original_size, processed_image
+        )
+
     def get_processor_info(self) -> Dict[str, Any]:
         """
         プロセッサ情報を取得
@@ -247,6 +883,13 @@ class ImageProcessor:
                 "supported_formats": self.processing_config.supported_formats,
                 "max_image_size": self.processing_config.max_image_size,
                 "quality": self.processing_config.quality,
+                "detection_max_side": self.get_detection_max_side(),
             },
             "face_detector": self.face_detector.get_detector_info(),
+            "detection_cache": (
+                self.detection_cache.get_stats() if self.detection_cache else None
+            ),
+            "detector_pool": (
+                self.face_detector_pool.get_stats() if self.face_detector_pool else None
+            ),
         }
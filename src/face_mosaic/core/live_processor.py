@@ -0,0 +1,520 @@
+"""
+カメラ・ストリームのリアルタイム処理クラス
+入力は別スレッドで読み込んで最新のフレームだけを保持し（処理が遅れた分の古いフレームは捨てる）、
+検出は別スレッドで最新のフレームに対して非同期に行う。検出の終わっていないフレームには
+直前の検出枠を使ってモザイクを適用し、ウィンドウ・動画ファイル・パイプへ出力する
+"""
+
+import os
+import stat
+import sys
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from ..config.settings import LiveConfig
+from ..core.box_tracker import expand_boxes
+from ..core.exceptions import VideoProcessingError
+from ..core.image_processor import ImageProcessor
+from ..core.video_processor import open_writer
+
+Box = Tuple[int, int, int, int]
+
+
+def open_source(source: str) -> Tuple[cv2.VideoCapture, bool]:
+    """
+    入力を開く
+
+    Args:
+        source: カメラ番号（数字）、動画ファイルのパス、またはストリームのURL
+
+    Returns:
+        (VideoCapture, 動画ファイルかどうか) のタプル。動画ファイルは
+        カメラの代わりとして再生速度に合わせて読み込む
+
+    Raises:
+        VideoProcessingError: 入力を開けない場合
+    """
+    if source.isdigit():
+        capture = cv2.VideoCapture(int(source))
+        is_file = False
+    else:
+        capture = cv2.VideoCapture(source)
+        is_file = Path(source).is_file()
+    if not capture.isOpened():
+        raise VideoProcessingError(f"入力を開けません: {source}")
+    return capture, is_file
+
+
+class WindowSink:
+    """ウィンドウに表示する出力先（q または Esc キーで停止）"""
+
+    def __init__(self, name: str):
+        """
+        Raises:
+            VideoProcessingError: ウィンドウを表示できない場合（GUI非対応のOpenCVなど）
+        """
+        self.name = name
+        # 表示先のない Linux ではウィンドウ作成時にプロセスごと終了するため事前に確認
+        if sys.platform.startswith("linux") and not (
+            os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY")
+        ):
+            raise VideoProcessingError(
+                "ウィンドウを表示できません（ディスプレイがありません）。"
+                "出力先に動画ファイル・パイプを指定してください"
+            )
+        try:
+            cv2.namedWindow(name, cv2.WINDOW_NORMAL)
+        except cv2.error as e:
+            raise VideoProcessingError(f"ウィンドウを表示できません: {e}")
+
+    def write(self, frame: np.ndarray) -> bool:
+        """フレームを表示（停止キーが押された場合はFalse）"""
+        cv2.imshow(self.name, frame)
+        return cv2.waitKey(1) & 0xFF not in (ord("q"), 27)
+
+    def close(self) -> None:
+        try:
+            cv2.destroyWindow(self.name)
+        except cv2.error:
+            pass
+
+
+class RawPipeSink:
+    """BGR24 の生フレームを書き出す出力先（標準出力・名前付きパイプ）"""
+
+    def __init__(self, stream: BinaryIO, close_stream: bool = False):
+        self.stream = stream
+        self.close_stream = close_stream
+
+    def write(self, frame: np.ndarray) -> bool:
+        """フレームを書き出す（読み手が閉じた場合はFalse）"""
+        try:
+            self.stream.write(np.ascontiguousarray(frame).data)
+            self.stream.flush()
+        except (BrokenPipeError, ValueError):
+            return False
+        return True
+
+    def close(self) -> None:
+        if self.close_stream:
+            try:
+                self.stream.close()
+            except BrokenPipeError:
+                pass
+
+
+class VideoFileSink:
+    """
+    動画ファイルに書き出す出力先
+
+    捨てたフレームの分は直前のフレームを繰り返し、再生時間を実時間に合わせる
+    """
+
+    def __init__(
+        self, path: Path, fps: float, frame_size: Tuple[int, int], fourcc: str
+    ):
+        self.fps = fps
+        self.writer = open_writer(path, fps, frame_size, fourcc)
+        self._start: Optional[float] = None
+        self._written = 0
+
+    def write(self, frame: np.ndarray) -> bool:
+        now = time.monotonic()
+        if self._start is None:
+            self._start = now
+        due = int((now - self._start) * self.fps) + 1
+        while self._written < due:
+            self.writer.write(frame)
+            self._written += 1
+        return True
+
+    def close(self) -> None:
+        self.writer.release()
+
+
+def create_sink(
+    output: str, fps: float, frame_size: Tuple[int, int], config: LiveConfig
+):
+    """
+    出力先を作成
+
+    Args:
+        output: "window"（ウィンドウ表示）、"-"（標準出力へ生フレーム）、
+            名前付きパイプのパス（生フレーム）、またはその他の動画ファイルのパス
+        fps: 動画ファイルのフレームレート
+        frame_size: フレームサイズ (width, height)
+        config: リアルタイム処理設定
+
+    Returns:
+        write(frame) -> bool と close() を持つ出力先
+    """
+    if output == "window":
+        return WindowSink(config.window_name)
+    if output == "-":
+        return RawPipeSink(sys.stdout.buffer)
+    path = Path(output)
+    if path.exists() and stat.S_ISFIFO(path.stat().st_mode):
+        return RawPipeSink(open(path, "wb"), close_stream=True)
+    return VideoFileSink(path, fps, frame_size, config.fourcc)
+
+
+class _LatestFrame:
+    """入力を別スレッドで読み込み、最新のフレームだけを保持するクラス"""
+
+    def __init__(self, capture: cv2.VideoCapture, paced: bool, fps: float):
+        self._capture = capture
+        self._paced = paced
+        self._fps = fps
+        self._condition = threading.Condition()
+        self._frame: Optional[np.ndarray] = None
+        self._index = -1
+        self._captured_at = 0.0
+        self._stop = threading.Event()
+        self.captured = 0
+        self.ended = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        start = time.monotonic()
+        try:
+            while not self._stop.is_set():
+                ok, frame = self._capture.read()
+                if not ok:
+                    break
+                if self._paced:
+                    # 動画ファイルはカメラと同じく再生速度でフレームが届くようにする
+                    delay = start + self.captured / self._fps - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+                with self._condition:
+                    # 取り出されなかった古いフレームは上書きして捨てる
+                    self._frame = frame
+                    self._index += 1
+                    self._captured_at = time.monotonic()
+                    self.captured += 1
+                    self._condition.notify_all()
+        finally:
+            with self._condition:
+                self.ended = True
+                self._condition.notify_all()
+
+    def wait_newer(
+        self, index: int, timeout: float
+    ) -> Optional[Tuple[int, np.ndarray, float]]:
+        """
+        index より新しいフレームを待って取得
+
+        Returns:
+            (フレーム番号, フレーム, 取り込み時刻) のタプル。
+            タイムアウト・入力の終わりの場合は None
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._index > index or self.ended, timeout)
+            if self._index > index:
+                return self._index, self._frame, self._captured_at
+            return None
+
+    def close(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+
+class LiveStreamProcessor:
+    """カメラ・ストリームのリアルタイム処理クラス"""
+
+    def __init__(self, image_processor: ImageProcessor, config: LiveConfig):
+        """
+        初期化
+
+        Args:
+            image_processor: 画像処理インスタンス
+            config: リアルタイム処理設定
+        """
+        self.image_processor = image_processor
+        self.config = config
+        self._condition = threading.Condition()
+        self._reset()
+
+    def _reset(self) -> None:
+        """実行ごとの状態を初期化"""
+        self._boxes: List[Box] = []
+        self._boxes_index = -1  # 検出枠を求めたフレーム番号
+        self._detecting = -1  # 検出中のフレーム番号
+        self._detect_started = 0.0
+        self._detect_time = 0.0  # 1回の検出にかかる時間（指数移動平均）
+        self._detections = 0
+        self._error: Optional[BaseException] = None
+        self._stop = threading.Event()  # 終了時・検出エラー時に検出スレッドを止める
+
+    def run(
+        self,
+        source: str,
+        output: Any,
+        stop_event: threading.Event,
+        on_stats: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        入力の終わり・停止要求・出力先の停止まで処理を続ける
+
+        Args:
+            source: カメラ番号、動画ファイルのパス、またはストリームのURL
+            output: 出力先の指定（create_sink を参照）、または
+                write(frame) -> bool と close() を持つ出力先
+            stop_event: 停止要求のイベント
+            on_stats: stats_interval 秒ごとに直近の統計を受け取るコールバック
+                {"fps", "latency_ms", "latency_p95_ms", "within_target",
+                 "detect_fps", "dropped"}
+
+        Returns:
+            全体の統計 {"frames_captured", "frames_output", "frames_dropped",
+            "detections", "fps", "latency_ms", "latency_p95_ms",
+            "within_target", "elapsed"}
+
+        Raises:
+            VideoProcessingError: 入力・出力先を開けない場合
+        """
+        capture, is_file = open_source(source)
+        fps = capture.get(cv2.CAP_PROP_FPS)
+        fps = fps if fps and fps > 0 else 30.0
+        frame_size = (
+            int(capture.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+        )
+        output_fps = min(fps, self.config.max_fps) if self.config.max_fps else fps
+
+        sink = output
+        if isinstance(output, str):
+            try:
+                sink = create_sink(output, output_fps, frame_size, self.config)
+            except BaseException:
+                capture.release()
+                raise
+
+        self._reset()
+        latest = _LatestFrame(capture, is_file, fps)
+        detector = threading.Thread(
+            target=self._detect_loop, args=(latest,), daemon=True
+        )
+        detector.start()
+        try:
+            totals = self._output_loop(latest, sink, stop_event, output_fps, on_stats)
+        finally:
+            self._stop.set()
+            detector.join()
+            latest.close()
+            capture.release()
+            sink.close()
+
+        if self._error is not None:
+            raise self._error
+        totals["frames_captured"] = latest.captured
+        totals["frames_dropped"] = latest.captured - totals["frames_output"]
+        totals["detections"] = self._detections
+        return totals
+
+    def _detect_loop(self, latest: _LatestFrame) -> None:
+        """検出が終わるたびに、その時点の最新のフレームを検出する"""
+        index = -1
+        try:
+            while not self._stop.is_set():
+                item = latest.wait_newer(index, 0.1)
+                if item is None:
+                    if latest.ended:
+                        return
+                    continue
+                index, frame, _ = item
+                with self._condition:
+                    self._detecting = index
+                    self._detect_started = time.monotonic()
+                faces, objects = self.image_processor.detect_targets(frame)
+                with self._condition:
+                    elapsed = time.monotonic() - self._detect_started
+                    self._detect_time = (
+                        0.8 * self._detect_time + 0.2 * elapsed
+                        if self._detections
+                        else elapsed
+                    )
+                    self._boxes = faces + objects
+                    self._boxes_index = index
+                    self._detections += 1
+                    self._condition.notify_all()
+        except BaseException as e:
+            self._error = e
+            self._stop.set()
+
+    def _boxes_for(self, index: int, deadline: float) -> Tuple[List[Box], int]:
+        """
+        フレームに適用する検出枠を取得
+
+        そのフレームを検出中で、これまでの検出時間から期限までに終わると
+        見込める場合は待つ
+
+        Returns:
+            (検出枠リスト, 検出枠を求めたフレーム番号) のタプル
+        """
+        with self._condition:
+            if (
+                self._detecting == index
+                and self._boxes_index < index
+                and self._detect_started + self._detect_time <= deadline
+            ):
+                self._condition.wait_for(
+                    lambda: self._boxes_index >= index,
+                    max(0.0, deadline - time.monotonic()),
+                )
+            return self._boxes, self._boxes_index
+
+    def _output_loop(
+        self,
+        latest: _LatestFrame,
+        sink: Any,
+        stop_event: threading.Event,
+        output_fps: float,
+        on_stats: Optional[Callable[[Dict[str, Any]], None]],
+    ) -> Dict[str, Any]:
+        """最新のフレームにモザイクを適用して出力する"""
+        config = self.config
+        budget = config.target_latency_ms / 1000.0
+        interval = 1.0 / output_fps if config.max_fps else 0.0
+        render_time = 0.0  # モザイク適用・出力にかかる時間（指数移動平均）
+
+        latencies = _LatencyHistogram(budget)
+        window: deque = deque()  # 直近の (出力時刻, 遅延, 検出回数, 取り込み数)
+        start = last_report = time.monotonic()
+        next_due = start
+        index = -1
+
+        while not (stop_event.is_set() or self._stop.is_set()):
+            if interval:
+                delay = next_due - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                next_due = max(next_due + interval, time.monotonic())
+
+            item = latest.wait_newer(index, 0.1)
+            if item is None:
+                if latest.ended:
+                    break
+                continue
+            index, frame, captured_at = item
+
+            # 検出中のフレームなら遅延の目標内に収まる範囲で検出を待つ
+            boxes, boxes_index = self._boxes_for(
+                index, captured_at + budget - render_time
+            )
+            if boxes_index != index:
+                boxes = expand_boxes(boxes, config.box_margin, frame.shape[1::-1])
+
+            rendered_at = time.monotonic()
+            if boxes:
+                frame = self.image_processor.apply_mosaic(frame, boxes)
+            keep_going = sink.write(frame)
+            now = time.monotonic()
+            render_time = 0.8 * render_time + 0.2 * (now - rendered_at)
+
+            latency = now - captured_at
+            latencies.add(latency)
+            window.append((now, latency, self._detections, latest.captured))
+            while window[0][0] < now - config.stats_interval:
+                window.popleft()
+            if on_stats and now - last_report >= config.stats_interval:
+                last_report = now
+                on_stats(self._window_stats(window, budget))
+            if not keep_going:
+                break
+
+        elapsed = time.monotonic() - start
+        summary = latencies.stats()
+        summary["frames_output"] = latencies.count
+        summary["fps"] = round(latencies.count / elapsed, 2) if elapsed else 0.0
+        summary["elapsed"] = elapsed
+        return summary
+
+    @staticmethod
+    def _window_stats(window: deque, budget: float) -> Dict[str, Any]:
+        """直近の出力から統計を求める"""
+        span = window[-1][0] - window[0][0]
+        frames = len(window) - 1
+        stats = _latency_stats([latency for _, latency, _, _ in window], budget)
+        stats["fps"] = round(frames / span, 2) if span > 0 else 0.0
+        stats["detect_fps"] = (
+            round((window[-1][2] - window[0][2]) / span, 2) if span > 0 else 0.0
+        )
+        stats["dropped"] = max(0, (window[-1][3] - window[0][3]) - frames)
+        return stats
+
+
+def _latency_stats(latencies: List[float], budget: float) -> Dict[str, Any]:
+    """遅延の平均・95パーセンタイル・目標内の割合を求める"""
+    if not latencies:
+        return {"latency_ms": 0.0, "latency_p95_ms": 0.0, "within_target": 0.0}
+    values = np.asarray(latencies) * 1000.0
+    return {
+        "latency_ms": round(float(values.mean()), 1),
+        "latency_p95_ms": round(float(np.percentile(values, 95)), 1),
+        "within_target": round(float((values <= budget * 1000.0).mean()), 3),
+    }
+
+
+class _LatencyHistogram:
+    """
+    実行全体の遅延の集計
+
+    長時間の配信でもメモリが増えないよう、遅延の値は保持せず合計・件数と
+    1ms刻みのヒストグラム（95パーセンタイル用）だけを持つ
+    """
+
+    # ヒストグラムの範囲（これを超える遅延は最後の区間に数える）
+    MAX_MS = 10000
+
+    def __init__(self, budget: float):
+        """
+        初期化
+
+        Args:
+            budget: 遅延の目標（秒）
+        """
+        self.budget = budget
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.within = 0
+        self._bins = np.zeros(self.MAX_MS + 1, dtype=np.int64)
+
+    def add(self, latency: float) -> None:
+        """
+        遅延を1件追加
+
+        Args:
+            latency: 遅延（秒）
+        """
+        ms = latency * 1000.0
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+        if ms <= self.budget * 1000.0:
+            self.within += 1
+        self._bins[min(int(ms), self.MAX_MS)] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        _latency_stats と同じ形式で統計を返す
+
+        95パーセンタイルは該当する区間の上端（最大値を超えない）とする
+        """
+        if not self.count:
+            return {"latency_ms": 0.0, "latency_p95_ms": 0.0, "within_target": 0.0}
+        rank = int(np.ceil(self.count * 0.95))
+        upper = int(np.searchsorted(np.cumsum(self._bins), rank)) + 1
+        return {
+            "latency_ms": round(float(self.total_ms / self.count), 1),
+            "latency_p95_ms": round(min(float(upper), self.max_ms), 1),
+            "within_target": round(self.within / self.count, 3),
+        }
@@ -1,16 +1,21 @@
 """
 モデル管理クラス
-YuNetモデルのダウンロードと管理を担当
+YuNetモデル（通常版・量子化版）のダウンロードと管理を担当
 """
 
 import os
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 
 from ..config.settings import ModelConfig
-from ..core.exceptions import ModelDownloadError, ModelLoadError
+from ..core.exceptions import ConfigurationError, ModelDownloadError, ModelLoadError
 from ..utils.file_utils import download_file
 
+# 有効なモデルとみなす最小ファイルサイズ（量子化版は通常版の半分以下になる）
+_MIN_MODEL_SIZE = 100000
+_MIN_QUANTIZED_MODEL_SIZE = 30000
+
 
 class ModelManager:
     """YuNetモデル管理クラス"""
@@ -21,9 +26,66 @@ class ModelManager:
 
         Args:
             config: モデル設定
+
+        Raises:
+            ConfigurationError: 未知のモデルバリアントが指定された場合
         """
         self.config = config
+        # バリアント名 → ダウンロードURL
+        self.variants: Dict[str, str] = {"fp32": config.yunet_model_url}
+        self.variants.update(config.quantized_model_urls)
+        self.variant = "fp32"
         self.model_path = config.model_cache_dir / config.model_filename
+        # 検出器プールの各スレッドから同時に呼ばれても1回だけダウンロードする
+        self._lock = threading.Lock()
+        self.set_variant(config.model_variant)
+
+    def list_variants(self) -> List[str]:
+        """
+        利用可能なモデルバリアント一覧を取得
+
+        Returns:
+            バリアント名リスト
+        """
+        return list(self.variants)
+
+    def variant_path(self, variant: str) -> Path:
+        """
+        バリアントのモデルファイルパスを取得
+
+        Args:
+            variant: バリアント名
+
+        Returns:
+            モデルファイルパス
+
+        Raises:
+            ConfigurationError: 未知のバリアントが指定された場合
+        """
+        if variant not in self.variants:
+            raise ConfigurationError(
+                f"未知のモデルバリアントです: {variant} "
+                f"(利用可能: {', '.join(self.variants)})"
+            )
+        if variant == "fp32":
+            filename = self.config.model_filename
+        else:
+            filename = self.variants[variant].rsplit("/", 1)[-1]
+        return self.config.model_cache_dir / filename
+
+    def set_variant(self, variant: str) -> None:
+        """
+        使用するモデルバリアントを切り替え
+
+        Args:
+            variant: バリアント名（"fp32", "int8" など）
+
+        Raises:
+            ConfigurationError: 未知のバリアントが指定された場合
+        """
+        self.model_path = self.variant_path(variant)
+        self.variant = variant
+        self.config.model_variant = variant
 
     def ensure_model_available(self) -> Path:
         """
@@ -36,14 +98,15 @@ class ModelManager:
             ModelDownloadError: ダウンロード失敗時
             ModelLoadError: モデル読み込み失敗時
         """
-        if self.model_path.exists():
-            if self._validate_model():
-                return self.model_path
-            else:
-                print("既存のモデルファイルが無効です。再ダウンロードします。")
-                self.model_path.unlink()
+        with self._lock:
+            if self.model_path.exists():
+                if self._validate_model():
+                    return self.model_path
+                else:
+                    print("既存のモデルファイルが無効です。再ダウンロードします。")
+                    self.model_path.unlink()
 
-        return self._download_model()
+            return self._download_model()
 
     def _download_model(self) -> Path:
         """
@@ -60,7 +123,7 @@ class ModelManager:
             self.config.model_cache_dir.mkdir(parents=True, exist_ok=True)
 
             # ダウンロード実行
-            download_file(self.config.yunet_model_url, str(self.model_path))
+            download_file(self.variants[self.variant], str(self.model_path))
 
             # ダウンロード後の検証
             if not self._validate_model():
@@ -85,7 +148,11 @@ class ModelManager:
 
         # ファイルサイズチェック（最小サイズ）
         file_size = self.model_path.stat().st_size
-        if file_size < 100000:  # 100KB未満は無効とみなす
+        if self.variant == "fp32":
+            min_size = _MIN_MODEL_SIZE  # 100KB未満は無効とみなす
+        else:
+            min_size = _MIN_QUANTIZED_MODEL_SIZE
+        if file_size < min_size:
             return False
 
         # 拡張子チェック
@@ -103,6 +170,7 @@ class ModelManager:
         """
         info = {
             "model_path": str(self.model_path),
+            "variant": self.variant,
             "exists": self.model_path.exists(),
             "size_mb": 0.0,
             "valid": False,
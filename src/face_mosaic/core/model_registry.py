@@ -0,0 +1,88 @@
+"""
+モデルレジストリ
+読み込み済みの物体検出モデルをプロセス内で共有し、再読み込みを避ける
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+ModelKey = Tuple[str, Optional[str], str]
+
+
+class ModelRegistry:
+    """(種類, パス, デバイス) をキーとする読み込み済みモデルのキャッシュクラス"""
+
+    def __init__(self):
+        """初期化"""
+        self._models: Dict[ModelKey, Any] = {}
+        self._load_times: Dict[ModelKey, float] = {}
+        self._key_locks: Dict[ModelKey, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_load(self, key: ModelKey, loader: Callable[[], Any]) -> Any:
+        """
+        モデルを取得（未読み込みの場合は読み込んで登録）
+
+        同じキーの読み込みが同時に要求された場合も読み込みは1回だけ行う
+
+        Args:
+            key: モデルのキー（種類, パス, デバイス）
+            loader: モデルを読み込む関数
+
+        Returns:
+            モデルインスタンス
+        """
+        with self._lock:
+            if key in self._models:
+                self.hits += 1
+                return self._models[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                if key in self._models:
+                    self.hits += 1
+                    return self._models[key]
+
+            start = time.perf_counter()
+            model = loader()
+            elapsed = time.perf_counter() - start
+
+            with self._lock:
+                self._models[key] = model
+                self._load_times[key] = elapsed
+                self.misses += 1
+
+        print(f"モデルを読み込みました: {key[0]} ({elapsed:.2f} 秒)")
+        return model
+
+    def clear(self) -> None:
+        """登録済みモデルを全て破棄"""
+        with self._lock:
+            self._models.clear()
+            self._load_times.clear()
+            self._key_locks.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        レジストリ統計を取得
+
+        Returns:
+            レジストリ統計辞書
+        """
+        with self._lock:
+            return {
+                "models": [
+                    {"key": [str(v) for v in key], "load_time": load_time}
+                    for key, load_time in self._load_times.items()
+                ],
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+# プロセス共通のレジストリ
+model_registry = ModelRegistry()
@@ -4,11 +4,14 @@ from torchvision.models.detection import (
     fasterrcnn_resnet50_fpn,
     FasterRCNN_ResNet50_FPN_Weights,
 )
+from torchvision.models.detection.transform import GeneralizedRCNNTransform
 from torchvision.transforms import functional as F
 import numpy as np
 import os
 import json
 
+from ..core.model_registry import model_registry
+
 
 class ObjectDetector:
     def __init__(
@@ -18,8 +21,17 @@ class ObjectDetector:
         label_names=None,
         score_thresh=0.5,
         model_path=None,
+        shared=True,
+        precision="fp32",
     ):
+        # shared: Falseの場合はレジストリを使わず専用のモデルを読み込む
+        # precision: "int8" の場合は全結合層を動的量子化する（CPUのみ対応）
+        if precision not in ("fp32", "int8"):
+            raise ValueError(f"未対応の精度です: {precision}")
+        if precision == "int8":
+            device = "cpu"
         self.device = device or ("cuda" if torch.cuda.is_available() else "cpu")
+        self.precision = precision
         weights = FasterRCNN_ResNet50_FPN_Weights.DEFAULT
 
         # モデルパスが指定されていればそれをロード
@@ -34,23 +46,47 @@ class ObjectDetector:
                 if candidates:
                     model_path = os.path.join(models_dir, candidates[0])
 
-        if model_path is not None and os.path.isfile(model_path):
-            print(f"ローカル学習済みモデルをロード: {model_path}")
-            self.model = torch.load(
-                model_path, map_location=self.device, weights_only=False
-            )
-            if isinstance(self.model, torch.nn.Module):
-                self.model.eval()
+        def load_model():
+            if model_path is not None and os.path.isfile(model_path):
+                print(f"ローカル学習済みモデルをロード: {model_path}")
+                model = torch.load(
+                    model_path, map_location=self.device, weights_only=False
+                )
+                if isinstance(model, torch.nn.Module):
+                    model.eval()
+                else:
+                    raise ValueError("ロードしたモデルがtorch.nn.Moduleではありません")
+
             else:
-                raise ValueError("ロードしたモデルがtorch.nn.Moduleではありません")
+                print(f"事前学習済みモデルをロード: {model_name} ({weights})")
+                model = fasterrcnn_resnet50_fpn(pretrained=True, weights=weights)
+                model.eval()
 
-        else:
-            print(f"事前学習済みモデルをロード: {model_name} ({weights})")
-            self.model = fasterrcnn_resnet50_fpn(pretrained=True, weights=weights)
-            self.model.eval()
+            model.to(self.device)
+            if precision == "int8":
+                # 動的量子化の対象は全結合層（ボックスヘッド）のみ。畳み込みはfp32のまま
+                model = torch.ao.quantization.quantize_dynamic(
+                    model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+            return model
 
-        self.model.to(self.device)
+        # 同じモデル・デバイス・精度の組み合わせは読み込み済みのものを再利用
+        model_type = "fasterrcnn" if precision == "fp32" else f"fasterrcnn-{precision}"
+        if shared:
+            self.model = model_registry.get_or_load(
+                (model_type, model_path or model_name, self.device), load_model
+            )
+        else:
+            self.model = load_model()
+        self.model_path = model_path
         self.score_thresh = score_thresh
+        # 推論解像度を指定できるか（torchvisionのFasterRCNN構成のモデルのみ）。
+        # 既定では短辺800pxに拡大して推論するため、縮小画像を渡しても速くならない
+        self.resizable_input = all(
+            hasattr(self.model, name)
+            for name in ("transform", "backbone", "rpn", "roi_heads")
+        ) and isinstance(self.model.transform, GeneralizedRCNNTransform)
+        self._transforms = {}
 
         # ラベル名の決定
         labels_path = os.path.join(
@@ -71,30 +107,98 @@ class ObjectDetector:
                 f"デフォルトラベルを使用: {self.label_names[:5]} ... (全{len(self.label_names)}件)"
             )
 
-    def detect(self, image, target_labels=None):
+        # ラベル名 → クラス番号。対象ラベルのクラス番号は初回に変換してキャッシュする
+        # （同名のラベルが複数ある場合は全て対象にする）
+        self._label_to_class = {}
+        for i, name in enumerate(self.label_names):
+            self._label_to_class.setdefault(name, []).append(i)
+        self._class_cache = {}
+
+    def class_indices(self, target_labels):
+        # target_labels: list of str or None
+        # 戻り値: 対象ラベルのクラス番号リスト（Noneの場合は全クラス）
+        if target_labels is None:
+            return None
+        key = tuple(target_labels)
+        classes = self._class_cache.get(key)
+        if classes is None:
+            classes = sorted(
+                {c for label in key for c in self._label_to_class.get(label, ())}
+            )
+            self._class_cache[key] = classes
+        return classes
+
+    def detect(self, image, target_labels=None, score_thresh=None, input_size=None):
         # image: numpy.ndarray (HWC, BGR or RGB)
         # target_labels: list of str or None
-        img_tensor = F.to_tensor(image).to(self.device)
+        # score_thresh: この呼び出しだけに使う閾値（Noneの場合はself.score_thresh）
+        # input_size: この呼び出しだけに使う推論時の最大辺（Noneの場合はモデルの既定値）
+        return self.detect_batch([image], target_labels, score_thresh, input_size)[0]
+
+    def detect_batch(
+        self, images, target_labels=None, score_thresh=None, input_size=None
+    ):
+        # images: list of numpy.ndarray (HWC, BGR or RGB)
+        # FasterRCNNはサイズの異なる画像をリストのまま1回の推論で処理できる
+        if score_thresh is None:
+            score_thresh = self.score_thresh
+        if not images:
+            return []
+        classes = self.class_indices(target_labels)
+        if classes == []:
+            # 対象ラベルがモデルのクラスにない
+            return [[] for _ in images]
+        if classes is not None:
+            classes = torch.as_tensor(classes, device=self.device)
+
+        img_tensors = [F.to_tensor(image).to(self.device) for image in images]
         with torch.no_grad():
-            outputs = self.model([img_tensor])[0]
+            if input_size is None or not self.resizable_input:
+                outputs = self.model(img_tensors)
+            else:
+                outputs = self._forward_resized(img_tensors, input_size)
+
+        return [self._parse_output(output, classes, score_thresh) for output in outputs]
+
+    def _forward_resized(self, img_tensors, input_size):
+        # 推論解像度だけを差し替えて GeneralizedRCNN.forward と同じ処理を行う。
+        # モデルは共有されているため、model.transform は書き換えずに別の変換を使う
+        transform = self._transforms.get(input_size)
+        if transform is None:
+            base = self.model.transform
+            transform = GeneralizedRCNNTransform(
+                min_size=input_size,
+                max_size=input_size,
+                image_mean=base.image_mean,
+                image_std=base.image_std,
+                size_divisible=base.size_divisible,
+            )
+            self._transforms[input_size] = transform
+
+        original_sizes = [tuple(img.shape[-2:]) for img in img_tensors]
+        images, _ = transform(img_tensors)
+        features = self.model.backbone(images.tensors)
+        proposals, _ = self.model.rpn(images, features)
+        detections, _ = self.model.roi_heads(features, proposals, images.image_sizes)
+        return transform.postprocess(detections, images.image_sizes, original_sizes)
+
+    def _parse_output(self, outputs, classes, score_thresh):
         boxes, labels, scores = outputs["boxes"], outputs["labels"], outputs["scores"]
 
         print(f"検出された物体数: {len(boxes)}")
 
-        results = []
-        for box, label, score in zip(boxes, labels, scores):
-            if score < self.score_thresh:
-                continue
-
-            label_name = self.label_names[label]
-            if (target_labels is None) or (label_name in target_labels):
-                results.append(
-                    {
-                        "box": box.cpu().numpy().astype(int),
-                        "label": label_name,
-                        "score": float(score.cpu().numpy()),
-                    }
-                )
+        # スコア・ラベルの絞り込みはテンソルのまま行い、残った分だけCPUに転送する
+        mask = scores >= score_thresh
+        if classes is not None:
+            mask &= torch.isin(labels, classes)
+        boxes = boxes[mask].cpu().numpy().astype(int)
+        labels = labels[mask].cpu().tolist()
+        scores = scores[mask].cpu().tolist()
+
+        results = [
+            {"box": box, "label": self.label_names[label], "score": score}
+            for box, label, score in zip(boxes, labels, scores)
+        ]
 
         print(f"検出結果: {len(results)} 個の物体")
 
@@ -0,0 +1,68 @@
+"""
+物体検出器ファクトリ
+設定に応じた物体検出器インスタンスを生成
+"""
+
+from typing import Optional
+
+from ..core.exceptions import ConfigurationError
+
+
+def create_object_detector(
+    detector_type: str,
+    model_path: Optional[str] = None,
+    shared: bool = True,
+    onnx_source: str = "yolo",
+    precision: str = "fp32",
+    calibration_dir: Optional[str] = None,
+):
+    """
+    物体検出器を生成
+
+    Args:
+        detector_type: 検出器の種類（"yolo", "fasterrcnn" または "onnx"）
+        model_path: モデルファイルパス（Noneの場合は既定モデル）
+        shared: 読み込み済みモデルをプロセス内で共有するかどうか
+            （スレッドごとに専用のモデルが必要な場合はFalse）
+        onnx_source: "onnx" で .onnx 以外のモデルを指定した場合の変換元の種類
+        precision: 推論精度（"fp32" または "int8"）。YOLOのint8はONNXに変換して
+            量子化したモデルをONNX Runtimeで推論する
+        calibration_dir: ONNXモデルのint8静的量子化に使う校正画像のディレクトリ
+            （Noneの場合は動的量子化）
+
+    Returns:
+        物体検出器インスタンス
+
+    Raises:
+        ConfigurationError: 未知の検出器種類・精度が指定された場合
+    """
+    if precision not in ("fp32", "int8"):
+        raise ConfigurationError(f"未対応の精度です: {precision}")
+
+    if detector_type == "yolo" and precision == "int8":
+        # ultralyticsのPyTorchモデルはCPUでのint8推論に対応しないためONNX経由にする
+        detector_type, onnx_source = "onnx", "yolo"
+
+    if detector_type == "yolo":
+        from ..core.yolov8_object_detector import YoloV8ObjectDetector
+
+        return YoloV8ObjectDetector(model_path=model_path, shared=shared)
+
+    if detector_type == "fasterrcnn":
+        from ..core.object_detector import ObjectDetector
+
+        return ObjectDetector(model_path=model_path, shared=shared, precision=precision)
+
+    if detector_type == "onnx":
+        # torchを読み込まずに推論する
+        from ..core.onnx_object_detector import OnnxObjectDetector
+
+        return OnnxObjectDetector(
+            model_path=model_path,
+            source_type=onnx_source,
+            shared=shared,
+            precision=precision,
+            calibration_dir=calibration_dir,
+        )
+
+    raise ConfigurationError(f"未知の物体検出器です: {detector_type}")
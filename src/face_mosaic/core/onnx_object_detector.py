@@ -0,0 +1,599 @@
+"""
+ONNX物体検出クラス
+YOLO/FasterRCNNをONNXに変換し、torchを使わずにCPUで推論
+"""
+
+import ast
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import cv2
+import numpy as np
+
+from ..core.exceptions import ConfigurationError, ModelLoadError
+from ..core.model_registry import model_registry
+from ..utils.box_utils import non_max_suppression
+
+# 変換したONNXモデルの保存先（models/onnx/）
+ONNX_MODEL_DIR = Path(__file__).resolve().parents[3] / "models" / "onnx"
+
+# YOLOのレターボックスの余白色
+_LETTERBOX_COLOR = 114
+
+# cv2.dnn はFasterRCNN形式の後処理（可変長出力）に対応しない
+_RCNN_REQUIRES_ORT = (
+    "FasterRCNN形式のONNXモデルには onnxruntime が必要です (pip install onnxruntime)"
+)
+
+
+def _labels_path(onnx_path: Path) -> Path:
+    """ONNXモデルに対応するラベルファイルのパス"""
+    return onnx_path.with_suffix(".labels.json")
+
+
+def export_onnx_model(
+    source_type: str = "yolo",
+    model_path: Optional[str] = None,
+    output_dir: Path = ONNX_MODEL_DIR,
+) -> Path:
+    """
+    YOLO/FasterRCNNモデルをONNXに変換して保存（変換済みの場合は再利用）
+
+    変換時のみtorch/ultralyticsを使用する
+
+    Args:
+        source_type: 変換元の検出器の種類（"yolo" または "fasterrcnn"）
+        model_path: 変換元のモデルファイルパス（Noneの場合は既定モデル）
+        output_dir: ONNXモデルの保存先ディレクトリ
+
+    Returns:
+        ONNXモデルファイルパス
+
+    Raises:
+        ConfigurationError: 未知の変換元が指定された場合
+        ModelLoadError: 変換失敗時
+    """
+    if source_type not in ("yolo", "fasterrcnn"):
+        raise ConfigurationError(f"ONNXに変換できない検出器です: {source_type}")
+
+    onnx_path = output_dir / f"{source_type}_{_export_tag(model_path)}.onnx"
+    if onnx_path.exists():
+        return onnx_path
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    print(f"物体検出モデルをONNXに変換中: {source_type} → {onnx_path}")
+
+    try:
+        if source_type == "yolo":
+            label_names = _export_yolo(model_path, onnx_path)
+        else:
+            label_names = _export_fasterrcnn(model_path, onnx_path)
+    except Exception as e:
+        onnx_path.unlink(missing_ok=True)
+        raise ModelLoadError(f"ONNXへの変換に失敗しました: {e}")
+
+    with open(_labels_path(onnx_path), "w", encoding="utf-8") as f:
+        json.dump(label_names, f, ensure_ascii=False)
+
+    return onnx_path
+
+
+def _export_tag(model_path: Optional[str]) -> str:
+    """
+    変換済みONNXモデルのファイル名に使う識別子
+
+    同名の別モデルや更新されたモデルで古い変換結果を再利用しないよう、
+    変換元の絶対パスと更新時刻のハッシュを付ける
+
+    Args:
+        model_path: 変換元のモデルファイルパス（Noneの場合は既定モデル）
+
+    Returns:
+        "<ファイル名>_<ハッシュ8桁>"（既定モデルは "default"）
+    """
+    if not model_path:
+        return "default"
+
+    path = Path(model_path)
+    source = str(path)
+    if path.is_file():
+        # 存在しない場合はモデル名として扱う（ultralyticsが取得する既定モデル名など）
+        source = f"{path.resolve()}:{path.stat().st_mtime_ns}"
+    digest = hashlib.sha256(source.encode("utf-8")).hexdigest()[:8]
+    return f"{path.stem}_{digest}"
+
+
+def _has_onnxruntime() -> bool:
+    """ONNX Runtime が導入されているかどうか"""
+    try:
+        import onnxruntime  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _letterbox(image: np.ndarray, imgsz: int):
+    """
+    YOLOの入力サイズにレターボックスしたblobを作成
+
+    Returns:
+        (blob (1, 3, imgsz, imgsz), 縮小率, 左余白, 上余白) のタプル
+    """
+    height, width = image.shape[:2]
+    ratio = min(imgsz / width, imgsz / height)
+    new_w, new_h = int(round(width * ratio)), int(round(height * ratio))
+    pad_x, pad_y = (imgsz - new_w) // 2, (imgsz - new_h) // 2
+
+    canvas = np.full((imgsz, imgsz, 3), _LETTERBOX_COLOR, np.uint8)
+    canvas[pad_y : pad_y + new_h, pad_x : pad_x + new_w] = cv2.resize(
+        image, (new_w, new_h), interpolation=cv2.INTER_LINEAR
+    )
+    blob = canvas.transpose(2, 0, 1)[np.newaxis].astype(np.float32) / 255.0
+    return blob, ratio, pad_x, pad_y
+
+
+def quantize_onnx_model(
+    onnx_path: Path,
+    calibration_dir: Optional[str] = None,
+    max_calibration_images: int = 32,
+) -> Path:
+    """
+    ONNXモデルをint8に量子化して保存（量子化済みの場合は再利用）
+
+    校正画像がある場合（YOLO形式のみ）は活性化も含めて静的量子化する。
+    畳み込みがint8のまま実行されるためCPUで高速になる。
+    校正画像がない場合は重みのみの動的量子化とする（速度向上は全結合層が中心）
+
+    Args:
+        onnx_path: 量子化元のONNXモデルファイルパス
+        calibration_dir: 校正用の画像ディレクトリ（Noneの場合は動的量子化）
+        max_calibration_images: 校正に使う画像の最大枚数
+
+    Returns:
+        量子化済みONNXモデルファイルパス
+        （静的量子化は <元のファイル名>_int8_static.onnx、動的量子化は _int8.onnx）
+
+    Raises:
+        ConfigurationError: ONNX Runtime が導入されていない場合
+        ModelLoadError: 量子化失敗時
+    """
+    try:
+        import onnxruntime
+        from onnxruntime import quantization
+    except ImportError:
+        raise ConfigurationError(
+            "int8量子化には onnxruntime が必要です (pip install onnxruntime)"
+        )
+
+    calibration = None
+    if calibration_dir is not None:
+        input_meta = onnxruntime.InferenceSession(
+            str(onnx_path), providers=["CPUExecutionProvider"]
+        ).get_inputs()[0]
+        if len(input_meta.shape) == 4 and isinstance(input_meta.shape[-1], int):
+            calibration = _load_calibration_blobs(
+                Path(calibration_dir), input_meta.shape[-1], max_calibration_images
+            )
+            calibration = [{input_meta.name: blob} for blob in calibration]
+        else:
+            print("FasterRCNN形式のモデルは動的量子化のみ対応しています")
+
+    suffix = "_int8_static" if calibration else "_int8"
+    quantized_path = onnx_path.with_name(f"{onnx_path.stem}{suffix}.onnx")
+    if quantized_path.exists():
+        return quantized_path
+
+    print(f"ONNXモデルをint8に量子化中: {onnx_path} → {quantized_path}")
+    try:
+        if calibration:
+            _quantize_static(quantization, onnx_path, quantized_path, calibration)
+        else:
+            quantization.quantize_dynamic(
+                str(onnx_path),
+                str(quantized_path),
+                weight_type=quantization.QuantType.QUInt8,
+            )
+    except Exception as e:
+        quantized_path.unlink(missing_ok=True)
+        raise ModelLoadError(f"ONNXモデルの量子化に失敗しました: {e}")
+
+    labels_path = _labels_path(onnx_path)
+    if labels_path.is_file():
+        shutil.copyfile(labels_path, _labels_path(quantized_path))
+
+    return quantized_path
+
+
+def _load_calibration_blobs(
+    calibration_dir: Path, imgsz: int, max_images: int
+) -> List[np.ndarray]:
+    """校正用画像を推論時と同じ前処理でblobに変換"""
+    from ..config.settings import ProcessingConfig
+    from ..utils.file_utils import get_image_files
+
+    blobs = []
+    files = get_image_files(calibration_dir, ProcessingConfig().supported_formats)
+    for path in files[:max_images]:
+        image = cv2.imread(str(path))
+        if image is not None:
+            image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+            blobs.append(_letterbox(image, imgsz)[0])
+
+    if not blobs:
+        raise ModelLoadError(f"校正用の画像がありません: {calibration_dir}")
+    return blobs
+
+
+def _quantize_static(
+    quantization, onnx_path: Path, quantized_path: Path, calibration: List[dict]
+) -> None:
+    """校正データで活性化の範囲を求め、QDQ形式で静的量子化"""
+
+    class _Reader(quantization.CalibrationDataReader):
+        def __init__(self):
+            self._feeds = iter(calibration)
+
+        def get_next(self):
+            return next(self._feeds, None)
+
+    # 量子化前に形状推論とグラフ最適化を行う（推奨される前処理）
+    prepared_path = quantized_path.with_name(f"{quantized_path.stem}.prep.onnx")
+    try:
+        quantization.shape_inference.quant_pre_process(
+            str(onnx_path), str(prepared_path)
+        )
+        source = prepared_path
+    except Exception:
+        source = onnx_path
+
+    try:
+        quantization.quantize_static(
+            str(source),
+            str(quantized_path),
+            _Reader(),
+            quant_format=quantization.QuantFormat.QDQ,
+            activation_type=quantization.QuantType.QUInt8,
+            weight_type=quantization.QuantType.QInt8,
+        )
+    finally:
+        prepared_path.unlink(missing_ok=True)
+
+
+def _export_yolo(model_path: Optional[str], onnx_path: Path) -> List[str]:
+    """YOLOモデルをONNXに変換し、ラベル名リストを返す"""
+    from ..core.yolov8_object_detector import YoloV8ObjectDetector
+
+    detector = YoloV8ObjectDetector(model_path=model_path, device="cpu", shared=False)
+    exported = detector.model.export(
+        format="onnx", imgsz=detector.imgsz, dynamic=False, opset=12
+    )
+    os.replace(exported, onnx_path)
+
+    names = detector.label_names
+    if isinstance(names, dict):
+        return [names[i] for i in sorted(names)]
+    return list(names)
+
+
+def _export_fasterrcnn(model_path: Optional[str], onnx_path: Path) -> List[str]:
+    """FasterRCNNモデルをONNXに変換し、ラベル名リストを返す"""
+    import torch
+
+    from ..core.object_detector import ObjectDetector
+
+    detector = ObjectDetector(model_path=model_path, device="cpu", shared=False)
+    dummy = torch.rand(3, 480, 640)
+    torch.onnx.export(
+        detector.model,
+        ([dummy],),
+        str(onnx_path),
+        opset_version=11,
+        input_names=["image"],
+        output_names=["boxes", "labels", "scores"],
+        dynamic_axes={"image": {1: "height", 2: "width"}},
+    )
+    return list(detector.label_names)
+
+
+def _load_session(onnx_path: Path):
+    """
+    推論セッションを生成（ONNX Runtime、未導入の場合はcv2.dnn）
+
+    Returns:
+        (バックエンド名, セッション) のタプル
+    """
+    try:
+        import onnxruntime
+    except ImportError:
+        return "opencv", cv2.dnn.readNetFromONNX(str(onnx_path))
+
+    options = onnxruntime.SessionOptions()
+    options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+    session = onnxruntime.InferenceSession(
+        str(onnx_path), options, providers=["CPUExecutionProvider"]
+    )
+    return "onnxruntime", session
+
+
+class OnnxObjectDetector:
+    """ONNX Runtime / cv2.dnn による物体検出クラス"""
+
+    def __init__(
+        self,
+        model_path: Optional[str] = None,
+        label_names: Optional[List[str]] = None,
+        score_thresh: float = 0.5,
+        nms_thresh: float = 0.45,
+        source_type: str = "yolo",
+        shared: bool = True,
+        precision: str = "fp32",
+        calibration_dir: Optional[str] = None,
+    ):
+        """
+        初期化
+
+        Args:
+            model_path: ONNXモデルファイルパス。.onnx 以外の場合は変換元モデルとして
+                扱い、models/onnx/ に変換したものを使用する
+            label_names: ラベル名リスト（Noneの場合は変換時に保存したラベル）
+            score_thresh: 信頼度閾値
+            nms_thresh: NMSのIoU閾値（YOLO形式の出力のみ使用）
+            source_type: 変換元の検出器の種類（"yolo" または "fasterrcnn"）
+            shared: 読み込み済みのセッションをプロセス内で共有するかどうか
+            precision: "int8" の場合は量子化したモデルを使用する
+            calibration_dir: int8の静的量子化に使う校正画像のディレクトリ
+                （Noneの場合は動的量子化）
+
+        Raises:
+            ConfigurationError: 未対応の精度が指定された場合、
+                ONNX Runtime なしでFasterRCNN形式のモデルを使う場合
+            ModelLoadError: モデル読み込み失敗時
+        """
+        if precision not in ("fp32", "int8"):
+            raise ConfigurationError(f"未対応の精度です: {precision}")
+        if source_type == "fasterrcnn" and not _has_onnxruntime():
+            raise ConfigurationError(_RCNN_REQUIRES_ORT)
+
+        if model_path is not None and model_path.endswith(".onnx"):
+            onnx_path = Path(model_path)
+        else:
+            onnx_path = export_onnx_model(source_type, model_path)
+
+        if not onnx_path.is_file():
+            raise ModelLoadError(f"ONNXモデルが見つかりません: {onnx_path}")
+        if precision == "int8":
+            onnx_path = quantize_onnx_model(onnx_path, calibration_dir)
+
+        try:
+            if shared:
+                self.backend, self.session = model_registry.get_or_load(
+                    ("onnx", str(onnx_path), "cpu"), lambda: _load_session(onnx_path)
+                )
+            else:
+                self.backend, self.session = _load_session(onnx_path)
+        except Exception as e:
+            raise ModelLoadError(f"ONNXモデルの読み込みに失敗しました: {e}")
+
+        self.model_path = str(onnx_path)
+        self.device = "cpu"
+        self.precision = precision
+        self.score_thresh = score_thresh
+        self.nms_thresh = nms_thresh
+        self.label_names = label_names or self._load_label_names(onnx_path)
+
+        if self.backend == "onnxruntime":
+            # 入力が3次元（バッチ次元なし）の場合はFasterRCNN形式
+            input_meta = self.session.get_inputs()[0]
+            self.input_name = input_meta.name
+            self.output_names = None
+            input_shape = input_meta.shape
+            self.layout = "rcnn" if len(input_shape) == 3 else "yolo"
+        else:
+            # cv2.dnn は入力形状を取得できないため出力数で判定する
+            # （FasterRCNN形式は boxes/labels/scores の3出力）
+            self.input_name = None
+            self.output_names = list(self.session.getUnconnectedOutLayersNames())
+            if len(self.output_names) >= 3:
+                raise ConfigurationError(_RCNN_REQUIRES_ORT)
+            input_shape = [1, 3, 640, 640]
+            self.layout = "yolo"
+        self.imgsz = input_shape[-1] if isinstance(input_shape[-1], int) else 640
+        # 変換済みモデルは入力サイズ固定（FasterRCNN形式もモデル内で拡大する）ため、
+        # 縮小画像を渡しても推論は速くならない
+        self.resizable_input = False
+        self._class_cache: Dict[tuple, List[int]] = {}
+
+    def _load_label_names(self, onnx_path: Path) -> List[str]:
+        """変換時に保存したラベル、またはONNXメタデータからラベル名を取得"""
+        labels_path = _labels_path(onnx_path)
+        if labels_path.is_file():
+            with open(labels_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+
+        if self.backend == "onnxruntime":
+            # ultralyticsで変換したモデルはメタデータにラベル名を持つ
+            metadata = self.session.get_modelmeta().custom_metadata_map
+            if "names" in metadata:
+                names = ast.literal_eval(metadata["names"])
+                return [names[i] for i in sorted(names)]
+
+        return []
+
+    def detect(
+        self,
+        image: np.ndarray,
+        target_labels: Optional[List[str]] = None,
+        score_thresh: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        物体を検出
+
+        Args:
+            image: 入力画像 (HWC, RGB)
+            target_labels: 対象ラベルリスト（Noneの場合は全ラベル）
+            score_thresh: この呼び出しだけに使う閾値（Noneの場合はself.score_thresh）
+
+        Returns:
+            検出結果リスト [{"box": [x1, y1, x2, y2], "label": str, "score": float}]
+        """
+        return self.detect_batch([image], target_labels, score_thresh)[0]
+
+    def detect_batch(
+        self,
+        images: List[np.ndarray],
+        target_labels: Optional[List[str]] = None,
+        score_thresh: Optional[float] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        複数画像の物体を検出
+
+        変換済みモデルは入力サイズ固定・バッチ1のため1枚ずつ推論する
+
+        Args:
+            images: 入力画像リスト (HWC, RGB)
+            target_labels: 対象ラベルリスト
+            score_thresh: この呼び出しだけに使う閾値
+
+        Returns:
+            画像ごとの検出結果リスト
+        """
+        if score_thresh is None:
+            score_thresh = self.score_thresh
+
+        classes = self.class_indices(target_labels)
+        if classes == []:
+            # 対象ラベルがモデルのクラスにない
+            return [[] for _ in images]
+
+        results = []
+        for image in images:
+            if self.layout == "rcnn":
+                boxes, labels, scores = self._infer_rcnn(image)
+            else:
+                boxes, labels, scores = self._infer_yolo(image, score_thresh, classes)
+            results.append(
+                self._to_results(boxes, labels, scores, classes, score_thresh)
+            )
+        return results
+
+    def class_indices(self, target_labels: Optional[List[str]]) -> Optional[List[int]]:
+        """
+        対象ラベルのクラス番号を取得（ラベルの組ごとに初回のみ変換）
+
+        Args:
+            target_labels: 対象ラベルリスト（Noneの場合は全クラス）
+
+        Returns:
+            クラス番号リスト（Noneの場合は全クラス）
+        """
+        if target_labels is None:
+            return None
+        key = tuple(target_labels)
+        classes = self._class_cache.get(key)
+        if classes is None:
+            names = set(key)
+            classes = [i for i, name in enumerate(self.label_names) if name in names]
+            self._class_cache[key] = classes
+        return classes
+
+    def _run(self, blob: np.ndarray) -> List[np.ndarray]:
+        """バックエンドで推論を実行"""
+        if self.backend == "onnxruntime":
+            return self.session.run(None, {self.input_name: blob})
+        self.session.setInput(blob)
+        return list(self.session.forward(self.output_names))
+
+    def _infer_yolo(
+        self,
+        image: np.ndarray,
+        score_thresh: float,
+        classes: Optional[List[int]] = None,
+    ):
+        """
+        YOLO形式のモデルで推論（閾値・対象クラスはNMSの前に適用）
+
+        Returns:
+            (矩形 (N, 4) [x1, y1, x2, y2], クラス (N,), スコア (N,)) のタプル
+        """
+        height, width = image.shape[:2]
+        blob, ratio, pad_x, pad_y = _letterbox(image, self.imgsz)
+
+        # 出力 (1, 4 + クラス数, 候補数) [cx, cy, w, h, クラススコア...]
+        predictions = self._run(blob)[0][0].T
+        class_scores = predictions[:, 4:]
+        labels = class_scores.argmax(axis=1)
+        scores = class_scores[np.arange(len(labels)), labels]
+
+        mask = scores >= score_thresh
+        if classes is not None:
+            mask &= np.isin(labels, classes)
+        predictions, labels, scores = predictions[mask], labels[mask], scores[mask]
+        if len(scores) == 0:
+            return np.empty((0, 4)), labels, scores
+
+        # 中心座標 → 左上座標（レターボックスを戻す）
+        boxes = np.empty((len(scores), 4), dtype=np.float32)
+        boxes[:, 0] = (predictions[:, 0] - predictions[:, 2] / 2 - pad_x) / ratio
+        boxes[:, 1] = (predictions[:, 1] - predictions[:, 3] / 2 - pad_y) / ratio
+        boxes[:, 2] = predictions[:, 2] / ratio
+        boxes[:, 3] = predictions[:, 3] / ratio
+
+        # クラスごとのNMS（クラスごとに座標をずらして一括処理）
+        offsets = labels[:, np.newaxis] * float(max(width, height) + 1)
+        shifted = boxes.copy()
+        shifted[:, :2] += offsets
+        keep = non_max_suppression(shifted, scores, self.nms_thresh)
+        boxes, labels, scores = boxes[keep], labels[keep], scores[keep]
+
+        # [x, y, w, h] → [x1, y1, x2, y2]（画像範囲にクリップ）
+        boxes[:, 2:] += boxes[:, :2]
+        boxes[:, [0, 2]] = boxes[:, [0, 2]].clip(0, width)
+        boxes[:, [1, 3]] = boxes[:, [1, 3]].clip(0, height)
+        return boxes, labels, scores
+
+    def _infer_rcnn(self, image: np.ndarray):
+        """
+        FasterRCNN形式のモデルで推論
+
+        Returns:
+            (矩形 (N, 4) [x1, y1, x2, y2], ラベル (N,), スコア (N,)) のタプル
+        """
+        blob = image.transpose(2, 0, 1).astype(np.float32) / 255.0
+        boxes, labels, scores = self._run(blob)[:3]
+        return boxes, labels, scores
+
+    def _to_results(
+        self,
+        boxes: np.ndarray,
+        labels: np.ndarray,
+        scores: np.ndarray,
+        classes: Optional[List[int]],
+        score_thresh: float,
+    ) -> List[Dict[str, Any]]:
+        """推論結果をObjectDetector.detectと同じ形式に変換"""
+        boxes, labels, scores = (
+            np.asarray(boxes),
+            np.asarray(labels),
+            np.asarray(scores),
+        )
+        mask = scores >= score_thresh
+        if classes is not None:
+            mask &= np.isin(labels, classes)
+
+        num_labels = len(self.label_names)
+        return [
+            {
+                "box": box,
+                "label": self.label_names[label] if label < num_labels else str(label),
+                "score": score,
+            }
+            for box, label, score in zip(
+                boxes[mask].astype(int),
+                labels[mask].astype(int).tolist(),
+                scores[mask].tolist(),
+            )
+        ]
@@ -0,0 +1,209 @@
+"""
+並列処理クラス
+プロセスプール・スレッドプールによる複数画像の並列処理を担当
+"""
+
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..config.settings import AppConfig
+from ..core.exceptions import ImageProcessingError
+
+# 1ファイルの処理結果 (処理結果辞書, エラーメッセージ)
+TaskResult = Tuple[Optional[Dict[str, Any]], Optional[str]]
+ResultCallback = Callable[
+    [Path, Optional[Path], Optional[Dict[str, Any]], Optional[str]], None
+]
+
+# ワーカープロセス内で保持する画像処理インスタンス
+_worker_image_processor = None
+
+
+def _run_bounded(
+    executor: Executor,
+    process_file: Callable[[Path, Optional[Path]], TaskResult],
+    tasks: List[Tuple[Path, Optional[Path]]],
+    on_result: ResultCallback,
+    max_in_flight: int,
+) -> None:
+    """
+    投入済みタスク数を上限付きにしてタスクを実行し、完了順に結果を通知
+
+    上限を設けることで、大量のファイルを処理する場合もメモリ使用量を抑える。
+    結果通知は呼び出し元スレッドで行う
+
+    Args:
+        executor: タスクを実行するプール
+        process_file: 1ファイルを処理する関数
+            (入力パス, 出力パス) -> (処理結果辞書, エラーメッセージ)
+        tasks: (入力パス, 出力パス) のリスト
+        on_result: 結果通知コールバック
+            (入力パス, 出力パス, 処理結果辞書, エラーメッセージ)
+        max_in_flight: 同時に投入しておくタスクの上限
+    """
+    task_iter = iter(tasks)
+    pending = {}
+
+    for input_path, output_path in task_iter:
+        future = executor.submit(process_file, input_path, output_path)
+        pending[future] = (input_path, output_path)
+        if len(pending) >= max_in_flight:
+            break
+
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            input_path, output_path = pending.pop(future)
+            result, error = future.result()
+            on_result(input_path, output_path, result, error)
+
+            next_task = next(task_iter, None)
+            if next_task is not None:
+                next_future = executor.submit(process_file, *next_task)
+                pending[next_future] = next_task
+
+
+def _initialize_worker(config: AppConfig) -> None:
+    """
+    ワーカープロセスを初期化（プロセスごとに1回だけ実行）
+
+    Args:
+        config: アプリケーション設定
+    """
+    global _worker_image_processor
+
+    import cv2
+
+    # プロセス数ぶんの並列化を行うため、OpenCV内部のスレッドは1本に制限
+    cv2.setNumThreads(1)
+
+    from ..core.application import FaceMosaicApplication
+
+    _worker_image_processor = FaceMosaicApplication(config).image_processor
+
+
+def _process_file(
+    method: str, input_path: Path, output_path: Optional[Path]
+) -> TaskResult:
+    """
+    ワーカープロセスで1ファイルを処理
+
+    Args:
+        method: 呼び出すImageProcessorのメソッド名
+        input_path: 入力ファイルパス
+        output_path: 出力ファイルパス
+
+    Returns:
+        (処理結果辞書, エラーメッセージ) のタプル
+    """
+    try:
+        process = getattr(_worker_image_processor, method)
+        return process(input_path, output_path), None
+    except Exception as e:
+        return None, str(e)
+
+
+class ParallelProcessor:
+    """プロセスプール並列処理クラス"""
+
+    def __init__(self, config: AppConfig, workers: int):
+        """
+        初期化
+
+        Args:
+            config: ワーカーで検出器を構築するためのアプリケーション設定
+            workers: ワーカープロセス数
+        """
+        self.config = config
+        self.workers = workers
+
+    def run(
+        self,
+        tasks: List[Tuple[Path, Optional[Path]]],
+        on_result: ResultCallback,
+        method: str = "process_image_file",
+    ) -> None:
+        """
+        タスクを並列処理し、完了順に結果を通知
+
+        Args:
+            tasks: (入力パス, 出力パス) のリスト
+            on_result: 結果通知コールバック
+                (入力パス, 出力パス, 処理結果辞書, エラーメッセージ)
+            method: タスクごとに呼び出すImageProcessorのメソッド名
+
+        Raises:
+            ImageProcessingError: ワーカープロセスが異常終了した場合
+        """
+        try:
+            with ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_initialize_worker,
+                initargs=(self.config,),
+            ) as executor:
+                _run_bounded(
+                    executor,
+                    partial(_process_file, method),
+                    tasks,
+                    on_result,
+                    self.workers * 4,
+                )
+
+        except BrokenProcessPool as e:
+            raise ImageProcessingError(f"並列処理ワーカーが異常終了しました: {e}")
+
+
+class ThreadedProcessor:
+    """スレッドプール並列処理クラス"""
+
+    def __init__(self, image_processor, threads: int):
+        """
+        初期化
+
+        OpenCVの推論中はGILが解放されるため、プロセスを分けずに
+        モデルのメモリを共有したまま並列化できる。検出器は
+        ImageProcessor の検出器プールからスレッドごとに借り出される
+
+        Args:
+            image_processor: 画像処理インスタンス（検出器プール設定済み）
+            threads: スレッド数
+        """
+        self.image_processor = image_processor
+        self.threads = threads
+
+    def run(
+        self,
+        tasks: List[Tuple[Path, Optional[Path]]],
+        on_result: ResultCallback,
+        method: str = "process_image_file",
+    ) -> None:
+        """
+        タスクをスレッド並列処理し、完了順に結果を通知
+
+        結果通知は呼び出し元スレッドで行うため、on_result はスレッドセーフでなくてよい
+
+        Args:
+            tasks: (入力パス, 出力パス) のリスト
+            on_result: 結果通知コールバック
+                (入力パス, 出力パス, 処理結果辞書, エラーメッセージ)
+            method: タスクごとに呼び出すImageProcessorのメソッド名
+        """
+        process = getattr(self.image_processor, method)
+
+        def process_file(input_path: Path, output_path: Optional[Path]) -> TaskResult:
+            try:
+                return process(input_path, output_path), None
+            except Exception as e:
+                return None, str(e)
+
+        with ThreadPoolExecutor(max_workers=self.threads) as executor:
+            _run_bounded(executor, process_file, tasks, on_result, self.threads * 4)
@@ -0,0 +1,261 @@
+"""
+パイプライン処理クラス
+読み込み・検出・モザイク/保存を別スレッドのステージに分割して処理
+"""
+
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..config.settings import ProcessingConfig
+from ..core.image_processor import ImageProcessor
+
+# ステージ終了を通知する番兵
+_SENTINEL = None
+
+
+class _StageTimer:
+    """ステージごとの稼働/待機時間を集計するクラス"""
+
+    def __init__(self, threads: int):
+        """
+        初期化
+
+        Args:
+            threads: ステージのスレッド数
+        """
+        self.threads = threads
+        self.busy = 0.0
+        self.idle = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, busy: float, idle: float) -> None:
+        """
+        スレッドの計測結果を加算
+
+        Args:
+            busy: 処理に費やした時間（秒）
+            idle: キュー待ちに費やした時間（秒）
+        """
+        with self._lock:
+            self.busy += busy
+            self.idle += idle
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        集計結果を辞書で取得
+
+        Returns:
+            集計結果辞書
+        """
+        total = self.busy + self.idle
+        return {
+            "threads": self.threads,
+            "busy_time": self.busy,
+            "idle_time": self.idle,
+            "utilization": self.busy / total if total > 0 else 0.0,
+        }
+
+
+class PipelineProcessor:
+    """ステージ分割パイプライン処理クラス"""
+
+    def __init__(
+        self, image_processor: ImageProcessor, processing_config: ProcessingConfig
+    ):
+        """
+        初期化
+
+        Args:
+            image_processor: 画像処理インスタンス
+            processing_config: 処理設定（キュー深さ・I/Oスレッド数）
+        """
+        self.image_processor = image_processor
+        self.queue_depth = max(1, processing_config.pipeline_queue_depth)
+        self.io_threads = max(1, processing_config.pipeline_io_threads)
+
+    def run(
+        self,
+        tasks: List[Tuple[Path, Path]],
+        on_result: Callable[
+            [Path, Path, Optional[Dict[str, Any]], Optional[str]], None
+        ],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        タスクをパイプライン処理し、完了順に結果を通知
+
+        読み込みスレッド → 検出スレッド → モザイク/保存スレッドを
+        上限付きキューで接続し、検出器が常に次の画像を処理できるようにする
+
+        Args:
+            tasks: (入力パス, 出力パス) のリスト
+            on_result: 結果通知コールバック
+                (入力パス, 出力パス, 処理結果辞書, エラーメッセージ)
+
+        Returns:
+            ステージごとの稼働/待機時間
+        """
+        task_iter = iter(tasks)
+        task_lock = threading.Lock()
+        decoded_queue = queue.Queue(maxsize=self.queue_depth)
+        detected_queue = queue.Queue(maxsize=self.queue_depth)
+        result_queue = queue.Queue(maxsize=self.queue_depth)
+
+        timers = {
+            "decode": _StageTimer(self.io_threads),
+            "detect": _StageTimer(1),
+            "encode": _StageTimer(self.io_threads),
+        }
+
+        def next_task() -> Optional[Tuple[Path, Path]]:
+            with task_lock:
+                return next(task_iter, None)
+
+        threads = [
+            threading.Thread(
+                target=self._decode_worker,
+                args=(next_task, decoded_queue, timers["decode"]),
+                daemon=True,
+            )
+            for _ in range(self.io_threads)
+        ]
+        threads.append(
+            threading.Thread(
+                target=self._detect_worker,
+                args=(decoded_queue, detected_queue, timers["detect"]),
+                daemon=True,
+            )
+        )
+        threads.extend(
+            threading.Thread(
+                target=self._encode_worker,
+                args=(detected_queue, result_queue, timers["encode"]),
+                daemon=True,
+            )
+            for _ in range(self.io_threads)
+        )
+
+        for thread in threads:
+            thread.start()
+
+        for _ in range(len(tasks)):
+            input_path, output_path, result, error = result_queue.get()
+            on_result(input_path, output_path, result, error)
+
+        for thread in threads:
+            thread.join()
+
+        return {name: timer.to_dict() for name, timer in timers.items()}
+
+    def _decode_worker(
+        self,
+        next_task: Callable[[], Optional[Tuple[Path, Path]]],
+        out_queue: queue.Queue,
+        timer: _StageTimer,
+    ) -> None:
+        """読み込みステージ"""
+        busy = idle = 0.0
+
+        while True:
+            task = next_task()
+            if task is None:
+                break
+            input_path, output_path = task
+
+            start = time.perf_counter()
+            try:
+                payload = self.image_processor.load_image(input_path)
+                error = None
+            except Exception as e:
+                payload, error = None, str(e)
+            busy += time.perf_counter() - start
+
+            start = time.perf_counter()
+            out_queue.put((input_path, output_path, payload, error))
+            idle += time.perf_counter() - start
+
+        out_queue.put(_SENTINEL)
+        timer.add(busy, idle)
+
+    def _detect_worker(
+        self, in_queue: queue.Queue, out_queue: queue.Queue, timer: _StageTimer
+    ) -> None:
+        """検出ステージ"""
+        busy = idle = 0.0
+        finished_decoders = 0
+
+        while finished_decoders < self.io_threads:
+            start = time.perf_counter()
+            item = in_queue.get()
+            idle += time.perf_counter() - start
+
+            if item is _SENTINEL:
+                finished_decoders += 1
+                continue
+
+            input_path, output_path, payload, error = item
+            if error is None:
+                start = time.perf_counter()
+                image, original_size, content_hash = payload
+                detection_stats = {}
+                try:
+                    faces, objects = self.image_processor.detect_targets(
+                        image, content_hash, detection_stats
+                    )
+                    payload = (image, original_size, faces, objects, detection_stats)
+                except Exception as e:
+                    payload, error = None, str(e)
+                busy += time.perf_counter() - start
+
+            start = time.perf_counter()
+            out_queue.put((input_path, output_path, payload, error))
+            idle += time.perf_counter() - start
+
+        for _ in range(self.io_threads):
+            out_queue.put(_SENTINEL)
+        timer.add(busy, idle)
+
+    def _encode_worker(
+        self, in_queue: queue.Queue, out_queue: queue.Queue, timer: _StageTimer
+    ) -> None:
+        """モザイク・保存ステージ"""
+        busy = idle = 0.0
+
+        while True:
+            start = time.perf_counter()
+            item = in_queue.get()
+            idle += time.perf_counter() - start
+
+            if item is _SENTINEL:
+                break
+
+            input_path, output_path, payload, error = item
+            result = None
+            if error is None:
+                start = time.perf_counter()
+                image, original_size, faces, objects, detection_stats = payload
+                try:
+                    processed_image = self.image_processor.render_image(
+                        image, faces, objects, input_path
+                    )
+                    self.image_processor.save_image(processed_image, output_path)
+                    result = self.image_processor.build_result(
+                        input_path,
+                        output_path,
+                        faces,
+                        objects,
+                        original_size,
+                        processed_image,
+                    )
+                    result.update(detection_stats)
+                except Exception as e:
+                    error = str(e)
+                busy += time.perf_counter() - start
+
+            start = time.perf_counter()
+            out_queue.put((input_path, output_path, result, error))
+            idle += time.perf_counter() - start
+
+        timer.add(busy, idle)
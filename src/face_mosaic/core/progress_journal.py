@@ -0,0 +1,175 @@
+"""
+進捗ジャーナルクラス
+バッチ処理の各ファイルの処理結果をSQLiteに記録し、中断後の再開に使用
+"""
+
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+class ProgressJournal:
+    """SQLiteによる進捗ジャーナルクラス"""
+
+    # まとめてコミットする記録件数
+    COMMIT_INTERVAL = 100
+
+    def __init__(self, journal_path: Path):
+        """
+        初期化
+
+        Args:
+            journal_path: ジャーナルファイルパス
+        """
+        self.journal_path = journal_path
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pending = 0
+
+        self.connection = sqlite3.connect(str(journal_path))
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                fingerprint TEXT NOT NULL,
+                status TEXT NOT NULL,
+                faces INTEGER NOT NULL DEFAULT 0,
+                error TEXT,
+                output_path TEXT,
+                updated_at REAL NOT NULL,
+                content_hash TEXT
+            )
+            """)
+        # 内容ハッシュ列のない旧形式のジャーナルを移行
+        columns = {
+            row[1] for row in self.connection.execute("PRAGMA table_info(entries)")
+        }
+        if "content_hash" not in columns:
+            self.connection.execute("ALTER TABLE entries ADD COLUMN content_hash TEXT")
+        self.connection.commit()
+
+    @staticmethod
+    def default_path(output_dir: Path) -> Path:
+        """
+        出力ディレクトリに対応するジャーナルファイルパスを取得
+
+        Args:
+            output_dir: 出力ディレクトリ
+
+        Returns:
+            出力ディレクトリと同じ階層に置くジャーナルファイルパス
+        """
+        output_dir = output_dir.resolve()
+        return output_dir.parent / f"{output_dir.name}.journal.sqlite3"
+
+    def lookup(self, path: str) -> Optional[Dict[str, Any]]:
+        """
+        エントリを取得
+
+        Args:
+            path: 入力ディレクトリからの相対パス
+
+        Returns:
+            エントリ辞書（未記録の場合はNone）
+        """
+        row = self.connection.execute(
+            "SELECT size, mtime_ns, fingerprint, status, content_hash, output_path "
+            "FROM entries WHERE path = ?",
+            (path,),
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        return {
+            "size": row[0],
+            "mtime_ns": row[1],
+            "fingerprint": row[2],
+            "status": row[3],
+            "content_hash": row[4],
+            "output_path": row[5],
+        }
+
+    def update_mtime(self, path: str, mtime_ns: int) -> None:
+        """
+        内容が変わっていないファイルの更新時刻を記録し直す
+
+        Args:
+            path: 入力ディレクトリからの相対パス
+            mtime_ns: 入力ファイル更新時刻（ナノ秒）
+        """
+        self.connection.execute(
+            "UPDATE entries SET mtime_ns = ?, updated_at = ? WHERE path = ?",
+            (mtime_ns, time.time(), path),
+        )
+
+        self._pending += 1
+        if self._pending >= self.COMMIT_INTERVAL:
+            self.commit()
+
+    def record(
+        self,
+        path: str,
+        size: int,
+        mtime_ns: int,
+        fingerprint: str,
+        success: bool,
+        faces: int = 0,
+        error: Optional[str] = None,
+        output_path: Optional[str] = None,
+        content_hash: Optional[str] = None,
+    ) -> None:
+        """
+        処理結果を記録
+
+        Args:
+            path: 入力ディレクトリからの相対パス
+            size: 入力ファイルサイズ
+            mtime_ns: 入力ファイル更新時刻（ナノ秒）
+            fingerprint: 設定フィンガープリント
+            success: 処理成功の可否
+            faces: 検出された顔の数
+            error: エラーメッセージ
+            output_path: 出力ファイルパス
+            content_hash: 入力ファイルの内容ハッシュ（オプション）
+        """
+        self.connection.execute(
+            "INSERT OR REPLACE INTO entries "
+            "(path, size, mtime_ns, fingerprint, status, faces, error, output_path,"
+            " updated_at, content_hash) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                path,
+                size,
+                mtime_ns,
+                fingerprint,
+                "success" if success else "failed",
+                faces,
+                error,
+                output_path,
+                time.time(),
+                content_hash,
+            ),
+        )
+
+        self._pending += 1
+        if self._pending >= self.COMMIT_INTERVAL:
+            self.commit()
+
+    def commit(self) -> None:
+        """未コミットの記録を確定"""
+        self.connection.commit()
+        self._pending = 0
+
+    def close(self) -> None:
+        """ジャーナルを閉じる"""
+        self.commit()
+        self.connection.close()
+
+    def __enter__(self) -> "ProgressJournal":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
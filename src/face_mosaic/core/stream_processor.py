@@ -0,0 +1,164 @@
+"""
+JSON Lines ストリーム処理クラス
+標準入力などから1行1ジョブのJSONを読み込み、完了した順に1行1件の結果を書き出す
+"""
+
+import json
+import queue
+import threading
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, TextIO
+
+from ..core.image_processor import ImageProcessor
+
+# 入力の終わり・ワーカーの終了を示す目印
+_END = object()
+
+
+class JsonLinesProcessor:
+    """JSON Lines 形式のジョブを逐次処理するクラス"""
+
+    def __init__(
+        self, image_processor: ImageProcessor, threads: int = 1, queue_depth: int = 8
+    ):
+        """
+        初期化
+
+        ジョブ・結果のキューは上限付きのため、出力の読み手が遅い場合は
+        ワーカーと入力の読み込みが止まり、メモリ使用量は増えない
+
+        Args:
+            image_processor: 画像処理インスタンス（2スレッド以上の場合は検出器プール設定済み）
+            threads: ジョブを処理するスレッド数
+            queue_depth: ジョブ・結果のキューの最大長
+        """
+        self.image_processor = image_processor
+        self.threads = max(1, threads)
+        self.queue_depth = max(1, queue_depth)
+
+    def run(self, source: Iterable[str], sink: TextIO) -> Dict[str, int]:
+        """
+        ジョブを読み込んで処理し、結果を完了順に書き出す
+
+        ジョブの形式:
+            {"input": "in.jpg", "output": "out.jpg", "id": 任意（結果にそのまま含める）,
+             "mosaic": {"ratio": 0.05, "pixelate": false, ...}（省略可）}
+
+        結果の形式:
+            成功時は process_image_file の処理結果辞書に "id" を加えたもの、
+            失敗時は {"id", "input", "output", "success": false, "error": str}
+
+        Args:
+            source: ジョブの行を返すイテラブル（標準入力など）
+            sink: 結果の書き出し先
+
+        Returns:
+            処理結果統計 {"total": int, "success": int, "failed": int}
+        """
+        jobs: queue.Queue = queue.Queue(maxsize=self.queue_depth)
+        results: queue.Queue = queue.Queue(maxsize=self.queue_depth)
+
+        reader = threading.Thread(
+            target=self._read_jobs, args=(source, jobs), daemon=True
+        )
+        reader.start()
+        workers = [
+            threading.Thread(target=self._work, args=(jobs, results), daemon=True)
+            for _ in range(self.threads)
+        ]
+        for worker in workers:
+            worker.start()
+
+        # 結果の書き出しは呼び出し元スレッドで行う（書き込みが詰まると
+        # 結果キューが埋まり、ワーカーが止まる）
+        stats = {"total": 0, "success": 0, "failed": 0}
+        finished = 0
+        while finished < self.threads:
+            result = results.get()
+            if result is _END:
+                finished += 1
+                continue
+            stats["total"] += 1
+            stats["success" if result.get("success") else "failed"] += 1
+            sink.write(json.dumps(result, ensure_ascii=False, default=str) + "\n")
+            sink.flush()
+
+        return stats
+
+    def _read_jobs(self, source: Iterable[str], jobs: queue.Queue) -> None:
+        """入力を1行ずつジョブキューへ送る（キューが埋まっている間は読み込まない）"""
+        try:
+            for line_number, line in enumerate(source, 1):
+                if line.strip():
+                    jobs.put((line_number, line))
+        finally:
+            for _ in range(self.threads):
+                jobs.put(_END)
+
+    def _work(self, jobs: queue.Queue, results: queue.Queue) -> None:
+        """ジョブを処理して結果キューへ送る"""
+        while True:
+            item = jobs.get()
+            if item is _END:
+                results.put(_END)
+                return
+            results.put(self.process_line(*item))
+
+    def process_line(self, line_number: int, line: str) -> Dict[str, Any]:
+        """
+        1行分のジョブを処理
+
+        Args:
+            line_number: 入力の行番号（JSONが不正な場合のエラー表示用）
+            line: ジョブのJSON文字列
+
+        Returns:
+            処理結果辞書
+        """
+        try:
+            job = json.loads(line)
+        except ValueError as e:
+            return {"line": line_number, "success": False, "error": f"不正なJSON: {e}"}
+        if not isinstance(job, dict):
+            return {
+                "line": line_number,
+                "success": False,
+                "error": "ジョブはJSONオブジェクトで指定してください",
+            }
+
+        job_id = job.get("id", line_number)
+        failure = {
+            "id": job_id,
+            "input": job.get("input"),
+            "output": job.get("output"),
+            "success": False,
+        }
+        if not job.get("input") or not job.get("output"):
+            return dict(failure, error="input と output を指定してください")
+
+        try:
+            processor = self._processor_for(job.get("mosaic"))
+            result = processor.process_image_file(
+                Path(job["input"]), Path(job["output"])
+            )
+        except Exception as e:
+            return dict(failure, error=str(e))
+
+        result["id"] = job_id
+        return result
+
+    def _processor_for(self, overrides: Optional[Dict[str, Any]]) -> ImageProcessor:
+        """
+        ジョブのモザイク設定を反映した画像処理インスタンスを取得
+
+        Raises:
+            ValueError: モザイク設定の項目名が不正な場合
+        """
+        if not overrides:
+            return self.image_processor
+        try:
+            mosaic_config = replace(self.image_processor.mosaic_config, **overrides)
+        except TypeError as e:
+            raise ValueError(f"不正なモザイク設定です: {e}")
+        return self.image_processor.with_mosaic_config(mosaic_config)
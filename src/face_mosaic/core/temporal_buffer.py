@@ -0,0 +1,179 @@
+"""
+検出枠の時間方向の保持・補間
+検出が数フレーム途切れてもモザイクが消えないよう、枠を一定フレーム数保持し、
+途切れた区間は前後の検出から線形補間する
+"""
+
+from collections import deque
+from typing import Any, List, Tuple
+
+import numpy as np
+
+from ..utils.box_utils import assign_by_iou, iou_matrix
+
+Box = Tuple[int, int, int, int]
+
+
+class _PendingFrame:
+    """出力を保留しているフレーム"""
+
+    __slots__ = ("item", "boxes", "labels", "filled", "filled_labels")
+
+    def __init__(self, item: Any, boxes: np.ndarray, labels: np.ndarray):
+        self.item = item
+        self.boxes = boxes  # 検出枠 (N, 4) [x, y, w, h]
+        self.labels = labels  # 枠の種別 (N,)
+        self.filled: List[np.ndarray] = []  # 補間した枠
+        self.filled_labels: List[np.ndarray] = []
+
+
+class TemporalBoxBuffer:
+    """
+    検出枠をフレーム間で引き継ぐバッファ
+
+    フレームは hold_frames 枚遅れて出力する。検出された枠は同じ種別の
+    直前の枠（トラック）とIoUで対応付け、途切れていた区間の枠を線形補間で埋める。
+    hold_frames 枚以内に再び検出されなかった枠は、最後の位置のまま
+    hold_frames 枚だけ保持する
+    """
+
+    def __init__(self, hold_frames: int, iou_threshold: float = 0.3):
+        """
+        初期化
+
+        Args:
+            hold_frames: 検出が途切れても枠を保持するフレーム数（出力の遅延フレーム数）
+            iou_threshold: 同じ対象とみなすIoUの下限
+        """
+        self.hold_frames = max(1, hold_frames)
+        self.iou_threshold = iou_threshold
+        self._pending: deque = deque()
+        self._next_index = 0  # 次に追加するフレームの番号
+        # トラック（対象ごとの最後の枠・種別・検出したフレーム番号）
+        self._track_boxes = np.empty((0, 4), np.float64)
+        self._track_labels = np.empty(0, np.int64)
+        self._track_last = np.empty(0, np.int64)
+
+    def push(
+        self, item: Any, boxes_by_label: List[List[Box]]
+    ) -> List[Tuple[Any, List[List[Box]], int]]:
+        """
+        フレームの検出結果を追加し、確定したフレームを返す
+
+        Args:
+            item: フレームに対応付けて返す値（フレーム画像など）
+            boxes_by_label: 種別ごとの検出枠リスト（[顔の枠リスト, 物体の枠リスト] など）
+
+        Returns:
+            確定したフレームの (item, 種別ごとの枠リスト, 補った枠の数) のリスト（入力順）
+        """
+        index = self._next_index
+        self._next_index += 1
+
+        boxes = np.asarray(
+            [box for group in boxes_by_label for box in group], np.float64
+        ).reshape(-1, 4)
+        labels = np.repeat(
+            np.arange(len(boxes_by_label)), [len(group) for group in boxes_by_label]
+        )
+        self._pending.append(_PendingFrame(item, boxes, labels))
+        self._match(index, boxes, labels)
+
+        released = []
+        while len(self._pending) > self.hold_frames:
+            released.append(self._release(len(boxes_by_label)))
+        return released
+
+    def flush(self, label_count: int) -> List[Tuple[Any, List[List[Box]], int]]:
+        """
+        保留している全フレームを確定して返す（入力の終わりで呼ぶ）
+
+        Args:
+            label_count: 種別の数
+
+        Returns:
+            確定したフレームのリスト（push と同じ形式）
+        """
+        released = []
+        while self._pending:
+            released.append(self._release(label_count))
+        return released
+
+    def _match(self, index: int, boxes: np.ndarray, labels: np.ndarray) -> None:
+        """検出枠をトラックに対応付け、途切れていた区間を補間する"""
+        gaps = index - self._track_last - 1
+        # 補間先のフレームがまだ保留中のトラックだけを対応付ける
+        candidates = np.flatnonzero(gaps <= self.hold_frames)
+
+        iou = iou_matrix(self._track_boxes[candidates], boxes)
+        iou[self._track_labels[candidates][:, None] != labels[None, :]] = 0.0
+        pairs = assign_by_iou(iou, self.iou_threshold)
+
+        if pairs:
+            rows = candidates[[i for i, _ in pairs]]
+            cols = np.array([j for _, j in pairs])
+            self._interpolate(rows, boxes[cols], gaps[rows])
+            self._track_boxes[rows] = boxes[cols]
+            self._track_last[rows] = index
+
+        # 対応付かなかった枠は新しいトラックにする
+        new = np.ones(len(boxes), dtype=bool)
+        new[[j for _, j in pairs]] = False
+        self._track_boxes = np.concatenate([self._track_boxes, boxes[new]])
+        self._track_labels = np.concatenate([self._track_labels, labels[new]])
+        self._track_last = np.concatenate(
+            [self._track_last, np.full(int(new.sum()), index)]
+        )
+
+    def _interpolate(
+        self, rows: np.ndarray, ends: np.ndarray, gaps: np.ndarray
+    ) -> None:
+        """トラックの最後の枠から新しい枠までの間のフレームに補間した枠を加える"""
+        steps = np.arange(1, self.hold_frames + 1)
+        valid = steps[None, :] <= gaps[:, None]  # (トラック数, 保持フレーム数)
+        if not valid.any():
+            return
+
+        starts = self._track_boxes[rows]
+        ratios = steps[None, :] / (gaps[:, None] + 1)
+        filled = starts[:, None, :] + (ends - starts)[:, None, :] * ratios[..., None]
+        frames = self._track_last[rows][:, None] + steps[None, :]
+        labels = np.broadcast_to(self._track_labels[rows][:, None], valid.shape)
+
+        filled, frames, labels = filled[valid], frames[valid], labels[valid]
+        first = self._next_index - len(self._pending)
+        for frame_index in np.unique(frames):
+            mask = frames == frame_index
+            pending = self._pending[int(frame_index) - first]
+            pending.filled.append(filled[mask])
+            pending.filled_labels.append(labels[mask])
+
+    def _release(self, label_count: int) -> Tuple[Any, List[List[Box]], int]:
+        """最も古い保留フレームを確定する"""
+        index = self._next_index - len(self._pending)
+        pending = self._pending.popleft()
+
+        # 以降のフレームで再び検出されていないトラックは最後の位置で保持する
+        held = (self._track_last < index) & (
+            self._track_last >= index - self.hold_frames
+        )
+        boxes = np.concatenate(
+            [pending.boxes, *pending.filled, self._track_boxes[held]]
+        )
+        labels = np.concatenate(
+            [pending.labels, *pending.filled_labels, self._track_labels[held]]
+        )
+        added = len(boxes) - len(pending.boxes)
+
+        # 保持期間を過ぎ、以降の補間にも使われないトラックを捨てる
+        alive = self._track_last > index - self.hold_frames
+        self._track_boxes = self._track_boxes[alive]
+        self._track_labels = self._track_labels[alive]
+        self._track_last = self._track_last[alive]
+
+        rounded = np.rint(boxes).astype(int)
+        boxes_by_label = [
+            [tuple(box) for box in rounded[labels == label].tolist()]
+            for label in range(label_count)
+        ]
+        return pending.item, boxes_by_label, added
@@ -0,0 +1,213 @@
+"""
+モデルバリアント比較クラス
+通常版と量子化版のモデルで同じ画像を検出し、速度と検出結果の一致度を比較
+"""
+
+import time
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+from ..config.settings import AppConfig
+from ..core.exceptions import FaceMosaicError
+from ..core.face_detector import FaceDetector
+from ..core.image_processor import ImageProcessor
+from ..core.model_manager import ModelManager
+from ..core.object_detector_factory import create_object_detector
+from ..utils.box_utils import match_boxes
+from ..utils.file_utils import get_image_files
+
+Box = Tuple[int, int, int, int]
+
+
+class ModelVariantComparison:
+    """モデルバリアントの精度・速度比較クラス"""
+
+    def __init__(self, config: AppConfig, iou_threshold: float = 0.5):
+        """
+        初期化
+
+        Args:
+            config: アプリケーション設定（検出設定・物体検出設定を使用）
+            iou_threshold: 基準バリアントの検出と一致とみなすIoU閾値
+        """
+        self.config = config
+        self.iou_threshold = iou_threshold
+
+    def compare(
+        self,
+        input_path: Path,
+        face_variants: Optional[Sequence[str]] = None,
+        object_precisions: Optional[Sequence[str]] = None,
+        sample_size: int = 20,
+    ) -> Dict[str, Any]:
+        """
+        ローカルの画像でバリアントを比較
+
+        先頭のバリアントを基準とし、各バリアントの1枚あたりの検出時間と
+        基準の検出結果との一致率（再現率・適合率）を計測する
+
+        Args:
+            input_path: 入力画像ファイルまたはディレクトリ
+            face_variants: 比較するYuNetのバリアント（Noneの場合は全て）
+            object_precisions: 比較する物体検出の精度（Noneの場合は物体検出を比較しない）
+            sample_size: 使用する画像の最大枚数
+
+        Returns:
+            比較結果 {"images": int, "iou_threshold": float,
+            "face": [バリアントごとの結果], "object": [精度ごとの結果]}
+
+        Raises:
+            FileNotFoundError: 入力パスが存在しない場合
+            ValueError: 読み込める画像がない場合
+        """
+        proxies = self._load_proxies(input_path, sample_size)
+        if not proxies:
+            raise ValueError(f"比較に使える画像がありません: {input_path}")
+
+        if face_variants is None:
+            face_variants = ModelManager(self.config.model).list_variants()
+
+        report: Dict[str, Any] = {
+            "images": len(proxies),
+            "iou_threshold": self.iou_threshold,
+            "face": self._compare_runs(face_variants, self._face_runner, proxies),
+            "object": [],
+        }
+
+        object_config = self.config.object_detection
+        if object_precisions and object_config.labels:
+            rgb_proxies = [cv2.cvtColor(p, cv2.COLOR_BGR2RGB) for p in proxies]
+            report["object"] = self._compare_runs(
+                object_precisions, self._object_runner, rgb_proxies
+            )
+
+        return report
+
+    def _load_proxies(self, input_path: Path, sample_size: int) -> List[np.ndarray]:
+        """本処理と同じ縮小をかけた検出用画像を読み込む"""
+        formats = self.config.processing.supported_formats
+        if input_path.is_file():
+            files = [input_path]
+        else:
+            files = get_image_files(input_path, formats)[:sample_size]
+
+        # 縮小処理は本処理の ImageProcessor と共通にする（検出器は遅延初期化のため
+        # モデルは読み込まれない）
+        face_detector = FaceDetector(
+            self.config.detection, ModelManager(self.config.model)
+        )
+        processor = ImageProcessor(
+            face_detector, self.config.mosaic, self.config.processing
+        )
+
+        proxies = []
+        for path in files:
+            image = cv2.imread(str(path))
+            if image is not None:
+                proxies.append(processor.create_detection_proxy(image)[0])
+        return proxies
+
+    def _face_runner(
+        self, variant: str
+    ) -> Tuple[Callable[[np.ndarray], List[Box]], Dict[str, Any]]:
+        """YuNetバリアントの検出関数と付加情報を生成"""
+        manager = ModelManager(replace(self.config.model, model_variant=variant))
+        detector = FaceDetector(self.config.detection, manager)
+        info = {"model": manager.model_path.name}
+
+        def run(image: np.ndarray) -> List[Box]:
+            return [face["box"] for face in detector.detect_face_details(image)]
+
+        return run, info
+
+    def _object_runner(
+        self, precision: str
+    ) -> Tuple[Callable[[np.ndarray], List[Box]], Dict[str, Any]]:
+        """物体検出器の精度ごとの検出関数と付加情報を生成"""
+        object_config = self.config.object_detection
+        detector = create_object_detector(
+            object_config.detector_type,
+            object_config.model_path,
+            onnx_source=object_config.onnx_source,
+            precision=precision,
+            calibration_dir=object_config.calibration_dir,
+        )
+        labels = list(object_config.labels)
+        info = {
+            "model": Path(str(detector.model_path)).name,
+            "backend": type(detector).__name__,
+        }
+
+        def run(image: np.ndarray) -> List[Box]:
+            return [
+                (int(x1), int(y1), int(x2 - x1), int(y2 - y1))
+                for x1, y1, x2, y2 in (
+                    obj["box"] for obj in detector.detect(image, target_labels=labels)
+                )
+            ]
+
+        return run, info
+
+    def _compare_runs(
+        self,
+        variants: Sequence[str],
+        build: Callable[[str], Tuple[Callable[[np.ndarray], List[Box]], Dict]],
+        images: List[np.ndarray],
+    ) -> List[Dict[str, Any]]:
+        """
+        各バリアントで全画像を検出し、先頭のバリアントを基準に集計
+
+        Args:
+            variants: バリアント名リスト
+            build: バリアント名から (検出関数, 付加情報) を生成する関数
+            images: 検出用画像リスト
+
+        Returns:
+            バリアントごとの結果リスト
+        """
+        rows: List[Dict[str, Any]] = []
+        reference: Optional[List[List[Box]]] = None
+        reference_time = None
+
+        for variant in variants:
+            row: Dict[str, Any] = {"variant": variant}
+            try:
+                start = time.perf_counter()
+                run, info = build(variant)
+                # 初回推論（遅延初期化・ウォームアップ）は計測に含めない
+                run(images[0])
+                row["load_time"] = round(time.perf_counter() - start, 3)
+                row.update(info)
+
+                boxes = []
+                start = time.perf_counter()
+                for image in images:
+                    boxes.append(run(image))
+                mean_time = (time.perf_counter() - start) / len(images)
+            except (FaceMosaicError, OSError, RuntimeError, ValueError) as e:
+                row["error"] = str(e)
+                rows.append(row)
+                continue
+
+            row["mean_time"] = round(mean_time, 4)
+            row["detections"] = sum(len(items) for items in boxes)
+
+            if reference is None:
+                reference, reference_time = boxes, mean_time
+            matched = sum(
+                match_boxes(ref, cand, self.iou_threshold)
+                for ref, cand in zip(reference, boxes)
+            )
+            ref_total = sum(len(items) for items in reference)
+            row["speedup"] = round(reference_time / mean_time, 2) if mean_time else 0.0
+            row["recall"] = round(matched / ref_total, 3) if ref_total else 1.0
+            row["precision"] = (
+                round(matched / row["detections"], 3) if row["detections"] else 1.0
+            )
+            rows.append(row)
+
+        return rows
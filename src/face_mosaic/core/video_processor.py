@@ -0,0 +1,931 @@
+"""
+動画処理クラス
+cv2.VideoCapture でフレームを逐次読み込み、複数フレームを並行して検出・モザイク処理し、
+cv2.VideoWriter で書き出した後に ffmpeg で元動画の音声を再多重化する。
+長い動画は区間に分けてプロセスごとに処理し、再エンコードせずに連結できる
+"""
+
+import itertools
+import os
+import queue
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import (
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import cv2
+import numpy as np
+from tqdm import tqdm
+
+from ..config.settings import AppConfig, VideoConfig
+from ..core.box_tracker import (
+    expand_boxes,
+    is_scene_cut,
+    make_tracking_image,
+    track_boxes,
+)
+from ..core.exceptions import VideoProcessingError
+from ..core.temporal_buffer import TemporalBoxBuffer
+from ..core.image_processor import ImageProcessor
+from ..utils.file_utils import ensure_directory
+
+Box = Tuple[int, int, int, int]
+
+# 読み込みの終わりを示す目印
+_END = object()
+
+
+def open_video(input_path: Path) -> Tuple[cv2.VideoCapture, Dict[str, Any]]:
+    """
+    動画を開いて基本情報を取得
+
+    Args:
+        input_path: 入力動画パス
+
+    Returns:
+        (VideoCapture, {"fps": float, "frame_size": (w, h), "frame_count": int}) のタプル
+
+    Raises:
+        VideoProcessingError: 動画を開けない場合
+    """
+    capture = cv2.VideoCapture(str(input_path))
+    if not capture.isOpened():
+        raise VideoProcessingError(f"動画を開けません: {input_path}")
+
+    fps = capture.get(cv2.CAP_PROP_FPS)
+    info = {
+        # FPSが取得できないコンテナは30fpsとして扱う
+        "fps": fps if fps and fps > 0 else 30.0,
+        "frame_size": (
+            int(capture.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+        ),
+        "frame_count": max(0, int(capture.get(cv2.CAP_PROP_FRAME_COUNT))),
+    }
+    return capture, info
+
+
+def open_writer(
+    output_path: Path, fps: float, frame_size: Tuple[int, int], fourcc: str
+) -> cv2.VideoWriter:
+    """
+    動画の書き出しを開始
+
+    Raises:
+        VideoProcessingError: 書き出し先を開けない場合
+    """
+    ensure_directory(output_path.parent)
+    writer = cv2.VideoWriter(
+        str(output_path), cv2.VideoWriter_fourcc(*fourcc), fps, frame_size
+    )
+    if not writer.isOpened():
+        raise VideoProcessingError(
+            f"動画を書き出せません: {output_path} (コーデック: {fourcc})"
+        )
+    return writer
+
+
+def mux_audio(
+    video_path: Path, audio_source: Path, output_path: Path, ffmpeg_path: str
+) -> bool:
+    """
+    ffmpeg で映像を再エンコードせずに元動画の音声と多重化
+
+    音声のない元動画の場合は映像のみを出力する
+
+    Args:
+        video_path: 映像のみの動画
+        audio_source: 音声を取り出す元動画
+        output_path: 出力パス
+        ffmpeg_path: ffmpeg の実行ファイル
+
+    Returns:
+        多重化できた場合はTrue（ffmpeg がない・失敗した場合はFalse）
+    """
+    ffmpeg = shutil.which(ffmpeg_path)
+    if ffmpeg is None:
+        return False
+    command = [
+        ffmpeg,
+        "-y",
+        "-v",
+        "error",
+        "-i",
+        str(video_path),
+        "-i",
+        str(audio_source),
+        "-map",
+        "0:v:0",
+        "-map",
+        "1:a?",
+        "-c",
+        "copy",
+        "-shortest",
+        str(output_path),
+    ]
+    proc = subprocess.run(command, capture_output=True, text=True)
+    return proc.returncode == 0
+
+
+def seek_frame(capture: cv2.VideoCapture, index: int) -> None:
+    """
+    読み込み位置を指定のフレームへ移動
+
+    シークできないコンテナでは先頭から読み飛ばす
+
+    Raises:
+        VideoProcessingError: 指定のフレームが存在しない場合
+    """
+    if index <= 0:
+        return
+    capture.set(cv2.CAP_PROP_POS_FRAMES, index)
+    if int(capture.get(cv2.CAP_PROP_POS_FRAMES)) == index:
+        return
+    capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+    for _ in range(index):
+        if not capture.grab():
+            raise VideoProcessingError(f"フレーム {index} へ移動できません")
+
+
+def concat_segments(
+    segment_paths: List[Path],
+    audio_source: Optional[Path],
+    output_path: Path,
+    ffmpeg_path: str,
+) -> bool:
+    """
+    ffmpeg の concat demuxer で区間の動画を再エンコードせずに連結
+
+    Args:
+        segment_paths: 区間の動画（再生順）
+        audio_source: 音声を取り出す元動画（Noneの場合は映像のみ）
+        output_path: 出力パス
+        ffmpeg_path: ffmpeg の実行ファイル
+
+    Returns:
+        連結できた場合はTrue（ffmpeg がない・失敗した場合はFalse）
+    """
+    ffmpeg = shutil.which(ffmpeg_path)
+    if ffmpeg is None:
+        return False
+    list_path = segment_paths[0].with_name("segments.txt")
+    with open(list_path, "w", encoding="utf-8") as f:
+        for path in segment_paths:
+            escaped = str(path.resolve()).replace("'", "'\\''")
+            f.write(f"file '{escaped}'\n")
+
+    command = [ffmpeg, "-y", "-v", "error", "-f", "concat", "-safe", "0"]
+    command += ["-i", str(list_path)]
+    if audio_source is not None:
+        command += ["-i", str(audio_source), "-map", "0:v:0", "-map", "1:a?"]
+        command += ["-shortest"]
+    command += ["-c", "copy", str(output_path)]
+    proc = subprocess.run(command, capture_output=True, text=True)
+    return proc.returncode == 0
+
+
+def _reencode_segments(
+    segment_paths: List[Path],
+    output_path: Path,
+    fps: float,
+    frame_size: Tuple[int, int],
+    fourcc: str,
+) -> None:
+    """ffmpeg を使えない場合に、区間の動画を読み込み直して1本に書き出す"""
+    writer = open_writer(output_path, fps, frame_size, fourcc)
+    try:
+        for path in segment_paths:
+            capture = cv2.VideoCapture(str(path))
+            try:
+                while True:
+                    ok, frame = capture.read()
+                    if not ok:
+                        break
+                    writer.write(frame)
+            finally:
+                capture.release()
+    finally:
+        writer.release()
+
+
+def _summarize_stats(stats: Dict[str, Any]) -> Dict[str, Any]:
+    """フレームの統計に検出の削減数・追跡したフレームの割合を加える"""
+    frames = stats["frames"]
+    # 区間の前後で書き出さずに検出したフレームも検出の対象に数える
+    decoded = frames + stats.get("overlap_frames", 0)
+    stats["detections_saved"] = decoded - stats["detection_calls"]
+    stats["tracked_frame_ratio"] = (
+        round(stats["tracked_frames"] / frames, 3) if frames else 0.0
+    )
+    return stats
+
+
+def _video_result(
+    input_path: Path,
+    output_path: Path,
+    info: Dict[str, Any],
+    audio: bool,
+    elapsed: float,
+    stats: Dict[str, Any],
+) -> Dict[str, Any]:
+    """動画の処理結果辞書を作成"""
+    result = {
+        "success": True,
+        "input_path": str(input_path),
+        "output_path": str(output_path),
+        "fps": round(info["fps"], 3),
+        "frame_size": info["frame_size"],
+        "audio": audio,
+        "elapsed": elapsed,
+        "processing_fps": round(stats["frames"] / elapsed, 2) if elapsed else 0.0,
+    }
+    result.update(stats)
+    return result
+
+
+class _FrameReader:
+    """別スレッドでフレームを先読みするクラス（先読み数は上限付き）"""
+
+    def __init__(
+        self, capture: cv2.VideoCapture, depth: int, limit: Optional[int] = None
+    ):
+        self._capture = capture
+        self._limit = limit  # 読み込むフレーム数の上限（Noneは終端まで）
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, depth))
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        try:
+            count = 0
+            while not self._stop.is_set():
+                if self._limit is not None and count >= self._limit:
+                    break
+                ok, frame = self._capture.read()
+                if not ok:
+                    break
+                self._queue.put(frame)
+                count += 1
+        finally:
+            self._queue.put(_END)
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        while True:
+            frame = self._queue.get()
+            if frame is _END:
+                return
+            yield frame
+
+    def close(self) -> None:
+        """読み込みを停止"""
+        self._stop.set()
+        # 読み込みスレッドがキューの空きを待っている場合に備えて空ける
+        while self._thread.is_alive():
+            try:
+                self._queue.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        self._thread.join()
+
+
+class VideoProcessor:
+    """動画処理クラス"""
+
+    def __init__(
+        self, image_processor: ImageProcessor, config: VideoConfig, threads: int = 1
+    ):
+        """
+        初期化
+
+        Args:
+            image_processor: 画像処理インスタンス（2スレッド以上の場合は検出器プール設定済み）
+            config: 動画処理設定
+            threads: フレームを処理するスレッド数
+        """
+        self.image_processor = image_processor
+        self.config = config
+        self.threads = max(1, threads)
+
+    @property
+    def frames_in_flight(self) -> int:
+        """同時に処理するフレーム数（メモリ上に保持するフレーム数の上限）"""
+        return self.config.frames_in_flight or self.threads * 2
+
+    def process_video(
+        self,
+        input_path: Path,
+        output_path: Path,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        動画を処理
+
+        保持するフレーム数は frames_in_flight と先読み分に限られるため、
+        動画の長さによらずメモリ使用量は一定
+
+        Args:
+            input_path: 入力動画パス
+            output_path: 出力動画パス
+            progress_callback: 進捗コールバック (処理済みフレーム数, 総フレーム数)
+
+        Returns:
+            処理結果辞書
+
+        Raises:
+            VideoProcessingError: 動画の読み込み・書き出しに失敗した場合
+        """
+        start_time = time.time()
+        capture, info = open_video(input_path)
+        # 映像は一時ファイルに書き出し、音声の多重化後に出力パスへ置く
+        video_path = output_path.with_name(
+            f".{output_path.stem}.video{output_path.suffix}"
+        )
+        try:
+            writer = open_writer(
+                video_path, info["fps"], info["frame_size"], self.config.fourcc
+            )
+            try:
+                stats = self._process_frames(
+                    capture, writer, info["frame_count"], progress_callback
+                )
+            finally:
+                writer.release()
+        except BaseException:
+            if video_path.exists():
+                video_path.unlink()
+            raise
+        finally:
+            capture.release()
+
+        audio = False
+        if self.config.keep_audio:
+            audio = mux_audio(
+                video_path, input_path, output_path, self.config.ffmpeg_path
+            )
+        if audio:
+            video_path.unlink()
+        else:
+            os.replace(video_path, output_path)
+
+        return _video_result(
+            input_path, output_path, info, audio, time.time() - start_time, stats
+        )
+
+    def process_segment(
+        self, input_path: Path, output_path: Path, start: int, count: Optional[int]
+    ) -> Dict[str, Any]:
+        """
+        動画の一部の区間を処理して映像のみの動画に書き出す
+
+        枠の保持（persist_frames）が有効な場合は、区間の前の persist_frames + 1 枚と
+        後の persist_frames 枚も検出し、枠の引き継ぎ・補間にだけ使う
+
+        Args:
+            input_path: 入力動画パス
+            output_path: 区間の出力動画パス
+            start: 区間の開始フレーム番号
+            count: 区間のフレーム数（Noneは終端まで）
+
+        Returns:
+            フレームの統計
+
+        Raises:
+            VideoProcessingError: 動画の読み込み・書き出しに失敗した場合
+        """
+        # 区間の先頭で見落とした対象も、単一プロセスと同じく前のフレームの枠で補う
+        persist = self.config.persist_frames
+        warmup = min(start, persist + 1) if persist > 0 else 0
+        lookahead = persist if count is not None else 0
+
+        capture, info = open_video(input_path)
+        try:
+            seek_frame(capture, start - warmup)
+            writer = open_writer(
+                output_path, info["fps"], info["frame_size"], self.config.fourcc
+            )
+            try:
+                expected = count if count is not None else info["frame_count"] - start
+                return self._process_frames(
+                    capture,
+                    writer,
+                    max(0, expected),
+                    None,
+                    max_frames=None if count is None else warmup + count + lookahead,
+                    show_progress=False,
+                    skip_frames=warmup,
+                    write_frames=count,
+                )
+            finally:
+                writer.release()
+        finally:
+            capture.release()
+
+    def _process_frames(
+        self,
+        capture: cv2.VideoCapture,
+        writer: cv2.VideoWriter,
+        frame_count: int,
+        progress_callback: Optional[Callable[[int, int], None]],
+        max_frames: Optional[int] = None,
+        show_progress: bool = True,
+        skip_frames: int = 0,
+        write_frames: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        フレームを並行して処理し、読み込み順に書き出す
+
+        Args:
+            capture: 読み込み位置に合わせた VideoCapture
+            writer: 書き出し先
+            frame_count: 処理するフレーム数の見込み（進捗表示用）
+            progress_callback: 進捗コールバック (処理済みフレーム数, 総フレーム数)
+            max_frames: 処理するフレーム数の上限（Noneは終端まで）
+            show_progress: 進捗バーを表示するかどうか
+            skip_frames: 先頭の書き出さないフレーム数（枠の引き継ぎ用に検出のみ行う）
+            write_frames: skip_frames 以降に書き出すフレーム数の上限
+                （Noneは終端まで。以降のフレームは枠の補間にのみ使う）
+
+        Returns:
+            フレームの統計 {"frames", "faces_detected", "objects_detected",
+            "frames_with_targets", "detection_calls", "tracked_frames", ...}
+        """
+        stats = {
+            "frames": 0,
+            "faces_detected": 0,
+            "objects_detected": 0,
+            "frames_with_targets": 0,
+            "detection_calls": 0,
+            "tracked_frames": 0,
+            "scene_cuts": 0,
+            "persisted_boxes": 0,
+            "overlap_frames": 0,  # 書き出さずに検出だけ行ったフレーム数
+        }
+        reader = _FrameReader(capture, self.frames_in_flight, max_frames)
+        frame_index = itertools.count()  # emit に届いたフレームの番号
+
+        def in_output(index: int) -> bool:
+            """書き出す範囲のフレームかどうか"""
+            return index >= skip_frames and (
+                write_frames is None or index < skip_frames + write_frames
+            )
+
+        buffer = None
+        if self.config.persist_frames > 0:
+            # 枠を補ってからモザイクを適用するため、ワーカーでは検出・追跡のみ行う
+            buffer = TemporalBoxBuffer(
+                self.config.persist_frames, self.config.persist_iou
+            )
+        rendering: deque = (
+            deque()
+        )  # (モザイク適用の Future, 対象の有無, 追跡したかどうか)
+
+        def write(frame: np.ndarray, has_targets: bool, tracked: bool) -> None:
+            writer.write(frame)
+            stats["frames"] += 1
+            if has_targets:
+                stats["frames_with_targets"] += 1
+            if tracked:
+                stats["tracked_frames"] += 1
+            pbar.update(1)
+            if progress_callback:
+                progress_callback(stats["frames"], frame_count)
+
+        def write_rendered(limit: int) -> None:
+            while rendering and (len(rendering) > limit or rendering[0][0].done()):
+                future, has_targets, tracked = rendering.popleft()
+                write(future.result(), has_targets, tracked)
+
+        def release(
+            result: _FrameResult, output: bool, targets: List[Box], added: int
+        ) -> None:
+            if not output:
+                return
+            stats["persisted_boxes"] += added
+            future = executor.submit(self._render, result.frame, targets)
+            rendering.append((future, bool(targets), result.tracked))
+            write_rendered(self.frames_in_flight)
+
+        def emit(result: _FrameResult) -> None:
+            output = in_output(next(frame_index))
+            if output:
+                stats["faces_detected"] += result.face_count
+                stats["objects_detected"] += result.object_count
+            else:
+                stats["overlap_frames"] += 1
+            if buffer is None:
+                if output:
+                    write(
+                        result.frame,
+                        bool(result.faces or result.objects),
+                        result.tracked,
+                    )
+                return
+            for (item, item_output), (faces, objects), added in buffer.push(
+                (result, output), [result.faces, result.objects]
+            ):
+                release(item, item_output, faces + objects, added)
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.threads) as executor, tqdm(
+                total=frame_count or None,
+                desc="動画処理中",
+                unit="frames",
+                disable=not show_progress,
+            ) as pbar:
+                render = buffer is None
+                if self.config.tracking:
+                    self._run_tracked(reader, executor, emit, stats, render)
+                else:
+                    self._run_per_frame(reader, executor, emit, stats, render)
+                if buffer is not None:
+                    for (item, output), (faces, objects), added in buffer.flush(2):
+                        release(item, output, faces + objects, added)
+                    write_rendered(0)
+        finally:
+            reader.close()
+
+        return _summarize_stats(stats)
+
+    def _run_per_frame(
+        self,
+        reader: "_FrameReader",
+        executor: ThreadPoolExecutor,
+        emit: Callable[["_FrameResult"], None],
+        stats: Dict[str, Any],
+        render: bool,
+    ) -> None:
+        """全フレームで検出する"""
+        in_flight: deque = deque()
+        for frame in reader:
+            in_flight.append(executor.submit(self._process_frame, frame, render))
+            stats["detection_calls"] += 1
+            if len(in_flight) >= self.frames_in_flight:
+                emit(in_flight.popleft().result())
+        while in_flight:
+            emit(in_flight.popleft().result())
+
+    def _process_frame(self, frame: np.ndarray, render: bool) -> "_FrameResult":
+        """
+        1フレームを検出し、render が True の場合はモザイクを適用
+
+        Returns:
+            フレームの処理結果
+        """
+        faces, objects = self.image_processor.detect_targets(frame)
+        if render:
+            frame = self._render(frame, faces + objects)
+        return _FrameResult(frame, faces, objects, len(faces), len(objects))
+
+    def _render(self, frame: np.ndarray, targets: List[Box]) -> np.ndarray:
+        """対象があればモザイクを適用"""
+        if targets:
+            frame = self.image_processor.apply_mosaic(frame, targets)
+        return frame
+
+    def _run_tracked(
+        self,
+        reader: "_FrameReader",
+        executor: ThreadPoolExecutor,
+        emit: Callable[["_FrameResult"], None],
+        stats: Dict[str, Any],
+        render: bool,
+    ) -> None:
+        """
+        detect_interval フレームごと（とシーンの切り替わり）で検出し、間のフレームは追跡する
+
+        キーフレームから次のキーフレームの手前までを1グループとし、
+        グループ単位で並行処理する。保持するフレームはおよそ
+        (スレッド数 + 2) × detect_interval 枚まで
+        """
+        config = self.config
+        interval = max(1, config.detect_interval)
+        max_pending = self.threads + 1
+        pending: deque = deque()  # グループの追跡結果（読み込み順）
+        current: Optional[_FrameGroup] = None
+        previous_gray = None
+
+        def write_group(future: Future) -> None:
+            for result in future.result():
+                emit(result)
+
+        for frame in reader:
+            gray, scale = make_tracking_image(frame, config.tracking_max_side)
+            cut = previous_gray is not None and is_scene_cut(
+                previous_gray, gray, config.scene_cut_threshold
+            )
+            previous_gray = gray
+
+            if current is not None and len(current.frames) < interval and not cut:
+                current.frames.append(frame)
+                current.grays.append(gray)
+                continue
+
+            # キーフレーム
+            detection = executor.submit(self.image_processor.detect_targets, frame)
+            stats["detection_calls"] += 1
+            if current is not None:
+                if cut:
+                    stats["scene_cuts"] += 1
+                else:
+                    # 次のキーフレームの検出枠を逆方向にも追跡し、
+                    # グループの途中で現れた対象も取りこぼさない
+                    current.next_detection = detection
+                    current.next_gray = gray
+                # 追跡は必要な検出より後に投入されるため、待ち合わせは短く済む
+                pending.append(
+                    executor.submit(self._track_group, current, scale, render)
+                )
+            current = _FrameGroup([frame], [gray], detection)
+
+            while pending and (len(pending) > max_pending or pending[0].done()):
+                write_group(pending.popleft())
+
+        if current is not None:
+            pending.append(executor.submit(self._track_group, current, scale, render))
+        while pending:
+            write_group(pending.popleft())
+
+    def _track_group(
+        self, group: "_FrameGroup", scale: float, render: bool
+    ) -> List["_FrameResult"]:
+        """
+        グループ内のフレームに検出枠を追跡し、render が True の場合はモザイクを適用
+
+        キーフレームの検出枠を順方向に、次のキーフレームの検出枠を逆方向に追跡し、
+        両方の枠を安全マージン付きで適用する
+
+        Returns:
+            フレームごとの処理結果
+        """
+        count = len(group.frames)
+        forward = [group.detection.result()]
+        faces, objects = forward[0]
+        for i in range(1, count):
+            previous, current = group.grays[i - 1], group.grays[i]
+            faces = track_boxes(previous, current, faces, scale)
+            objects = track_boxes(previous, current, objects, scale)
+            forward.append((faces, objects))
+
+        backward: List[Tuple[List[Box], List[Box]]] = [([], [])] * count
+        if group.next_detection is not None:
+            faces, objects = group.next_detection.result()
+            previous = group.next_gray
+            for i in range(count - 1, 0, -1):
+                current = group.grays[i]
+                faces = track_boxes(previous, current, faces, scale)
+                objects = track_boxes(previous, current, objects, scale)
+                backward[i] = (faces, objects)
+                previous = current
+
+        height, width = group.frames[0].shape[:2]
+        margin = self.config.tracking_margin
+        outputs = []
+        for i, frame in enumerate(group.frames):
+            faces, objects = forward[i]
+            face_count, object_count = len(faces), len(objects)
+            if i > 0:
+                back_faces, back_objects = backward[i]
+                face_count = max(face_count, len(back_faces))
+                object_count = max(object_count, len(back_objects))
+                faces = expand_boxes(faces + back_faces, margin, (width, height))
+                objects = expand_boxes(objects + back_objects, margin, (width, height))
+            if render:
+                frame = self._render(frame, faces + objects)
+            outputs.append(
+                _FrameResult(frame, faces, objects, face_count, object_count, i > 0)
+            )
+        return outputs
+
+
+# ワーカープロセス内で保持する動画処理インスタンス
+_worker_video_processor: Optional[VideoProcessor] = None
+
+
+def _initialize_segment_worker(config: AppConfig) -> None:
+    """
+    区間処理のワーカープロセスを初期化（プロセスごとに1回だけ実行）
+
+    Args:
+        config: アプリケーション設定
+    """
+    global _worker_video_processor
+
+    # プロセス数ぶんの並列化を行うため、OpenCV内部のスレッドは1本に制限
+    cv2.setNumThreads(1)
+
+    from ..core.application import FaceMosaicApplication
+
+    # ワーカーごとに1本の検出器で処理する（config はワーカー内の複製）
+    config.processing.threads = 1
+    app = FaceMosaicApplication(config)
+    _worker_video_processor = VideoProcessor(app.image_processor, config.video)
+
+
+def _process_segment(
+    input_path: Path, output_path: Path, start: int, count: Optional[int]
+) -> Dict[str, Any]:
+    """ワーカープロセスで1区間を処理"""
+    return _worker_video_processor.process_segment(
+        input_path, output_path, start, count
+    )
+
+
+def plan_segments(
+    frame_count: int, segments: int, min_frames: int
+) -> List[Tuple[int, Optional[int]]]:
+    """
+    動画を区間に分割
+
+    追跡は区間の先頭で検出し直し、枠の保持は区間の前後のフレームを
+    重ねて読み込んで引き継ぐため、区間の境界は任意のフレームに置ける
+
+    Args:
+        frame_count: 総フレーム数
+        segments: 分割数の上限
+        min_frames: 1区間の最小フレーム数
+
+    Returns:
+        (開始フレーム番号, フレーム数) のリスト。フレーム数の取得が
+        不正確なコンテナに備えて、最後の区間のフレーム数は None（終端まで）
+    """
+    segments = max(1, min(segments, frame_count // max(1, min_frames)))
+    starts = [frame_count * i // segments for i in range(segments)]
+    plan = [(start, end - start) for start, end in zip(starts, starts[1:])]
+    plan.append((starts[-1], None))
+    return plan
+
+
+class SegmentedVideoProcessor:
+    """動画を区間に分けてプロセスプールで並列処理するクラス"""
+
+    def __init__(self, config: AppConfig, workers: int):
+        """
+        初期化
+
+        Args:
+            config: ワーカーで検出器を構築するためのアプリケーション設定
+            workers: ワーカープロセス数
+        """
+        self.config = config
+        self.workers = max(1, workers)
+
+    def process_video(
+        self,
+        input_path: Path,
+        output_path: Path,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+    ) -> Dict[str, Any]:
+        """
+        動画を区間に分けて並列処理し、連結して出力
+
+        区間の映像は ffmpeg の concat demuxer で再エンコードせずに連結し、
+        同時に元動画の音声を多重化する。ffmpeg がない場合は
+        区間を読み込み直して再エンコードする（音声なし）
+
+        Args:
+            input_path: 入力動画パス
+            output_path: 出力動画パス
+            progress_callback: 進捗コールバック (処理済みフレーム数, 総フレーム数)
+
+        Returns:
+            処理結果辞書（VideoProcessor.process_video の項目に "segments" を加えたもの）
+
+        Raises:
+            VideoProcessingError: 動画の読み込み・書き出しに失敗した場合
+        """
+        start_time = time.time()
+        video_config = self.config.video
+        capture, info = open_video(input_path)
+        capture.release()
+
+        frame_count = info["frame_count"]
+        plan = plan_segments(
+            frame_count, self.workers * 2, video_config.min_segment_frames
+        )
+        ensure_directory(output_path.parent)
+        with tempfile.TemporaryDirectory(
+            prefix=f".{output_path.stem}.segments", dir=output_path.parent
+        ) as tmp:
+            segment_paths = [
+                Path(tmp) / f"segment_{i:04d}{output_path.suffix}"
+                for i in range(len(plan))
+            ]
+            stats = self._run_segments(
+                input_path, segment_paths, plan, frame_count, progress_callback
+            )
+
+            audio_source = input_path if video_config.keep_audio else None
+            joined = concat_segments(
+                segment_paths, audio_source, output_path, video_config.ffmpeg_path
+            )
+            if not joined:
+                _reencode_segments(
+                    segment_paths,
+                    output_path,
+                    info["fps"],
+                    info["frame_size"],
+                    video_config.fourcc,
+                )
+
+        result = _video_result(
+            input_path,
+            output_path,
+            info,
+            joined and audio_source is not None,
+            time.time() - start_time,
+            stats,
+        )
+        result["segments"] = len(plan)
+        return result
+
+    def _run_segments(
+        self,
+        input_path: Path,
+        segment_paths: List[Path],
+        plan: List[Tuple[int, Optional[int]]],
+        frame_count: int,
+        progress_callback: Optional[Callable[[int, int], None]],
+    ) -> Dict[str, Any]:
+        """
+        区間をワーカープロセスで処理し、フレームの統計を合算
+
+        Raises:
+            VideoProcessingError: ワーカープロセスが異常終了した場合
+        """
+        totals: Dict[str, Any] = {}
+        processed = 0
+        try:
+            with ProcessPoolExecutor(
+                max_workers=min(self.workers, len(plan)),
+                initializer=_initialize_segment_worker,
+                initargs=(self.config,),
+            ) as executor, tqdm(
+                total=frame_count or None, desc="動画処理中", unit="frames"
+            ) as pbar:
+                futures = [
+                    executor.submit(
+                        _process_segment, input_path, segment_path, start, count
+                    )
+                    for segment_path, (start, count) in zip(segment_paths, plan)
+                ]
+                for future in as_completed(futures):
+                    stats = future.result()
+                    for key in _SUMMED_STATS:
+                        totals[key] = totals.get(key, 0) + stats[key]
+                    processed += stats["frames"]
+                    pbar.update(stats["frames"])
+                    if progress_callback:
+                        progress_callback(processed, frame_count)
+        except BrokenProcessPool as e:
+            raise VideoProcessingError(f"動画処理ワーカーが異常終了しました: {e}")
+        return _summarize_stats(totals)
+
+
+# 区間ごとの統計のうち合算する項目
+_SUMMED_STATS = (
+    "frames",
+    "faces_detected",
+    "objects_detected",
+    "frames_with_targets",
+    "detection_calls",
+    "tracked_frames",
+    "scene_cuts",
+    "persisted_boxes",
+    "overlap_frames",
+)
+
+
+@dataclass
+class _FrameResult:
+    """1フレームの検出・追跡結果"""
+
+    frame: np.ndarray  # モザイク適用済み（ワーカーで適用しない場合は元のフレーム）
+    faces: List[Box]
+    objects: List[Box]
+    face_count: int  # 統計に数える顔の数（追跡した枠の重複を除く）
+    object_count: int
+    tracked: bool = False
+
+
+@dataclass
+class _FrameGroup:
+    """キーフレームと、次のキーフレームまでの追跡するフレーム"""
+
+    frames: List[np.ndarray]
+    grays: List[np.ndarray]  # 追跡用画像
+    detection: Future  # キーフレームの検出 (顔座標リスト, 物体座標リスト)
+    next_detection: Optional[Future] = None  # 次のキーフレームの検出（逆方向の追跡用）
+    next_gray: Optional[np.ndarray] = None
@@ -1,11 +1,22 @@
 from ultralytics import YOLO
+import math
 import os
+import torch
+
+from ..core.model_registry import model_registry
 
 
 class YoloV8ObjectDetector:
     def __init__(
-        self, model_path=None, device=None, label_names=None, score_thresh=0.5
+        self,
+        model_path=None,
+        device=None,
+        label_names=None,
+        score_thresh=0.5,
+        shared=True,
     ):
+        # shared: Falseの場合はレジストリを使わず専用のモデルを読み込む
+        # （検出器プールで別スレッドに持たせる場合など）
         # デフォルトパス
         if model_path is None:
             # models/yolov8/ ディレクトリ配下の.ptファイルを自動検出
@@ -20,17 +31,27 @@ class YoloV8ObjectDetector:
             if model_path is None:
                 model_path = "yolov8n.pt"  # ultralyticsのデフォルト
 
-        self.device = device or (
-            "cuda"
-            if (
-                hasattr(YOLO(model_path), "device")
-                and YOLO(model_path).device.type == "cuda"
+        # デバイス判定のためにモデルを読み込まず、torchで直接判定する
+        self.device = device or ("cuda" if torch.cuda.is_available() else "cpu")
+
+        def load_model():
+            model = YOLO(model_path)
+            model.to(self.device)
+            return model
+
+        # 同じモデル・デバイスの組み合わせは読み込み済みのものを再利用
+        if shared:
+            self.model = model_registry.get_or_load(
+                ("yolo", model_path, self.device), load_model
             )
-            else "cpu"
-        )
-        self.model = YOLO(model_path)
-        self.model.to(self.device)
+        else:
+            self.model = load_model()
+        self.model_path = model_path
         self.score_thresh = score_thresh
+        # 推論入力サイズの上限（小さい画像はこれより小さいキャンバスで推論する）
+        self.imgsz = 640
+        # 推論解像度を呼び出しごとに指定できる
+        self.resizable_input = True
 
         if label_names is not None:
             self.label_names = label_names
@@ -39,26 +60,84 @@ class YoloV8ObjectDetector:
         else:
             self.label_names = []
 
-    def detect(self, image, target_labels=None):
+        # ラベル名 → クラス番号。対象ラベルのクラス番号は初回に変換してキャッシュする
+        names = (
+            self.label_names.items()
+            if isinstance(self.label_names, dict)
+            else enumerate(self.label_names)
+        )
+        # （同名のラベルが複数ある場合は全て対象にする）
+        self._label_to_class = {}
+        for i, name in names:
+            self._label_to_class.setdefault(name, []).append(int(i))
+        self._class_cache = {}
+
+    def class_indices(self, target_labels):
+        # target_labels: list of str or None
+        # 戻り値: 対象ラベルのクラス番号リスト（Noneの場合は全クラス）
+        if target_labels is None:
+            return None
+        key = tuple(target_labels)
+        classes = self._class_cache.get(key)
+        if classes is None:
+            classes = sorted(
+                {c for label in key for c in self._label_to_class.get(label, ())}
+            )
+            self._class_cache[key] = classes
+        return classes
+
+    def detect(self, image, target_labels=None, score_thresh=None, input_size=None):
         # image: numpy.ndarray (HWC, BGR or RGB)
         # target_labels: list of str or None
-        results = self.model(image)
-        detections = results[0]
-        boxes = detections.boxes.xyxy.cpu().numpy()  # (N, 4)
-        scores = detections.boxes.conf.cpu().numpy()  # (N,)
-        labels = detections.boxes.cls.cpu().numpy().astype(int)  # (N,)
-        out = []
-        for box, label, score in zip(boxes, labels, scores):
-            if score < self.score_thresh:
-                continue
-            label_name = self.label_names[label] if self.label_names else str(label)
-            if (target_labels is None) or (label_name in target_labels):
-                x1, y1, x2, y2 = box.astype(int)
-                out.append(
-                    {
-                        "box": [x1, y1, x2, y2],
-                        "label": label_name,
-                        "score": float(score),
-                    }
-                )
-        return out
+        # score_thresh: この呼び出しだけに使う閾値（Noneの場合はself.score_thresh）
+        # input_size: この呼び出しだけに使う推論時の最大辺（Noneの場合はself.imgsz）
+        return self.detect_batch([image], target_labels, score_thresh, input_size)[0]
+
+    def detect_batch(
+        self, images, target_labels=None, score_thresh=None, input_size=None
+    ):
+        # images: list of numpy.ndarray (HWC, BGR or RGB)
+        # 1回の推論でまとめて処理する。サイズの異なる画像はultralyticsの前処理で
+        # 入力サイズにレターボックスされ、座標は各画像の元サイズに戻される
+        if score_thresh is None:
+            score_thresh = self.score_thresh
+        if not images:
+            return []
+        # バッチ内の最大辺を覆うストライド(32)の倍数をキャンバスとし、
+        # 小さい画像を上限サイズまで拡大せずにレターボックスする
+        max_side = max(max(image.shape[:2]) for image in images)
+        if input_size is not None:
+            max_side = min(max_side, input_size)
+        imgsz = min(self.imgsz, math.ceil(max_side / 32) * 32)
+
+        # 対象クラスと閾値は推論時に渡し、NMSの段階で対象外の候補を除外する
+        classes = self.class_indices(target_labels)
+        if classes == []:
+            # 対象ラベルがモデルのクラスにない
+            return [[] for _ in images]
+        results = self.model(
+            list(images),
+            imgsz=imgsz,
+            conf=score_thresh,
+            classes=classes,
+            verbose=False,
+        )
+        return [self._parse_result(detections) for detections in results]
+
+    def _parse_result(self, detections):
+        # 推論時に閾値・クラスで絞り込み済みのため、辞書に変換するだけ
+        # data: (N, 6) [x1, y1, x2, y2, (track_id,) conf, cls] を1回でCPUに転送する
+        data = detections.boxes.data.cpu().numpy()
+        if len(data) == 0:
+            return []
+        boxes = data[:, :4].astype(int).tolist()
+        scores = data[:, -2].tolist()
+        labels = data[:, -1].astype(int).tolist()
+        if self.label_names:
+            names = [self.label_names[label] for label in labels]
+        else:
+            names = [str(label) for label in labels]
+        return [
+            {"box": box, "label": name, "score": score}
+            for box, name, score in zip(boxes, names, scores)
+        ]
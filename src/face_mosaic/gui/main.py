@@ -5,6 +5,7 @@ GUI版メインモジュール
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
+import os
 import threading
 from pathlib import Path
 from typing import Optional
@@ -27,6 +28,9 @@ class GUIApplication:
         self.root = root
         self.app: Optional[FaceMosaicApplication] = None
         self.processing = False
+        # 処理モード: "process"（通常）, "detect"（検出のみ）, "render"（検出結果から描画）
+        self.run_mode = "process"
+        self.sidecar_path: Optional[Path] = None
 
         self.setup_window()
         self.create_widgets()
@@ -215,10 +219,17 @@ class GUIApplication:
             variable=self.detector_type_var,
             value="yolo",
             command=self.update_settings,
-        ).grid(row=0, column=1)
+        ).grid(row=0, column=1, padx=(0, 10))
+        ttk.Radiobutton(
+            detector_type_frame,
+            text="ONNX",
+            variable=self.detector_type_var,
+            value="onnx",
+            command=self.update_settings,
+        ).grid(row=0, column=2)
 
         # 物体検出モデルパス
-        ttk.Label(section_frame, text="物体検出モデル(.pt):").grid(
+        ttk.Label(section_frame, text="物体検出モデル(.pt/.onnx):").grid(
             row=5, column=0, sticky=tk.W, padx=(0, 5), pady=(5, 0)
         )
         self.object_model_var = tk.StringVar()
@@ -230,6 +241,19 @@ class GUIApplication:
             section_frame, text="参照", command=self.select_object_model_file
         ).grid(row=5, column=2, padx=(0, 5), pady=(5, 0))
 
+        # 並列ワーカー数
+        ttk.Label(section_frame, text="ワーカー数:").grid(
+            row=6, column=0, sticky=tk.W, padx=(0, 5), pady=(5, 0)
+        )
+        self.workers_var = tk.IntVar(value=1)
+        ttk.Spinbox(
+            section_frame,
+            from_=1,
+            to=max(1, os.cpu_count() or 1),
+            textvariable=self.workers_var,
+            width=5,
+        ).grid(row=6, column=1, sticky=tk.W, pady=(5, 0))
+
     def create_execution_section(self, parent: ttk.Frame, row: int) -> None:
         """実行ボタンセクション作成"""
         # セクションフレーム
@@ -260,6 +284,16 @@ class GUIApplication:
         )
         self.stop_button.grid(row=0, column=3)
 
+        self.detect_only_button = ttk.Button(
+            section_frame, text="検出のみ", command=self.start_detect_only
+        )
+        self.detect_only_button.grid(row=1, column=0, padx=(0, 10), pady=(5, 0))
+
+        self.render_button = ttk.Button(
+            section_frame, text="検出結果から描画", command=self.start_render_from
+        )
+        self.render_button.grid(row=1, column=1, padx=(0, 10), pady=(5, 0))
+
     def create_progress_section(self, parent: ttk.Frame, row: int) -> None:
         """進捗セクション作成"""
         # セクションフレーム
@@ -314,7 +348,8 @@ class GUIApplication:
             config = AppConfig()
             self.app = FaceMosaicApplication(config)
 
-            if self.app.is_ready():
+            # 検出モデルは初回の検出時に読み込むため、ここでは要件のみ確認
+            if all(self.app.check_requirements().values()):
                 self.log("アプリケーションが正常に初期化されました")
                 self.status_var.set("準備完了")
             else:
@@ -390,10 +425,11 @@ class GUIApplication:
         """物体検出モデルファイル選択"""
         filetypes = [
             ("PyTorch/YOLOv8 モデル", "*.pt"),
+            ("ONNX モデル", "*.onnx"),
             ("すべてのファイル", "*.*"),
         ]
         filename = filedialog.askopenfilename(
-            title="物体検出モデル(.pt)を選択", filetypes=filetypes
+            title="物体検出モデルを選択", filetypes=filetypes
         )
         if filename:
             self.object_model_var.set(filename)
@@ -423,49 +459,18 @@ class GUIApplication:
         try:
             # モザイク設定更新
             self.app.config.mosaic.pixelate = self.mosaic_type_var.get() == "pixelate"
-            # 物体検出設定更新
-            use_obj = self.use_object_detection_var.get()
+            # 物体検出設定更新（検出結果から描画する場合はモデルを読み込まない）
+            use_obj = self.use_object_detection_var.get() and self.run_mode != "render"
             labels = [
                 s.strip() for s in self.object_labels_var.get().split(",") if s.strip()
             ]
             detector_type = self.detector_type_var.get()
             model_path = self.object_model_var.get() or None
-            if use_obj:
-                if detector_type == "yolo":
-                    from ..core.yolov8_object_detector import YoloV8ObjectDetector
-
-                    if not hasattr(
-                        self.app.image_processor, "object_detector"
-                    ) or not isinstance(
-                        self.app.image_processor.object_detector, YoloV8ObjectDetector
-                    ):
-                        self.app.image_processor.object_detector = YoloV8ObjectDetector(
-                            model_path=model_path
-                        )
-                    else:
-                        self.app.image_processor.object_detector.model = (
-                            YoloV8ObjectDetector(model_path=model_path).model
-                        )
-                else:
-                    from ..core.object_detector import ObjectDetector
-
-                    if not hasattr(
-                        self.app.image_processor, "object_detector"
-                    ) or not isinstance(
-                        self.app.image_processor.object_detector, ObjectDetector
-                    ):
-                        self.app.image_processor.object_detector = ObjectDetector(
-                            model_path=model_path
-                        )
-                    else:
-                        self.app.image_processor.object_detector.model = ObjectDetector(
-                            model_path=model_path
-                        ).model
-                self.app.image_processor.use_object_detection = True
-                self.app.image_processor.object_labels = labels
-            else:
-                self.app.image_processor.use_object_detection = False
-                self.app.image_processor.object_labels = []
+            self.app.configure_object_detection(
+                use_obj, labels, detector_type, model_path
+            )
+            # 並列処理設定更新
+            self.app.update_workers(self.workers_var.get())
         except Exception as e:
             self.log(f"設定更新エラー: {e}")
 
@@ -482,6 +487,57 @@ class GUIApplication:
         if not messagebox.askyesno("確認", "処理を開始しますか？"):
             return
 
+        self._start_background("process")
+
+    def start_detect_only(self) -> None:
+        """検出のみ実行し、検出結果ファイルを保存"""
+        if not self.input_var.get():
+            messagebox.showerror("エラー", "入力パスを選択してください")
+            return
+
+        if self.processing:
+            messagebox.showwarning("警告", "処理が既に実行中です")
+            return
+
+        filename = filedialog.asksaveasfilename(
+            title="検出結果の保存先を選択",
+            defaultextension=".jsonl",
+            filetypes=[("検出結果", "*.jsonl *.jsonl.gz"), ("すべて", "*.*")],
+        )
+        if not filename:
+            return
+
+        self.sidecar_path = Path(filename)
+        self._start_background("detect")
+
+    def start_render_from(self) -> None:
+        """保存済みの検出結果でモザイクを適用（検出モデルは読み込まない）"""
+        if not self.validate_inputs():
+            return
+
+        if self.processing:
+            messagebox.showwarning("警告", "処理が既に実行中です")
+            return
+
+        filename = filedialog.askopenfilename(
+            title="検出結果ファイルを選択",
+            filetypes=[("検出結果", "*.jsonl *.jsonl.gz"), ("すべて", "*.*")],
+        )
+        if not filename:
+            return
+
+        self.sidecar_path = Path(filename)
+        self._start_background("render")
+
+    def _start_background(self, mode: str) -> None:
+        """
+        バックグラウンド処理を開始
+
+        Args:
+            mode: 処理モード
+        """
+        self.run_mode = mode
+
         # 設定更新
         self.update_settings()
 
@@ -513,7 +569,21 @@ class GUIApplication:
                     ),
                 )
 
-            if input_path.is_file():
+            if self.run_mode == "detect":
+                # 検出のみ
+                self.root.after(0, lambda: self.log("検出のみを開始"))
+                stats = self.app.detect_only(
+                    input_path, self.sidecar_path, progress_callback
+                )
+                self.root.after(0, lambda: self._show_batch_results(stats))
+            elif self.run_mode == "render":
+                # 検出結果から描画
+                self.root.after(0, lambda: self.log("検出結果からの描画を開始"))
+                stats = self.app.render_from_sidecar(
+                    input_path, output_path, self.sidecar_path, progress_callback
+                )
+                self.root.after(0, lambda: self._show_batch_results(stats))
+            elif input_path.is_file():
                 # 単一ファイル処理
                 self.root.after(0, lambda: self.log("単一ファイル処理を開始"))
                 result = self.app.process_single_image(input_path, output_path)
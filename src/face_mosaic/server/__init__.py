@@ -0,0 +1,30 @@
+"""
+サーバーモジュール
+検出モデルを読み込んだまま常駐し、ジョブを受け付けるサーバー（Unixソケット・HTTP）と
+そのクライアントを提供
+"""
+
+import importlib
+
+# クライアントは起動を軽くするため、cv2 を使うサーバー側と分けて参照時に読み込む
+_LAZY_ATTRIBUTES = {
+    "FaceMosaicSocketServer": ".socket_server",
+    "FaceMosaicClient": ".socket_client",
+    "FaceMosaicHTTPServer": ".http_server",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+__all__ = ["FaceMosaicSocketServer", "FaceMosaicClient", "FaceMosaicHTTPServer"]
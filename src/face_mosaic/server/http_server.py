@@ -0,0 +1,620 @@
+"""
+HTTPサーバー
+POSTされた画像をモザイク処理して返す（asyncio と標準ライブラリのみで実装）
+
+エンドポイント:
+  POST /mosaic  画像データを受け取り、モザイク処理済みの画像を返す
+                （?format=.png で出力形式を指定。省略時はJPEG）
+  POST /detect  画像データを受け取り、検出結果をJSONで返す
+  GET  /health  稼働状況をJSONで返す
+
+同時に届いたリクエストの検出はまとめてバッチ推論し、デコード・描画・エンコードは
+スレッド数を制限した executor で実行する。各段階の所要時間は Server-Timing ヘッダーで返す
+"""
+
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import cv2
+import numpy as np
+
+from .. import __version__
+from ..core.application import FaceMosaicApplication
+from ..core.exceptions import FaceMosaicError, InvalidImageError
+from ..core.image_processor import ImageProcessor
+
+# レスポンス本文を書き出す単位（バイト）
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_CONTENT_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".bmp": "image/bmp",
+    ".webp": "image/webp",
+}
+
+
+@dataclass
+class HTTPRequest:
+    """HTTPリクエスト"""
+
+    method: str
+    path: str
+    query: Dict[str, str] = field(default_factory=dict)
+    headers: Dict[str, str] = field(default_factory=dict)  # キーは小文字
+    body: bytes = b""
+
+
+@dataclass
+class HTTPResponse:
+    """HTTPレスポンス"""
+
+    status: int
+    body: bytes = b""
+    content_type: str = "application/json"
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def json(
+        cls, status: int, data: Dict[str, Any], headers: Optional[Dict] = None
+    ) -> "HTTPResponse":
+        """JSONレスポンスを作成"""
+        body = json.dumps(data, ensure_ascii=False, default=str).encode("utf-8")
+        return cls(status, body, "application/json", dict(headers or {}))
+
+    @classmethod
+    def error(cls, status: int, message: str) -> "HTTPResponse":
+        """エラーレスポンスを作成"""
+        return cls.json(status, {"error": message})
+
+
+class _HTTPError(Exception):
+    """リクエストを処理できない場合の例外（ステータスコード付き）"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass
+class _DetectionOutcome:
+    """まとめて検出した結果のうち1リクエスト分"""
+
+    faces: List[Dict[str, Any]]
+    objects: List[Dict[str, Any]]
+    stats: Dict[str, Any]
+    batch_size: int
+    queue_time: float
+    detect_time: float
+
+
+class DetectionBatcher:
+    """同時に届いた検出要求をまとめてバッチ推論するクラス"""
+
+    def __init__(
+        self,
+        image_processor: ImageProcessor,
+        executor: ThreadPoolExecutor,
+        max_batch_size: int = 8,
+        batch_window: float = 0.005,
+        concurrency: int = 1,
+    ):
+        """
+        初期化
+
+        Args:
+            image_processor: 検出に使用する画像処理インスタンス
+            executor: 検出を実行する executor
+            max_batch_size: まとめる最大枚数
+            batch_window: デコード中のリクエストを待つ最大時間（秒）
+            concurrency: 同時に実行するバッチ数（検出器プールのサイズ）
+        """
+        self.image_processor = image_processor
+        self.executor = executor
+        self.max_batch_size = max(1, max_batch_size)
+        self.batch_window = max(0.0, batch_window)
+        self.concurrency = max(1, concurrency)
+        self.batches = 0
+        self.images = 0
+        # デコード中（まもなく検出要求が届く）のリクエスト数
+        self._incoming = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._task: Optional[asyncio.Task] = None
+        self._running: set = set()
+
+    def start(self) -> None:
+        """バッチ処理タスクを開始（イベントループ内で呼ぶ）"""
+        self._queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self.concurrency)
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """バッチ処理タスクを停止"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._running:
+            await asyncio.gather(*self._running, return_exceptions=True)
+
+    def announce(self) -> None:
+        """検出要求がまもなく届くことを通知（デコード開始時に呼ぶ）"""
+        self._incoming += 1
+
+    def withdraw(self) -> None:
+        """通知した検出要求を取り消す（デコード失敗時に呼ぶ）"""
+        self._incoming = max(0, self._incoming - 1)
+
+    async def detect(self, image: np.ndarray) -> _DetectionOutcome:
+        """
+        画像の検出を要求し、結果を待つ
+
+        Args:
+            image: 入力画像（BGR形式）
+
+        Returns:
+            検出結果
+        """
+        future = asyncio.get_running_loop().create_future()
+        self.withdraw()
+        self._queue.put_nowait((image, future, time.perf_counter()))
+        return await future
+
+    async def _run(self) -> None:
+        """キューから要求を取り出してバッチにまとめる"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            self._drain(batch)
+            # デコード中のリクエストがある場合だけ、まとめる相手を待つ
+            if len(batch) < self.max_batch_size and self._incoming > 0:
+                deadline = loop.time() + self.batch_window
+                while (
+                    len(batch) < self.max_batch_size
+                    and self._incoming > 0
+                    and loop.time() < deadline
+                ):
+                    await asyncio.sleep(min(0.001, self.batch_window))
+                    self._drain(batch)
+
+            await self._slots.acquire()
+            task = loop.create_task(self._detect_batch(batch))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    def _drain(self, batch: List[Tuple]) -> None:
+        """キューに溜まっている要求を最大枚数までバッチに追加"""
+        while len(batch) < self.max_batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+
+    async def _detect_batch(self, batch: List[Tuple]) -> None:
+        """バッチを executor で検出し、各要求に結果を返す"""
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        images = [image for image, _, _ in batch]
+        stats_list = [{} for _ in batch]
+        try:
+            detected = await loop.run_in_executor(
+                self.executor,
+                self.image_processor.detect_details_batch,
+                images,
+                stats_list,
+            )
+        except Exception as e:
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        finally:
+            self._slots.release()
+
+        detect_time = time.perf_counter() - start
+        self.batches += 1
+        self.images += len(batch)
+        for (_, future, queued_at), (faces, objects), stats in zip(
+            batch, detected, stats_list
+        ):
+            if not future.done():
+                future.set_result(
+                    _DetectionOutcome(
+                        faces,
+                        objects,
+                        stats,
+                        len(batch),
+                        start - queued_at,
+                        detect_time,
+                    )
+                )
+
+
+class FaceMosaicHTTPServer:
+    """画像をモザイク処理するHTTPサーバークラス"""
+
+    def __init__(
+        self,
+        app: FaceMosaicApplication,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+    ):
+        """
+        初期化
+
+        ホスト・ポート・スレッド数・バッチ設定は app.config.server から取得する
+
+        Args:
+            app: 初期化済みのアプリケーション
+            host: 待ち受けるホスト（Noneの場合は設定値）
+            port: 待ち受けるポート（Noneの場合は設定値、0で空いているポート）
+        """
+        self.app = app
+        server_config = app.config.server
+        self.host = server_config.http_host if host is None else host
+        self.port = server_config.http_port if port is None else port
+        self.max_body_size = server_config.max_body_size
+        self.workers = max(1, server_config.http_workers)
+        self.started_at = time.time()
+        self.requests_handled = 0
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._batcher: Optional[DetectionBatcher] = None
+        # 処理中のリクエスト数を制限し、受信済みの画像でメモリを使い切らない
+        self._admission: Optional[asyncio.Semaphore] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._routes = {
+            ("POST", "/mosaic"): self._handle_mosaic,
+            ("POST", "/detect"): self._handle_detect,
+            ("GET", "/health"): self._handle_health,
+        }
+
+    async def start(self, listen: bool = True) -> None:
+        """
+        executor とバッチ処理を準備し、待ち受けを開始
+
+        Args:
+            listen: Falseの場合はソケットを開かない（dispatch を直接呼ぶテスト用）
+        """
+        server_config = self.app.config.server
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="face-mosaic-http"
+        )
+        self._batcher = DetectionBatcher(
+            self.app.image_processor,
+            self._executor,
+            max_batch_size=server_config.batch_size,
+            batch_window=server_config.batch_window_ms / 1000.0,
+            concurrency=self.app.config.processing.threads,
+        )
+        self._batcher.start()
+        self._admission = asyncio.Semaphore(self.workers * 2)
+
+        if listen:
+            self._server = await asyncio.start_server(
+                self._handle_connection, self.host, self.port
+            )
+            # ポート0を指定した場合に実際のポートを記録
+            self.port = self._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        """待ち受けを停止してスレッドを終了"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._batcher is not None:
+            await self._batcher.stop()
+            self._batcher = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    async def serve_forever(self) -> None:
+        """close されるまでリクエストを処理"""
+        if self._server is None:
+            await self.start()
+        print(f"HTTPサーバーを起動しました: http://{self.host}:{self.port}")
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    def run(self) -> None:
+        """イベントループを作成してサーバーを実行（Ctrl+Cで停止）"""
+        try:
+            asyncio.run(self.serve_forever())
+        except KeyboardInterrupt:
+            pass
+
+    async def dispatch(self, request: HTTPRequest) -> HTTPResponse:
+        """
+        リクエストを処理してレスポンスを返す
+
+        Args:
+            request: HTTPリクエスト
+
+        Returns:
+            HTTPレスポンス（Server-Timing ヘッダー付き）
+        """
+        start = time.perf_counter()
+        timings: Dict[str, float] = {}
+        response = await self._route(request, timings)
+        # エラー応答でも、どの段階まで進んで時間がかかったかを返す
+        timings["total"] = time.perf_counter() - start
+        response.headers["Server-Timing"] = ", ".join(
+            f"{name};dur={seconds * 1000:.2f}" for name, seconds in timings.items()
+        )
+        return response
+
+    async def _route(
+        self, request: HTTPRequest, timings: Dict[str, float]
+    ) -> HTTPResponse:
+        """ハンドラーを呼び出し、例外をエラー応答に変換"""
+        handler = self._routes.get((request.method, request.path))
+        if handler is None:
+            if any(path == request.path for _, path in self._routes):
+                return HTTPResponse.error(
+                    HTTPStatus.METHOD_NOT_ALLOWED, f"{request.method} は使用できません"
+                )
+            return HTTPResponse.error(
+                HTTPStatus.NOT_FOUND, f"見つかりません: {request.path}"
+            )
+
+        try:
+            response = await handler(request, timings)
+        except _HTTPError as e:
+            return HTTPResponse.error(e.status, str(e))
+        except InvalidImageError as e:
+            return HTTPResponse.error(HTTPStatus.BAD_REQUEST, str(e))
+        except FaceMosaicError as e:
+            return HTTPResponse.error(HTTPStatus.INTERNAL_SERVER_ERROR, str(e))
+        except Exception as e:
+            return HTTPResponse.error(
+                HTTPStatus.INTERNAL_SERVER_ERROR, f"予期しないエラー: {e}"
+            )
+
+        self.requests_handled += 1
+        return response
+
+    async def _run_cpu(self, func, *args) -> Any:
+        """CPU処理を executor で実行"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    async def _decode_and_detect(
+        self, request: HTTPRequest, timings: Dict[str, float]
+    ) -> Tuple[np.ndarray, _DetectionOutcome]:
+        """リクエストの画像をデコードし、他のリクエストとまとめて検出"""
+        if not request.body:
+            raise _HTTPError(HTTPStatus.BAD_REQUEST, "画像データがありません")
+
+        start = time.perf_counter()
+        self._batcher.announce()
+        try:
+            image = await self._run_cpu(_decode_image, request.body)
+        except Exception:
+            self._batcher.withdraw()
+            raise
+        finally:
+            timings["decode"] = time.perf_counter() - start
+
+        outcome = await self._batcher.detect(image)
+        timings["queue"] = outcome.queue_time
+        timings["detect"] = outcome.detect_time
+        return image, outcome
+
+    async def _handle_mosaic(
+        self, request: HTTPRequest, timings: Dict[str, float]
+    ) -> HTTPResponse:
+        """画像をモザイク処理して返す"""
+        ext = request.query.get("format", ".jpg").lower()
+        if not ext.startswith("."):
+            ext = f".{ext}"
+        if ext not in _CONTENT_TYPES:
+            raise _HTTPError(
+                HTTPStatus.BAD_REQUEST, f"対応していない出力形式です: {ext}"
+            )
+
+        image, outcome = await self._decode_and_detect(request, timings)
+        targets = [face["box"] for face in outcome.faces] + [
+            obj["box"] for obj in outcome.objects
+        ]
+
+        start = time.perf_counter()
+        encoded = await self._run_cpu(self._render_and_encode, image, targets, ext)
+        timings["render"] = time.perf_counter() - start
+
+        return HTTPResponse(
+            HTTPStatus.OK,
+            encoded,
+            _CONTENT_TYPES[ext],
+            {
+                "X-Faces-Detected": str(len(outcome.faces)),
+                "X-Objects-Detected": str(len(outcome.objects)),
+                "X-Batch-Size": str(outcome.batch_size),
+            },
+        )
+
+    def _render_and_encode(
+        self, image: np.ndarray, targets: List[Tuple[int, int, int, int]], ext: str
+    ) -> bytes:
+        """モザイクを適用してエンコード"""
+        processor = self.app.image_processor
+        if targets:
+            image = processor.apply_mosaic(image, targets)
+        return processor.encode_image(image, ext)
+
+    async def _handle_detect(
+        self, request: HTTPRequest, timings: Dict[str, float]
+    ) -> HTTPResponse:
+        """検出結果をJSONで返す"""
+        image, outcome = await self._decode_and_detect(request, timings)
+        result = {
+            "image_size": list(image.shape[:2][::-1]),
+            "faces": outcome.faces,
+            "objects": outcome.objects,
+        }
+        result.update(outcome.stats)
+        return HTTPResponse.json(
+            HTTPStatus.OK, result, {"X-Batch-Size": str(outcome.batch_size)}
+        )
+
+    async def _handle_health(
+        self, request: HTTPRequest, timings: Dict[str, float]
+    ) -> HTTPResponse:
+        """稼働状況を返す"""
+        batcher = self._batcher
+        return HTTPResponse.json(
+            HTTPStatus.OK,
+            {
+                "status": "ok",
+                "version": __version__,
+                "uptime": round(time.time() - self.started_at, 1),
+                "requests_handled": self.requests_handled,
+                "batches": batcher.batches,
+                "mean_batch_size": (
+                    round(batcher.images / batcher.batches, 2) if batcher.batches else 0
+                ),
+            },
+        )
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """1接続分のリクエストを処理（keep-alive の場合は繰り返し受け付ける）"""
+        try:
+            while True:
+                try:
+                    request, keep_alive = await self._read_request(reader)
+                except _HTTPError as e:
+                    await self._write_response(
+                        writer, HTTPResponse.error(e.status, str(e)), False
+                    )
+                    return
+                if request is None:
+                    return
+
+                async with self._admission:
+                    try:
+                        request.body = await self._read_body(reader, request)
+                    except _HTTPError as e:
+                        # 本文を読まずに応答するため接続は維持しない
+                        await self._write_response(
+                            writer, HTTPResponse.error(e.status, str(e)), False
+                        )
+                        return
+                    response = await self.dispatch(request)
+                await self._write_response(writer, response, keep_alive)
+                if not keep_alive:
+                    return
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _read_request(
+        self, reader: asyncio.StreamReader
+    ) -> Tuple[Optional[HTTPRequest], bool]:
+        """
+        リクエスト行とヘッダーを読み込む（本文は _read_body で読む）
+
+        Returns:
+            (リクエスト, 接続を維持するかどうか) のタプル（接続が閉じられた場合はNone）
+        """
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError:
+            return None, False
+        except asyncio.LimitOverrunError:
+            raise _HTTPError(
+                HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "ヘッダーが大きすぎます"
+            )
+
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, version = lines[0].split(" ", 2)
+        except ValueError:
+            raise _HTTPError(HTTPStatus.BAD_REQUEST, "不正なリクエスト行です")
+
+        headers = {}
+        for line in lines[1:]:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+
+        url = urlsplit(target)
+        request = HTTPRequest(
+            method.upper(), url.path, dict(parse_qsl(url.query)), headers
+        )
+
+        connection = headers.get("connection", "").lower()
+        if version == "HTTP/1.0":
+            keep_alive = connection == "keep-alive"
+        else:
+            keep_alive = connection != "close"
+        return request, keep_alive
+
+    async def _read_body(
+        self, reader: asyncio.StreamReader, request: HTTPRequest
+    ) -> bytes:
+        """Content-Length 分の本文を読み込む"""
+        if "chunked" in request.headers.get("transfer-encoding", "").lower():
+            raise _HTTPError(
+                HTTPStatus.LENGTH_REQUIRED, "Content-Length を指定してください"
+            )
+        try:
+            length = int(request.headers.get("content-length", "0"))
+        except ValueError:
+            raise _HTTPError(HTTPStatus.BAD_REQUEST, "Content-Length が不正です")
+        if length > self.max_body_size:
+            raise _HTTPError(
+                HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                f"画像データが大きすぎます: {length} バイト",
+            )
+        return await reader.readexactly(length) if length > 0 else b""
+
+    @staticmethod
+    async def _write_response(
+        writer: asyncio.StreamWriter, response: HTTPResponse, keep_alive: bool
+    ) -> None:
+        """ヘッダーを送信した後、本文を一定サイズごとに書き出す"""
+        status = HTTPStatus(response.status)
+        headers = {
+            "Content-Type": response.content_type,
+            "Content-Length": str(len(response.body)),
+            "Connection": "keep-alive" if keep_alive else "close",
+            **response.headers,
+        }
+        head = f"HTTP/1.1 {status.value} {status.phrase}\r\n" + "".join(
+            f"{name}: {value}\r\n" for name, value in headers.items()
+        )
+        writer.write(head.encode("latin-1") + b"\r\n")
+
+        body = memoryview(response.body)
+        for offset in range(0, len(body), STREAM_CHUNK_SIZE):
+            writer.write(body[offset : offset + STREAM_CHUNK_SIZE])
+            # クライアントの受信が遅い場合は書き込みバッファが空くまで待つ
+            await writer.drain()
+        await writer.drain()
+
+
+def _decode_image(data: bytes) -> np.ndarray:
+    """
+    画像データをデコード
+
+    Raises:
+        InvalidImageError: 画像データを読み込めない場合
+    """
+    image = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+    if image is None:
+        raise InvalidImageError("画像データを読み込めません")
+    return image
@@ -0,0 +1,78 @@
+"""
+常駐サーバーの通信プロトコル
+メッセージは [ヘッダー長 (4バイト, ビッグエンディアン)][JSONヘッダー][ペイロード] の形式。
+ペイロード（画像データ）の長さはヘッダーの "payload_size" で示す
+"""
+
+import json
+import socket
+import struct
+from typing import Any, Dict, Tuple
+
+from ..core.exceptions import ServerError
+
+_LENGTH = struct.Struct("!I")
+
+# 異常なメッセージでメモリを使い切らないための上限
+MAX_HEADER_SIZE = 1024 * 1024
+MAX_PAYLOAD_SIZE = 512 * 1024 * 1024
+
+
+def send_message(
+    sock: socket.socket, header: Dict[str, Any], payload: bytes = b""
+) -> None:
+    """
+    メッセージを送信
+
+    Args:
+        sock: 接続済みソケット
+        header: JSONに変換できるヘッダー辞書
+        payload: ペイロード（画像データなど）
+    """
+    header = dict(header, payload_size=len(payload))
+    data = json.dumps(header, ensure_ascii=False, default=str).encode("utf-8")
+    sock.sendall(_LENGTH.pack(len(data)) + data)
+    if payload:
+        sock.sendall(payload)
+
+
+def recv_message(sock: socket.socket) -> Tuple[Dict[str, Any], bytes]:
+    """
+    メッセージを受信
+
+    Args:
+        sock: 接続済みソケット
+
+    Returns:
+        (ヘッダー辞書, ペイロード) のタプル
+
+    Raises:
+        ServerError: 接続が途中で切れた場合、またはメッセージが不正な場合
+    """
+    (header_size,) = _LENGTH.unpack(_recv_exact(sock, _LENGTH.size))
+    if header_size > MAX_HEADER_SIZE:
+        raise ServerError(f"ヘッダーが大きすぎます: {header_size} バイト")
+
+    try:
+        header = json.loads(_recv_exact(sock, header_size).decode("utf-8"))
+    except ValueError as e:
+        raise ServerError(f"ヘッダーを解析できません: {e}")
+
+    payload_size = int(header.get("payload_size", 0))
+    if not 0 <= payload_size <= MAX_PAYLOAD_SIZE:
+        raise ServerError(f"ペイロードサイズが不正です: {payload_size} バイト")
+
+    return header, _recv_exact(sock, payload_size)
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    """指定バイト数を受信するまで読み込む"""
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
+    while received < size:
+        count = sock.recv_into(view[received:])
+        if count == 0:
+            raise ServerError("接続が切断されました")
+        received += count
+    return bytes(buffer)
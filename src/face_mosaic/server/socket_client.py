@@ -0,0 +1,153 @@
+"""
+常駐サーバーのクライアントクラス
+cv2 や検出モデルを読み込まずにジョブをサーバーへ転送する
+"""
+
+import socket
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from ..core.exceptions import ServerError
+from ..server.protocol import recv_message, send_message
+
+
+class FaceMosaicClient:
+    """常駐サーバーのクライアントクラス"""
+
+    def __init__(
+        self,
+        socket_path: Path,
+        fingerprint: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ):
+        """
+        初期化
+
+        Args:
+            socket_path: サーバーのソケットファイルのパス
+            fingerprint: クライアント側の設定のフィンガープリント
+                （指定した場合、サーバーの設定と異なるとエラーになる）
+            timeout: 応答待ちのタイムアウト（秒、Noneの場合は無制限）
+        """
+        self.socket_path = Path(socket_path)
+        self.fingerprint = fingerprint
+        self.timeout = timeout
+
+    def request(
+        self, header: Dict[str, Any], payload: bytes = b""
+    ) -> Tuple[Dict[str, Any], bytes]:
+        """
+        リクエストを送信して応答を受け取る
+
+        Args:
+            header: リクエストヘッダー
+            payload: ペイロード（画像データ）
+
+        Returns:
+            (処理結果, 応答のペイロード) のタプル
+
+        Raises:
+            ServerError: 接続できない場合、またはサーバーでの処理が失敗した場合
+        """
+        if self.fingerprint is not None:
+            header = dict(header, fingerprint=self.fingerprint)
+
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(str(self.socket_path))
+            send_message(sock, header, payload)
+            response, response_payload = recv_message(sock)
+        except OSError as e:
+            raise ServerError(f"サーバーと通信できません: {e}")
+        finally:
+            sock.close()
+
+        if not response.get("ok"):
+            raise ServerError(
+                response.get("error", "サーバーでの処理に失敗しました"),
+                response.get("error_type"),
+            )
+        return response["result"], response_payload
+
+    def ping(self, timeout: float = 1.0) -> Optional[Dict[str, Any]]:
+        """
+        サーバーの稼働を確認
+
+        Args:
+            timeout: 応答待ちのタイムアウト（秒）
+
+        Returns:
+            サーバー情報（稼働していない場合はNone）
+        """
+        if not self.socket_path.exists():
+            return None
+        client = FaceMosaicClient(self.socket_path, timeout=timeout)
+        try:
+            return client.request({"op": "ping"})[0]
+        except ServerError:
+            return None
+
+    def process_file(self, input_path: Path, output_path: Path) -> Dict[str, Any]:
+        """
+        単一ファイルを処理
+
+        サーバーの作業ディレクトリに依存しないよう、パスは絶対パスで送る
+
+        Args:
+            input_path: 入力ファイルパス
+            output_path: 出力ファイルパス
+
+        Returns:
+            処理結果
+        """
+        return self.request(
+            {
+                "op": "process_file",
+                "input": str(Path(input_path).resolve()),
+                "output": str(Path(output_path).resolve()),
+            }
+        )[0]
+
+    def process_directory(
+        self, input_dir: Path, output_dir: Path, resume: bool = False
+    ) -> Dict[str, Any]:
+        """
+        ディレクトリを処理
+
+        Args:
+            input_dir: 入力ディレクトリ
+            output_dir: 出力ディレクトリ
+            resume: 前回処理済みのファイルをスキップ
+
+        Returns:
+            処理結果統計
+        """
+        return self.request(
+            {
+                "op": "process_directory",
+                "input": str(Path(input_dir).resolve()),
+                "output": str(Path(output_dir).resolve()),
+                "resume": resume,
+            }
+        )[0]
+
+    def process_bytes(
+        self, data: bytes, ext: str = ".jpg"
+    ) -> Tuple[bytes, Dict[str, Any]]:
+        """
+        画像データを処理
+
+        Args:
+            data: 画像ファイルの内容
+            ext: 出力形式の拡張子
+
+        Returns:
+            (モザイク処理済みの画像データ, 処理結果) のタプル
+        """
+        result, payload = self.request({"op": "process_bytes", "format": ext}, data)
+        return payload, result
+
+    def shutdown(self) -> None:
+        """サーバーを停止"""
+        self.request({"op": "shutdown"})
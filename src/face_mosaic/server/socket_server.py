@@ -0,0 +1,222 @@
+"""
+常駐サーバークラス
+FaceMosaicApplication と検出モデルを読み込んだまま、Unixドメインソケットでジョブを受け付ける
+"""
+
+import os
+import socket
+import socketserver
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .. import __version__
+from ..core.application import FaceMosaicApplication
+from ..core.exceptions import ConfigurationError, FaceMosaicError, ServerError
+from ..server.protocol import recv_message, send_message
+from ..utils.hash_utils import settings_fingerprint
+
+
+class _RequestHandler(socketserver.BaseRequestHandler):
+    """1接続分のリクエストを処理するハンドラ（接続が閉じられるまで繰り返し受け付ける）"""
+
+    def handle(self) -> None:
+        owner: "FaceMosaicSocketServer" = self.server.owner
+        while True:
+            try:
+                header, payload = recv_message(self.request)
+            except (ServerError, OSError):
+                return
+            response, response_payload = owner.handle_request(header, payload)
+            try:
+                send_message(self.request, response, response_payload)
+            except OSError:
+                return
+            if header.get("op") == "shutdown":
+                return
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """接続ごとにスレッドで処理するUnixソケットサーバー"""
+
+    daemon_threads = True
+
+
+class FaceMosaicSocketServer:
+    """モデルを常駐させてジョブを処理するサーバークラス"""
+
+    def __init__(self, app: FaceMosaicApplication, socket_path: Path):
+        """
+        初期化
+
+        同時に処理するジョブ数は ProcessingConfig.threads まで
+        （2以上の場合は検出器プールでスレッドごとに検出器を使い分ける）
+
+        Args:
+            app: 初期化済みのアプリケーション
+            socket_path: 待ち受けるソケットファイルのパス
+        """
+        self.app = app
+        self.socket_path = Path(socket_path)
+        self.fingerprint = settings_fingerprint(app.config)
+        self._jobs = threading.BoundedSemaphore(max(1, app.config.processing.threads))
+        self._server: Optional[_UnixServer] = None
+        self.started_at = time.time()
+        self.requests_handled = 0
+        self._stats_lock = threading.Lock()
+
+        self._operations: Dict[str, Callable[[Dict[str, Any], bytes], Tuple]] = {
+            "ping": self._ping,
+            "process_file": self._process_file,
+            "process_directory": self._process_directory,
+            "process_bytes": self._process_bytes,
+            "shutdown": self._shutdown,
+        }
+
+    def start(self) -> None:
+        """
+        ソケットを作成して待ち受けを開始（serve_forever の前に呼ぶ）
+
+        Raises:
+            ConfigurationError: 同じソケットで別のサーバーが稼働中の場合
+        """
+        if self.socket_path.exists():
+            # 前回のサーバーが異常終了して残ったソケットファイルは削除する
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(str(self.socket_path))
+            except OSError:
+                self.socket_path.unlink()
+            else:
+                raise ConfigurationError(
+                    f"サーバーは既に起動しています: {self.socket_path}"
+                )
+            finally:
+                probe.close()
+
+        self._server = _UnixServer(str(self.socket_path), _RequestHandler)
+        self._server.owner = self
+        # 他のユーザーからジョブを受け付けない
+        os.chmod(self.socket_path, 0o600)
+
+    def serve_forever(self) -> None:
+        """shutdown が呼ばれるまでリクエストを処理"""
+        if self._server is None:
+            self.start()
+        print(f"サーバーを起動しました: {self.socket_path}")
+        try:
+            self._server.serve_forever()
+        finally:
+            self.close()
+
+    def shutdown(self) -> None:
+        """待ち受けを停止（serve_forever とは別のスレッドから呼ぶ）"""
+        if self._server is not None:
+            self._server.shutdown()
+
+    def close(self) -> None:
+        """ソケットを閉じてソケットファイルを削除"""
+        if self._server is not None:
+            self._server.server_close()
+            self._server = None
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+
+    def handle_request(
+        self, header: Dict[str, Any], payload: bytes
+    ) -> Tuple[Dict[str, Any], bytes]:
+        """
+        リクエストを処理
+
+        Args:
+            header: リクエストヘッダー（"op" で処理の種類を指定）
+            payload: リクエストのペイロード（画像データ）
+
+        Returns:
+            (レスポンスヘッダー, レスポンスのペイロード) のタプル
+            レスポンスヘッダーは成功時 {"ok": True, "result": ...}、
+            失敗時 {"ok": False, "error": str, "error_type": str}
+        """
+        start = time.perf_counter()
+        op = header.get("op")
+        operation = self._operations.get(op)
+        if operation is None:
+            return self._error(f"未知の操作です: {op}", "ValidationError"), b""
+
+        # クライアントの設定が異なる場合は処理せず、クライアント側での処理に任せる
+        fingerprint = header.get("fingerprint")
+        if fingerprint is not None and fingerprint != self.fingerprint:
+            return (
+                self._error("サーバーと設定が異なります", "SettingsMismatch"),
+                b"",
+            )
+
+        try:
+            result, response_payload = operation(header, payload)
+        except FaceMosaicError as e:
+            return self._error(str(e), type(e).__name__), b""
+        except Exception as e:
+            return self._error(f"予期しないエラー: {e}", type(e).__name__), b""
+
+        with self._stats_lock:
+            self.requests_handled += 1
+        response = {
+            "ok": True,
+            "result": result,
+            "elapsed": round(time.perf_counter() - start, 4),
+        }
+        return response, response_payload
+
+    @staticmethod
+    def _error(message: str, error_type: str) -> Dict[str, Any]:
+        return {"ok": False, "error": message, "error_type": error_type}
+
+    def _ping(self, header: Dict[str, Any], payload: bytes) -> Tuple[Dict, bytes]:
+        """稼働確認（設定のフィンガープリントと統計を返す）"""
+        with self._stats_lock:
+            handled = self.requests_handled
+        return {
+            "version": __version__,
+            "pid": os.getpid(),
+            "fingerprint": self.fingerprint,
+            "uptime": round(time.time() - self.started_at, 1),
+            "requests_handled": handled,
+        }, b""
+
+    def _process_file(
+        self, header: Dict[str, Any], payload: bytes
+    ) -> Tuple[Dict, bytes]:
+        """単一ファイルを処理"""
+        with self._jobs:
+            result = self.app.process_single_image(
+                Path(header["input"]), Path(header["output"])
+            )
+        return result, b""
+
+    def _process_directory(
+        self, header: Dict[str, Any], payload: bytes
+    ) -> Tuple[Dict, bytes]:
+        """ディレクトリを処理"""
+        with self._jobs:
+            stats = self.app.process_directory(
+                Path(header["input"]),
+                Path(header["output"]),
+                resume=bool(header.get("resume", False)),
+            )
+        return stats, b""
+
+    def _process_bytes(
+        self, header: Dict[str, Any], payload: bytes
+    ) -> Tuple[Dict, bytes]:
+        """画像データを処理し、処理済みの画像データを返す"""
+        with self._jobs:
+            encoded, result = self.app.image_processor.process_image_data(
+                payload, header.get("format", ".jpg")
+            )
+        return result, encoded
+
+    def _shutdown(self, header: Dict[str, Any], payload: bytes) -> Tuple[Dict, bytes]:
+        """サーバーを停止（応答を返した後に停止する）"""
+        threading.Thread(target=self.shutdown, daemon=True).start()
+        return {"stopping": True}, b""
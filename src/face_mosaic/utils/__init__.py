@@ -3,15 +3,24 @@
 共通的な機能を提供
 """
 
-from .system_info import get_system_info, check_requirements, print_system_info
-from .file_utils import (
-    download_file,
-    get_image_files,
-    validate_image_format,
-    ensure_directory,
-    get_file_size_mb,
-    create_backup_path,
-)
+from .._lazy import lazy_exports
+
+# cv2/numpy に依存するモジュールは参照時に読み込む（PEP 562）
+_LAZY_ATTRIBUTES = {
+    "get_system_info": ".system_info",
+    "check_requirements": ".system_info",
+    "print_system_info": ".system_info",
+    "download_file": ".file_utils",
+    "get_image_files": ".file_utils",
+    "validate_image_format": ".file_utils",
+    "ensure_directory": ".file_utils",
+    "get_file_size_mb": ".file_utils",
+    "create_backup_path": ".file_utils",
+    "scale_boxes": ".box_utils",
+}
+
+__getattr__, __dir__ = lazy_exports(_LAZY_ATTRIBUTES, globals())
+
 
 __all__ = [
     "get_system_info",
@@ -23,4 +32,5 @@ __all__ = [
     "ensure_directory",
     "get_file_size_mb",
     "create_backup_path",
+    "scale_boxes",
 ]
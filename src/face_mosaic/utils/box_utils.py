@@ -0,0 +1,193 @@
+"""
+矩形座標ユーティリティ
+"""
+
+import math
+from typing import List, Tuple
+
+import numpy as np
+
+
+def scale_boxes(
+    boxes: List[Tuple[int, int, int, int]],
+    factor: float,
+    image_size: Tuple[int, int],
+) -> List[Tuple[int, int, int, int]]:
+    """
+    矩形座標を拡大縮小し、画像範囲にクリップ
+
+    端数は矩形が広がる方向に丸めるため、縮小画像での検出結果を
+    元解像度に戻してもモザイク範囲が欠けない
+
+    Args:
+        boxes: 矩形座標リスト [(x, y, w, h), ...]
+        factor: 倍率
+        image_size: クリップ先の画像サイズ (width, height)
+
+    Returns:
+        変換後の矩形座標リスト [(x, y, w, h), ...]
+    """
+    width, height = image_size
+    scaled = []
+
+    for x, y, w, h in boxes:
+        x1 = max(0, min(math.floor(x * factor), width - 1))
+        y1 = max(0, min(math.floor(y * factor), height - 1))
+        x2 = max(x1 + 1, min(math.ceil((x + w) * factor), width))
+        y2 = max(y1 + 1, min(math.ceil((y + h) * factor), height))
+        scaled.append((x1, y1, x2 - x1, y2 - y1))
+
+    return scaled
+
+
+def generate_tiles(
+    width: int, height: int, tile_size: int, overlap: float
+) -> List[Tuple[int, int, int, int]]:
+    """
+    画像を重なりのあるタイルに分割
+
+    Args:
+        width: 画像幅
+        height: 画像高さ
+        tile_size: タイルの一辺（ピクセル）
+        overlap: 隣接タイルの重なり率 (0.0-1.0未満)
+
+    Returns:
+        タイル座標リスト [(x, y, w, h), ...]
+    """
+    stride = max(1, int(tile_size * (1.0 - overlap)))
+
+    def starts(length: int) -> List[int]:
+        if length <= tile_size:
+            return [0]
+        positions = list(range(0, length - tile_size, stride))
+        # 最後のタイルは画像端に揃える
+        positions.append(length - tile_size)
+        return positions
+
+    return [
+        (x, y, min(tile_size, width - x), min(tile_size, height - y))
+        for y in starts(height)
+        for x in starts(width)
+    ]
+
+
+def non_max_suppression(
+    boxes: np.ndarray, scores: np.ndarray, iou_threshold: float
+) -> np.ndarray:
+    """
+    Non-Maximum Suppressionで重複矩形を除去
+
+    Args:
+        boxes: 矩形座標配列 (N, 4) [x, y, w, h]
+        scores: スコア配列 (N,)
+        iou_threshold: 重複とみなすIoU閾値
+
+    Returns:
+        残す矩形のインデックス配列（スコア降順）
+    """
+    if len(boxes) == 0:
+        return np.empty(0, dtype=int)
+
+    x1 = boxes[:, 0].astype(np.float64)
+    y1 = boxes[:, 1].astype(np.float64)
+    x2 = x1 + boxes[:, 2]
+    y2 = y1 + boxes[:, 3]
+    areas = np.maximum(0.0, x2 - x1) * np.maximum(0.0, y2 - y1)
+
+    order = np.argsort(scores)[::-1]
+    keep = []
+
+    while order.size > 0:
+        i = order[0]
+        keep.append(i)
+        rest = order[1:]
+
+        inter_w = np.maximum(
+            0.0, np.minimum(x2[i], x2[rest]) - np.maximum(x1[i], x1[rest])
+        )
+        inter_h = np.maximum(
+            0.0, np.minimum(y2[i], y2[rest]) - np.maximum(y1[i], y1[rest])
+        )
+        inter = inter_w * inter_h
+        union = areas[i] + areas[rest] - inter
+        iou = np.where(union > 0, inter / np.maximum(union, 1e-9), 0.0)
+
+        order = rest[iou <= iou_threshold]
+
+    return np.array(keep, dtype=int)
+
+
+def iou_matrix(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    2組の矩形の全組み合わせのIoUを計算
+
+    Args:
+        a: 矩形座標配列 (N, 4) [x, y, w, h]
+        b: 矩形座標配列 (M, 4) [x, y, w, h]
+
+    Returns:
+        IoU行列 (N, M)
+    """
+    a = np.asarray(a, dtype=np.float64).reshape(-1, 4)
+    b = np.asarray(b, dtype=np.float64).reshape(-1, 4)
+    x1 = np.maximum(a[:, None, 0], b[None, :, 0])
+    y1 = np.maximum(a[:, None, 1], b[None, :, 1])
+    x2 = np.minimum(a[:, None, 0] + a[:, None, 2], b[None, :, 0] + b[None, :, 2])
+    y2 = np.minimum(a[:, None, 1] + a[:, None, 3], b[None, :, 1] + b[None, :, 3])
+    inter = np.maximum(0.0, x2 - x1) * np.maximum(0.0, y2 - y1)
+    union = (a[:, None, 2] * a[:, None, 3]) + (b[None, :, 2] * b[None, :, 3]) - inter
+    return np.where(union > 0, inter / np.maximum(union, 1e-9), 0.0)
+
+
+def assign_by_iou(iou: np.ndarray, iou_threshold: float) -> List[Tuple[int, int]]:
+    """
+    IoU行列から矩形を1対1に対応付ける
+
+    IoUの大きい組から順に貪欲に対応付ける
+
+    Args:
+        iou: IoU行列 (N, M)
+        iou_threshold: 対応付けるIoUの下限
+
+    Returns:
+        対応付けた (行, 列) のリスト
+    """
+    pairs = []
+    if iou.size == 0:
+        return pairs
+    used_rows = np.zeros(iou.shape[0], dtype=bool)
+    used_cols = np.zeros(iou.shape[1], dtype=bool)
+    for flat in np.argsort(iou, axis=None)[::-1]:
+        i, j = divmod(int(flat), iou.shape[1])
+        if iou[i, j] < iou_threshold:
+            break
+        if used_rows[i] or used_cols[j]:
+            continue
+        used_rows[i] = used_cols[j] = True
+        pairs.append((i, j))
+    return pairs
+
+
+def match_boxes(
+    reference: List[Tuple[int, int, int, int]],
+    candidates: List[Tuple[int, int, int, int]],
+    iou_threshold: float = 0.5,
+) -> int:
+    """
+    2つの検出結果の矩形を1対1に対応付け、一致した数を数える
+
+    IoUの大きい組から順に貪欲に対応付ける
+
+    Args:
+        reference: 基準の矩形リスト [(x, y, w, h), ...]
+        candidates: 比較対象の矩形リスト [(x, y, w, h), ...]
+        iou_threshold: 一致とみなすIoU閾値
+
+    Returns:
+        一致した矩形の数
+    """
+    if not reference or not candidates:
+        return 0
+
+    return len(assign_by_iou(iou_matrix(reference, candidates), iou_threshold))
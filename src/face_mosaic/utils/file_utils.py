@@ -112,6 +112,20 @@ def validate_image_format(filepath: Path, supported_formats: Tuple[str, ...]) ->
     return True
 
 
+def is_video_file(filepath: Path, video_formats: Tuple[str, ...]) -> bool:
+    """
+    動画ファイルかどうかを拡張子で判定
+
+    Args:
+        filepath: ファイルパス
+        video_formats: 動画として扱う拡張子
+
+    Returns:
+        動画ファイルの場合はTrue
+    """
+    return filepath.suffix.lower() in video_formats
+
+
 def ensure_directory(directory: Path) -> None:
     """
     ディレクトリの存在を確認し、必要に応じて作成
@@ -0,0 +1,91 @@
+"""
+ハッシュ計算ユーティリティ
+"""
+
+import hashlib
+import json
+from dataclasses import asdict
+from pathlib import Path
+
+
+def settings_fingerprint(config) -> str:
+    """
+    出力結果に影響する設定のフィンガープリントを計算
+
+    スレッド数・バッチサイズなど実行方式だけの設定は含めないため、
+    これらを変えても再開・差分処理や常駐サーバーへの転送で同じ設定とみなされる
+
+    Args:
+        config: アプリケーション設定（AppConfig）
+
+    Returns:
+        設定フィンガープリント（16進文字列）
+    """
+    detection = config.detection
+    # 未設定の場合は max_image_size（タイル検出時は縮小なし）が検出用プロキシの最大辺になる
+    max_side = detection.detection_max_side
+    if max_side is None:
+        max_side = 0 if detection.tiling else config.processing.max_image_size
+    settings = {
+        "detection": {
+            "method": detection.method,
+            "confidence_threshold": detection.confidence_threshold,
+            "nms_threshold": detection.nms_threshold,
+            "top_k": detection.top_k,
+            "input_size": list(detection.input_size),
+            "detection_max_side": max_side,
+        },
+        "mosaic": asdict(config.mosaic),
+        "quality": config.processing.quality,
+        "preserve_metadata": config.processing.preserve_metadata,
+        "model": config.model.model_filename,
+    }
+    if detection.tiling:
+        settings["tiling"] = {
+            "tile_size": detection.tile_size,
+            "tile_overlap": detection.tile_overlap,
+            "tile_scales": list(detection.tile_scales),
+            "tile_global_pass": detection.tile_global_pass,
+        }
+    if config.model.model_variant != "fp32":
+        settings["model_variant"] = config.model.model_variant
+
+    objects = config.object_detection
+    if objects.enabled:
+        settings["object_detection"] = {
+            "detector_type": objects.detector_type,
+            "model_path": objects.model_path,
+            "labels": sorted(objects.labels),
+            "precision": objects.precision,
+        }
+        if objects.detector_type == "onnx":
+            settings["object_detection"]["onnx_source"] = objects.onnx_source
+        if objects.precision != "fp32":
+            settings["object_detection"]["calibration_dir"] = objects.calibration_dir
+        if objects.gate:
+            # 事前判定で本検出を省略した画像は結果が変わりうる
+            settings["object_detection"]["gate"] = [
+                objects.gate_max_side,
+                objects.gate_score_threshold,
+            ]
+
+    payload = json.dumps(settings, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def file_content_hash(filepath: Path, chunk_size: int = 1024 * 1024) -> str:
+    """
+    ファイル内容のハッシュを計算
+
+    Args:
+        filepath: ファイルパス
+        chunk_size: 読み込みチャンクサイズ
+
+    Returns:
+        内容ハッシュ（16進文字列）
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
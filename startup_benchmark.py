@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+起動時間ベンチマーク
+パッケージのimport時間（python -X importtime）、CLIの各モードの応答時間、
+1枚目の画像を処理し終えるまでの時間を計測する
+
+使用例:
+  python3 startup_benchmark.py
+  python3 startup_benchmark.py --runs 5 --json startup.json
+  python3 startup_benchmark.py --cli-args "--object-detect --object-labels person"
+"""
+
+import argparse
+import json
+import shlex
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+SRC = ROOT / "src"
+CLI = ROOT / "cli.py"
+
+
+def _importtime(code: str) -> dict:
+    """
+    python -X importtime でコードを実行し、モジュールごとの累積import時間を取得
+
+    Returns:
+        {モジュール名: 累積時間 (ms)}
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=SRC,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = {}
+    for line in proc.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        modules[name.strip()] = int(cumulative) / 1000.0
+    return modules
+
+
+def measure_import(runs: int) -> dict:
+    """
+    python -X importtime で `import face_mosaic` の時間を計測
+
+    Returns:
+        {"median_ms": float, "runs_ms": [...], "slowest": [(モジュール, ms), ...]}
+    """
+    # インタープリタ起動時に読み込まれるモジュール（site など）は除外する
+    startup = set(_importtime("pass"))
+
+    totals = []
+    modules = {}
+    for _ in range(runs):
+        modules = _importtime("import face_mosaic")
+        totals.append(modules.get("face_mosaic", 0.0))
+
+    slowest = sorted(
+        ((name, ms) for name, ms in modules.items() if name not in startup),
+        key=lambda item: item[1],
+        reverse=True,
+    )[:10]
+    return {
+        "median_ms": round(statistics.median(totals), 1),
+        "runs_ms": [round(t, 1) for t in totals],
+        "slowest": [(name, round(ms, 1)) for name, ms in slowest],
+    }
+
+
+def measure_command(args: list, runs: int) -> dict:
+    """
+    CLIを実行して終了までの時間を計測
+
+    Returns:
+        {"median_s": float, "runs_s": [...], "returncode": int}
+    """
+    times = []
+    returncode = 0
+    for _ in range(runs):
+        start = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, str(CLI), *args],
+            cwd=ROOT,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        times.append(time.perf_counter() - start)
+        returncode = proc.returncode
+    return {
+        "median_s": round(statistics.median(times), 3),
+        "runs_s": [round(t, 3) for t in times],
+        "returncode": returncode,
+    }
+
+
+def main():
+    """ベンチマークを実行して結果を表示"""
+    parser = argparse.ArgumentParser(description="起動時間ベンチマーク")
+    parser.add_argument("--runs", type=int, default=3, help="計測回数 (デフォルト: 3)")
+    parser.add_argument(
+        "--input",
+        type=Path,
+        default=ROOT / "sample_inputs",
+        help="ドライラン・初回処理に使う画像ディレクトリ (デフォルト: sample_inputs)",
+    )
+    parser.add_argument(
+        "--cli-args",
+        type=str,
+        default="",
+        help="初回処理の計測でCLIに追加で渡す引数",
+    )
+    parser.add_argument("--json", type=Path, help="結果をJSONで保存するパス")
+    args = parser.parse_args()
+
+    images = sorted(
+        p for p in args.input.iterdir() if p.suffix.lower() in (".jpg", ".png")
+    )
+    if not images:
+        print(f"エラー: 画像が見つかりません: {args.input}")
+        sys.exit(1)
+
+    results = {"import": measure_import(args.runs), "cli": {}}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output_dir = Path(tmp) / "out"
+        commands = {
+            "--version": ["--version"],
+            "--info": ["--info"],
+            "--dry-run": ["-i", str(args.input), "-o", str(output_dir), "--dry-run"],
+            # 1枚目の画像の処理完了まで（モデル読み込みを含む）
+            "first_image": [
+                "-i",
+                str(images[0]),
+                "-o",
+                str(Path(tmp) / f"first{images[0].suffix}"),
+                "--no-confirm",
+                *shlex.split(args.cli_args),
+            ],
+        }
+        for name, command in commands.items():
+            results["cli"][name] = measure_command(command, args.runs)
+
+    print("=== import face_mosaic ===")
+    print(f"中央値: {results['import']['median_ms']:.1f} ms")
+    for name, ms in results["import"]["slowest"]:
+        print(f"  {ms:8.1f} ms  {name}")
+
+    print("\n=== CLI ===")
+    for name, timing in results["cli"].items():
+        status = (
+            "" if timing["returncode"] == 0 else f" (終了コード {timing['returncode']})"
+        )
+        print(f"{name:>12}: {timing['median_s']:.3f} 秒{status}")
+
+    if args.json:
+        args.json.write_text(
+            json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+        print(f"\n結果を保存しました: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
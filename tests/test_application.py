@@ -129,6 +129,36 @@ class TestFaceMosaicApplication:
             assert stats["success"] == 0  # ドライランなので実際の処理はなし
             assert stats["failed"] == 0
     
+    def test_directory_processing_parallel(self, app, test_image):
+        """ディレクトリ処理（並列ワーカー）テスト"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            input_dir = temp_path / "input"
+            output_dir = temp_path / "output"
+            input_dir.mkdir()
+            
+            # テスト画像を複数作成
+            for i in range(4):
+                cv2.imwrite(str(input_dir / f"test_{i}.jpg"), test_image)
+            
+            # 2ワーカーで処理実行
+            app.update_workers(2)
+            progress = []
+            stats = app.process_directory(
+                input_dir, output_dir, lambda current, total: progress.append(current)
+            )
+            
+            # 結果検証
+            assert stats["total"] == 4
+            assert stats["success"] == 4
+            assert len(stats["files"]) == 4
+            assert progress == [1, 2, 3, 4]
+            assert all((output_dir / f"test_{i}.jpg").exists() for i in range(4))
+            
+            # 異常な値
+            with pytest.raises(ValueError):
+                app.update_workers(0)
+    
     def test_file_list_retrieval(self, app, test_image):
         """ファイル一覧取得テスト"""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -0,0 +1,66 @@
+"""
+検出枠追跡のテスト
+"""
+
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import numpy as np
+
+from face_mosaic.core.box_tracker import (
+    expand_boxes,
+    is_scene_cut,
+    make_tracking_image,
+    track_boxes,
+)
+
+
+def _textured_frame(offset=(0, 0)):
+    """模様のある正方形を offset だけ動かしたフレームを作成"""
+    rng = np.random.default_rng(0)
+    patch = rng.integers(0, 256, (40, 40, 3), dtype=np.uint8)
+    frame = np.full((120, 160, 3), 128, np.uint8)
+    x, y = 50 + offset[0], 30 + offset[1]
+    frame[y:y + 40, x:x + 40] = patch
+    return frame
+
+
+class TestBoxTracker:
+    """検出枠追跡のテストクラス"""
+    
+    def test_track_boxes_follows_motion(self):
+        """枠が対象の移動に追従することをテスト"""
+        previous, scale = make_tracking_image(_textured_frame(), 0)
+        current, _ = make_tracking_image(_textured_frame((6, 4)), 0)
+        
+        (x, y, w, h), = track_boxes(previous, current, [(50, 30, 40, 40)], scale)
+        
+        assert abs(x - 56) <= 1 and abs(y - 34) <= 1
+        assert abs(w - 40) <= 2 and abs(h - 40) <= 2
+    
+    def test_track_boxes_on_downscaled_image(self):
+        """縮小した追跡用画像でも元解像度の座標を返すことをテスト"""
+        previous, scale = make_tracking_image(_textured_frame(), 80)
+        current, _ = make_tracking_image(_textured_frame((8, 0)), 80)
+        assert scale == 0.5
+        
+        (x, y, w, h), = track_boxes(previous, current, [(50, 30, 40, 40)], scale)
+        
+        assert abs(x - 58) <= 2 and abs(y - 30) <= 2
+    
+    def test_is_scene_cut(self):
+        """大きく変化したフレームだけを切り替わりと判定することをテスト"""
+        first, _ = make_tracking_image(_textured_frame(), 0)
+        moved, _ = make_tracking_image(_textured_frame((2, 0)), 0)
+        other, _ = make_tracking_image(np.zeros((120, 160, 3), np.uint8), 0)
+        
+        assert not is_scene_cut(first, moved, 30.0)
+        assert is_scene_cut(first, other, 30.0)
+    
+    def test_expand_boxes_clips_to_frame(self):
+        """広げた枠が画像の範囲内に収まることをテスト"""
+        boxes = expand_boxes([(10, 10, 20, 20), (0, 0, 10, 10)], 0.5, (35, 100))
+        
+        assert boxes == [(0, 0, 35, 40), (0, 0, 15, 15)]
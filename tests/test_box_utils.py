@@ -0,0 +1,95 @@
+"""
+矩形座標ユーティリティのテスト
+"""
+
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import numpy as np
+
+from face_mosaic.utils.box_utils import (
+    generate_tiles,
+    match_boxes,
+    non_max_suppression,
+    scale_boxes,
+)
+
+
+class TestScaleBoxes:
+    """scale_boxesのテストクラス"""
+    
+    def test_upscale_covers_original_region(self):
+        """拡大時に端数が外側へ丸められることを確認"""
+        boxes = scale_boxes([(10, 10, 5, 5)], 2.5, (1000, 1000))
+        assert boxes == [(25, 25, 13, 13)]
+    
+    def test_clip_to_image(self):
+        """画像範囲へのクリップ"""
+        boxes = scale_boxes([(90, 40, 20, 20)], 2.0, (200, 100))
+        x, y, w, h = boxes[0]
+        assert x + w <= 200
+        assert y + h <= 100
+        assert w >= 1 and h >= 1
+    
+    def test_identity(self):
+        """倍率1.0では変化しない"""
+        assert scale_boxes([(1, 2, 3, 4)], 1.0, (100, 100)) == [(1, 2, 3, 4)]
+
+
+class TestGenerateTiles:
+    """generate_tilesのテストクラス"""
+    
+    def test_small_image_single_tile(self):
+        """タイルより小さい画像は1タイル"""
+        assert generate_tiles(300, 200, 640, 0.25) == [(0, 0, 300, 200)]
+    
+    def test_tiles_cover_image_with_overlap(self):
+        """タイルが画像全体を重なり付きで覆うことを確認"""
+        tiles = generate_tiles(1500, 700, 640, 0.25)
+        covered = np.zeros((700, 1500), dtype=bool)
+        for x, y, w, h in tiles:
+            assert w <= 640 and h <= 640
+            covered[y : y + h, x : x + w] = True
+        assert covered.all()
+        # 最後のタイルは画像端に揃う
+        assert max(x + w for x, _, w, _ in tiles) == 1500
+        assert max(y + h for _, y, _, h in tiles) == 700
+
+
+class TestNonMaxSuppression:
+    """non_max_suppressionのテストクラス"""
+    
+    def test_suppress_overlapping(self):
+        """重複矩形は高スコアのみ残る"""
+        boxes = np.array([[0, 0, 10, 10], [1, 1, 10, 10], [50, 50, 10, 10]])
+        scores = np.array([0.6, 0.9, 0.7])
+        keep = non_max_suppression(boxes, scores, 0.3)
+        assert list(keep) == [1, 2]
+    
+    def test_empty(self):
+        """空入力"""
+        keep = non_max_suppression(np.empty((0, 4)), np.empty(0), 0.3)
+        assert len(keep) == 0
+
+
+class TestMatchBoxes:
+    """match_boxesのテストクラス"""
+    
+    def test_one_to_one(self):
+        """1つの基準矩形には1つの比較矩形だけが対応する"""
+        reference = [(0, 0, 10, 10)]
+        candidates = [(0, 0, 10, 10), (1, 1, 10, 10)]
+        assert match_boxes(reference, candidates) == 1
+    
+    def test_threshold(self):
+        """IoUが閾値未満の組は一致としない"""
+        reference = [(0, 0, 10, 10), (50, 50, 10, 10)]
+        candidates = [(5, 0, 10, 10), (50, 50, 10, 10)]
+        assert match_boxes(reference, candidates, 0.5) == 1
+        assert match_boxes(reference, candidates, 0.3) == 2
+    
+    def test_empty(self):
+        """空の場合"""
+        assert match_boxes([], [(0, 0, 1, 1)]) == 0
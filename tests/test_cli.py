@@ -0,0 +1,95 @@
+"""
+CLIの引数検証のテスト
+"""
+
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import pytest
+
+from face_mosaic.cli.main import CLIApplication
+
+
+class TestValidateArguments:
+    """validate_argumentsのテストクラス"""
+    
+    def validate(self, argv):
+        cli = CLIApplication()
+        return cli.validate_arguments(cli.create_parser().parse_args(argv))
+    
+    @pytest.mark.parametrize(
+        "mode",
+        [["--jsonl"], ["--serve"], ["--serve-http"], ["--live", "0"], ["--stop-server"]],
+    )
+    def test_dry_run_rejected_without_input(self, mode):
+        """入力パスを持たないモードでは --dry-run を拒否することをテスト"""
+        assert self.validate(mode)
+        assert not self.validate([*mode, "--dry-run"])
+    
+    @pytest.mark.parametrize(
+        "mode", [["--jsonl"], ["--serve"], ["--serve-http"], ["--live", "0"]]
+    )
+    def test_settings_checked_for_every_mode(self, mode):
+        """入出力不要のモードでも設定値の範囲を検証することをテスト"""
+        assert not self.validate([*mode, "--ratio", "5"])
+        assert not self.validate([*mode, "--confidence", "0"])
+        assert not self.validate([*mode, "--threads", "0"])
+
+    
+    def test_pipeline_with_workers_rejected(self, tmp_path):
+        """--pipeline と複数ワーカーの同時指定を拒否することをテスト"""
+        base = ["-i", str(tmp_path), "-o", str(tmp_path / "out"), "--pipeline"]
+        
+        assert self.validate(base)
+        assert not self.validate([*base, "--workers", "2"])
+
+
+class TestForwardToServer:
+    """常駐サーバーへの転送のテストクラス"""
+    
+    @pytest.mark.parametrize(
+        "option", [["--incremental"], ["--workers", "2"], ["--pipeline"]]
+    )
+    def test_local_only_options_not_forwarded(self, option, tmp_path, capsys):
+        """サーバーで扱えないオプション指定時は転送せずに警告することをテスト"""
+        cli = CLIApplication()
+        args = cli.create_parser().parse_args(
+            ["-i", str(tmp_path), "-o", str(tmp_path / "out"), "--server", *option]
+        )
+        
+        assert cli.forward_to_server(args) is False
+        assert option[0] in capsys.readouterr().out
+    
+    def test_video_not_forwarded(self, tmp_path, capsys):
+        """動画入力は転送せずにローカルで処理することをテスト"""
+        video = tmp_path / "clip.mp4"
+        video.write_bytes(b"")
+        cli = CLIApplication()
+        args = cli.create_parser().parse_args(
+            ["-i", str(video), "-o", str(tmp_path / "out.mp4"), "--server", "--track"]
+        )
+        
+        assert cli.forward_to_server(args) is False
+        assert "動画" in capsys.readouterr().out
+    
+    def client_fingerprint(self, cli, tmp_path, *options):
+        args = cli.create_parser().parse_args(
+            ["-i", str(tmp_path), "-o", str(tmp_path / "out"), "--server", *options]
+        )
+        return cli._create_client(args, cli.build_config(args)).fingerprint
+    
+    def test_execution_options_match_server(self, tmp_path):
+        """実行方式だけ異なるクライアントはサーバーと同じ設定とみなすことをテスト"""
+        cli = CLIApplication()
+        server = self.client_fingerprint(cli, tmp_path)
+        
+        assert server == self.client_fingerprint(
+            cli,
+            tmp_path,
+            "--threads", "4",
+            "--tile-threads", "2",
+            "--object-batch-size", "8",
+        )
+        assert server != self.client_fingerprint(cli, tmp_path, "--confidence", "0.9")
@@ -0,0 +1,98 @@
+"""
+検出結果キャッシュのテスト
+"""
+
+import tempfile
+import time
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from face_mosaic.core.detection_cache import DetectionCache
+
+
+class TestDetectionCache:
+    """DetectionCacheのテストクラス"""
+    
+    def test_put_and_get(self):
+        """登録した検出結果を取得できる"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = DetectionCache(Path(temp_dir) / "cache.sqlite3")
+            cache.put("key", [(1, 2, 3, 4)], [(5, 6, 7, 8)])
+            
+            assert cache.get("key") == ([(1, 2, 3, 4)], [(5, 6, 7, 8)])
+            assert cache.get("missing") is None
+            assert cache.get_stats()["hits"] == 1
+            assert cache.get_stats()["misses"] == 1
+            cache.close()
+    
+    def test_lru_eviction(self):
+        """上限を超えると最終参照が古いエントリから削除される"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = DetectionCache(Path(temp_dir) / "cache.sqlite3", max_entries=2)
+            cache.put("a", [], [])
+            time.sleep(0.05)
+            cache.put("b", [], [])
+            time.sleep(0.05)
+            cache.get("a")
+            time.sleep(0.05)
+            cache.put("c", [], [])
+            cache.close()
+            
+            cache = DetectionCache(Path(temp_dir) / "cache.sqlite3", max_entries=2)
+            assert cache.get("b") is None
+            assert cache.get("a") is not None
+            assert cache.get("c") is not None
+            cache.close()
+    
+    def test_access_time_flushed_in_batches(self):
+        """参照時刻はヒットごとではなくまとめて書き込まれ、終了時にも反映される"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "cache.sqlite3"
+            cache = DetectionCache(path)
+            cache.put("key", [], [])
+            stored = cache.connection.execute(
+                "SELECT last_access FROM detections"
+            ).fetchone()[0]
+            time.sleep(0.05)
+            
+            cache.get("key")
+            assert cache.connection.total_changes == 1
+            
+            cache.close()
+            with DetectionCache(path) as cache:
+                accessed = cache.connection.execute(
+                    "SELECT last_access FROM detections"
+                ).fetchone()[0]
+            assert accessed > stored
+    
+    def test_close_is_idempotent(self):
+        """2回閉じてもエラーにならず、書き込みが残っている"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "cache.sqlite3"
+            with DetectionCache(path) as cache:
+                cache.put("key", [(1, 2, 3, 4)], [])
+            cache.close()
+            
+            with DetectionCache(path) as cache:
+                assert cache.get("key") == ([(1, 2, 3, 4)], [])
+    
+    def test_application_close(self):
+        """アプリケーションの終了処理でキャッシュが閉じられる"""
+        from face_mosaic.config.settings import AppConfig
+        from face_mosaic.core.application import FaceMosaicApplication
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = AppConfig()
+            config.processing.detection_cache_path = Path(temp_dir) / "cache.sqlite3"
+            app = FaceMosaicApplication(config)
+            cache = app.detection_cache
+            cache.put("key", [], [])
+            
+            app.close()
+            app.close()
+            
+            assert app.detection_cache is None
+            assert app.image_processor.detection_cache is None
+            assert cache._closed
@@ -0,0 +1,54 @@
+"""
+検出結果サイドカーのテスト
+"""
+
+import tempfile
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import pytest
+
+from face_mosaic.core.detection_sidecar import (
+    DetectionSidecarWriter,
+    load_detection_sidecar,
+)
+from face_mosaic.core.exceptions import ValidationError
+
+
+class TestDetectionSidecar:
+    """検出結果サイドカーのテストクラス"""
+    
+    @pytest.mark.parametrize("name", ["detections.jsonl", "detections.jsonl.gz"])
+    def test_round_trip(self, name):
+        """書き込んだ検出結果を読み込めることをテスト"""
+        face = {
+            "box": (10, 20, 30, 40),
+            "confidence": 0.95,
+            "landmarks": [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0], [7.0, 8.0], [9.0, 10.0]],
+        }
+        obj = {"box": (1, 2, 3, 4), "label": "car", "score": 0.5}
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            sidecar_path = Path(temp_dir) / name
+            with DetectionSidecarWriter(sidecar_path, {"detection": "abc"}) as writer:
+                writer.write("sub/a.jpg", (640, 480), [face], [obj])
+                writer.write("b.jpg", (100, 100), [], [])
+            
+            records = load_detection_sidecar(sidecar_path)
+        
+        assert list(records) == ["sub/a.jpg", "b.jpg"]
+        assert records["sub/a.jpg"]["size"] == (640, 480)
+        assert records["sub/a.jpg"]["faces"] == [face]
+        assert records["sub/a.jpg"]["objects"] == [obj]
+        assert records["b.jpg"]["faces"] == []
+    
+    def test_invalid_format(self):
+        """形式の異なるファイルでエラーになることをテスト"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            sidecar_path = Path(temp_dir) / "other.jsonl"
+            sidecar_path.write_text('{"format": "other"}\n', encoding="utf-8")
+            
+            with pytest.raises(ValidationError):
+                load_detection_sidecar(sidecar_path)
@@ -0,0 +1,80 @@
+"""
+検出器プールのテスト
+"""
+
+import threading
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import pytest
+
+from face_mosaic.core.detector_pool import DetectorPool
+from face_mosaic.core.exceptions import DetectionError
+
+
+class TestDetectorPool:
+    """DetectorPoolのテストクラス"""
+    
+    def test_reuses_returned_detector(self):
+        """返却された検出器が再利用されることをテスト"""
+        pool = DetectorPool(object, 2)
+        
+        with pool.acquire() as first:
+            pass
+        with pool.acquire() as second:
+            pass
+        
+        assert first is second
+        assert pool.get_stats() == {"size": 2, "created": 1, "available": 1}
+    
+    def test_initial_detectors(self):
+        """生成済みの検出器が先に使われることをテスト"""
+        existing = object()
+        pool = DetectorPool(object, 2, initial=[existing])
+        
+        assert pool.checkout() is existing
+        assert pool.checkout() is not existing
+    
+    def test_size_limit(self):
+        """上限数を超えて生成しないことをテスト"""
+        pool = DetectorPool(object, 1)
+        detector = pool.checkout()
+        
+        with pytest.raises(DetectionError):
+            pool.checkout(timeout=0.01)
+        
+        pool.checkin(detector)
+        assert pool.checkout(timeout=0.01) is detector
+    
+    def test_concurrent_checkout(self):
+        """同時に借り出した検出器が重複しないことをテスト"""
+        pool = DetectorPool(object, 4)
+        barrier = threading.Barrier(4)
+        used = []
+        
+        def worker():
+            with pool.acquire() as detector:
+                used.append(detector)
+                barrier.wait(timeout=5)
+        
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len(set(map(id, used))) == 4
+        assert pool.get_stats()["created"] == 4
+    
+    def test_drain_returns_idle_detectors(self):
+        """貸し出し中でない検出器だけが取り出されることをテスト"""
+        pool = DetectorPool(object, 3)
+        borrowed = pool.checkout()
+        idle = pool.checkout()
+        pool.checkin(idle)
+        
+        assert pool.drain() == [idle]
+        assert pool.drain() == []
+        assert borrowed is not idle
@@ -0,0 +1,140 @@
+"""
+顔検出クラスのテスト
+"""
+
+import threading
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import numpy as np
+
+from face_mosaic.config.settings import DetectionConfig
+from face_mosaic.core.face_detector import FaceDetector
+
+
+class _FakeYuNet:
+    """入力サイズだけを記録し、顔を検出しない検出器"""
+    
+    def __init__(self, sizes=None):
+        self.sizes = sizes if sizes is not None else []
+    
+    def setInputSize(self, size):
+        self.sizes.append(size)
+    
+    def detect(self, image):
+        return 1, None
+
+
+class TestFaceDetectorTiling:
+    """タイル検出のテストクラス"""
+    
+    def create_detector(self, tile_threads, **options):
+        """生成回数を数える検出器を組み込んだFaceDetectorを作成"""
+        config = DetectionConfig(
+            tiling=True, tile_size=64, tile_overlap=0.0, tile_scales=(1.0,),
+            tile_threads=tile_threads, **options,
+        )
+        detector = FaceDetector(config, model_manager=None)
+        detector.created = 0
+        detector.sizes = []
+        lock = threading.Lock()
+        
+        def create():
+            with lock:
+                detector.created += 1
+            return _FakeYuNet(detector.sizes)
+        
+        detector._create_detector = create
+        return detector
+    
+    def test_tile_detectors_reused_across_images(self):
+        """タイル検出のスレッドと検出器が画像をまたいで使い回されることをテスト"""
+        detector = self.create_detector(tile_threads=3)
+        image = np.zeros((256, 256, 3), dtype=np.uint8)
+        
+        for _ in range(5):
+            assert detector.detect_faces(image) == []
+        executor = detector._tile_executor
+        assert detector.detect_faces(image) == []
+        
+        assert detector._tile_executor is executor
+        # 全体検出用の1つとタイル用のスレッド数分だけ生成される
+        assert detector.created <= 1 + 3
+        
+        detector.close()
+        assert detector._tile_executor is None
+    
+    def test_single_thread_uses_main_detector(self):
+        """並列数1ではタイル用の検出器を生成しないことをテスト"""
+        detector = self.create_detector(tile_threads=1)
+        image = np.zeros((128, 128, 3), dtype=np.uint8)
+        
+        detector.detect_faces(image)
+        detector.detect_faces(image)
+        
+        assert detector.created == 1
+        assert detector._tile_executor is None
+    
+    def test_global_pass_covers_whole_image(self):
+        """画像全体を縮小した検出がタイルと別に1回行われることをテスト"""
+        detector = self.create_detector(tile_threads=1)
+        image = np.zeros((128, 256, 3), dtype=np.uint8)
+        
+        detector.detect_faces(image)
+        
+        # 64pxタイル 4×2 枚と、画像全体を最大辺64pxに縮小した1回
+        assert len(detector.sizes) == 9
+        assert (64, 32) in detector.sizes
+    
+    def test_global_pass_disabled(self):
+        """tile_global_pass を無効にするとタイルのみで検出することをテスト"""
+        detector = self.create_detector(tile_threads=1, tile_global_pass=False)
+        image = np.zeros((128, 256, 3), dtype=np.uint8)
+        
+        detector.detect_faces(image)
+        
+        assert len(detector.sizes) == 8
+
+
+class TestTilingProxy:
+    """タイル検出時の検出用プロキシのテストクラス"""
+    
+    def test_tiling_skips_default_proxy(self):
+        """タイル検出時は既定の最大辺で縮小しないことをテスト"""
+        from face_mosaic.config.settings import MosaicConfig, ProcessingConfig
+        from face_mosaic.core.image_processor import ImageProcessor
+        
+        config = DetectionConfig(tiling=True)
+        processor = ImageProcessor(
+            FaceDetector(config, model_manager=None), MosaicConfig(), ProcessingConfig()
+        )
+        image = np.zeros((10, 5000, 3), dtype=np.uint8)
+        
+        assert processor.create_detection_proxy(image)[1] == 1.0
+        
+        config.detection_max_side = 1000
+        assert processor.create_detection_proxy(image)[1] == 0.2
+
+
+class TestApplicationFaceDetectors:
+    """アプリケーションが保持する顔検出器のテストクラス"""
+    
+    def test_threshold_change_closes_old_detector(self):
+        """信頼度閾値の変更で古い検出器のタイル検出用スレッドが終了することをテスト"""
+        from face_mosaic.config.settings import AppConfig
+        from face_mosaic.core.application import FaceMosaicApplication
+        
+        config = AppConfig()
+        config.detection.tiling = True
+        config.detection.tile_threads = 2
+        app = FaceMosaicApplication(config)
+        old = app.face_detector
+        old._get_tile_workers(2)
+        
+        app.update_confidence_threshold(0.7)
+        
+        assert old._tile_executor is None
+        assert app.face_detector is not old
+        app.close()
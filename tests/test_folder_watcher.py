@@ -0,0 +1,141 @@
+"""
+フォルダ監視のテスト
+"""
+
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import pytest
+
+from face_mosaic.config.settings import WatchConfig
+from face_mosaic.core.folder_watcher import (
+    FileSettler,
+    FolderWatchProcessor,
+    InotifyWatcher,
+    PollingWatcher,
+)
+
+
+class _StubProcessor:
+    """入力をそのまま出力へコピーする画像処理のスタブ"""
+    
+    def detect_details(self, image):
+        return [], []
+    
+    def process_image_file(self, input_path, output_path):
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_bytes(input_path.read_bytes())
+        return {"success": True, "faces_detected": 1}
+
+
+class TestFileSettler:
+    """FileSettlerのテストクラス"""
+    
+    def test_waits_until_stable(self):
+        """サイズが変化しなくなるまで返さないことをテスト"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "a.jpg"
+            path.write_bytes(b"x")
+            settler = FileSettler(1.0)
+            settler.touch(path, now=0.0)
+            
+            assert settler.ready(10, now=0.5) == []
+            path.write_bytes(b"xyz")
+            # 変化していたので待ち直す
+            assert settler.ready(10, now=1.0) == []
+            assert settler.ready(10, now=1.5) == []
+            assert settler.ready(10, now=2.0) == [path]
+            assert len(settler) == 0
+    
+    def test_removed_file_is_dropped(self):
+        """削除されたファイルが破棄されることをテスト"""
+        settler = FileSettler(0.0)
+        settler.touch(Path("missing.jpg"), now=0.0)
+        assert settler.ready(10, now=1.0) == []
+        assert len(settler) == 0
+
+
+class TestWatchers:
+    """監視クラスのテストクラス"""
+    
+    def test_polling_reports_new_and_changed_files(self):
+        """ポーリングで追加・更新されたファイルが返ることをテスト"""
+        with tempfile.TemporaryDirectory() as tmp:
+            directory = Path(tmp)
+            (directory / "a.jpg").write_bytes(b"a")
+            watcher = PollingWatcher(directory, interval=0.0)
+            
+            assert watcher.read(0.1) == [directory / "a.jpg"]
+            assert watcher.read(0.1) == []
+            (directory / "sub").mkdir()
+            (directory / "sub" / "b.jpg").write_bytes(b"b")
+            assert watcher.read(0.1) == [directory / "sub" / "b.jpg"]
+    
+    def test_inotify_reports_closed_files(self):
+        """inotify で書き込みが完了したファイルが返ることをテスト"""
+        with tempfile.TemporaryDirectory() as tmp:
+            directory = Path(tmp)
+            try:
+                watcher = InotifyWatcher(directory)
+            except (OSError, AttributeError):
+                pytest.skip("inotify を使用できません")
+            try:
+                (directory / "sub").mkdir()
+                assert watcher.read(1.0) == []
+                (directory / "sub" / "a.jpg").write_bytes(b"a")
+                assert watcher.read(1.0) == [directory / "sub" / "a.jpg"]
+            finally:
+                watcher.close()
+
+
+class TestFolderWatchProcessor:
+    """FolderWatchProcessorのテストクラス"""
+    
+    def test_processes_and_archives(self):
+        """書き込まれたファイルが処理・アーカイブされることをテスト"""
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            spool = root / "spool"
+            (spool / "sub").mkdir(parents=True)
+            (spool / "existing.jpg").write_bytes(b"0")
+            config = WatchConfig(
+                settle_time=0.05,
+                poll_interval=0.05,
+                use_inotify=False,
+                archive_dir=root / "archive",
+            )
+            processor = FolderWatchProcessor(
+                _StubProcessor(), config, (".jpg",), threads=2
+            )
+            stop_event = threading.Event()
+            results = []
+            
+            def on_result(path, result, error):
+                results.append(path)
+                if len(results) == 3:
+                    stop_event.set()
+            
+            def produce():
+                time.sleep(0.2)
+                (spool / "sub" / "new.jpg").write_bytes(b"1")
+                (spool / "ignored.txt").write_bytes(b"2")
+                (spool / "late.jpg").write_bytes(b"3")
+            
+            threading.Thread(target=produce, daemon=True).start()
+            timeout = threading.Timer(10, stop_event.set)
+            timeout.start()
+            stats = processor.run(spool, root / "out", stop_event, on_result)
+            timeout.cancel()
+            
+            assert stats["processed"] == 3
+            assert stats["archived"] == 3
+            assert (root / "out" / "sub" / "new.jpg").read_bytes() == b"1"
+            assert (root / "archive" / "existing.jpg").exists()
+            assert sorted(p.name for p in spool.rglob("*") if p.is_file()) == [
+                "ignored.txt"
+            ]
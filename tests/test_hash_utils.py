@@ -0,0 +1,78 @@
+"""
+ハッシュ計算ユーティリティのテスト
+"""
+
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from face_mosaic.config.settings import AppConfig
+from face_mosaic.utils.hash_utils import settings_fingerprint
+
+
+class TestSettingsFingerprint:
+    """settings_fingerprintのテストクラス"""
+    
+    def test_max_image_size_changes_fingerprint(self):
+        """検出用プロキシの最大辺が変わるとフィンガープリントが変わることをテスト"""
+        config = AppConfig()
+        before = settings_fingerprint(config)
+        
+        config.processing.max_image_size = 1024
+        
+        assert settings_fingerprint(config) != before
+    
+    def test_explicit_detection_max_side_takes_precedence(self):
+        """detection_max_side 指定時は max_image_size の影響を受けないことをテスト"""
+        config = AppConfig()
+        config.detection.detection_max_side = 800
+        before = settings_fingerprint(config)
+        
+        config.processing.max_image_size = 1024
+        
+        assert settings_fingerprint(config) == before
+    
+    def test_same_effective_proxy_size(self):
+        """実効的に同じ最大辺なら同じフィンガープリントになることをテスト"""
+        implicit = AppConfig()
+        explicit = AppConfig()
+        explicit.detection.detection_max_side = implicit.processing.max_image_size
+        
+        assert settings_fingerprint(implicit) == settings_fingerprint(explicit)
+    
+    def test_execution_settings_do_not_change_fingerprint(self):
+        """スレッド数・バッチサイズなど実行方式の設定では変わらないことをテスト"""
+        config = AppConfig()
+        before = settings_fingerprint(config)
+        
+        config.detection.tile_threads = 8
+        config.processing.threads = 4
+        config.processing.workers = 4
+        config.processing.pipeline = True
+        config.object_detection.batch_size = 16
+        config.object_detection.gate = True
+        
+        assert settings_fingerprint(config) == before
+    
+    def test_object_settings_only_when_enabled(self):
+        """物体検出が有効な場合だけ物体検出・事前判定の設定が反映されることをテスト"""
+        config = AppConfig()
+        config.object_detection.enabled = True
+        config.object_detection.labels = ("person",)
+        before = settings_fingerprint(config)
+        
+        config.object_detection.batch_size = 16
+        assert settings_fingerprint(config) == before
+        
+        config.object_detection.gate = True
+        assert settings_fingerprint(config) != before
+    
+    def test_output_settings_change_fingerprint(self):
+        """出力に影響する設定で変わることをテスト"""
+        config = AppConfig()
+        before = settings_fingerprint(config)
+        
+        config.detection.confidence_threshold = 0.8
+        
+        assert settings_fingerprint(config) != before
@@ -0,0 +1,148 @@
+"""
+HTTPサーバーのテスト
+"""
+
+import asyncio
+import json
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import cv2
+import numpy as np
+
+from face_mosaic.config.settings import AppConfig
+from face_mosaic.core.image_processor import ImageProcessor
+from face_mosaic.server.http_server import FaceMosaicHTTPServer, HTTPRequest
+
+
+class _StubFaceDetector:
+    """画像の中央付近に顔を1つ返す顔検出器のスタブ"""
+    
+    def __init__(self, config):
+        self.config = config
+    
+    def detect_face_details(self, image):
+        height, width = image.shape[:2]
+        return [
+            {
+                "box": (width // 4, height // 4, width // 2, height // 2),
+                "confidence": 0.9,
+                "landmarks": [],
+            }
+        ]
+
+
+class _StubApp:
+    """モデルを読み込まないアプリケーションのスタブ"""
+    
+    def __init__(self):
+        self.config = AppConfig()
+        self.config.server.batch_window_ms = 50.0
+        self.image_processor = ImageProcessor(
+            _StubFaceDetector(self.config.detection),
+            self.config.mosaic,
+            self.config.processing,
+        )
+
+
+def _encode(width=64, height=48):
+    image = np.random.default_rng(0).integers(0, 255, (height, width, 3), np.uint8)
+    return cv2.imencode(".png", image)[1].tobytes()
+
+
+def _run(coroutine_function):
+    """サーバーを起動してテスト用のコルーチンを実行"""
+    async def main():
+        server = FaceMosaicHTTPServer(_StubApp(), host="127.0.0.1", port=0)
+        await server.start()
+        try:
+            return await coroutine_function(server)
+        finally:
+            await server.close()
+    
+    return asyncio.run(main())
+
+
+class TestFaceMosaicHTTPServer:
+    """FaceMosaicHTTPServerのテストクラス"""
+    
+    def test_mosaic(self):
+        """画像がモザイク処理されて返ることをテスト"""
+        async def scenario(server):
+            return await server.dispatch(
+                HTTPRequest("POST", "/mosaic", {"format": "png"}, body=_encode())
+            )
+        
+        response = _run(scenario)
+        assert response.status == 200
+        assert response.content_type == "image/png"
+        assert response.headers["X-Faces-Detected"] == "1"
+        assert "detect;dur=" in response.headers["Server-Timing"]
+        
+        image = cv2.imdecode(np.frombuffer(response.body, np.uint8), cv2.IMREAD_COLOR)
+        assert image.shape == (48, 64, 3)
+    
+    def test_detect_json(self):
+        """検出結果がJSONで返ることをテスト"""
+        async def scenario(server):
+            return await server.dispatch(
+                HTTPRequest("POST", "/detect", body=_encode(80, 40))
+            )
+        
+        response = _run(scenario)
+        result = json.loads(response.body)
+        assert result["image_size"] == [80, 40]
+        assert result["faces"][0]["box"] == [20, 10, 40, 20]
+    
+    def test_concurrent_requests_are_batched(self):
+        """同時に届いたリクエストがまとめて検出されることをテスト"""
+        async def scenario(server):
+            requests = [
+                server.dispatch(HTTPRequest("POST", "/detect", body=_encode()))
+                for _ in range(4)
+            ]
+            return await asyncio.gather(*requests)
+        
+        responses = _run(scenario)
+        assert all(response.status == 200 for response in responses)
+        assert max(int(r.headers["X-Batch-Size"]) for r in responses) > 1
+    
+    def test_errors(self):
+        """不正なリクエストにエラーが返ることをテスト"""
+        async def scenario(server):
+            return [
+                await server.dispatch(HTTPRequest("POST", "/mosaic", body=b"xx")),
+                await server.dispatch(HTTPRequest("GET", "/mosaic")),
+                await server.dispatch(HTTPRequest("GET", "/missing")),
+            ]
+        
+        responses = _run(scenario)
+        assert [response.status for response in responses] == [400, 405, 404]
+        # エラー応答にも Server-Timing を付ける（失敗した段階までの所要時間）
+        assert all("total;dur=" in r.headers["Server-Timing"] for r in responses)
+        assert "decode;dur=" in responses[0].headers["Server-Timing"]
+    
+    def test_http_round_trip(self):
+        """ソケット経由でリクエストとレスポンスをやり取りできることをテスト"""
+        async def scenario(server):
+            reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+            body = _encode()
+            writer.write(
+                b"POST /mosaic HTTP/1.1\r\nHost: localhost\r\n"
+                b"Connection: close\r\n"
+                + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                + body
+            )
+            await writer.drain()
+            data = await reader.read()
+            writer.close()
+            return data
+        
+        data = _run(scenario)
+        head, body = data.split(b"\r\n\r\n", 1)
+        assert head.startswith(b"HTTP/1.1 200 OK")
+        assert b"Server-Timing: " in head
+        assert b"Content-Type: image/jpeg" in head
+        assert body[:2] == b"\xff\xd8"
@@ -0,0 +1,41 @@
+"""
+パッケージの遅延読み込みのテスト
+"""
+
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import subprocess
+
+SRC = Path(__file__).parent.parent / "src"
+
+
+def run_python(code: str) -> str:
+    """新しいインタープリタでコードを実行して標準出力を返す"""
+    proc = subprocess.run(
+        [sys.executable, "-c", code], cwd=SRC, capture_output=True, text=True
+    )
+    assert proc.returncode == 0, proc.stderr
+    return proc.stdout.strip()
+
+
+class TestLazyImports:
+    """遅延読み込みのテストクラス"""
+    
+    def test_package_import_is_light(self):
+        """パッケージのimportでcv2/torchが読み込まれないことを確認"""
+        out = run_python(
+            "import sys, face_mosaic, face_mosaic.core, face_mosaic.utils; "
+            "print(sorted({'cv2', 'torch', 'ultralytics'} & set(sys.modules)))"
+        )
+        assert out == "[]"
+    
+    def test_lazy_attribute(self):
+        """参照時にクラスが読み込まれることを確認"""
+        out = run_python(
+            "import face_mosaic; "
+            "print(face_mosaic.FaceMosaicApplication.__module__)"
+        )
+        assert out == "face_mosaic.core.application"
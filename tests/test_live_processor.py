@@ -0,0 +1,128 @@
+"""
+リアルタイム処理のテスト
+"""
+
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import cv2
+import numpy as np
+
+from face_mosaic.config.settings import AppConfig, LiveConfig
+from face_mosaic.core.image_processor import ImageProcessor
+from face_mosaic.core.live_processor import (
+    LiveStreamProcessor,
+    _LatencyHistogram,
+    _latency_stats,
+)
+
+
+class _StubFaceDetector:
+    """フレームの左上に顔を1つ返す顔検出器のスタブ"""
+    
+    def __init__(self, config):
+        self.config = config
+    
+    def detect_face_details(self, image):
+        return [{"box": (0, 0, 16, 16), "confidence": 0.9, "landmarks": []}]
+
+
+class _CollectingSink:
+    """出力されたフレームの明るさを記録する出力先"""
+    
+    def __init__(self, delay=0.0, limit=None):
+        self.delay = delay
+        self.limit = limit
+        self.means = []
+        self.closed = False
+    
+    def write(self, frame):
+        time.sleep(self.delay)
+        self.means.append(float(frame[24:, 32:].mean()))
+        return self.limit is None or len(self.means) < self.limit
+    
+    def close(self):
+        self.closed = True
+
+
+def _write_video(path, frames=30, fps=100.0, size=(64, 48)):
+    """フレームごとに明るさの異なる動画を作成"""
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), fps, size)
+    for i in range(frames):
+        writer.write(np.full((size[1], size[0], 3), i * 240 // frames, np.uint8))
+    writer.release()
+
+
+def _processor():
+    config = AppConfig()
+    image_processor = ImageProcessor(
+        _StubFaceDetector(config.detection), config.mosaic, config.processing
+    )
+    return LiveStreamProcessor(image_processor, LiveConfig())
+
+
+class TestLiveStreamProcessor:
+    """LiveStreamProcessorのテストクラス"""
+    
+    def test_slow_output_drops_stale_frames(self):
+        """出力が遅れた場合に古いフレームを捨て、新しい順に出力することをテスト"""
+        with tempfile.TemporaryDirectory() as tmp:
+            source = Path(tmp) / "in.avi"
+            _write_video(source)
+            sink = _CollectingSink(delay=0.03)
+            
+            stats = _processor().run(str(source), sink, threading.Event())
+            
+            assert stats["frames_captured"] == 30
+            assert stats["frames_dropped"] > 0
+            assert stats["frames_output"] + stats["frames_dropped"] == 30
+            assert stats["frames_output"] == len(sink.means)
+            assert sink.means == sorted(sink.means)
+            assert len(set(sink.means)) == len(sink.means)
+            assert stats["detections"] >= 1
+            assert sink.closed
+    
+    def test_sink_can_stop_processing(self):
+        """出力先が停止を返した場合に処理を終えることをテスト"""
+        with tempfile.TemporaryDirectory() as tmp:
+            source = Path(tmp) / "in.avi"
+            _write_video(source, frames=100, fps=50.0)
+            sink = _CollectingSink(limit=3)
+            reports = []
+            
+            stats = _processor().run(
+                str(source), sink, threading.Event(), reports.append
+            )
+            
+            assert stats["frames_output"] == 3
+            assert stats["frames_captured"] < 100
+            assert 0.0 <= stats["within_target"] <= 1.0
+            assert set(stats) >= {"fps", "latency_ms", "latency_p95_ms", "elapsed"}
+
+
+class TestLatencyHistogram:
+    """_LatencyHistogramのテストクラス"""
+    
+    def test_matches_exact_stats(self):
+        """保持した値から求めた統計と1ms以内で一致することをテスト"""
+        latencies = [0.01 + 0.0003 * i for i in range(500)]
+        histogram = _LatencyHistogram(0.1)
+        for latency in latencies:
+            histogram.add(latency)
+        
+        stats = histogram.stats()
+        exact = _latency_stats(latencies, 0.1)
+        assert stats["latency_ms"] == exact["latency_ms"]
+        assert stats["within_target"] == exact["within_target"]
+        assert abs(stats["latency_p95_ms"] - exact["latency_p95_ms"]) <= 1.0
+        assert histogram.count == 500
+    
+    def test_empty(self):
+        """出力がない場合は0を返すことをテスト"""
+        assert _LatencyHistogram(0.1).stats()["latency_p95_ms"] == 0.0
+
@@ -0,0 +1,39 @@
+"""
+モデル管理クラスのテスト
+"""
+
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import pytest
+
+from face_mosaic.config.settings import ModelConfig
+from face_mosaic.core.exceptions import ConfigurationError
+from face_mosaic.core.model_manager import ModelManager
+
+
+class TestModelVariants:
+    """モデルバリアント管理のテストクラス"""
+    
+    def test_default_is_fp32(self, tmp_path):
+        """既定では従来のモデルファイルを使用する"""
+        config = ModelConfig(model_cache_dir=tmp_path)
+        manager = ModelManager(config)
+        assert manager.variant == "fp32"
+        assert manager.model_path == tmp_path / config.model_filename
+        assert "int8" in manager.list_variants()
+    
+    def test_switch_variant(self, tmp_path):
+        """バリアントごとに別のファイルを使用する"""
+        manager = ModelManager(ModelConfig(model_cache_dir=tmp_path))
+        manager.set_variant("int8")
+        assert manager.model_path.name == "face_detection_yunet_2023mar_int8.onnx"
+        assert manager.get_model_info()["variant"] == "int8"
+    
+    def test_unknown_variant(self, tmp_path):
+        """未知のバリアントは設定エラー"""
+        config = ModelConfig(model_cache_dir=tmp_path, model_variant="fp8")
+        with pytest.raises(ConfigurationError):
+            ModelManager(config)
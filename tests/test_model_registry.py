@@ -0,0 +1,58 @@
+"""
+モデルレジストリのテスト
+"""
+
+import threading
+import time
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from face_mosaic.core.model_registry import ModelRegistry
+
+
+class TestModelRegistry:
+    """ModelRegistryのテストクラス"""
+    
+    def test_loads_once_per_key(self):
+        """同じキーのモデルは1回だけ読み込まれることをテスト"""
+        registry = ModelRegistry()
+        calls = []
+        
+        def loader():
+            calls.append(1)
+            return object()
+        
+        first = registry.get_or_load(("yolo", "a.pt", "cpu"), loader)
+        second = registry.get_or_load(("yolo", "a.pt", "cpu"), loader)
+        other = registry.get_or_load(("yolo", "a.pt", "cuda"), loader)
+        
+        assert first is second
+        assert first is not other
+        assert len(calls) == 2
+        assert registry.get_stats()["hits"] == 1
+        assert registry.get_stats()["misses"] == 2
+    
+    def test_concurrent_load(self):
+        """同時に要求されても読み込みが1回だけであることをテスト"""
+        registry = ModelRegistry()
+        calls = []
+        results = []
+        
+        def loader():
+            calls.append(1)
+            time.sleep(0.05)
+            return object()
+        
+        def worker():
+            results.append(registry.get_or_load(("yolo", None, "cpu"), loader))
+        
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
@@ -0,0 +1,122 @@
+"""
+物体検出の事前判定のテスト
+"""
+
+import time
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import cv2
+import numpy as np
+import pytest
+
+from face_mosaic.config.settings import DetectionConfig, MosaicConfig, ProcessingConfig
+from face_mosaic.core.face_detector import FaceDetector
+from face_mosaic.core.image_processor import ImageProcessor
+
+
+class _RescalingDetector:
+    """FasterRCNNのように短辺を既定サイズへ拡大して推論する検出器の代替"""
+    
+    def __init__(self, resizable_input=True, min_size=800):
+        self.resizable_input = resizable_input
+        self.min_size = min_size
+        self.calls = []
+    
+    def detect_batch(self, images, target_labels=None, score_thresh=None, input_size=None):
+        self.calls.append((len(images), input_size))
+        results = []
+        for image in images:
+            height, width = image.shape[:2]
+            if input_size is None:
+                scale = self.min_size / min(height, width)
+            else:
+                scale = input_size / max(height, width)
+            # 推論時間は推論解像度の画素数に比例する
+            time.sleep(height * width * scale * scale * 1e-7)
+            results.append([{"box": [0, 0, 10, 10], "label": "person", "score": 0.9}])
+        return results
+
+
+class TestObjectGate:
+    """物体検出の事前判定のテストクラス"""
+    
+    def create_processor(self, detector, gate_max_side=320):
+        processor = ImageProcessor(
+            FaceDetector(DetectionConfig(), model_manager=None),
+            MosaicConfig(),
+            ProcessingConfig(),
+            object_detector=detector,
+            object_labels=["person"],
+            use_object_detection=True,
+        )
+        processor.object_gate_max_side = gate_max_side
+        return processor
+    
+    def test_gate_is_cheaper_than_full_pass(self):
+        """入力を拡大する検出器でも事前判定が本検出より速いことをテスト"""
+        detector = _RescalingDetector()
+        processor = self.create_processor(detector)
+        image = np.zeros((900, 1200, 3), dtype=np.uint8)
+        stats = {}
+        
+        processor._detect_objects_batch([image], [stats])
+        
+        gate = stats["object_gate"]
+        assert gate["passed"]
+        assert gate["gate_time"] < gate["full_time"]
+        assert detector.calls == [(1, 320), (1, None)]
+    
+    def test_gate_skipped_for_fixed_input_detector(self):
+        """入力サイズ固定の検出器では事前判定を省略し、その旨を記録することをテスト"""
+        detector = _RescalingDetector(resizable_input=False)
+        processor = self.create_processor(detector)
+        image = np.zeros((900, 1200, 3), dtype=np.uint8)
+        stats = {}
+        
+        results = processor._detect_objects_batch([image], [stats])
+        
+        assert stats["object_gate"]["skipped"] == "fixed_input_size"
+        assert stats["object_gate"]["passed"]
+        assert detector.calls == [(1, None)]
+        assert len(results[0]) == 1
+
+
+class TestFasterRCNNInputSize:
+    """FasterRCNNの推論解像度指定のテストクラス"""
+    
+    def test_gate_runs_at_reduced_resolution(self):
+        """input_size 指定時は縮小した解像度でバックボーンを実行することをテスト"""
+        pytest.importorskip("torchvision")
+        from torchvision.models.detection import fasterrcnn_resnet50_fpn
+        from face_mosaic.core.object_detector import ObjectDetector
+        
+        # 重みを読み込まずに構築したモデルを組み込む
+        model = fasterrcnn_resnet50_fpn(
+            weights=None, weights_backbone=None, num_classes=2
+        ).eval()
+        detector = ObjectDetector.__new__(ObjectDetector)
+        detector.model = model
+        detector.device = "cpu"
+        detector.score_thresh = 0.5
+        detector.label_names = ["__background__", "person"]
+        detector._label_to_class = {"person": [1]}
+        detector._class_cache = {}
+        detector._transforms = {}
+        detector.resizable_input = True
+        
+        shapes = []
+        model.backbone.register_forward_hook(
+            lambda module, inputs, output: shapes.append(inputs[0].shape[-2:])
+        )
+        image = cv2.cvtColor(np.zeros((240, 320, 3), np.uint8), cv2.COLOR_BGR2RGB)
+        
+        results = detector.detect(image, ["person"], score_thresh=0.0, input_size=320)
+        
+        assert max(shapes[0]) <= 320
+        assert model.transform.min_size == (800,)
+        for item in results:
+            x1, y1, x2, y2 = item["box"]
+            assert 0 <= x1 <= x2 <= 320 and 0 <= y1 <= y2 <= 240
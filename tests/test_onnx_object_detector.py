@@ -0,0 +1,77 @@
+"""
+ONNX物体検出のテスト
+"""
+
+import os
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import pytest
+
+from face_mosaic.core import onnx_object_detector
+from face_mosaic.core.exceptions import ConfigurationError
+from face_mosaic.core.onnx_object_detector import (
+    OnnxObjectDetector,
+    export_onnx_model,
+)
+
+
+class TestExportOnnxModel:
+    """export_onnx_modelのテストクラス"""
+    
+    @pytest.fixture
+    def exports(self, monkeypatch):
+        """変換処理を置き換え、変換した回数を記録する"""
+        calls = []
+        
+        def fake_export(model_path, onnx_path):
+            calls.append(model_path)
+            onnx_path.write_bytes(b"onnx")
+            return ["person"]
+        
+        monkeypatch.setattr(onnx_object_detector, "_export_yolo", fake_export)
+        return calls
+    
+    def test_same_name_in_other_directory_not_reused(self, tmp_path, exports):
+        """別ディレクトリの同名モデルは変換済みモデルを再利用しないことをテスト"""
+        output_dir = tmp_path / "onnx"
+        for name in ("a", "b"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "best.pt").write_bytes(name.encode())
+        
+        first = export_onnx_model("yolo", str(tmp_path / "a" / "best.pt"), output_dir)
+        second = export_onnx_model("yolo", str(tmp_path / "b" / "best.pt"), output_dir)
+        
+        assert first != second
+        assert len(exports) == 2
+    
+    def test_updated_model_exported_again(self, tmp_path, exports):
+        """変換元が更新された場合は再変換し、未更新なら再利用することをテスト"""
+        output_dir = tmp_path / "onnx"
+        model = tmp_path / "best.pt"
+        model.write_bytes(b"v1")
+        
+        first = export_onnx_model("yolo", str(model), output_dir)
+        assert export_onnx_model("yolo", str(model), output_dir) == first
+        assert len(exports) == 1
+        
+        stat = model.stat()
+        os.utime(model, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        
+        assert export_onnx_model("yolo", str(model), output_dir) != first
+        assert len(exports) == 2
+
+
+class TestOnnxObjectDetectorBackend:
+    """推論バックエンド選択のテストクラス"""
+    
+    def test_fasterrcnn_requires_onnxruntime(self, monkeypatch, tmp_path):
+        """ONNX Runtime なしでFasterRCNN形式を指定すると設定エラーになることをテスト"""
+        monkeypatch.setattr(onnx_object_detector, "_has_onnxruntime", lambda: False)
+        
+        with pytest.raises(ConfigurationError):
+            OnnxObjectDetector(
+                model_path=str(tmp_path / "rcnn.onnx"), source_type="fasterrcnn"
+            )
@@ -0,0 +1,53 @@
+"""
+並列処理クラスのテスト
+"""
+
+import threading
+import time
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from face_mosaic.core.parallel_processor import ThreadedProcessor
+
+
+class _RecordingProcessor:
+    """同時実行数を記録する画像処理の代替"""
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+    
+    def process_image_file(self, input_path, output_path):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(0.005)
+        with self.lock:
+            self.running -= 1
+        if input_path.name == "bad.jpg":
+            raise ValueError("broken")
+        return {"faces_detected": 1}
+
+
+class TestThreadedProcessor:
+    """ThreadedProcessorのテストクラス"""
+    
+    def test_reports_every_result(self):
+        """全タスクの結果とエラーが通知されることをテスト"""
+        image_processor = _RecordingProcessor()
+        tasks = [(Path(f"{i}.jpg"), Path(f"out/{i}.jpg")) for i in range(20)]
+        tasks.append((Path("bad.jpg"), None))
+        results = {}
+        
+        def on_result(input_path, output_path, result, error):
+            results[input_path] = (output_path, result, error)
+        
+        ThreadedProcessor(image_processor, 3).run(tasks, on_result)
+        
+        assert len(results) == len(tasks)
+        assert results[Path("0.jpg")] == (Path("out/0.jpg"), {"faces_detected": 1}, None)
+        assert results[Path("bad.jpg")] == (None, None, "broken")
+        assert image_processor.max_running <= 3
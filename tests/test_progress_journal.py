@@ -0,0 +1,118 @@
+"""
+進捗ジャーナルのテスト
+"""
+
+import tempfile
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from face_mosaic.config.settings import AppConfig
+from face_mosaic.core.batch_processor import BatchProcessor
+from face_mosaic.core.progress_journal import ProgressJournal
+from face_mosaic.utils.hash_utils import settings_fingerprint
+
+
+class TestProgressJournal:
+    """ProgressJournalのテストクラス"""
+    
+    def test_default_path_next_to_output(self):
+        """ジャーナルは出力ディレクトリの隣に置かれる"""
+        path = ProgressJournal.default_path(Path("/data/output"))
+        assert path == Path("/data/output.journal.sqlite3")
+    
+    def test_record_and_lookup(self):
+        """記録したエントリが再オープン後も取得できる"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            journal_path = Path(temp_dir) / "run.journal.sqlite3"
+            
+            with ProgressJournal(journal_path) as journal:
+                journal.record("a.jpg", 100, 1, "fp", success=True, faces=2)
+                journal.record("b.jpg", 100, 1, "fp", success=False, error="x")
+            
+            # 再オープンしても記録が残っている
+            with ProgressJournal(journal_path) as journal:
+                entry = journal.lookup("a.jpg")
+                assert entry["status"] == "success"
+                assert (entry["size"], entry["mtime_ns"], entry["fingerprint"]) == (
+                    100, 1, "fp"
+                )
+                assert journal.lookup("b.jpg")["status"] != "success"
+                assert journal.lookup("c.jpg") is None
+    
+    def test_content_hash_and_mtime_update(self):
+        """内容ハッシュの記録と更新時刻の再記録"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            journal_path = Path(temp_dir) / "run.journal.sqlite3"
+            
+            with ProgressJournal(journal_path) as journal:
+                journal.record("a.jpg", 100, 1, "fp", success=True, content_hash="h")
+                journal.update_mtime("a.jpg", 5)
+                
+                entry = journal.lookup("a.jpg")
+                assert entry["content_hash"] == "h"
+                assert entry["mtime_ns"] == 5
+                assert journal.lookup("missing.jpg") is None
+
+
+class TestIncrementalPlan:
+    """差分処理の対象判定のテストクラス"""
+    
+    def _plan(self, config, input_dir, output_dir, journal):
+        processor = BatchProcessor(None, config.processing, config)
+        files = sorted(input_dir.glob("*.jpg"))
+        return processor._plan_tasks(
+            files,
+            input_dir,
+            output_dir,
+            journal,
+            settings_fingerprint(config),
+            resume=False,
+        )
+    
+    def test_execution_settings_keep_files_skipped(self):
+        """スレッド数・バッチサイズの変更だけでは再処理しない"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_dir = Path(temp_dir) / "input"
+            output_dir = Path(temp_dir) / "output"
+            input_dir.mkdir()
+            output_dir.mkdir()
+            for name in ("a.jpg", "b.jpg"):
+                (input_dir / name).write_bytes(b"data")
+                (output_dir / name).write_bytes(b"out")
+            
+            config = AppConfig()
+            config.processing.incremental = True
+            journal_path = ProgressJournal.default_path(output_dir)
+            
+            with ProgressJournal(journal_path) as journal:
+                tasks, file_stats, skipped = self._plan(
+                    config, input_dir, output_dir, journal
+                )
+                assert (len(tasks), skipped) == (2, 0)
+                for img_file, _ in tasks:
+                    key, size, mtime_ns, content_hash = file_stats[img_file]
+                    journal.record(
+                        key,
+                        size,
+                        mtime_ns,
+                        settings_fingerprint(config),
+                        success=True,
+                        content_hash=content_hash,
+                    )
+            
+            config.processing.threads = 8
+            config.detection.tile_threads = 4
+            config.object_detection.batch_size = 16
+            
+            with ProgressJournal(journal_path) as journal:
+                tasks, _, skipped = self._plan(config, input_dir, output_dir, journal)
+                assert (len(tasks), skipped) == (0, 2)
+            
+            # 出力に影響する設定を変えた場合は再処理する
+            config.mosaic.ratio = 0.2
+            
+            with ProgressJournal(journal_path) as journal:
+                tasks, _, skipped = self._plan(config, input_dir, output_dir, journal)
+                assert (len(tasks), skipped) == (2, 0)
@@ -0,0 +1,87 @@
+"""
+常駐サーバーのテスト
+"""
+
+import tempfile
+import threading
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import pytest
+
+from face_mosaic.config.settings import AppConfig
+from face_mosaic.core.exceptions import ConfigurationError, ServerError
+from face_mosaic.server.socket_client import FaceMosaicClient
+from face_mosaic.server.socket_server import FaceMosaicSocketServer
+from face_mosaic.utils.hash_utils import settings_fingerprint
+
+
+class _StubProcessor:
+    """画像データをそのまま返す画像処理のスタブ"""
+    
+    def process_image_data(self, data, ext=".jpg"):
+        return data[::-1], {"success": True, "format": ext}
+
+
+class _StubApp:
+    """モデルを読み込まないアプリケーションのスタブ"""
+    
+    def __init__(self):
+        self.config = AppConfig()
+        self.image_processor = _StubProcessor()
+        self.calls = []
+    
+    def process_single_image(self, input_path, output_path):
+        self.calls.append((input_path, output_path))
+        return {"success": True, "input_path": str(input_path)}
+
+
+class TestFaceMosaicSocketServer:
+    """FaceMosaicSocketServerのテストクラス"""
+    
+    @pytest.fixture
+    def server(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            server = FaceMosaicSocketServer(_StubApp(), Path(tmp) / "test.sock")
+            server.start()
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            yield server
+            server.shutdown()
+            thread.join(5)
+    
+    def test_ping_and_process(self, server):
+        """稼働確認と処理の往復をテスト"""
+        fingerprint = settings_fingerprint(server.app.config)
+        client = FaceMosaicClient(server.socket_path, fingerprint)
+        
+        info = client.ping()
+        assert info["fingerprint"] == fingerprint
+        
+        payload, result = client.process_bytes(b"abc", ".png")
+        assert payload == b"cba"
+        assert result["format"] == ".png"
+        
+        result = client.process_file(Path("in.jpg"), Path("out.jpg"))
+        assert result["success"]
+        # パスは絶対パスで送られる
+        assert server.app.calls[0][0].is_absolute()
+    
+    def test_settings_mismatch(self, server):
+        """設定が異なるクライアントのリクエストが拒否されることをテスト"""
+        client = FaceMosaicClient(server.socket_path, "different")
+        with pytest.raises(ServerError) as excinfo:
+            client.process_bytes(b"abc")
+        assert excinfo.value.error_type == "SettingsMismatch"
+    
+    def test_rejects_second_server(self, server):
+        """同じソケットで2つ目のサーバーが起動できないことをテスト"""
+        with pytest.raises(ConfigurationError):
+            FaceMosaicSocketServer(_StubApp(), server.socket_path).start()
+    
+    def test_ping_without_server(self):
+        """サーバーが起動していない場合にNoneが返ることをテスト"""
+        client = FaceMosaicClient(Path(tempfile.gettempdir()) / "missing.sock")
+        assert client.ping() is None
@@ -0,0 +1,94 @@
+"""
+JSON Lines ストリーム処理のテスト
+"""
+
+import io
+import json
+import threading
+import time
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from face_mosaic.config.settings import MosaicConfig
+from face_mosaic.core.stream_processor import JsonLinesProcessor
+
+
+class _StubProcessor:
+    """ファイルを読み書きせず、使用したモザイク設定を返す画像処理のスタブ"""
+    
+    def __init__(self, mosaic_config=None):
+        self.mosaic_config = mosaic_config or MosaicConfig()
+    
+    def with_mosaic_config(self, mosaic_config):
+        return _StubProcessor(mosaic_config)
+    
+    def process_image_file(self, input_path, output_path):
+        if input_path.name == "broken.jpg":
+            raise ValueError("画像を読み込めません")
+        return {
+            "success": True,
+            "input_path": str(input_path),
+            "output_path": str(output_path),
+            "ratio": self.mosaic_config.ratio,
+        }
+
+
+def _job(index, **extra):
+    return json.dumps(dict(extra, input=f"{index}.jpg", output=f"out/{index}.jpg"))
+
+
+class TestJsonLinesProcessor:
+    """JsonLinesProcessorのテストクラス"""
+    
+    def test_results_and_errors(self):
+        """各行の結果が1行ずつ書き出されることをテスト"""
+        source = [
+            _job(0, id="a"),
+            _job(1, mosaic={"ratio": 0.3}),
+            "\n",
+            "not json",
+            json.dumps({"input": "broken.jpg", "output": "out/broken.jpg"}),
+            json.dumps({"input": "0.jpg", "output": "x.jpg", "mosaic": {"bad": 1}}),
+        ]
+        sink = io.StringIO()
+        stats = JsonLinesProcessor(_StubProcessor(), threads=2).run(source, sink)
+        
+        results = [json.loads(line) for line in sink.getvalue().splitlines()]
+        by_id = {result.get("id", result.get("line")): result for result in results}
+        assert stats == {"total": 5, "success": 2, "failed": 3}
+        assert by_id["a"]["ratio"] == 0.1
+        # id を省略した場合は行番号
+        assert by_id[2]["ratio"] == 0.3
+        assert "不正なJSON" in by_id[4]["error"]
+        assert by_id[5]["error"] == "画像を読み込めません"
+        assert "不正なモザイク設定" in by_id[6]["error"]
+    
+    def test_backpressure(self):
+        """書き出しが詰まっている間は入力の読み込みが止まることをテスト"""
+        consumed = []
+        release = threading.Event()
+        
+        def source():
+            for i in range(1000):
+                consumed.append(i)
+                yield _job(i)
+        
+        class SlowSink(io.StringIO):
+            def write(self, text):
+                release.wait()
+                return super().write(text)
+        
+        processor = JsonLinesProcessor(_StubProcessor(), threads=2, queue_depth=4)
+        sink = SlowSink()
+        thread = threading.Thread(target=processor.run, args=(source(), sink))
+        thread.start()
+        time.sleep(0.3)
+        
+        # ジョブ・結果キューとワーカー・書き出し中の分だけ読み込まれる
+        assert len(consumed) <= 4 + 4 + 2 + 2
+        release.set()
+        thread.join(10)
+        assert len(consumed) == 1000
+        assert len(sink.getvalue().splitlines()) == 1000
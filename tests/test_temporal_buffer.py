@@ -0,0 +1,79 @@
+"""
+検出枠の保持・補間のテスト
+"""
+
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from face_mosaic.core.temporal_buffer import TemporalBoxBuffer
+
+
+def _run(buffer, frames):
+    """全フレームを追加し、確定した (item, 枠リスト, 補った数) を返す"""
+    released = []
+    for i, boxes_by_label in enumerate(frames):
+        released.extend(buffer.push(i, boxes_by_label))
+    released.extend(buffer.flush(2))
+    return released
+
+
+class TestTemporalBoxBuffer:
+    """TemporalBoxBufferのテストクラス"""
+    
+    def test_output_is_delayed_and_ordered(self):
+        """hold_frames 枚遅れて入力順に確定することをテスト"""
+        buffer = TemporalBoxBuffer(hold_frames=2)
+        
+        assert buffer.push(0, [[], []]) == []
+        assert buffer.push(1, [[], []]) == []
+        assert [item for item, _, _ in buffer.push(2, [[], []])] == [0]
+        assert [item for item, _, _ in buffer.flush(2)] == [1, 2]
+    
+    def test_gap_is_interpolated(self):
+        """検出の途切れたフレームが前後の枠から補間されることをテスト"""
+        frames = [
+            [[(0, 0, 10, 10)], []],
+            [[], []],
+            [[], []],
+            [[(3, 3, 10, 10)], []],
+        ]
+        
+        released = _run(TemporalBoxBuffer(hold_frames=3), frames)
+        
+        assert [faces for _, (faces, _), _ in released] == [
+            [(0, 0, 10, 10)],
+            [(1, 1, 10, 10)],
+            [(2, 2, 10, 10)],
+            [(3, 3, 10, 10)],
+        ]
+        assert [added for _, _, added in released] == [0, 1, 1, 0]
+    
+    def test_lost_box_is_held_for_hold_frames(self):
+        """再び検出されない枠が hold_frames 枚だけ保持されることをテスト"""
+        frames = [[[(5, 5, 10, 10)], []]] + [[[], []]] * 4
+        
+        released = _run(TemporalBoxBuffer(hold_frames=2), frames)
+        
+        assert [faces for _, (faces, _), _ in released] == [
+            [(5, 5, 10, 10)],
+            [(5, 5, 10, 10)],
+            [(5, 5, 10, 10)],
+            [],
+            [],
+        ]
+    
+    def test_labels_are_not_mixed(self):
+        """種別の異なる枠は対応付けないことをテスト"""
+        frames = [
+            [[(0, 0, 10, 10)], []],
+            [[], []],
+            [[], [(0, 0, 10, 10)]],
+        ]
+        
+        released = _run(TemporalBoxBuffer(hold_frames=2), frames)
+        
+        # 顔は補間されずに保持され、物体は新しい対象として扱われる
+        assert released[1][1] == [[(0, 0, 10, 10)], []]
+        assert released[2][1] == [[(0, 0, 10, 10)], [(0, 0, 10, 10)]]
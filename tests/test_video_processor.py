@@ -0,0 +1,219 @@
+"""
+動画処理のテスト
+"""
+
+import tempfile
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import cv2
+import numpy as np
+import pytest
+
+from face_mosaic.config.settings import AppConfig, VideoConfig
+from face_mosaic.core.exceptions import VideoProcessingError
+from face_mosaic.core.image_processor import ImageProcessor
+from face_mosaic.core.video_processor import (
+    VideoProcessor,
+    open_video,
+    plan_segments,
+)
+
+
+class _StubFaceDetector:
+    """フレームの左上に顔を1つ返す顔検出器のスタブ"""
+    
+    def __init__(self, config):
+        self.config = config
+        self.calls = 0
+    
+    def detect_face_details(self, image):
+        self.calls += 1
+        return [{"box": (0, 0, 16, 16), "confidence": 0.9, "landmarks": []}]
+
+
+class _FlickeringFaceDetector(_StubFaceDetector):
+    """3フレームに1回顔を見落とす顔検出器のスタブ（フレーム番号は明るさから求める）"""
+    
+    def detect_face_details(self, image):
+        if round(float(image.mean()) / 10) % 3 == 1:
+            return []
+        return super().detect_face_details(image)
+
+
+def _write_video(path, frames=20, size=(64, 48)):
+    """フレームごとに明るさの異なる動画を作成"""
+    writer = cv2.VideoWriter(
+        str(path), cv2.VideoWriter_fourcc(*"MJPG"), 10.0, size
+    )
+    for i in range(frames):
+        writer.write(np.full((size[1], size[0], 3), i * 10, np.uint8))
+    writer.release()
+
+
+def _processor(threads=1, detector_class=_StubFaceDetector, **video_options):
+    config = AppConfig()
+    image_processor = ImageProcessor(
+        detector_class(config.detection), config.mosaic, config.processing
+    )
+    video_config = VideoConfig(fourcc="MJPG", keep_audio=False, **video_options)
+    return VideoProcessor(image_processor, video_config, threads)
+
+
+class TestVideoProcessor:
+    """VideoProcessorのテストクラス"""
+    
+    @pytest.mark.parametrize("threads", [1, 3])
+    def test_frames_are_written_in_order(self, threads):
+        """全フレームが読み込み順に書き出されることをテスト"""
+        with tempfile.TemporaryDirectory() as tmp:
+            input_path = Path(tmp) / "in.avi"
+            output_path = Path(tmp) / "out" / "out.avi"
+            _write_video(input_path)
+            
+            result = _processor(threads).process_video(input_path, output_path)
+            
+            assert result["frames"] == 20
+            assert result["faces_detected"] == 20
+            assert result["audio"] is False
+            assert sorted(p.name for p in output_path.parent.iterdir()) == ["out.avi"]
+            
+            capture, info = open_video(output_path)
+            means = []
+            while True:
+                ok, frame = capture.read()
+                if not ok:
+                    break
+                means.append(float(frame[24:, 32:].mean()))
+            capture.release()
+            assert info["frame_size"] == (64, 48)
+            assert len(means) == 20
+            assert means == sorted(means)
+    
+    def test_missing_video(self):
+        """開けない動画でエラーになることをテスト"""
+        with pytest.raises(VideoProcessingError):
+            _processor().process_video(Path("missing.mp4"), Path("out.mp4"))
+    
+    @pytest.mark.parametrize("threads", [1, 3])
+    def test_tracking_skips_detection(self, threads):
+        """追跡モードで検出が間引かれ、全フレームにモザイクが適用されることをテスト"""
+        with tempfile.TemporaryDirectory() as tmp:
+            input_path = Path(tmp) / "in.avi"
+            output_path = Path(tmp) / "out.avi"
+            _write_video(input_path)
+            processor = _processor(threads, tracking=True, detect_interval=5)
+            
+            result = processor.process_video(input_path, output_path)
+            
+            assert result["frames"] == 20
+            assert result["detection_calls"] == 4
+            assert processor.image_processor.face_detector.calls == 4
+            assert result["detections_saved"] == 16
+            assert result["tracked_frames"] == 16
+            assert result["frames_with_targets"] == 20
+    
+    def test_tracking_detects_on_scene_cut(self):
+        """シーンが切り替わったフレームで検出し直すことをテスト"""
+        with tempfile.TemporaryDirectory() as tmp:
+            input_path = Path(tmp) / "in.avi"
+            writer = cv2.VideoWriter(
+                str(input_path), cv2.VideoWriter_fourcc(*"MJPG"), 10.0, (64, 48)
+            )
+            for i in range(10):
+                writer.write(np.full((48, 64, 3), 0 if i < 3 else 200, np.uint8))
+            writer.release()
+            processor = _processor(tracking=True, detect_interval=5)
+            
+            result = processor.process_video(input_path, Path(tmp) / "out.avi")
+            
+            # 0, 3（切り替わり）, 8 フレーム目で検出
+            assert result["detection_calls"] == 3
+            assert result["scene_cuts"] == 1
+    
+    @pytest.mark.parametrize("threads", [1, 3])
+    def test_persisted_boxes_fill_missed_frames(self, threads):
+        """検出を見落としたフレームにも保持した枠でモザイクが適用されることをテスト"""
+        with tempfile.TemporaryDirectory() as tmp:
+            input_path = Path(tmp) / "in.avi"
+            _write_video(input_path)
+            
+            flickering = _processor(threads, _FlickeringFaceDetector)
+            without = flickering.process_video(input_path, Path(tmp) / "a.avi")
+            persisting = _processor(
+                threads, _FlickeringFaceDetector, persist_frames=2
+            )
+            result = persisting.process_video(input_path, Path(tmp) / "b.avi")
+            
+            assert without["frames_with_targets"] < 20
+            assert result["frames"] == 20
+            assert result["frames_with_targets"] == 20
+            assert result["persisted_boxes"] == 20 - without["frames_with_targets"]
+    
+    def test_process_segment(self):
+        """指定した区間のフレームだけが書き出されることをテスト"""
+        with tempfile.TemporaryDirectory() as tmp:
+            input_path = Path(tmp) / "in.avi"
+            output_path = Path(tmp) / "segment.avi"
+            _write_video(input_path)
+            
+            stats = _processor().process_segment(input_path, output_path, 5, 8)
+            
+            assert stats["frames"] == 8
+            capture, _ = open_video(output_path)
+            means = []
+            while True:
+                ok, frame = capture.read()
+                if not ok:
+                    break
+                means.append(float(frame[24:, 32:].mean()))
+            capture.release()
+            # 5〜12フレーム目（明るさ 50〜120）
+            assert len(means) == 8
+            assert abs(means[0] - 50) < 5 and abs(means[-1] - 120) < 5
+
+    
+    def test_segments_carry_persisted_boxes(self):
+        """区間に分けても区間の先頭で見落とした顔に枠が引き継がれることをテスト"""
+        with tempfile.TemporaryDirectory() as tmp:
+            input_path = Path(tmp) / "in.avi"
+            _write_video(input_path)
+            processor = _processor(1, _FlickeringFaceDetector, persist_frames=2)
+            
+            whole = processor.process_video(input_path, Path(tmp) / "whole.avi")
+            # 7, 13 フレーム目（区間の先頭）は検出を見落とす
+            segments = [
+                processor.process_segment(
+                    input_path, Path(tmp) / f"segment_{start}.avi", start, count
+                )
+                for start, count in [(0, 7), (7, 6), (13, None)]
+            ]
+            
+            assert [stats["frames"] for stats in segments] == [7, 6, 7]
+            assert sum(stats["frames_with_targets"] for stats in segments) == 20
+            assert sum(stats["persisted_boxes"] for stats in segments) == (
+                whole["persisted_boxes"]
+            )
+            assert sum(stats["faces_detected"] for stats in segments) == (
+                whole["faces_detected"]
+            )
+            # 前の区間の3フレームと後の区間の2フレームを重ねて読み込む
+            assert [stats["overlap_frames"] for stats in segments] == [2, 5, 3]
+
+
+class TestPlanSegments:
+    """区間分割のテストクラス"""
+    
+    def test_segments_cover_all_frames(self):
+        """区間が重ならずに全フレームを覆うことをテスト"""
+        plan = plan_segments(1000, 4, 100)
+        
+        assert plan == [(0, 250), (250, 250), (500, 250), (750, None)]
+    
+    def test_short_video_is_not_split(self):
+        """最小フレーム数に満たない場合は分割しないことをテスト"""
+        assert plan_segments(250, 8, 100) == [(0, 125), (125, None)]
+        assert plan_segments(50, 8, 100) == [(0, None)]
+        assert plan_segments(0, 8, 100) == [(0, None)]